@@ -0,0 +1,110 @@
+"""
+Walk-forward backtest of the stock forecast models over a ticker universe.
+
+Each model forecasts every ticker's close ``--horizon`` bars ahead from each
+rolling ``--lookback`` window, ``--stride`` bars apart. The report gives the
+error metrics against the realized closes, fit and predict throughput, and
+the tickers the first model forecasts worst.
+
+Prices come from a local CSV cache, so runs are offline:
+
+- ``--refresh`` downloads ``--period`` of closes for ``--tickers`` into it
+- ``--synthetic`` fills it with a seeded random universe, for CI
+
+Usage:
+    python -m benchmarks.forecast_backtest --synthetic --lookback 252 --stride 5
+    python -m benchmarks.forecast_backtest --refresh --tickers AAPL MSFT NVDA
+"""
+
+import argparse
+import asyncio
+
+from src.tools.backtest import (
+    FORECAST_MODELS,
+    load_price_cache,
+    save_price_cache,
+    synthetic_prices,
+    walk_forward,
+)
+from src.tools.market_data import market_data
+
+
+DEFAULT_TICKERS = [
+    "AAPL",
+    "MSFT",
+    "NVDA",
+    "AMZN",
+    "GOOGL",
+    "META",
+    "JPM",
+    "XOM",
+    "JNJ",
+    "WMT",
+]
+
+
+async def download(tickers, period):
+    histories = await asyncio.gather(
+        *(market_data.history(ticker, period) for ticker in tickers)
+    )
+    return {
+        ticker: history["Close"]
+        for ticker, history in zip(tickers, histories, strict=True)
+    }
+
+
+def main(args) -> None:
+    if args.refresh:
+        save_price_cache(
+            args.cache_dir, asyncio.run(download(args.tickers, args.period))
+        )
+    elif args.synthetic:
+        save_price_cache(
+            args.cache_dir, synthetic_prices(args.tickers, args.bars, args.seed)
+        )
+    prices = load_price_cache(args.cache_dir, args.tickers)
+
+    results = walk_forward(
+        prices,
+        [FORECAST_MODELS[name] for name in args.models],
+        lookback=args.lookback,
+        horizon=args.horizon,
+        stride=args.stride,
+        chunk_elements=args.chunk_elements,
+    )
+    print(
+        f"{len(prices)} tickers, lookback {args.lookback}, horizon {args.horizon}, "
+        f"stride {args.stride}, {results[0].windows:,} forecasts per model"
+    )
+    for result in results:
+        print(
+            f"{result.model:<13} MAE {result.mae:8.3f} | RMSE {result.rmse:8.3f} | "
+            f"MAPE {result.mape:7.2%} | direction {result.direction_accuracy:6.1%} | "
+            f"fit {result.fits_per_second:12,.0f}/s | "
+            f"predict {result.predictions_per_second:14,.0f}/s"
+        )
+    worst = sorted(results[0].ticker_mape.items(), key=lambda item: -item[1])
+    print(
+        f"worst {results[0].model} MAPE: "
+        + ", ".join(f"{ticker} {mape:.2%}" for ticker, mape in worst[:5])
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", nargs="+", default=DEFAULT_TICKERS)
+    parser.add_argument(
+        "--models", nargs="+", default=list(FORECAST_MODELS), choices=FORECAST_MODELS
+    )
+    parser.add_argument("--cache-dir", default="benchmarks/data/prices")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--refresh", action="store_true")
+    source.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--period", default="5y")
+    parser.add_argument("--bars", type=int, default=3 * 252)
+    parser.add_argument("--lookback", type=int, default=504)
+    parser.add_argument("--horizon", type=int, default=1)
+    parser.add_argument("--stride", type=int, default=1)
+    parser.add_argument("--chunk-elements", type=int, default=2_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
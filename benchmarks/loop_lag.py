@@ -0,0 +1,91 @@
+"""
+Benchmarks event-loop lag while tools fetch market data.
+
+Runs concurrent history requests for distinct tickers through two
+``MarketDataService`` instances. One calls the blocking provider inline on
+the event loop, the way the tools used to; the other goes through the
+bounded ``ProviderExecutor``. The provider is simulated by a ``time.sleep``
+of ``--fetch-latency`` seconds so the benchmark runs offline. A heartbeat
+coroutine that should wake every ``--tick`` seconds measures how late the
+loop serves it; that lag is what every other agent and session waits.
+
+Usage:
+    python -m benchmarks.loop_lag --requests 16 --fetch-latency 0.2
+"""
+
+import argparse
+import asyncio
+import time
+
+import pandas as pd
+
+from src.tools.market_data import (
+    YFINANCE,
+    MarketDataService,
+    MarketDataVersions,
+    ProviderExecutor,
+)
+
+
+def blocking_history(latency: float) -> pd.DataFrame:
+    time.sleep(latency)
+    return pd.DataFrame(
+        {"Close": [100.0]}, index=pd.bdate_range(end="2024-06-28", periods=1)
+    )
+
+
+async def measure(service: MarketDataService, args) -> tuple[float, list[float]]:
+    lags = []
+    done = False
+
+    async def heartbeat():
+        while not done:
+            expected = time.perf_counter() + args.tick
+            await asyncio.sleep(args.tick)
+            lags.append(max(time.perf_counter() - expected, 0.0))
+
+    beat = asyncio.ensure_future(heartbeat())
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(service.history(f"T{index}", "1d") for index in range(args.requests))
+    )
+    elapsed = time.perf_counter() - started
+    done = True
+    await beat
+    return elapsed, sorted(lags)
+
+
+def report(name: str, elapsed: float, lags: list[float]) -> None:
+    p95 = lags[int(len(lags) * 0.95)] if lags else 0.0
+    worst = lags[-1] if lags else 0.0
+    print(
+        f"{name:<9} wall {elapsed:6.3f}s | heartbeats {len(lags):4d} | "
+        f"lag p95 {p95 * 1000:8.1f}ms  max {worst * 1000:8.1f}ms"
+    )
+
+
+async def main(args) -> None:
+    async def inline_fetch(ticker, period, interval):
+        return blocking_history(args.fetch_latency)
+
+    executor = ProviderExecutor(
+        max_workers=args.workers, provider_limits={YFINANCE: args.limit}
+    )
+
+    async def pooled_fetch(ticker, period, interval):
+        return await executor.run(YFINANCE, blocking_history, args.fetch_latency)
+
+    for name, fetch in (("inline", inline_fetch), ("executor", pooled_fetch)):
+        service = MarketDataService(fetch, versions=MarketDataVersions())
+        report(name, *await measure(service, args))
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--fetch-latency", type=float, default=0.2)
+    parser.add_argument("--tick", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,99 @@
+"""
+Benchmarks pricing an option chain with Greeks, per contract versus vectorized.
+
+Prices a strikes x expiries x call/put grid, 10k contracts by default, twice.
+The scalar path loops over contracts with ``math`` and ``scipy.stats.norm``,
+the way ``OptionsPricingTool`` priced its single contract; the vectorized path
+is one ``price_chain`` call. Both compute the price and all five Greeks, and
+the largest price difference between them is reported as a sanity check.
+
+Usage:
+    python -m benchmarks.options_chain --strikes 100 --expiries 50 --repeat 5
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+from scipy.stats import norm
+
+from src.tools.options import OPTION_TYPES, price_chain
+
+
+def scalar_contract(spot, strike, expiry, rate, sigma, option_type):
+    sqrt_t = math.sqrt(expiry)
+    d1 = (math.log(spot / strike) + (rate + sigma**2 / 2) * expiry) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    discounted = strike * math.exp(-rate * expiry)
+    pdf_d1 = norm.pdf(d1)
+    common_theta = -spot * pdf_d1 * sigma / (2 * sqrt_t)
+    if option_type == "call":
+        price = spot * norm.cdf(d1) - discounted * norm.cdf(d2)
+        delta = norm.cdf(d1)
+        theta = common_theta - rate * discounted * norm.cdf(d2)
+        rho = discounted * expiry * norm.cdf(d2)
+    else:
+        price = discounted * norm.cdf(-d2) - spot * norm.cdf(-d1)
+        delta = norm.cdf(d1) - 1
+        theta = common_theta + rate * discounted * norm.cdf(-d2)
+        rho = -discounted * expiry * norm.cdf(-d2)
+    gamma = pdf_d1 / (spot * sigma * sqrt_t)
+    vega = spot * pdf_d1 * sqrt_t
+    return price, delta, gamma, vega, theta, rho
+
+
+def scalar_chain(spot, strikes, expiries, rate, sigma) -> np.ndarray:
+    return np.array(
+        [
+            [
+                [
+                    scalar_contract(spot, strike, expiry, rate, sigma, option_type)[0]
+                    for strike in strikes
+                ]
+                for expiry in expiries
+            ]
+            for option_type in OPTION_TYPES
+        ]
+    )
+
+
+def best_of(repeat: int, func, *args) -> tuple[float, object]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main(args) -> None:
+    strikes = np.linspace(50, 150, args.strikes)
+    expiries = np.linspace(1 / 52, 2, args.expiries)
+    inputs = (args.spot, strikes, expiries, args.rate, args.volatility)
+    contracts = len(OPTION_TYPES) * len(strikes) * len(expiries)
+
+    scalar_time, scalar_prices = best_of(args.repeat, scalar_chain, *inputs)
+    vector_time, chain = best_of(args.repeat, price_chain, *inputs)
+    difference = np.max(np.abs(chain.valuation.price - scalar_prices))
+
+    print(f"{contracts} contracts, best of {args.repeat}")
+    for name, elapsed in (("scalar", scalar_time), ("vectorized", vector_time)):
+        print(
+            f"{name:<10} {elapsed * 1000:9.2f}ms | "
+            f"{contracts / elapsed:12,.0f} contracts/s"
+        )
+    print(
+        f"speedup {scalar_time / vector_time:.0f}x | max price difference {difference:.2e}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--strikes", type=int, default=100)
+    parser.add_argument("--expiries", type=int, default=50)
+    parser.add_argument("--spot", type=float, default=100.0)
+    parser.add_argument("--rate", type=float, default=0.04)
+    parser.add_argument("--volatility", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,110 @@
+"""
+Benchmarks per-stage model routing against a single model for every stage.
+
+Sends representative planning, resolution and validation requests through
+two clients built from the same model config: one that ignores the
+``stages`` section and one that routes by stage. Prints mean latency, token
+usage and cost per stage for both.
+
+Usage:
+    MODEL_CONFIG_PATH=config/model_config.json python -m benchmarks.stage_routing --runs 5
+"""
+
+import argparse
+import asyncio
+import os
+
+from autogen_core.models import SystemMessage, UserMessage
+
+from src.agents.prompts import (
+    VALIDATOR_SYSTEM_MESSAGE,
+    build_orchestrator_system_message,
+    format_resolution_text,
+)
+from src.llm import (
+    PLANNING,
+    RESOLUTION,
+    VALIDATION,
+    StageRoutedChatCompletionClient,
+    build_model_client,
+    llm_stage,
+    load_model_config,
+)
+from src.llm.routing import DEFAULT_STAGE, ModelPricing
+from src.tools import build_orchestrator_tools
+
+
+QUERY = "What is the current price of AAPL and how has it moved this month?"
+ANSWER = (
+    "AAPL closed at 189.12 USD, up 3.4% over the last month with a 52-week "
+    "range of 164.08 to 199.62 USD."
+)
+
+
+async def run_stage(client, stage: str, runs: int) -> None:
+    tools = build_orchestrator_tools()
+    if stage == PLANNING:
+        messages = [
+            SystemMessage(content=build_orchestrator_system_message(tools)),
+            UserMessage(content=QUERY, source="User"),
+        ]
+    elif stage == RESOLUTION:
+        messages = [SystemMessage(content=format_resolution_text(QUERY, ANSWER, ""))]
+        tools = []
+    else:
+        messages = [
+            SystemMessage(content=VALIDATOR_SYSTEM_MESSAGE),
+            SystemMessage(
+                content=f"The initial query was: {QUERY}\nthe answer was: {ANSWER}\n"
+                "Your answer needs to start with Yes or No."
+            ),
+        ]
+        tools = []
+    for _ in range(runs):
+        with llm_stage(stage):
+            await client.create(messages, tools=tools)
+
+
+async def main(config_path: str, runs: int) -> None:
+    model_config = load_model_config(config_path)
+    if "stages" not in model_config:
+        raise SystemExit("The model config has no 'stages' section to compare against")
+
+    single_config = {k: v for k, v in model_config.items() if k != "stages"}
+    single_client = build_model_client(single_config)
+    single_pricing = {
+        DEFAULT_STAGE: ModelPricing.from_config(model_config.get("pricing"))
+    }
+    routed = build_model_client(model_config)
+
+    print(
+        f"{'stage':<12}{'client':<8}{'mean s':>8}{'prompt':>8}{'compl.':>8}{'cost':>10}"
+    )
+    for stage in (PLANNING, RESOLUTION, VALIDATION):
+        # Routes nothing, so the stage is served on the default model and
+        # priced at its DEFAULT_STAGE pricing, but still recorded under its name
+        single = StageRoutedChatCompletionClient(single_client, {}, single_pricing)
+        await run_stage(single, stage, runs)
+        await run_stage(routed, stage, runs)
+        rows = [
+            ("single", single.stats.by_stage[stage]),
+            ("routed", routed.stats.by_stage[stage]),
+        ]
+        for name, usage in rows:
+            print(
+                f"{stage:<12}{name:<8}{usage.mean_latency:>8.2f}"
+                f"{usage.prompt_tokens / usage.calls:>8.0f}"
+                f"{usage.completion_tokens / usage.calls:>8.0f}"
+                f"{usage.cost / usage.calls:>10.5f}"
+            )
+
+    await single_client.close()
+    await routed.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--config", default=os.getenv("MODEL_CONFIG_PATH"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.config, args.runs))
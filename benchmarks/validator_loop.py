@@ -0,0 +1,269 @@
+"""
+Benchmarks model, tool and engine calls per validated turn in the validator loop.
+
+Drives ``OrchestratorAssistantAgent.message_loop`` offline: tools, the Arthur
+Evaluation Engine and the model are simulated. Each tool output fails the
+engine check with probability ``--tool-failure``; the simulated validator
+answers "No" whenever the answer contains a failed output, and otherwise with
+probability ``--llm-rejection``.
+
+The recursive loop this replaced re-ran both planning calls, every tool and
+every engine check on each retry, and retried only on the LLM verdict. Its
+cost is simulated with the same probabilities for comparison. With
+``--latency`` every simulated call sleeps that long, and the wall time per turn
+shows how many round-trips the concurrent checks take off the critical path.
+``--candidates N`` also races N candidates per turn and reports the turn-time
+percentiles of both modes, where best-of-N trades extra calls for tail latency.
+
+Usage:
+    python -m benchmarks.validator_loop --turns 200 --tools 3
+    python -m benchmarks.validator_loop --latency 0.02 --candidates 3
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from unittest import mock
+
+from autogen_core import (
+    AgentId,
+    CancellationToken,
+    FunctionCall,
+    MessageContext,
+    SingleThreadedAgentRuntime,
+)
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_core.tools import BaseTool
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from pydantic import BaseModel
+
+from src.agents import orchestrator_validator
+from src.agents.orchestrator_validator import (
+    MAX_VALIDATION_ATTEMPTS,
+    OrchestratorAssistantAgent,
+)
+from src.core.messages import UserTextMessage
+from src.llm.stages import VALIDATION, current_llm_stage
+
+
+TOOL_NAMES = [f"tool_{index}" for index in range(8)]
+
+
+class TickerArgs(BaseModel):
+    ticker: str
+
+
+class TextResult(BaseModel):
+    data: str
+
+
+class SimulatedTool(BaseTool[TickerArgs, TextResult]):
+    def __init__(
+        self,
+        name: str,
+        counts: dict,
+        rng: random.Random,
+        failure: float,
+        latency: float,
+    ):
+        super().__init__(TickerArgs, TextResult, name, f"Simulated {name}")
+        self._latency = latency
+        self._counts = counts
+        self._rng = rng
+        self._failure = failure
+
+    async def run(self, args: TickerArgs, cancellation_token: CancellationToken):
+        self._counts["tool"] += 1
+        await asyncio.sleep(self._latency)
+        bad = self._rng.random() < self._failure
+        return TextResult(data=f"{self.name}:{'BAD' if bad else 'ok'} ")
+
+
+class SimulatedModel(ReplayChatCompletionClient):
+    def __init__(
+        self,
+        counts: dict,
+        rng: random.Random,
+        tools: int,
+        rejection: float,
+        latency: float,
+    ):
+        super().__init__([])
+        self._latency = latency
+        self._counts = counts
+        self._rng = rng
+        self._tools = tools
+        self._rejection = rejection
+
+    async def create(self, messages, *, tools=(), extra_create_args=None, **kwargs):
+        self._counts["llm"] += 1
+        await asyncio.sleep(self._latency)
+        if current_llm_stage() == VALIDATION:
+            answer = str(messages[-1].content)
+            valid = "BAD" not in answer and self._rng.random() >= self._rejection
+            content = "Yes" if valid else "No"
+        elif (extra_create_args or {}).get("tool_choice") == "none":
+            content = "intent"
+        else:
+            content = [
+                FunctionCall(id=name, name=name, arguments='{"ticker": "AAPL"}')
+                for name in TOOL_NAMES[: self._tools]
+            ]
+        return CreateResult(
+            finish_reason="stop",
+            content=content,
+            usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+            cached=False,
+        )
+
+
+def engine_result(passed: bool) -> dict:
+    return {
+        "inference_id": "inference",
+        "user_id": "1",
+        "rule_results": [
+            {
+                "id": "rule",
+                "name": "Quality",
+                "rule_type": "quality",
+                "scope": "response",
+                "result": "Pass" if passed else "Fail",
+                "latency_ms": 1,
+            }
+        ],
+    }
+
+
+async def run_iterative(
+    args, rng: random.Random, name: str, candidates: int = 1
+) -> tuple[dict, int]:
+    counts = {"llm": 0, "tool": 0, "engine": 0}
+    validated = 0
+
+    async def validate_prompt(*_):
+        counts["engine"] += 1
+        await asyncio.sleep(args.latency)
+        return engine_result(True)
+
+    async def validate_response(response, *_):
+        counts["engine"] += 1
+        await asyncio.sleep(args.latency)
+        return engine_result("BAD" not in str(response))
+
+    names = TOOL_NAMES[: args.tools]
+    config = {
+        "tools": {name: {"eval_engine_model": "task"} for name in [*names, "default"]},
+        "agents": {
+            "OrchestratorAgent": {"eval_engine_model": "task"},
+            "ValidatorAgent": {"eval_engine_model": "task"},
+        },
+    }
+    tools = [
+        SimulatedTool(name, counts, rng, args.tool_failure, args.latency)
+        for name in names
+    ]
+    model = SimulatedModel(counts, rng, args.tools, args.llm_rejection, args.latency)
+    ctx = MessageContext(None, None, False, CancellationToken(), "benchmark")
+
+    with (
+        mock.patch.object(
+            orchestrator_validator, "build_orchestrator_tools", lambda: tools
+        ),
+        mock.patch.object(
+            orchestrator_validator, "send_prompt_to_arthur_engine", validate_prompt
+        ),
+        mock.patch.object(
+            orchestrator_validator, "send_response_to_arthur_engine", validate_response
+        ),
+    ):
+        durations = []
+        for turn in range(args.turns):
+            runtime = SingleThreadedAgentRuntime()
+            await OrchestratorAssistantAgent.register(
+                runtime,
+                "Orchestrator",
+                lambda: OrchestratorAssistantAgent(
+                    "Orchestrator",
+                    "benchmark",
+                    model,
+                    shield_config=config,
+                    candidates=candidates,
+                ),
+            )
+            agent = await runtime.try_get_underlying_agent_instance(
+                AgentId("Orchestrator", "default"), OrchestratorAssistantAgent
+            )
+            started = time.perf_counter()
+            answer, _ = await agent.message_loop(
+                UserTextMessage(content=f"question {turn}", source="User"),
+                ctx,
+                f"turn-{turn}",
+            )
+            durations.append(time.perf_counter() - started)
+            validated += "BAD" not in answer
+    if args.latency:
+        durations.sort()
+        print(
+            f"{name:<10} {sum(durations) / args.turns:.3f}s per turn | "
+            f"p50 {durations[len(durations) // 2]:.3f}s  "
+            f"p95 {durations[int(len(durations) * 0.95)]:.3f}s"
+        )
+    return counts, validated
+
+
+def run_recursive(args, rng: random.Random) -> tuple[dict, int]:
+    counts = {"llm": 0, "tool": 0, "engine": 0}
+    validated = 0
+    for _ in range(args.turns):
+        for _ in range(MAX_VALIDATION_ATTEMPTS):
+            # Intent and planning calls, every tool, two engine calls per tool,
+            # then the LLM validation with its two engine calls
+            counts["llm"] += 3
+            counts["tool"] += args.tools
+            counts["engine"] += 2 * args.tools + 2
+            bad = any(rng.random() < args.tool_failure for _ in range(args.tools))
+            if not bad and rng.random() >= args.llm_rejection:
+                validated += 1
+                break
+    return counts, validated
+
+
+def report(name: str, counts: dict, validated: int, turns: int) -> None:
+    total = sum(counts.values())
+    per_validated = total / validated if validated else float("inf")
+    print(
+        f"{name:<10} llm {counts['llm'] / turns:5.2f}  tool {counts['tool'] / turns:5.2f}  "
+        f"engine {counts['engine'] / turns:5.2f} per turn | "
+        f"validated {validated}/{turns} | {per_validated:6.2f} calls per validated turn"
+    )
+
+
+async def main(args) -> None:
+    report("recursive", *run_recursive(args, random.Random(args.seed)), args.turns)
+    report(
+        "iterative",
+        *await run_iterative(args, random.Random(args.seed), "iterative"),
+        args.turns,
+    )
+    if args.candidates > 1:
+        name = f"best-of-{args.candidates}"
+        report(
+            name,
+            *await run_iterative(
+                args, random.Random(args.seed), name, candidates=args.candidates
+            ),
+            args.turns,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--tools", type=int, default=3)
+    parser.add_argument("--tool-failure", type=float, default=0.15)
+    parser.add_argument("--llm-rejection", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--candidates", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main(parser.parse_args()))
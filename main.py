@@ -25,6 +25,8 @@ if __name__ == "__main__":
     - Sets up the conversation loop
     - Handles user input collection
     - Manages application lifecycle
+    - Tool progress and streamed answers are printed by the user proxy agent
+      while the workflow runs; only questions for the user come back here
 
     Logging:
 
@@ -54,7 +56,9 @@ if __name__ == "__main__":
             logger.debug(
                 f"[run_main] Getting user input for question: {question_for_user}"
             )
-            user_input = await get_user_input(question_for_user)
+            user_input = await get_user_input(
+                question_for_user, workflow_manager.question_streamed
+            )
         else:
             logger.debug("[run_main] No initial question, starting fresh conversation")
             user_input = None
@@ -32,31 +32,53 @@ from autogen_core import (
     message_handler,
     type_subscription,
 )
-from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     ChatCompletionClient,
+    CreateResult,
     LLMMessage,
+    RequestUsage,
     SystemMessage,
     UserMessage,
 )
 from autogen_core.tools import BaseTool
 
-from src.agents.prompts import ORCHESTRATOR_SYSTEM_MESSAGE, format_resolution_text
+from src.agents.prompts import (
+    build_orchestrator_system_message,
+    format_resolution_text,
+    format_tool_progress,
+    format_unknown_tool_error,
+)
 from src.arthur_engine.helpers import (
     get_arthur_engine_model,
     send_prompt_to_arthur_engine,
     send_response_to_arthur_engine,
 )
-from src.core.messages import AssistantTextMessage, UserTextMessage
+from src.core.answer_cache import TurnAnswerCache, executed_plan
+from src.core.deadline import (
+    DEFAULT_TURN_DEADLINE,
+    DEGRADED_ANSWER,
+    ENGINE,
+    TOOLS,
+    StageOverrun,
+    TurnDeadline,
+)
+from src.core.messages import (
+    AssistantTextChunk,
+    AssistantTextMessage,
+    ToolProgressMessage,
+    UserTextMessage,
+)
+from src.core.streaming import STREAM_OFF, StreamGate
 from src.inference.inference import InferenceResult
-from src.tools.tools import (
-    FinancialLiteracyTool,
-    OptionsPricingTool,
-    PortfolioOptimizationTool,
-    SentimentAnalysisTool,
-    StockInfoTool,
+from src.llm.prompt_layout import (
+    CompactingChatCompletionContext,
+    PromptAssembler,
+    PromptCacheStats,
 )
+from src.llm.stages import PLANNING, RESOLUTION, llm_session, llm_stage
+from src.tools.registry import build_orchestrator_tools
+from src.tools.router import ToolRouter
 from src.utils.logger import get_logger
 
 
@@ -82,10 +104,22 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
     - Provides response validation and formatting
 
     Attributes:
-        _model_context: Buffered context for maintaining conversation state
+        _model_context: Append-only conversation history, user messages and answers
+        _turn_messages: Working messages of the turn being processed, sent as
+            volatile content and never stored in the history
+        _turn_calls: Tool calls that ran this turn, the plan the answer is cached under
+        _turn_degraded: Whether this turn's answer was cut short by a stage budget
         _name: Unique identifier for this agent instance
         _model_client: LLM client for generating responses
-        _system_message: System prompts defining agent behavior
+        _prompt: Assembler keeping the system prompt and tools as a stable prefix
+        _cache_stats: Provider prompt-cache accounting for this agent
+        _router: Local pre-router narrowing the tools sent with each planning call
+        _answer_cache: Turn-level cache of validated answers shared across turns
+        _turn_deadline: Seconds a turn may take before it is answered in degraded form
+        _deadline: Deadline and stage budgets of the turn being processed
+        _stream_policy: How the final answer is streamed, see ``StreamGate``
+        _stream_gate: Gate for the answer of the turn being processed
+        _show_progress: Whether tool results are published as they finish
     """
 
     def __init__(
@@ -95,6 +129,10 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         model_client: ChatCompletionClient,
         initial_message: AssistantTextMessage | None = None,
         arthur_engine_config: dict = None,
+        answer_cache: TurnAnswerCache | None = None,
+        turn_deadline: float = DEFAULT_TURN_DEADLINE,
+        stream_policy: str = STREAM_OFF,
+        show_progress: bool = True,
     ) -> None:
         """
         Initialize the orchestrator agent.
@@ -104,13 +142,17 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
             description (str): Human-readable description of agent's purpose
             model_client (ChatCompletionClient): LLM client for generating responses
             initial_message (Optional[AssistantTextMessage]): Starting message for conversation
+            answer_cache (Optional[TurnAnswerCache]): Shared cache of validated final answers
+            turn_deadline (float): Seconds a turn may take, split into stage budgets
+            stream_policy (str): ``off``, ``hold`` or ``stream`` for the final answer
+            show_progress (bool): Publish a progress message as each tool finishes
         """
         logger.info(
             f"[SoloOrchestratorAssistantAgent.init] Initializing SoloOrchestratorAssistantAgent: {name}"
         )
         super().__init__(description)
-        self._model_context = BufferedChatCompletionContext(
-            buffer_size=20,
+        self._model_context = CompactingChatCompletionContext(
+            max_messages=40,
             initial_messages=(
                 [
                     UserMessage(
@@ -121,9 +163,25 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
                 else None
             ),
         )
+        self._turn_messages: list[LLMMessage] = []
+        self._turn_calls: list[dict] = []
+        self._turn_degraded = False
         self._name = name
         self._model_client = model_client
-        self._system_message = [SystemMessage(content=ORCHESTRATOR_SYSTEM_MESSAGE)]
+        # Initialize available tools for processing user requests
+        # Created once so their schemas serialize identically on every call
+        self._tools = build_orchestrator_tools()
+        self._prompt = PromptAssembler(
+            build_orchestrator_system_message(self._tools), self._tools
+        )
+        self._cache_stats = PromptCacheStats()
+        self._router = ToolRouter(self._prompt.tools)
+        self._answer_cache = answer_cache
+        self._turn_deadline = turn_deadline
+        self._deadline = TurnDeadline(turn_deadline)
+        self._stream_policy = stream_policy
+        self._stream_gate = StreamGate(self.publish_chunk, STREAM_OFF)
+        self._show_progress = show_progress
         self._config = arthur_engine_config
         self._orchestrator_task = get_arthur_engine_model(
             "agents", "OrchestratorAgent", self._config
@@ -148,15 +206,52 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         """
         # Generate a unique conversation ID
         conversation_id = str(uuid.uuid4())
+        self._deadline = TurnDeadline(
+            self._turn_deadline,
+            conversation_id=conversation_id,
+            parent_token=ctx.cancellation_token,
+        )
+        self._stream_gate = StreamGate(
+            self.publish_chunk,
+            self._stream_policy,
+            conversation_id,
+            source=self.metadata["type"],
+        )
+
+        # Model calls for this turn queue under its own session in the rate limiter
+        with llm_session(conversation_id):
+            try:
+                await self.process_turn(message, ctx, conversation_id)
+            except StageOverrun as e:
+                logger.warning(
+                    f"[SoloOrchestratorAssistantAgent.handle_message] Answering in degraded form: {e}"
+                )
+                # Anything streamed so far was never checked
+                await self._stream_gate.abort("the answer ran out of time")
+                await self.publish_answer(DEGRADED_ANSWER, conversation_id)
+            finally:
+                # Stops any LLM or tool call still linked to this turn
+                self._deadline.cancel()
+
+    async def process_turn(
+        self, message: UserTextMessage, ctx: MessageContext, conversation_id: str
+    ) -> None:
+        """
+        Answers one user message: plans, runs tools, checks and publishes the answer.
+
+        Args:
+            message (UserTextMessage): The incoming user message
+            ctx (MessageContext): Message context information
+            conversation_id (str): Trace identifier for this turn
+
+        Returns:
+            None
+        """
 
         messages = await self._model_context.get_messages()
         logger.debug(
             f"[SoloOrchestratorAssistantAgent.handle_message] Getting messages, {messages}"
         )
-        if len(messages) == 0:
-            await self._model_context.add_message(
-                SystemMessage(content=f"System:{self._system_message}")
-            )
 
         logger.info(
             f"[SoloOrchestratorAssistantAgent.handle_message] Received user message from {message.source}"
@@ -168,11 +263,30 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
             f"[SoloOrchestratorAssistantAgent.handle_message] Conversation ID: {conversation_id}"
         )
 
+        self._turn_messages = []
+        self._turn_calls = []
+        self._turn_degraded = False
         await self._model_context.add_message(
             UserMessage(content=f"User: {message.content}\n", source=message.source)
         )
+
+        # Answer repeated questions from the turn-level cache
+        # Skips the LLM calls, the tools and the Arthur Evaluation Engine checks
+        # Earlier user messages of this conversation, for follow-up questions
+        previous = [
+            earlier.content for earlier in messages if isinstance(earlier, UserMessage)
+        ]
+        if self._answer_cache is not None:
+            cached_answer = self._answer_cache.get(message.content, previous)
+            if cached_answer is not None:
+                logger.info(
+                    "[SoloOrchestratorAssistantAgent.handle_message] Answering from cache"
+                )
+                await self.publish_answer(cached_answer, conversation_id)
+                return
+
         result, tool_validation_message = await self.message_loop(
-            message, ctx, self._system_message, 0, conversation_id
+            message, ctx, 0, conversation_id
         )
 
         # Format and publish final response
@@ -186,17 +300,22 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         )
 
         # Final Arthur Evaluation Engine validation of formatted response
-        arthur_engine_response = await send_prompt_to_arthur_engine(
-            message.content, self._orchestrator_task, conversation_id
+        arthur_engine_response = await self._deadline.run(
+            ENGINE,
+            send_prompt_to_arthur_engine(
+                message.content, self._orchestrator_task, conversation_id
+            ),
         )
         inference_result = InferenceResult(arthur_engine_response)
+        if not inference_result.return_pii():
+            self._stream_gate.hold("prompt failed the PII check")
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Arthur Evaluation Engine validation response: {inference_result.get_rule_details()}"
         )
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Arthur Evaluation Engine validation response: {inference_result.get_pass_fail_results()}"
         )
-        await self._model_context.add_message(
+        self._turn_messages.append(
             SystemMessage(
                 content=f"Arthur Evaluation Engine validations: {inference_result.get_pass_fail_string()}",
                 source=message.source,
@@ -205,16 +324,39 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
 
         # Generate and validate final human-readable response
         resolution_message = SystemMessage(content=resolution_text)
-        await self._model_context.add_message(resolution_message)
-        final_resolution_response = await self._model_client.create(
-            [resolution_message]
-        )
-        context = await self._model_context.get_messages()
-        arthur_engine_message = await send_response_to_arthur_engine(
-            final_resolution_response.content,
-            self._orchestrator_task,
-            inference_result.get_inference_id(),
-            context,
+        self._turn_messages.append(resolution_message)
+        try:
+            with llm_stage(RESOLUTION):
+                final_resolution_response = await self._deadline.run(
+                    RESOLUTION, self.resolve(resolution_message)
+                )
+        except StageOverrun:
+            # Degraded answer: the tool results, unformatted but still checked below
+            self._turn_degraded = True
+            # It replaces whatever part of the formatted answer was streamed
+            await self._stream_gate.abort(
+                "the answer ran out of time, the unformatted results follow"
+            )
+            final_resolution_response = CreateResult(
+                finish_reason="stop",
+                # The model's own reply when it answered without tools
+                content=result.content if isinstance(result, CreateResult) else result,
+                usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+                cached=False,
+            )
+        self._cache_stats.record(final_resolution_response.usage, "resolution")
+        logger.info(
+            f"[SoloOrchestratorAssistantAgent] Prompt cache (prefix {self._prompt.prefix_fingerprint()[:12]}): {self._cache_stats.summary()}"
+        )
+        context = await self.turn_context()
+        arthur_engine_message = await self._deadline.run(
+            ENGINE,
+            send_response_to_arthur_engine(
+                final_resolution_response.content,
+                self._orchestrator_task,
+                inference_result.get_inference_id(),
+                context,
+            ),
         )
         inference_result = InferenceResult(arthur_engine_message)
         logger.debug(
@@ -223,7 +365,7 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Arthur Evaluation Engine validation response: {inference_result.get_pass_fail_results()}"
         )
-        await self._model_context.add_message(
+        self._turn_messages.append(
             SystemMessage(
                 content=f"Arthur Evaluation Engine validations: {inference_result.get_pass_fail_string()}",
                 source=message.source,
@@ -242,16 +384,75 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         )
         if not hallucination_status:
             final_resolution_response.content = "The answer is not safe to share."
+        await self._stream_gate.settle(PII_status and hallucination_status)
 
-        final_resolution_response = (
-            f"[Trace ID: {conversation_id}] {final_resolution_response.content}"
+        if PII_status and hallucination_status and self._answer_cache is not None:
+            if self._turn_degraded:
+                logger.info(
+                    "[SoloOrchestratorAssistantAgent.handle_message] Not caching a degraded answer"
+                )
+            else:
+                # Keyed by what actually ran, not by the router's guess
+                tool_names, tickers = executed_plan(self._turn_calls)
+                self._answer_cache.put(
+                    message.content,
+                    tool_names,
+                    tickers,
+                    final_resolution_response.content,
+                    previous,
+                )
+        await self.publish_answer(final_resolution_response.content, conversation_id)
+
+    async def resolve(self, resolution_message: SystemMessage) -> CreateResult:
+        """
+        Generates the human-readable answer, streaming it through the gate if enabled.
+
+        Args:
+            resolution_message (SystemMessage): Formatting request with the tool results
+
+        Returns:
+            CreateResult: The complete resolution completion
+        """
+        if not self._stream_gate.streaming:
+            return await self._model_client.create(
+                [resolution_message],
+                cancellation_token=self._deadline.cancellation_token,
+            )
+        result = None
+        async for chunk in self._model_client.create_stream(
+            [resolution_message],
+            cancellation_token=self._deadline.cancellation_token,
+        ):
+            if isinstance(chunk, CreateResult):
+                result = chunk
+            else:
+                await self._stream_gate.feed(chunk)
+        return result
+
+    async def publish_chunk(self, chunk: AssistantTextChunk) -> None:
+        """Publishes part of a streaming answer to the user."""
+        await self.publish_message(
+            chunk, topic_id=DefaultTopicId("assistant_conversation")
         )
+
+    async def publish_answer(self, answer: str, conversation_id: str) -> None:
+        """
+        Publishes the final answer to the user and records it in the context.
+
+        Args:
+            answer (str): Validated, human-readable answer
+            conversation_id (str): Trace ID prefixed to the published answer
+        """
+        final_resolution_response = f"[Trace ID: {conversation_id}] {answer}"
         # Publish final response to user
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Validation response: {final_resolution_response}"
         )
         speech = AssistantTextMessage(
-            content=final_resolution_response, source=self.metadata["type"]
+            content=final_resolution_response,
+            source=self.metadata["type"],
+            # The user already read it chunk by chunk
+            streamed=self._stream_gate.shown,
         )
         await self._model_context.add_message(
             AssistantMessage(
@@ -267,7 +468,6 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         self,
         message: UserTextMessage,
         ctx: MessageContext,
-        system_message: SystemMessage,
         loop_count: int,
         conversation_id: str,
     ) -> None:
@@ -283,7 +483,6 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         Args:
             message (UserTextMessage): The user's input message to process
             ctx (MessageContext): Context information for the current message
-            system_message (SystemMessage): System-level configuration and prompts
             loop_count (int): Number of refinement iterations attempted
 
         Returns:
@@ -305,34 +504,36 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         # Initial Arthur Evaluation Engine validation of user input
         query = message.content
 
-        # Add user message to conversation contexts
-        logger.debug(
-            "[SoloOrchestratorAssistantAgent.message_loop] Adding query to model context"
-        )
-        await self._model_context.add_message(
-            UserMessage(content=f"{message.source}: {query}", source=message.source)
+        # Narrow the tool set locally before planning
+        # Falls back to every tool when the query is ambiguous; calls to tools
+        # outside the subset get an error result from loop_calls
+        route = self._router.route(query)
+        tools = route.tools
+        logger.info(
+            f"[SoloOrchestratorAssistantAgent.message_loop] Routed to tools {route.tool_names} (confidence {route.confidence:.2f})"
         )
 
-        # Initialize available tools for processing user requests
-        # Sets up specialized financial analysis and information tools
-        logger.info("[SoloOrchestratorAssistantAgent.message_loop] Initializing tools")
-        tools = [
-            OptionsPricingTool(),
-            StockInfoTool(),
-            SentimentAnalysisTool(),
-            FinancialLiteracyTool(),
-            PortfolioOptimizationTool(),
-        ]
-
-        # Get initial model response without tools
-        # This helps understand the user's intent before tool selection
+        # Get initial model response without tool calls
+        # This helps understand the user's intent before tool selection. The
+        # tool schemas are still sent so this request shares its prefix with
+        # the planning request below.
         logger.info(
             "[SoloOrchestratorAssistantAgent.message_loop] Requesting initial model response"
         )
-        response = await self._model_client.create(
-            system_message + (await self._model_context.get_messages()), tools=[]
-        )
-        await self._model_context.add_message(
+        with llm_stage(PLANNING):
+            response = await self._deadline.run(
+                PLANNING,
+                self._model_client.create(
+                    self._prompt.assemble(
+                        await self._model_context.get_messages(), self._turn_messages
+                    ),
+                    tools=tools,
+                    extra_create_args={"tool_choice": "none"},
+                    cancellation_token=self._deadline.cancellation_token,
+                ),
+            )
+        self._cache_stats.record(response.usage, "intent")
+        self._turn_messages.append(
             SystemMessage(
                 content=f"System:{response.content}", source=self.metadata["type"]
             )
@@ -346,16 +547,25 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         logger.debug(
             "[SoloOrchestratorAssistantAgent.message_loop] Getting context for Arthur Evaluation Engine"
         )
-        context = await self._model_context.get_messages()
+        context = await self.turn_context()
 
         # Get final model response with tools enabled
         # Allows model to use specialized tools for detailed analysis
         logger.info(
             "[SoloOrchestratorAssistantAgent.message_loop] Requesting final model response with tools"
         )
-        response_with_tools = await self._model_client.create(
-            system_message + (await self._model_context.get_messages()), tools=tools
-        )
+        with llm_stage(PLANNING):
+            response_with_tools = await self._deadline.run(
+                PLANNING,
+                self._model_client.create(
+                    self._prompt.assemble(
+                        await self._model_context.get_messages(), self._turn_messages
+                    ),
+                    tools=tools,
+                    cancellation_token=self._deadline.cancellation_token,
+                ),
+            )
+        self._cache_stats.record(response_with_tools.usage, "planning")
 
         # Process tool calls and get combined response
         # Executes necessary tool operations and aggregates results
@@ -413,10 +623,16 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         """
         tool_context = []
 
-        for tool_response in tool_responses:
+        for position, tool_response in enumerate(tool_responses):
             logger.debug(
                 f"[ToolValidation] Processing tool response: {tool_response}..."
             )
+            if tool_response.get("error"):
+                # The call never reached a tool, so there is nothing to check
+                tool_context.append(
+                    f"{tool_response['name']}: {tool_response['response']}"
+                )
+                continue
 
             # Get Arthur Evaluation Engine task from configuration
             validation_task = get_arthur_engine_model(
@@ -427,16 +643,35 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
             logger.debug(
                 f"[ToolValidation] Processing tool response: {tool_response['response'][:100]}..."
             )
-            arthur_engine_response = await send_prompt_to_arthur_engine(
-                message, validation_task, conversation_id
-            )
-            inference_result = InferenceResult(arthur_engine_response)
-            arthur_engine_response = await send_response_to_arthur_engine(
-                tool_response["response"],
-                validation_task,
-                inference_result.get_inference_id(),
-                context,
-            )
+            try:
+                arthur_engine_response = await self._deadline.run(
+                    ENGINE,
+                    send_prompt_to_arthur_engine(
+                        message, validation_task, conversation_id
+                    ),
+                )
+                inference_result = InferenceResult(arthur_engine_response)
+                arthur_engine_response = await self._deadline.run(
+                    ENGINE,
+                    send_response_to_arthur_engine(
+                        tool_response["response"],
+                        validation_task,
+                        inference_result.get_inference_id(),
+                        context,
+                    ),
+                )
+            except StageOverrun:
+                # The answer goes out unvalidated, so it must not be cached
+                self._turn_degraded = True
+                unchecked = tool_responses[position:]
+                logger.warning(
+                    f"[SoloOrchestratorAssistantAgent.validate_tool_responses] {len(unchecked)} tool responses left unchecked, engine budget used up"
+                )
+                tool_context.extend(
+                    f"{skipped['name']}: validation timed out, unchecked"
+                    for skipped in unchecked
+                )
+                break
 
             if arthur_engine_response is not None:
                 inference_result = InferenceResult(arthur_engine_response)
@@ -454,7 +689,7 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         tool_system_message = SystemMessage(
             content=f"System: {tool_validation_message}"
         )
-        await self._model_context.add_message(tool_system_message)
+        self._turn_messages.append(tool_system_message)
         return tool_validation_message
 
     async def loop_calls(
@@ -467,6 +702,10 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
         """
         Executes a series of tool function calls and validates their responses.
 
+        A call to a tool that is not in ``tools`` gets an error text as its
+        response rather than failing the turn, so the answer checks can ask for
+        a retry.
+
         Args:
             calls (list[FunctionCall]): List of tool functions to execute
             tools (list[BaseTool]): Available tools for execution
@@ -475,9 +714,6 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
 
         Returns:
             str: Concatenated and validated responses from all tool calls
-
-        Raises:
-            ValueError: If a required tool is not found
         """
         final_response = ""
         tool_responses = []
@@ -496,32 +732,81 @@ class SoloOrchestratorAssistantAgent(RoutedAgent):
                 )
                 tool = next((tool for tool in tools if tool.name == call.name), None)
                 if tool is None:
-                    logger.error(
-                        f"[SoloOrchestratorAssistantAgent] Tool not found: {call.name}"
+                    # Reported back as the call's result instead of failing the turn
+                    logger.warning(
+                        f"[SoloOrchestratorAssistantAgent.loop_calls] Tool not found: {call.name}"
+                    )
+                    error = format_unknown_tool_error(
+                        call.name, [known.name for known in tools]
+                    )
+                    final_response += error
+                    self._turn_calls.append(
+                        {"name": call.name, "arguments": call.arguments}
+                    )
+                    tool_responses.append(
+                        {"name": call.name, "response": error, "error": True}
+                    )
+                    self._turn_messages.append(
+                        SystemMessage(
+                            content=f"Tool {call.name} response: {error}",
+                            source=call.name,
+                        )
                     )
-                    raise ValueError(f"Tool not found: {call.name}")
+                    continue
                 logger.debug(
                     f"[SoloOrchestratorAssistantAgent] Running tool {call.name} with arguments: {call.arguments}"
                 )
                 arguments = json.loads(call.arguments)
-                output = await tool.run_json(arguments, ctx.cancellation_token)
+                try:
+                    output = await self._deadline.run(
+                        TOOLS,
+                        tool.run_json(arguments, self._deadline.cancellation_token),
+                    )
+                except StageOverrun:
+                    # Degraded answer: keep the results of the tools that finished
+                    self._turn_degraded = True
+                    logger.warning(
+                        f"[SoloOrchestratorAssistantAgent.loop_calls] Skipping {call.name} and later calls, tool budget used up"
+                    )
+                    break
                 logger.debug(
                     f"[SoloOrchestratorAssistantAgent] Tool {call.name} completed with result: {output}"
                 )
                 final_response += f"{output.data}"
+                self._turn_calls.append(
+                    {"name": call.name, "arguments": call.arguments}
+                )
                 tool_response = {"name": call.name, "response": output.data}
                 tool_responses.append(tool_response)
-                await self._model_context.add_message(
+                self._turn_messages.append(
                     SystemMessage(
                         content=f"Tool {call.name} response: {output.data}",
                         source=call.name,
                     )
                 )
+                if self._show_progress and len(calls) > 1:
+                    next_tool = calls[idx].name if idx < len(calls) else None
+                    await self.publish_message(
+                        ToolProgressMessage(
+                            source=self.metadata["type"],
+                            content=format_tool_progress(
+                                idx, len(calls), call.name, output.data, next_tool
+                            ),
+                            tool_name=call.name,
+                            step=idx,
+                            total_steps=len(calls),
+                        ),
+                        topic_id=DefaultTopicId("assistant_conversation"),
+                    )
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Final response: {final_response}"
         )
         return final_response, tool_responses
 
+    async def turn_context(self) -> list[LLMMessage]:
+        """Returns the history followed by this turn's messages, for engine checks."""
+        return [*await self._model_context.get_messages(), *self._turn_messages]
+
     async def save_state(self) -> Mapping[str, Any]:
         return {
             "memory": await self._model_context.save_state(),
@@ -19,7 +19,10 @@ The system uses a modular architecture with:
 - Input validation and safety checks
 """
 
+import asyncio
 from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import partial
 import json
 from typing import Any
 import uuid
@@ -32,40 +35,123 @@ from autogen_core import (
     message_handler,
     type_subscription,
 )
-from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     ChatCompletionClient,
+    CreateResult,
     LLMMessage,
+    RequestUsage,
     SystemMessage,
     UserMessage,
 )
 from autogen_core.tools import BaseTool
 
 from src.agents.prompts import (
-    ORCHESTRATOR_SYSTEM_MESSAGE,
     VALIDATOR_SYSTEM_MESSAGE,
+    build_orchestrator_system_message,
+    format_partial_retry_text,
     format_resolution_text,
+    format_tool_progress,
+    format_unknown_tool_error,
 )
 from src.arthur_engine.helpers import (
     get_arthur_engine_model,
     send_prompt_to_arthur_engine,
     send_response_to_arthur_engine,
 )
-from src.core.messages import AssistantTextMessage, UserTextMessage
+from src.core.answer_cache import TurnAnswerCache, executed_plan
+from src.core.deadline import (
+    DEFAULT_TURN_DEADLINE,
+    DEGRADED_ANSWER,
+    ENGINE,
+    TOOLS,
+    StageOverrun,
+    TurnDeadline,
+)
+from src.core.grounding import NumericVerifier
+from src.core.messages import (
+    AssistantTextChunk,
+    AssistantTextMessage,
+    ToolProgressMessage,
+    UserTextMessage,
+)
+from src.core.streaming import STREAM_OFF, StreamGate
 from src.inference.inference import InferenceResult
-from src.tools.tools import (
-    FinancialLiteracyTool,
-    OptionsPricingTool,
-    PortfolioOptimizationTool,
-    SentimentAnalysisTool,
-    StockInfoTool,
+from src.llm.prompt_layout import (
+    CompactingChatCompletionContext,
+    PromptAssembler,
+    PromptCacheStats,
 )
+from src.llm.stages import PLANNING, RESOLUTION, VALIDATION, llm_session, llm_stage
+from src.tools.registry import build_orchestrator_tools
+from src.tools.router import ToolRouter
 from src.utils.logger import get_logger
 
 
 logger = get_logger("src.core")
 
+# Planning attempts per turn, the first one included
+MAX_VALIDATION_ATTEMPTS = 4
+# Retries stop once an attempt raises the share of passed checks by less than this
+MIN_RETRY_IMPROVEMENT = 0.1
+# Planning temperature of the last candidate when candidates are raced
+MAX_CANDIDATE_TEMPERATURE = 1.0
+# Validation verdict recorded when the numeric check stands in for the LLM
+GROUNDED_VERDICT = "Yes, every number in the answer matches the tool results."
+
+
+@dataclass
+class CandidateOutcome:
+    """
+    A validated candidate answer from ``race_candidates``.
+
+    Attributes:
+        answer (str): Answer assembled from the candidate's tool responses
+        tool_validation (str): Shield validation summary of those responses
+        passed (bool): Whether every shield check and the answer validation passed
+        score (float): Share of passed checks, used when no candidate passed
+        temperature (float): Planning temperature the candidate was sampled at
+        kept (list[dict]): Tool responses that passed their shield checks
+        failed (list[str]): Names of the tools whose responses failed them
+        validation_response (str): The validator's objection, empty if it approved
+        messages (list[LLMMessage]): Tool results and checks of the candidate,
+            merged into the turn only if it is picked
+        responses (list[dict]): Every tool response the candidate ran
+    """
+
+    answer: str
+    tool_validation: str
+    passed: bool
+    score: float
+    temperature: float
+    kept: list[dict] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    validation_response: str = ""
+    messages: list[LLMMessage] = field(default_factory=list)
+    responses: list[dict] = field(default_factory=list)
+
+
+def tool_call_key(call: FunctionCall | dict) -> str:
+    """
+    Identifies a tool call by its name and normalized arguments.
+
+    Args:
+        call (FunctionCall | dict): Planned call, or a tool response with
+            ``name`` and ``arguments``
+
+    Returns:
+        str: Key that is equal for calls with the same name and arguments
+    """
+    if isinstance(call, dict):
+        name, arguments = call["name"], call["arguments"]
+    else:
+        name, arguments = call.name, call.arguments
+    try:
+        arguments = json.dumps(json.loads(arguments), sort_keys=True)
+    except json.JSONDecodeError:
+        pass
+    return f"{name}:{arguments}"
+
 
 @type_subscription("assistant_conversation")
 class OrchestratorAssistantAgent(RoutedAgent):
@@ -86,10 +172,27 @@ class OrchestratorAssistantAgent(RoutedAgent):
     - Provides response validation and formatting
 
     Attributes:
-        _model_context: Buffered context for maintaining conversation state
+        _model_context: Append-only conversation history, user messages and answers
+        _validator_context: Append-only history the planning and validation calls see
+        _turn_messages: Working messages of the turn (intent, tool results, checks)
+            passed to the engine checks, never stored in the history
+        _validator_turn_messages: Corrections and validation requests of the turn,
+            sent as volatile content after the validator history
+        _turn_calls: Tool calls that ran this turn, the plan the answer is cached under
+        _turn_degraded: Whether this turn's answer was cut short by a stage budget
         _name: Unique identifier for this agent instance
         _model_client: LLM client for generating responses
-        _system_message/b: System prompts defining agent behavior
+        _prompt/_validation_prompt: Assemblers keeping system prompts and tools as a stable prefix
+        _cache_stats: Provider prompt-cache accounting for this agent
+        _router: Local pre-router narrowing the tools sent with each planning call
+        _verifier: Numeric check of answers against structured tool results
+        _answer_cache: Turn-level cache of validated answers shared across turns
+        _turn_deadline: Seconds a turn may take before it is answered in degraded form
+        _deadline: Deadline and stage budgets of the turn being processed
+        _stream_policy: How the final answer is streamed, see ``StreamGate``
+        _stream_gate: Gate for the answer of the turn being processed
+        _show_progress: Whether tool results are published as they finish
+        _candidates: Candidate answers raced per turn, see ``race_candidates``
     """
 
     def __init__(
@@ -99,6 +202,11 @@ class OrchestratorAssistantAgent(RoutedAgent):
         model_client: ChatCompletionClient,
         initial_message: AssistantTextMessage | None = None,
         shield_config: dict = None,
+        answer_cache: TurnAnswerCache | None = None,
+        turn_deadline: float = DEFAULT_TURN_DEADLINE,
+        stream_policy: str = STREAM_OFF,
+        show_progress: bool = True,
+        candidates: int = 1,
     ) -> None:
         """
         Initialize the orchestrator agent.
@@ -108,13 +216,19 @@ class OrchestratorAssistantAgent(RoutedAgent):
             description (str): Human-readable description of agent's purpose
             model_client (ChatCompletionClient): LLM client for generating responses
             initial_message (Optional[AssistantTextMessage]): Starting message for conversation
+            answer_cache (Optional[TurnAnswerCache]): Shared cache of validated final answers
+            turn_deadline (float): Seconds a turn may take, split into stage budgets
+            stream_policy (str): ``off``, ``hold`` or ``stream`` for the final answer
+            show_progress (bool): Publish a progress message as each tool finishes
+            candidates (int): Candidate answers generated concurrently per turn;
+                1 keeps the iterative retry loop
         """
         logger.info(
             f"[OrchestratorAssistantAgent.init] Initializing OrchestratorAssistantAgent: {name}"
         )
         super().__init__(description)
-        self._model_context = BufferedChatCompletionContext(
-            buffer_size=20,
+        self._model_context = CompactingChatCompletionContext(
+            max_messages=40,
             initial_messages=(
                 [
                     UserMessage(
@@ -125,8 +239,8 @@ class OrchestratorAssistantAgent(RoutedAgent):
                 else None
             ),
         )
-        self._validator_context = BufferedChatCompletionContext(
-            buffer_size=20,
+        self._validator_context = CompactingChatCompletionContext(
+            max_messages=40,
             initial_messages=(
                 [
                     UserMessage(
@@ -138,12 +252,29 @@ class OrchestratorAssistantAgent(RoutedAgent):
                 else None
             ),
         )
+        self._turn_messages: list[LLMMessage] = []
+        self._turn_calls: list[dict] = []
+        self._turn_degraded = False
+        self._validator_turn_messages: list[LLMMessage] = []
         self._name = name
         self._model_client = model_client
-        self._system_message = [SystemMessage(content=ORCHESTRATOR_SYSTEM_MESSAGE)]
-        self._system_validation_message = [
-            SystemMessage(content=VALIDATOR_SYSTEM_MESSAGE)
-        ]
+        # Initialize available tools for processing user requests
+        # Created once so their schemas serialize identically on every call
+        self._tools = build_orchestrator_tools()
+        self._prompt = PromptAssembler(
+            build_orchestrator_system_message(self._tools), self._tools
+        )
+        self._validation_prompt = PromptAssembler(VALIDATOR_SYSTEM_MESSAGE, [])
+        self._cache_stats = PromptCacheStats()
+        self._router = ToolRouter(self._prompt.tools)
+        self._verifier = NumericVerifier()
+        self._answer_cache = answer_cache
+        self._turn_deadline = turn_deadline
+        self._deadline = TurnDeadline(turn_deadline)
+        self._stream_policy = stream_policy
+        self._stream_gate = StreamGate(self.publish_chunk, STREAM_OFF)
+        self._show_progress = show_progress
+        self._candidates = candidates
         self._config = shield_config
         self._orchestrator_task = get_arthur_engine_model(
             "agents", "OrchestratorAgent", self._config
@@ -171,15 +302,52 @@ class OrchestratorAssistantAgent(RoutedAgent):
         """
         # Generate a unique conversation ID
         conversation_id = str(uuid.uuid4())
+        self._deadline = TurnDeadline(
+            self._turn_deadline,
+            conversation_id=conversation_id,
+            parent_token=ctx.cancellation_token,
+        )
+        self._stream_gate = StreamGate(
+            self.publish_chunk,
+            self._stream_policy,
+            conversation_id,
+            source=self.metadata["type"],
+        )
+
+        # Model calls for this turn queue under its own session in the rate limiter
+        with llm_session(conversation_id):
+            try:
+                await self.process_turn(message, ctx, conversation_id)
+            except StageOverrun as e:
+                logger.warning(
+                    f"[OrchestratorAssistantAgent.handle_message] Answering in degraded form: {e}"
+                )
+                # Anything streamed so far was never checked
+                await self._stream_gate.abort("the answer ran out of time")
+                await self.publish_answer(DEGRADED_ANSWER, conversation_id)
+            finally:
+                # Stops any LLM or tool call still linked to this turn
+                self._deadline.cancel()
+
+    async def process_turn(
+        self, message: UserTextMessage, ctx: MessageContext, conversation_id: str
+    ) -> None:
+        """
+        Answers one user message: plans, runs tools, checks and publishes the answer.
+
+        Args:
+            message (UserTextMessage): The incoming user message
+            ctx (MessageContext): Message context information
+            conversation_id (str): Trace identifier for this turn
+
+        Returns:
+            None
+        """
 
         messages = await self._model_context.get_messages()
         logger.debug(
             f"[SoloOrchestratorAssistantAgent.handle_message] Getting messages, {messages}"
         )
-        if len(messages) == 0:
-            await self._model_context.add_message(
-                SystemMessage(content=f"System:{self._system_message}")
-            )
 
         logger.info(
             f"[OrchestratorAssistantAgent.handle_message] Received user message from {message.source}"
@@ -191,14 +359,34 @@ class OrchestratorAssistantAgent(RoutedAgent):
             f"[OrchestratorAssistantAgent.handle_message] Conversation ID: {conversation_id}"
         )
 
+        self._turn_messages = []
+        self._turn_calls = []
+        self._turn_degraded = False
+        self._validator_turn_messages = []
         await self._model_context.add_message(
             UserMessage(content=message.content, source=message.source)
         )
         await self._validator_context.add_message(
             UserMessage(content=message.content, source=message.source)
         )
+
+        # Answer repeated questions from the turn-level cache
+        # Skips the LLM calls, the tools and the Arthur Evaluation Engine checks
+        # Earlier user messages of this conversation, for follow-up questions
+        previous = [
+            earlier.content for earlier in messages if isinstance(earlier, UserMessage)
+        ]
+        if self._answer_cache is not None:
+            cached_answer = self._answer_cache.get(message.content, previous)
+            if cached_answer is not None:
+                logger.info(
+                    "[OrchestratorAssistantAgent.handle_message] Answering from cache"
+                )
+                await self.publish_answer(cached_answer, conversation_id)
+                return
+
         result, tool_validation_message = await self.message_loop(
-            message, ctx, self._system_message, 0, conversation_id
+            message, ctx, conversation_id
         )
 
         # Format and publish final response
@@ -212,17 +400,22 @@ class OrchestratorAssistantAgent(RoutedAgent):
         )
 
         # Final shield validation of formatted response
-        arthur_engine_response = await send_prompt_to_arthur_engine(
-            message.content, self._orchestrator_task, conversation_id
+        arthur_engine_response = await self._deadline.run(
+            ENGINE,
+            send_prompt_to_arthur_engine(
+                message.content, self._orchestrator_task, conversation_id
+            ),
         )
         inference_result = InferenceResult(arthur_engine_response)
+        if not inference_result.return_pii():
+            self._stream_gate.hold("prompt failed the PII check")
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Shield validation response: {inference_result.get_rule_details()}"
         )
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Shield validation response: {inference_result.get_pass_fail_results()}"
         )
-        await self._model_context.add_message(
+        self._turn_messages.append(
             SystemMessage(
                 content=f"Shield validations: {inference_result.get_pass_fail_string()}",
                 source=message.source,
@@ -231,16 +424,39 @@ class OrchestratorAssistantAgent(RoutedAgent):
 
         # Generate and validate final human-readable response
         resolution_message = SystemMessage(content=resolution_text)
-        await self._model_context.add_message(resolution_message)
-        final_resolution_response = await self._model_client.create(
-            [resolution_message]
-        )
-        context = await self._model_context.get_messages()
-        arthur_engine_message = await send_response_to_arthur_engine(
-            final_resolution_response.content,
-            self._orchestrator_task,
-            inference_result.get_inference_id(),
-            context,
+        self._turn_messages.append(resolution_message)
+        try:
+            with llm_stage(RESOLUTION):
+                final_resolution_response = await self._deadline.run(
+                    RESOLUTION, self.resolve(resolution_message)
+                )
+        except StageOverrun:
+            # Degraded answer: the tool results, unformatted but still checked below
+            self._turn_degraded = True
+            # It replaces whatever part of the formatted answer was streamed
+            await self._stream_gate.abort(
+                "the answer ran out of time, the unformatted results follow"
+            )
+            final_resolution_response = CreateResult(
+                finish_reason="stop",
+                # The model's own reply when it answered without tools
+                content=result.content if isinstance(result, CreateResult) else result,
+                usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+                cached=False,
+            )
+        self._cache_stats.record(final_resolution_response.usage, "resolution")
+        logger.info(
+            f"[OrchestratorAssistantAgent] Prompt cache (prefix {self._prompt.prefix_fingerprint()[:12]}): {self._cache_stats.summary()}"
+        )
+        context = [*await self._model_context.get_messages(), *self._turn_messages]
+        arthur_engine_message = await self._deadline.run(
+            ENGINE,
+            send_response_to_arthur_engine(
+                final_resolution_response.content,
+                self._orchestrator_task,
+                inference_result.get_inference_id(),
+                context,
+            ),
         )
         inference_result = InferenceResult(arthur_engine_message)
         logger.debug(
@@ -249,7 +465,7 @@ class OrchestratorAssistantAgent(RoutedAgent):
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Shield validation response: {inference_result.get_pass_fail_results()}"
         )
-        await self._model_context.add_message(
+        self._turn_messages.append(
             SystemMessage(
                 content=f"Shield validations: {inference_result.get_pass_fail_string()}",
                 source=message.source,
@@ -259,168 +475,568 @@ class OrchestratorAssistantAgent(RoutedAgent):
         logger.debug(f"[SoloOrchestratorAssistantAgent] PII status: {PII_status}")
         if not PII_status:
             final_resolution_response.content = "The answer is not safe to share."
+        await self._stream_gate.settle(PII_status)
+
+        if PII_status and self._answer_cache is not None:
+            if self._turn_degraded:
+                logger.info(
+                    "[OrchestratorAssistantAgent.handle_message] Not caching a degraded answer"
+                )
+            else:
+                # Keyed by what actually ran, not by the router's guess
+                tool_names, tickers = executed_plan(self._turn_calls)
+                self._answer_cache.put(
+                    message.content,
+                    tool_names,
+                    tickers,
+                    final_resolution_response.content,
+                    previous,
+                )
+        await self.publish_answer(final_resolution_response.content, conversation_id)
+
+    async def resolve(self, resolution_message: SystemMessage) -> CreateResult:
+        """
+        Generates the human-readable answer, streaming it through the gate if enabled.
+
+        Args:
+            resolution_message (SystemMessage): Formatting request with the tool results
+
+        Returns:
+            CreateResult: The complete resolution completion
+        """
+        if not self._stream_gate.streaming:
+            return await self._model_client.create(
+                [resolution_message],
+                cancellation_token=self._deadline.cancellation_token,
+            )
+        result = None
+        async for chunk in self._model_client.create_stream(
+            [resolution_message],
+            cancellation_token=self._deadline.cancellation_token,
+        ):
+            if isinstance(chunk, CreateResult):
+                result = chunk
+            else:
+                await self._stream_gate.feed(chunk)
+        return result
 
-        final_resolution_response = (
-            f"[Trace ID: {conversation_id}] {final_resolution_response.content}"
+    async def publish_chunk(self, chunk: AssistantTextChunk) -> None:
+        """Publishes part of a streaming answer to the user."""
+        await self.publish_message(
+            chunk, topic_id=DefaultTopicId("assistant_conversation")
         )
+
+    async def publish_answer(self, answer: str, conversation_id: str) -> None:
+        """
+        Publishes the final answer to the user and records it in the context.
+
+        Args:
+            answer (str): Validated, human-readable answer
+            conversation_id (str): Trace ID prefixed to the published answer
+        """
+        final_resolution_response = f"[Trace ID: {conversation_id}] {answer}"
         # Publish final response to user
         logger.debug(
-            f"[SoloOrchestratorAssistantAgent] Validation response: {final_resolution_response}"
+            f"[OrchestratorAssistantAgent] Validation response: {final_resolution_response}"
         )
         speech = AssistantTextMessage(
-            content=final_resolution_response, source=self.metadata["type"]
+            content=final_resolution_response,
+            source=self.metadata["type"],
+            # The user already read it chunk by chunk
+            streamed=self._stream_gate.shown,
         )
-        await self._model_context.add_message(
-            AssistantMessage(
-                content=f"System:{final_resolution_response}",
-                source=self.metadata["type"],
+        for context in (self._model_context, self._validator_context):
+            await context.add_message(
+                AssistantMessage(
+                    content=f"System:{final_resolution_response}",
+                    source=self.metadata["type"],
+                )
             )
-        )
         await self.publish_message(
             speech, topic_id=DefaultTopicId("assistant_conversation")
         )
 
+    async def plan_tool_calls(
+        self, tools: list[BaseTool], first_attempt: bool
+    ) -> tuple[CreateResult, CreateResult]:
+        """
+        Asks the model which tool calls answer the query in the validator context.
+
+        Args:
+            tools (list[BaseTool]): Tools routed for this query
+            first_attempt (bool): Also request the intent response; retries skip it
+                because the correction message already states what is missing
+
+        Returns:
+            tuple[CreateResult, CreateResult]: Intent response (the planning response
+                again on retries) and the planning response with tool calls
+        """
+        response = None
+        if first_attempt:
+            # Get initial model response without tool calls
+            # This helps understand the user's intent before tool selection. The
+            # tool schemas are still sent so this request shares its prefix with
+            # the planning request below.
+            logger.info(
+                "[OrchestratorAssistantAgent.plan_tool_calls] Requesting initial model response"
+            )
+            with llm_stage(PLANNING):
+                response = await self._deadline.run(
+                    PLANNING,
+                    self._model_client.create(
+                        await self.planning_prompt(),
+                        tools=tools,
+                        extra_create_args={"tool_choice": "none"},
+                        cancellation_token=self._deadline.cancellation_token,
+                    ),
+                )
+            self._cache_stats.record(response.usage, "intent")
+            logger.debug(
+                f"[OrchestratorAssistantAgent.plan_tool_calls] Initial model response: {response.content[:100]}..."
+            )
+            self._turn_messages.append(
+                SystemMessage(
+                    content=f"System:{response.content}", source=self.metadata["type"]
+                )
+            )
+
+        # Get final model response with tools enabled
+        # Allows model to use specialized tools for detailed analysis
+        logger.info(
+            "[OrchestratorAssistantAgent.plan_tool_calls] Requesting model response with tools"
+        )
+        with llm_stage(PLANNING):
+            response_with_tools = await self._deadline.run(
+                PLANNING,
+                self._model_client.create(
+                    await self.planning_prompt(),
+                    tools=tools,
+                    cancellation_token=self._deadline.cancellation_token,
+                ),
+            )
+        self._cache_stats.record(response_with_tools.usage, "planning")
+        return response or response_with_tools, response_with_tools
+
+    async def planning_prompt(self) -> list[LLMMessage]:
+        """Lays out a planning request: validator history, then this turn's corrections."""
+        return self._prompt.assemble(
+            await self._validator_context.get_messages(), self._validator_turn_messages
+        )
+
     async def message_loop(
         self,
         message: UserTextMessage,
         ctx: MessageContext,
-        system_message: SystemMessage,
-        loop_count: int,
         conversation_id: str,
-        tool_validation_message: str = None,
-    ) -> None:
+    ) -> tuple[str, str]:
         """
-        Processes user messages through a validation and response generation loop.
+        Plans, runs and validates tool calls, retrying only the parts that failed.
 
-        This method handles the core conversation flow, including:
-        - Initial shield validation of user input
-        - Tool selection and execution
-        - Response validation and refinement
-        - Safety checks and quality assurance
+        Each attempt runs only the tool calls that have not already passed the
+        shield checks; passing results are kept and reused. When the LLM
+        validation or a tool check fails, the correction prompt names the failed
+        parts and lists the kept results, so the model re-plans just those.
 
         Args:
             message (UserTextMessage): The user's input message to process
             ctx (MessageContext): Context information for the current message
-            system_message (SystemMessage): System-level configuration and prompts
-            loop_count (int): Number of refinement iterations attempted
+            conversation_id (str): Trace identifier for this turn
 
         Returns:
-            str: The final validated and processed response
-
-        Flow:
-            1. Initial shield validation of user input
-            2. Context management and tool initialization
-            3. Initial model response generation
-            4. Tool execution and response aggregation
-            5. Response validation and refinement
-            6. Final safety checks and formatting
+            tuple[str, str]: The best answer found and its shield validation summary
 
         Note:
-            The method will attempt up to 3 refinement loops if validation fails,
-            helping ensure high-quality, relevant responses.
+            At most ``MAX_VALIDATION_ATTEMPTS`` attempts are made. Retrying stops
+            early when an attempt improves the share of passed checks by less
+            than ``MIN_RETRY_IMPROVEMENT``; the best attempt is returned. With
+            more than one candidate configured, the first attempt races several
+            candidates instead, see ``race_candidates``.
         """
-
-        # Initial shield validation of user input
         query = message.content
 
-        # Initialize available tools for processing user requests
-        # Sets up specialized financial analysis and information tools
-        logger.info("[OrchestratorAssistantAgent.message_loop] Initializing tools")
-        tools = [
-            OptionsPricingTool(),
-            StockInfoTool(),
-            SentimentAnalysisTool(),
-            FinancialLiteracyTool(),
-            PortfolioOptimizationTool(),
-        ]
+        # Narrow the tool set locally before planning
+        # Falls back to every tool when the query is ambiguous; calls to tools
+        # outside the subset get an error result from loop_calls
+        route = self._router.route(query)
+        tools = route.tools
+        logger.info(
+            f"[OrchestratorAssistantAgent.message_loop] Routed to tools {route.tool_names} (confidence {route.confidence:.2f})"
+        )
+
+        # Tool results that passed the shield checks, keyed by call
+        kept: dict[str, dict] = {}
+        best_score = -1.0
+        best = ("", "")
+        previous_score = None
+        first_attempt = 0
+        if self._candidates > 1:
+            outcome = await self.race_candidates(query, tools, ctx, conversation_id)
+            # Only the picked candidate's work becomes part of the turn
+            self._turn_messages.extend(outcome.messages)
+            self._turn_calls.extend(outcome.responses)
+            if outcome.passed:
+                return outcome.answer, outcome.tool_validation
+            # Retry from the best candidate, reusing its passing tool results
+            kept = {
+                tool_call_key(tool_response): tool_response
+                for tool_response in outcome.kept
+            }
+            best_score = previous_score = outcome.score
+            best = (outcome.answer, outcome.tool_validation)
+            self._validator_turn_messages.append(
+                SystemMessage(
+                    content=format_partial_retry_text(
+                        query,
+                        outcome.validation_response,
+                        outcome.failed,
+                        outcome.kept,
+                        outcome.tool_validation,
+                    )
+                )
+            )
+            first_attempt = 1
+
+        for attempt in range(first_attempt, MAX_VALIDATION_ATTEMPTS):
+            response, response_with_tools = await self.plan_tool_calls(
+                tools, first_attempt=attempt == 0
+            )
+            calls = response_with_tools.content
+            if not isinstance(calls, list):
+                calls = []
+            new_calls = [call for call in calls if tool_call_key(call) not in kept]
+            logger.info(
+                f"[OrchestratorAssistantAgent.message_loop] Attempt {attempt + 1}: running {len(new_calls)} calls, reusing {len(kept)} results"
+            )
+
+            # Process tool calls and get combined response
+            # Executes necessary tool operations and aggregates results
+            _, tool_responses = await self.loop_calls(new_calls, tools, ctx, query)
+            self._turn_calls.extend(tool_responses)
+            if not tool_responses and not kept:
+                if new_calls:
+                    # The tool budget ran out before any planned call finished
+                    raise StageOverrun(
+                        TOOLS, max(self._deadline.stage_remaining(TOOLS), 0.0)
+                    )
+                return response.content, ""
+
+            final_response = "".join(
+                f"{tool_response['response']}"
+                for tool_response in [*kept.values(), *tool_responses]
+            )
+            logger.debug(
+                f"[OrchestratorAssistantAgent.message_loop] Final response: {final_response}"
+            )
+
+            shield_results, verdicts, llm_check = await self.check_answer(
+                query,
+                final_response,
+                list(kept.values()),
+                tool_responses,
+                conversation_id,
+            )
+            tool_validation = f"""
+                                    The tool responses were sent to the shield service (on run {attempt}) and the results are: {shield_results}
+                                    """
+            if isinstance(llm_check, StageOverrun):
+                # Degraded answer: no time left to refine, keep the current one
+                self._turn_degraded = True
+                # It still goes through the final shield checks
+                return final_response, tool_validation
+            is_valid, validation_response = llm_check
+
+            failed = []
+            for tool_response, passed in zip(tool_responses, verdicts, strict=False):
+                if passed:
+                    kept[tool_call_key(tool_response)] = tool_response
+                else:
+                    failed.append(tool_response)
+
+            score = (len(kept) + is_valid) / (len(kept) + len(failed) + 1)
+            if score > best_score:
+                best_score, best = score, (final_response, tool_validation)
+            logger.debug(
+                f"[OrchestratorAssistantAgent.message_loop] Is valid: {is_valid}, failed tools: {[r['name'] for r in failed]}, score {score:.2f}"
+            )
+            if is_valid and not failed:
+                break
+            if (
+                previous_score is not None
+                and score - previous_score < MIN_RETRY_IMPROVEMENT
+            ):
+                logger.info(
+                    f"[OrchestratorAssistantAgent.message_loop] Stopping retries, score moved {previous_score:.2f} -> {score:.2f}"
+                )
+                break
+            previous_score = score
+
+            if attempt + 1 < MAX_VALIDATION_ATTEMPTS:
+                correction_message = format_partial_retry_text(
+                    query,
+                    validation_response if not is_valid else "",
+                    [r["name"] for r in failed],
+                    list(kept.values()),
+                    tool_validation,
+                )
+                self._validator_turn_messages.append(
+                    SystemMessage(content=correction_message)
+                )
 
-        # Get initial model response without tools
-        # This helps understand the user's intent before tool selection
         logger.info(
-            "[OrchestratorAssistantAgent.message_loop] Requesting initial model response"
+            f"[OrchestratorAssistantAgent.message_loop] Returning best response (score {best_score:.2f})"
         )
-        response = await self._model_client.create(
-            system_message + (await self._validator_context.get_messages()), tools=[]
+        return best
+
+    async def check_answer(
+        self,
+        query: str,
+        final_response: str,
+        kept_responses: list[dict],
+        tool_responses: list[dict],
+        conversation_id: str,
+        record: bool = True,
+        messages: list[LLMMessage] | None = None,
+    ) -> tuple[str, list[bool], tuple[bool, str] | StageOverrun]:
+        """
+        Runs the shield checks of new tool responses and validates the answer.
+
+        Answers built only from structured tool results, with every number
+        matching them, skip the LLM validation once the shield checks pass.
+        Otherwise both checks run concurrently.
+
+        Args:
+            query (str): The original user query
+            final_response (str): Answer assembled from the tool responses
+            kept_responses (list[dict]): Responses that already passed their checks
+            tool_responses (list[dict]): Responses of this attempt, checked here
+            conversation_id (str): Trace identifier for this turn
+            record (bool): Add the validation request to the validator context
+            messages (list[LLMMessage] | None): Where to add the shield summary,
+                the turn's working messages by default
+
+        Returns:
+            tuple[str, list[bool], tuple[bool, str] | StageOverrun]: Shield summary,
+                whether each new response passed, and the answer verdict with its
+                text, or the overrun that cut the LLM validation short
+        """
+        responses = [*kept_responses, *tool_responses]
+        grounding = self._verifier.verify(
+            final_response,
+            [tool_response["values"] for tool_response in responses],
+            [query, *(tool_response["arguments"] for tool_response in responses)],
         )
-        logger.debug(
-            f"[OrchestratorAssistantAgent.message_loop] Initial model response: {response.content[:100]}..."
+        grounded = grounding.all_grounded and all(
+            tool_response["values"] for tool_response in responses
         )
-        await self._model_context.add_message(
-            SystemMessage(
-                content=f"System:{response.content}", source=self.metadata["type"]
-            )
+        context = [
+            *await self._validator_context.get_messages(),
+            *self._validator_turn_messages,
+        ]
+        answer_check = partial(
+            self.LLM_validation,
+            query,
+            final_response,
+            self._validator_task,
+            context,
+            conversation_id,
+            record=record,
         )
+        if grounded:
+            tool_check = await self.validate_tool_responses(
+                tool_responses, query, context, conversation_id, messages
+            )
+            if all(tool_check[1]):
+                logger.info(
+                    f"[OrchestratorAssistantAgent.check_answer] Skipping LLM validation, answer is grounded: {grounding.summary()}"
+                )
+                llm_check = (True, GROUNDED_VERDICT)
+            else:
+                (llm_check,) = await asyncio.gather(
+                    answer_check(), return_exceptions=True
+                )
+        else:
+            # Check the tool responses and the combined answer concurrently
+            # The shield checks of each tool output and the LLM validation are
+            # independent; only the correction prompt needs both
+            tool_check, llm_check = await asyncio.gather(
+                self.validate_tool_responses(
+                    tool_responses, query, context, conversation_id, messages
+                ),
+                answer_check(),
+                return_exceptions=True,
+            )
+        for outcome in (tool_check, llm_check):
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, StageOverrun
+            ):
+                raise outcome
+        shield_results, verdicts = tool_check
+        return shield_results, verdicts, llm_check
+
+    async def race_candidates(
+        self,
+        query: str,
+        tools: list[BaseTool],
+        ctx: MessageContext,
+        conversation_id: str,
+    ) -> CandidateOutcome:
+        """
+        Generates several candidate answers concurrently and keeps the first valid one.
 
-        # Get conversation context for shield validation
-        # Provides full conversation history for contextual validation
-        logger.debug(
-            "[OrchestratorAssistantAgent.message_loop] Getting context for shield"
-        )
-        context = await self._validator_context.get_messages()
+        Each candidate plans at its own temperature, runs its tool calls and is
+        validated like a single attempt. The first candidate to pass the shield
+        checks and the answer validation wins and the others are cancelled.
 
-        # Get final model response with tools enabled
-        # Allows model to use specialized tools for detailed analysis
+        Args:
+            query (str): The original user query
+            tools (list[BaseTool]): Tools routed for this query
+            ctx (MessageContext): Context information for the current message
+            conversation_id (str): Trace identifier for this turn
+
+        Returns:
+            CandidateOutcome: The first passing candidate, or the best-scoring one
+                if none passed; ``message_loop`` then retries from it
+
+        Raises:
+            Exception: The last candidate's error if every candidate failed
+        """
+        temperatures = [
+            MAX_CANDIDATE_TEMPERATURE * index / (self._candidates - 1)
+            for index in range(self._candidates)
+        ]
         logger.info(
-            "[OrchestratorAssistantAgent.message_loop] Requesting final model response with tools"
+            f"[OrchestratorAssistantAgent.race_candidates] Racing {self._candidates} candidates at temperatures {temperatures}"
         )
-        response_with_tools = await self._model_client.create(
-            system_message + (await self._validator_context.get_messages()), tools=tools
+        candidates = [
+            asyncio.create_task(
+                self.run_candidate(query, tools, ctx, conversation_id, temperature)
+            )
+            for temperature in temperatures
+        ]
+        best = None
+        error = None
+        try:
+            for finished in asyncio.as_completed(candidates):
+                try:
+                    outcome = await finished
+                except Exception as e:  # noqa: BLE001
+                    # Any model, tool or engine error only drops that candidate;
+                    # the last one is re-raised when every candidate failed
+                    logger.warning(
+                        f"[OrchestratorAssistantAgent.race_candidates] Candidate failed: {e}"
+                    )
+                    error = e
+                    continue
+                if outcome.passed:
+                    logger.info(
+                        f"[OrchestratorAssistantAgent.race_candidates] Candidate at temperature {outcome.temperature} passed"
+                    )
+                    return outcome
+                if best is None or outcome.score > best.score:
+                    best = outcome
+        finally:
+            for candidate in candidates:
+                candidate.cancel()
+            # Let the losers unwind their LLM and tool calls before returning
+            await asyncio.gather(*candidates, return_exceptions=True)
+        if best is None:
+            raise error
+        logger.info(
+            f"[OrchestratorAssistantAgent.race_candidates] No candidate passed, returning the best (score {best.score:.2f})"
         )
+        return best
 
-        # Process tool calls and get combined response
-        # Executes necessary tool operations and aggregates results
-        final_response, tool_responses = await self.loop_calls(
-            response_with_tools.content, tools, ctx, query
-        )
-        if final_response == "":
-            return response, ""
-        logger.debug(
-            f"[OrchestratorAssistantAgent.message_loop] Final response: {final_response}"
-        )
+    async def run_candidate(
+        self,
+        query: str,
+        tools: list[BaseTool],
+        ctx: MessageContext,
+        conversation_id: str,
+        temperature: float,
+    ) -> CandidateOutcome:
+        """
+        Plans, runs and validates one candidate answer without retrying.
 
-        # Process individual tool responses
-        # Validates each tool's output for safety and quality
-        tool_validation = f"""
-                                    {tool_validation_message}
-                                    The tool responses were sent to the shield service (on run {loop_count}) and the results are: {await self.validate_tool_responses(tool_responses, query, context, conversation_id)}
-                                    """
+        Candidates run side by side, so each keeps its tool results and checks
+        in its own message list, the validation request is not added to the
+        shared validator context and no tool progress is published.
 
-        # Validate final response using LLM
-        # Ensures response quality and relevance to original query
-        context = await self._validator_context.get_messages()
-        is_valid, validation_response = await self.LLM_validation(
-            query, final_response, self._validator_task, context, conversation_id
-        )
-
-        # Loop until valid response is generated
-        # Continues refining response if validation fails
-        logger.debug(f"[OrchestratorAssistantAgent.message_loop] Is valid: {is_valid}")
-        if not is_valid and loop_count < 3:
-            correction_message = SystemMessage(
-                content=f"""
-                    The initial query was: {context[1]}
-                    the answer was: {final_response}
-                    This answer was not valid, the error is: {validation_response}
-                    Shield validation results are: {tool_validation}
-                    Having seen the error and the mistakes, can you answer the query, {context[1]} again?
-                """
-            )
-            await self._validator_context.add_message(
-                SystemMessage(content=correction_message.content)
+        Args:
+            query (str): The original user query
+            tools (list[BaseTool]): Tools routed for this query
+            ctx (MessageContext): Context information for the current message
+            conversation_id (str): Trace identifier for this turn
+            temperature (float): Sampling temperature of the planning call
+
+        Returns:
+            CandidateOutcome: The candidate's answer and verdict
+        """
+        with llm_stage(PLANNING):
+            response = await self._deadline.run(
+                PLANNING,
+                self._model_client.create(
+                    await self.planning_prompt(),
+                    tools=tools,
+                    extra_create_args={"temperature": temperature},
+                    cancellation_token=self._deadline.cancellation_token,
+                ),
             )
-            return await self.message_loop(
-                correction_message,
-                ctx,
-                system_message,
-                loop_count + 1,
-                conversation_id,
-                tool_validation,
+        self._cache_stats.record(response.usage, "planning")
+        calls = response.content if isinstance(response.content, list) else []
+        messages: list[LLMMessage] = []
+        _, tool_responses = await self.loop_calls(
+            calls, tools, ctx, query, progress=False, messages=messages
+        )
+        if not tool_responses:
+            # Nothing here was validated: the model answered without tools, or
+            # the tool budget ran out before the first call finished. Neither
+            # may win the race; the planned calls are reported as failed
+            return CandidateOutcome(
+                response.content if isinstance(response.content, str) else "",
+                "",
+                False,
+                0.0,
+                temperature,
+                failed=[call.name for call in calls],
+                messages=messages,
             )
 
-        logger.info(
-            f"[OrchestratorAssistantAgent.message_loop] Returning final response {validation_response}"
+        final_response = "".join(
+            f"{tool_response['response']}" for tool_response in tool_responses
+        )
+        shield_results, verdicts, llm_check = await self.check_answer(
+            query,
+            final_response,
+            [],
+            tool_responses,
+            conversation_id,
+            record=False,
+            messages=messages,
+        )
+        if isinstance(llm_check, StageOverrun):
+            raise llm_check
+        is_valid, validation_response = llm_check
+        tool_validation = f"""
+                                    The tool responses were sent to the shield service (candidate at temperature {temperature}) and the results are: {shield_results}
+                                    """
+        return CandidateOutcome(
+            final_response,
+            tool_validation,
+            is_valid and all(verdicts),
+            (sum(verdicts) + is_valid) / (len(verdicts) + 1),
+            temperature,
+            kept=[
+                r for r, passed in zip(tool_responses, verdicts, strict=False) if passed
+            ],
+            failed=[
+                r["name"]
+                for r, passed in zip(tool_responses, verdicts, strict=False)
+                if not passed
+            ],
+            validation_response="" if is_valid else validation_response,
+            messages=messages,
+            responses=tool_responses,
         )
-        return final_response, tool_validation_message
 
     async def validate_tool_responses(
         self,
@@ -428,12 +1044,13 @@ class OrchestratorAssistantAgent(RoutedAgent):
         message: str,
         context: list[LLMMessage],
         conversation_id: str,
-    ) -> bool:
+        messages: list[LLMMessage] | None = None,
+    ) -> tuple[str, list[bool]]:
         """
         Validates responses from multiple tools through the shield service.
 
-        This function processes each tool response through appropriate validation tasks
-        based on the tool type. It ensures responses meet safety, quality, and
+        This function checks every tool response concurrently through appropriate
+        validation tasks based on the tool type. It ensures responses meet safety, quality, and
         relevance standards before being presented to users.
 
         Args:
@@ -443,52 +1060,29 @@ class OrchestratorAssistantAgent(RoutedAgent):
                 - response: The tool's output data
             message (LLMMessage): The original LLM message that triggered the tool calls
             context (list[LLMMessage]): Current conversation context for validation
+            conversation_id (str): Trace identifier for this turn
+            messages (list[LLMMessage] | None): Where to add the summary, the
+                turn's working messages by default
 
         Returns:
-            list[dict]: List of validation results for each tool response
-                Each result contains pass/fail status and validation details
+            tuple[str, list[bool]]: Pass/fail summary of every checked rule, and
+                whether each tool response passed all of its rules
 
         Note:
             Different validation tasks are used based on tool type:
             - Financial data tools use quantitative validation (553368bd-...)
             - Educational content uses content safety validation (915ba7d1-...)
         """
-        tool_context = []
-
-        for tool_response in tool_responses:
-            logger.debug(
-                f"[ToolValidation] Processing tool response: {tool_response}..."
-            )
-
-            # Get shield task from configuration
-            validation_task = get_arthur_engine_model(
-                "tools", tool_response["name"], self._config
-            )
-
-            # Validate tool response through shield service
-            logger.debug(
-                f"[ToolValidation] Processing tool response: {tool_response['response'][:100]}..."
-            )
-            arthur_engine_response = await send_prompt_to_arthur_engine(
-                message, validation_task, conversation_id
-            )
-            inference_result = InferenceResult(arthur_engine_response)
-            arthur_engine_response = await send_response_to_arthur_engine(
-                tool_response["response"],
-                validation_task,
-                inference_result.get_inference_id(),
-                context,
-            )
-
-            if arthur_engine_response is not None:
-                inference_result = InferenceResult(arthur_engine_response)
-                logger.debug(
-                    f"[ToolValidation] Shield validation response: {inference_result.get_rule_details()}"
+        checks = await asyncio.gather(
+            *(
+                self.validate_tool_response(
+                    tool_response, message, context, conversation_id
                 )
-                logger.debug(
-                    f"[ToolValidation] Shield validation response: {inference_result.get_pass_fail_results()}"
-                )
-                tool_context.append(inference_result.get_pass_fail_string())
+                for tool_response in tool_responses
+            )
+        )
+        tool_context = [summary for summary, _ in checks if summary is not None]
+        verdicts = [passed for _, passed in checks]
 
         tool_validation_message = f"""
             {tool_context}
@@ -496,8 +1090,78 @@ class OrchestratorAssistantAgent(RoutedAgent):
         tool_system_message = SystemMessage(
             content=f"System: {tool_validation_message}"
         )
-        await self._model_context.add_message(tool_system_message)
-        return tool_validation_message
+        (self._turn_messages if messages is None else messages).append(
+            tool_system_message
+        )
+        return tool_validation_message, verdicts
+
+    async def validate_tool_response(
+        self,
+        tool_response: dict,
+        message: str,
+        context: list[LLMMessage],
+        conversation_id: str,
+    ) -> tuple[str | None, bool]:
+        """
+        Validates one tool response through the shield service.
+
+        Args:
+            tool_response (dict): Tool response with ``name`` and ``response``
+            message (str): The original user query
+            context (list[LLMMessage]): Current conversation context for validation
+            conversation_id (str): Trace identifier for this turn
+
+        Returns:
+            tuple[str | None, bool]: Pass/fail summary (None when the engine returned
+                nothing) and whether the response passed all of its rules
+        """
+        logger.debug(f"[ToolValidation] Processing tool response: {tool_response}...")
+        if tool_response.get("error"):
+            # The call never reached a tool, so there is nothing to check
+            return f"{tool_response['name']}: {tool_response['response']}", False
+
+        # Get shield task from configuration
+        validation_task = get_arthur_engine_model(
+            "tools", tool_response["name"], self._config
+        )
+
+        # Validate tool response through shield service
+        logger.debug(
+            f"[ToolValidation] Processing tool response: {tool_response['response'][:100]}..."
+        )
+        try:
+            arthur_engine_response = await self._deadline.run(
+                ENGINE,
+                send_prompt_to_arthur_engine(message, validation_task, conversation_id),
+            )
+            inference_result = InferenceResult(arthur_engine_response)
+            arthur_engine_response = await self._deadline.run(
+                ENGINE,
+                send_response_to_arthur_engine(
+                    tool_response["response"],
+                    validation_task,
+                    inference_result.get_inference_id(),
+                    context,
+                ),
+            )
+        except StageOverrun:
+            # Unchecked responses count as failed, and keep the answer out of the cache
+            self._turn_degraded = True
+            return f"{tool_response['name']}: validation timed out, unchecked", False
+
+        if arthur_engine_response is None:
+            return None, True
+        inference_result = InferenceResult(arthur_engine_response)
+        logger.debug(
+            f"[ToolValidation] Shield validation response: {inference_result.get_rule_details()}"
+        )
+        logger.debug(
+            f"[ToolValidation] Shield validation response: {inference_result.get_pass_fail_results()}"
+        )
+        return (
+            inference_result.get_pass_fail_string(),
+            inference_result.all_rules_passed(),
+        )
 
     async def loop_calls(
         self,
@@ -505,22 +1169,30 @@ class OrchestratorAssistantAgent(RoutedAgent):
         tools: list[BaseTool],
         ctx: MessageContext,
         query: str,
+        progress: bool = True,
+        messages: list[LLMMessage] | None = None,
     ) -> None:
         """
         Executes a series of tool function calls and validates their responses.
 
+        A call to a tool that is not in ``tools`` gets an error text as its
+        response rather than failing the turn, so the answer checks can ask for
+        a retry.
+
         Args:
             calls (list[FunctionCall]): List of tool functions to execute
             tools (list[BaseTool]): Available tools for execution
             ctx (MessageContext): Current message context
             query (str): Original user query
+            progress (bool): Publish progress messages if enabled for the agent
+            messages (list[LLMMessage] | None): Where to add the tool results, the
+                turn's working messages by default
 
         Returns:
             str: Concatenated and validated responses from all tool calls
-
-        Raises:
-            ValueError: If a required tool is not found
         """
+        if messages is None:
+            messages = self._turn_messages
         final_response = ""
         tool_responses = []
         if isinstance(calls, list) and all(
@@ -538,27 +1210,77 @@ class OrchestratorAssistantAgent(RoutedAgent):
                 )
                 tool = next((tool for tool in tools if tool.name == call.name), None)
                 if tool is None:
-                    logger.error(
-                        f"[SoloOrchestratorAssistantAgent] Tool not found: {call.name}"
+                    # Reported back as the call's result instead of failing the turn
+                    logger.warning(
+                        f"[OrchestratorAssistantAgent.loop_calls] Tool not found: {call.name}"
+                    )
+                    error = format_unknown_tool_error(
+                        call.name, [known.name for known in tools]
+                    )
+                    final_response += error
+                    tool_responses.append(
+                        {
+                            "name": call.name,
+                            "arguments": call.arguments,
+                            "response": error,
+                            "values": {},
+                            "error": True,
+                        }
                     )
-                    raise ValueError(f"Tool not found: {call.name}")
+                    messages.append(
+                        SystemMessage(
+                            content=f"Tool {call.name} response: {error}",
+                            source=call.name,
+                        )
+                    )
+                    continue
                 logger.debug(
                     f"[SoloOrchestratorAssistantAgent] Running tool {call.name} with arguments: {call.arguments}"
                 )
                 arguments = json.loads(call.arguments)
-                output = await tool.run_json(arguments, ctx.cancellation_token)
+                try:
+                    output = await self._deadline.run(
+                        TOOLS,
+                        tool.run_json(arguments, self._deadline.cancellation_token),
+                    )
+                except StageOverrun:
+                    # Degraded answer: keep the results of the tools that finished
+                    self._turn_degraded = True
+                    logger.warning(
+                        f"[OrchestratorAssistantAgent.loop_calls] Skipping {call.name} and later calls, tool budget used up"
+                    )
+                    break
                 logger.debug(
                     f"[SoloOrchestratorAssistantAgent] Tool {call.name} completed with result: {output}"
                 )
                 final_response += f"{output.data}"
-                tool_response = {"name": call.name, "response": output.data}
+                tool_response = {
+                    "name": call.name,
+                    "arguments": call.arguments,
+                    "response": output.data,
+                    "values": getattr(output, "values", {}),
+                }
                 tool_responses.append(tool_response)
-                await self._model_context.add_message(
+                messages.append(
                     SystemMessage(
                         content=f"Tool {call.name} response: {output.data}",
                         source=call.name,
                     )
                 )
+                if self._show_progress and progress and len(calls) > 1:
+                    next_tool = calls[idx].name if idx < len(calls) else None
+                    await self.publish_message(
+                        ToolProgressMessage(
+                            source=self.metadata["type"],
+                            content=format_tool_progress(
+                                idx, len(calls), call.name, output.data, next_tool
+                            ),
+                            tool_name=call.name,
+                            step=idx,
+                            total_steps=len(calls),
+                        ),
+                        topic_id=DefaultTopicId("assistant_conversation"),
+                    )
         logger.debug(
             f"[SoloOrchestratorAssistantAgent] Final response: {final_response}"
         )
@@ -579,6 +1301,7 @@ class OrchestratorAssistantAgent(RoutedAgent):
         shield_task: str,
         context: list[LLMMessage],
         conversation_id: str,
+        record: bool = True,
     ) -> bool:
         """
         Validates if an LLM response properly answers the original query.
@@ -588,6 +1311,7 @@ class OrchestratorAssistantAgent(RoutedAgent):
             output_data (Any): The response data to validate
             shield_task (str): Shield service task identifier
             context (list[LLMMessage]): Current conversation context
+            record (bool): Add the validation request to the validator context
 
         Returns:
             bool: True if response is valid, False otherwise
@@ -606,20 +1330,42 @@ class OrchestratorAssistantAgent(RoutedAgent):
         logger.debug(
             f"[OrchestratorAssistantAgent.LLM_validation] Checking text: {check_text}"
         )
-        arthur_engine_response = await send_prompt_to_arthur_engine(
-            check_text, shield_task, conversation_id
+        # The prompt check and the validation call do not depend on each other
+        prompt_check = asyncio.ensure_future(
+            self._deadline.run(
+                ENGINE,
+                send_prompt_to_arthur_engine(check_text, shield_task, conversation_id),
+            )
         )
-        inference_id = arthur_engine_response["inference_id"]
 
         checking_message = SystemMessage(content=check_text)
-        await self._validator_context.add_message(checking_message)
-        validation_response = await self._model_client.create(
-            self._system_validation_message
-            + (await self._validator_context.get_messages()),
-            tools=[],
-        )
-        arthur_engine_message = await send_response_to_arthur_engine(
-            validation_response.content, shield_task, inference_id, context
+        if record:
+            self._validator_turn_messages.append(checking_message)
+            volatile = self._validator_turn_messages
+        else:
+            volatile = [*self._validator_turn_messages, checking_message]
+        try:
+            with llm_stage(VALIDATION):
+                validation_response = await self._deadline.run(
+                    VALIDATION,
+                    self._model_client.create(
+                        self._validation_prompt.assemble(
+                            await self._validator_context.get_messages(), volatile
+                        ),
+                        tools=[],
+                        cancellation_token=self._deadline.cancellation_token,
+                    ),
+                )
+        except BaseException:
+            prompt_check.cancel()
+            raise
+        inference_id = (await prompt_check)["inference_id"]
+        self._cache_stats.record(validation_response.usage, "validation")
+        arthur_engine_message = await self._deadline.run(
+            ENGINE,
+            send_response_to_arthur_engine(
+                validation_response.content, shield_task, inference_id, context
+            ),
         )
 
         logger.debug(
@@ -3,61 +3,68 @@ System prompts and messages for AI agents.
 Contains the core instructions and behavior definitions for each agent type.
 """
 
-ORCHESTRATOR_SYSTEM_MESSAGE = """
-                            I am an AI assistant, that helps you with parsing and understanding tasks into smaller tasks.
-                            This system comes with eight helpful financial tools.
-
-                            Available Tools:
-                            1. StockInfoTool:
-                               - Gets real-time and historical stock data
-                               - Parameters:
-                                 * symbol (required): Stock ticker symbol
-
-                            2. FinancialLiteracyTool:
-                               - Provides educational content and explanations about financial concepts
-                               - Parameters:
-                                 * topic (required): Financial concept to explain
-
-                            3. SentimentAnalysisTool:
-                               - Analyzes market sentiment from news and social media
-                               - Parameters:
-                                 * symbol (required): Stock ticker symbol
-
-                            4. PortfolioOptimizationTool:
-                               - Optimizes investment portfolios using modern portfolio theory
-                               - Parameters:
-                                 * symbols (required): List of stock symbols
-                                 * investment_amount (required): Total investment amount
-
-                            5. StockForecastTool:
-                               - Predicts future stock price movements using machine learning
-                               - Parameters:
-                                 * symbol (required): Stock ticker symbol
-                                 * days (required): Number of days to forecast
-
-                            6. OptionsPricingTool:
-                               - Calculates option prices and Greeks using Black-Scholes model
-                               - Parameters:
-                                 * symbol (required): Stock ticker symbol
-                                 * strike_price (required): Option strike price
-                                 * expiration_date (required): Option expiration date
-                                 * option_type (required): "call" or "put"
-
-                            7. StockScreenerTool:
-                               - Screens stocks based on specified criteria
-                               - Parameters:
-                                 * criteria (required): Dictionary of screening criteria
-                                 * market (required): Market to screen (e.g., "NYSE", "NASDAQ")
-
-
-                            I need to always try to split the task into smaller tasks that are listed above.
-                            Each task is going to be a single tool call.
-                            I will always be providing a JSON list where each element contains:
-                            - agent: the agent responsible for the task
-                            - task: the task to be performed
-                            - params: the parameters for the task
-                            Along with that I will provide a function call to the tool that is responsible for the task.
-                        """
+from collections.abc import Sequence
+
+from autogen_core.tools import BaseTool
+
+
+# Tool names and descriptions already reach the model through the ``tools=``
+# schemas, so the prompt only names each tool and its real parameters.
+ORCHESTRATOR_INSTRUCTIONS = (
+    "You are a financial assistant that splits the user's request into smaller "
+    "tasks. Each task is a single call to one of these tools: {tool_signatures}. "
+    "Reply with a JSON list whose elements have agent, task and params, and make "
+    "the matching tool calls."
+)
+
+
+def format_tool_signature(tool: BaseTool) -> str:
+    """
+    Formats a tool as ``name(param, ...)`` from its JSON schema.
+
+    Args:
+        tool (BaseTool): Registered tool
+
+    Returns:
+        str: Compact signature using the tool's real parameter names
+    """
+    parameters = tool.schema.get("parameters", {}).get("properties", {})
+    return f"{tool.name}({','.join(parameters)})"
+
+
+def build_orchestrator_system_message(tools: Sequence[BaseTool]) -> str:
+    """
+    Generates the orchestrator system prompt from the registered tools.
+
+    Args:
+        tools (Sequence[BaseTool]): Tools sent to the model with each planning call
+
+    Returns:
+        str: Minified system prompt listing each tool once, sorted by name
+    """
+    signatures = sorted({format_tool_signature(tool) for tool in tools})
+    return ORCHESTRATOR_INSTRUCTIONS.format(tool_signatures="; ".join(signatures))
+
+
+def format_unknown_tool_error(tool_name: str, tool_names: Sequence[str]) -> str:
+    """
+    Formats the result reported for a call to a tool that was not sent.
+
+    The system prompt names every tool, so the planner can still ask for one
+    the router left out, or make a name up.
+
+    Args:
+        tool_name (str): Tool the model asked for
+        tool_names (Sequence[str]): Tools sent with the planning call
+
+    Returns:
+        str: Error text used as the call's tool response
+    """
+    return (
+        f"Error: tool {tool_name} is not available. "
+        f"Available tools are: {', '.join(tool_names)}."
+    )
+
 
 VALIDATOR_SYSTEM_MESSAGE = """
                             I am an AI assistant specialized in resource management and validation. My responsibilities include:
@@ -104,3 +111,65 @@ def format_resolution_text(
                     validations are: {tool_validation_message}
                     The answer should be more readable. remove any introductions when answering.
                 """
+
+
+def format_partial_retry_text(
+    query: str,
+    validation_error: str,
+    failed_tools: Sequence[str],
+    kept_responses: Sequence[dict],
+    shield_results: str,
+) -> str:
+    """
+    Formats the correction prompt for a retry that re-plans only the failed parts.
+
+    Args:
+        query (str): The original user query
+        validation_error (str): LLM validation feedback, empty if it passed
+        failed_tools (Sequence[str]): Tools whose output failed the shield checks
+        kept_responses (Sequence[dict]): Tool responses that passed and are reused
+        shield_results (str): Shield validation summary of the last attempt
+
+    Returns:
+        str: Correction prompt asking only for the calls still needed
+    """
+    kept = "; ".join(
+        f"{response['name']}({response['arguments']}): {response['response']}"
+        for response in kept_responses
+    )
+    return f"""
+                    The initial query was: {query}
+                    These tool results passed validation and will be reused, do not call them again: {kept or "none"}
+                    These tools returned results that failed validation: {", ".join(failed_tools) or "none"}
+                    The answer validation error is: {validation_error or "none"}
+                    Shield validation results are: {shield_results}
+                    Call only the tools needed to fix the failed parts or fill what is missing.
+                """
+
+
+PROGRESS_SUMMARY_CHARS = 160
+
+
+def format_tool_progress(
+    step: int, total: int, tool_name: str, result: str, next_tool: str | None
+) -> str:
+    """
+    Formats a short progress update for a tool that just finished.
+
+    Args:
+        step (int): 1-based position of the finished tool call
+        total (int): Number of tool calls in the plan
+        tool_name (str): Name of the finished tool
+        result (str): The tool's output
+        next_tool (Optional[str]): Name of the tool that runs next, if any
+
+    Returns:
+        str: e.g. "[1/2] fetch_stock_data: The stock ... closed at $189.12 ... running options_pricing_calculator..."
+    """
+    summary = " ".join(str(result).split())
+    if len(summary) > PROGRESS_SUMMARY_CHARS:
+        summary = summary[: PROGRESS_SUMMARY_CHARS - 3].rstrip() + "..."
+    text = f"[{step}/{total}] {tool_name}: {summary}"
+    if next_tool is not None:
+        text += f" Running {next_tool}..."
+    return text
@@ -12,7 +12,13 @@ from autogen_core import (
 from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import AssistantMessage
 
-from src.core.messages import AssistantTextMessage, GetSlowUserMessage
+from src.core.messages import (
+    AssistantTextChunk,
+    AssistantTextMessage,
+    GetSlowUserMessage,
+    ToolProgressMessage,
+)
+from src.utils.user_io import render_progress, render_stream_chunk
 
 
 logger = logging.getLogger(__name__)
@@ -104,10 +110,49 @@ class SlowUserProxyAgent(RoutedAgent):
 
         logger.info("[SlowUserProxyAgent.handle_message] Publishing GetSlowUserMessage")
         await self.publish_message(
-            GetSlowUserMessage(content=message.content),
+            GetSlowUserMessage(content=message.content, streamed=message.streamed),
             topic_id=DefaultTopicId("assistant_conversation"),
         )
 
+    @message_handler
+    async def handle_chunk(
+        self, message: AssistantTextChunk, ctx: MessageContext
+    ) -> None:
+        """
+        Renders part of a streaming answer without asking the user for input.
+
+        The complete answer follows as an AssistantTextMessage, which is the
+        one added to the context. It is marked ``streamed`` unless the chunks
+        were withdrawn, so the question for the user does not repeat it.
+
+        Args:
+            message (AssistantTextChunk): The partial answer
+            ctx (MessageContext): Context information for the message
+
+        Returns:
+            None
+        """
+        render_stream_chunk(message.content, message.redact)
+
+    @message_handler
+    async def handle_progress(
+        self, message: ToolProgressMessage, ctx: MessageContext
+    ) -> None:
+        """
+        Renders an intermediate tool result without asking the user for input.
+
+        Args:
+            message (ToolProgressMessage): Progress update from the orchestrator
+            ctx (MessageContext): Context information for the message
+
+        Returns:
+            None
+        """
+        logger.debug(
+            f"[SlowUserProxyAgent.handle_progress] Step {message.step}/{message.total_steps}: {message.tool_name}"
+        )
+        render_progress(message.content)
+
     async def save_state(self) -> Mapping[str, Any]:
         """
         Persists the agent's current state and conversation context.
@@ -2,15 +2,23 @@
 Core functionality for message handling, persistence, and system operations.
 """
 
+from src.core.answer_cache import TurnAnswerCache
+from src.core.deadline import StageOverrun, TurnDeadline, turn_overruns
+from src.core.grounding import NumericVerifier
 from src.core.handlers import NeedsUserInputHandler, TerminationHandler
 from src.core.messages import AssistantTextMessage, UserTextMessage
 from src.core.persistence import MockPersistence
 
 
 __all__ = [
+    "AssistantTextMessage",
+    "MockPersistence",
     "NeedsUserInputHandler",
+    "NumericVerifier",
+    "StageOverrun",
     "TerminationHandler",
-    "AssistantTextMessage",
+    "TurnAnswerCache",
+    "TurnDeadline",
     "UserTextMessage",
-    "MockPersistence",
+    "turn_overruns",
 ]
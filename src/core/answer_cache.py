@@ -0,0 +1,244 @@
+"""
+Turn-level answer cache for repeated user questions.
+
+Many users ask the same thing ("AAPL price today", "explain compound
+interest"). When a turn's final answer has passed every Arthur Evaluation
+Engine check, it is stored under the normalized query and the user's previous
+messages in the conversation, together with the tool plan that produced it:
+the tools that actually ran and the tickers they were called with. A later
+identical question asked after the same messages is answered directly,
+skipping both LLM calls, the tools and the engine round-trips. The previous
+messages keep follow-ups such as "and the put?" from being answered with
+another conversation's answer.
+
+Entries expire after the shortest TTL of the tools in their plan and are
+dropped as soon as the market data version (latest bar and close) of any of
+their tickers changes. Degraded or unchecked answers are never stored.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+import hashlib
+import json
+import re
+import time
+
+from src.tools.market_data import MarketDataVersions, market_data_versions
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Seconds an answer built from each tool stays valid. A TTL of 0 disables
+# caching for plans that include the tool.
+DEFAULT_TOOL_TTLS: dict[str, float] = {
+    "explain_finance": 24 * 3600,
+    "fetch_stock_data": 60,
+    "options_pricing_calculator": 300,
+    "predict_stock_price": 3600,
+    "optimize_portfolio": 3600,
+    "ai_powered_stock_screener": 3600,
+    # Sentiment scores are regenerated on every call
+    "analyze_sentiment": 0,
+}
+DEFAULT_TTL = 300
+# Previous user messages of the conversation that are part of the key
+DEFAULT_CONTEXT_MESSAGES = 2
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a question so trivial variations share a cache entry.
+
+    Lower-cases, drops punctuation other than ``$``, ``.`` and ``-`` and
+    collapses whitespace, e.g. "AAPL price today?" -> "aapl price today".
+    """
+    text = re.sub(r"[^\w\s$.-]", " ", query.lower())
+    return " ".join(text.split()).strip(".")
+
+
+def executed_plan(calls: Iterable[Mapping]) -> tuple[list[str], list[str]]:
+    """
+    Extracts the tool plan of a turn from the tool calls that ran.
+
+    Args:
+        calls (Iterable[Mapping]): Executed calls with ``name`` and JSON ``arguments``
+
+    Returns:
+        tuple[list[str], list[str]]: Tool names and the tickers they were called with
+    """
+    tool_names, tickers = [], []
+    for call in calls:
+        tool_names.append(call["name"])
+        try:
+            arguments = json.loads(call.get("arguments") or "{}")
+        except json.JSONDecodeError:
+            continue
+        ticker = arguments.get("ticker") if isinstance(arguments, dict) else None
+        if isinstance(ticker, str) and ticker:
+            tickers.append(ticker.upper())
+    return list(dict.fromkeys(tool_names)), list(dict.fromkeys(tickers))
+
+
+@dataclass
+class CachedAnswer:
+    """
+    A validated final answer and what it depended on.
+
+    Attributes:
+        answer (str): Final answer shown to the user, without the trace ID
+        expires_at (float): Clock time after which the entry is stale
+        versions (dict[str, str | None]): Market data version per ticker at store time
+        plan (str): Signature of the tool plan that produced the answer
+    """
+
+    answer: str
+    expires_at: float
+    versions: dict[str, str | None] = field(default_factory=dict)
+    plan: str = ""
+
+
+class TurnAnswerCache:
+    """
+    LRU of validated final answers keyed by query and conversation.
+
+    Attributes:
+        _tool_ttls: Seconds each tool's output stays fresh
+        _default_ttl: TTL for tools missing from ``_tool_ttls``
+        _max_entries: Capacity of the LRU
+        _context_messages: Previous user messages included in the key
+        _versions: Market data versions used for invalidation
+        _clock: Monotonic time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        tool_ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: int = 512,
+        context_messages: int = DEFAULT_CONTEXT_MESSAGES,
+        versions: MarketDataVersions = market_data_versions,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._tool_ttls = dict(DEFAULT_TOOL_TTLS if tool_ttls is None else tool_ttls)
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._context_messages = context_messages
+        self._versions = versions
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedAnswer] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def plan_signature(tool_names: Iterable[str], tickers: Iterable[str]) -> str:
+        """Returns an order-independent signature of a tool plan."""
+        tools = ",".join(sorted(set(tool_names)))
+        symbols = ",".join(sorted({ticker.upper() for ticker in tickers}))
+        return f"{tools}|{symbols}"
+
+    def key(self, query: str, context: Sequence[str] = ()) -> str:
+        """
+        Hashes a query and the most recent previous messages.
+
+        The tool plan is not part of the key: it is only known once the tools
+        have run, so it is stored with the entry and drives its TTL and
+        invalidation instead.
+
+        Args:
+            query (str): The user's question
+            context (Sequence[str]): The user's previous messages, oldest first;
+                only the last ``_context_messages`` count
+
+        Returns:
+            str: Hex digest identifying the entry
+        """
+        recent = (
+            list(context)[-self._context_messages :] if self._context_messages else []
+        )
+        raw = "\n".join(
+            [normalize_query(query), *(normalize_query(message) for message in recent)]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, tool_names: Iterable[str]) -> float:
+        """Returns the shortest TTL across the tools in a plan."""
+        return min(
+            (self._tool_ttls.get(name, self._default_ttl) for name in tool_names),
+            default=self._default_ttl,
+        )
+
+    def get(self, query: str, context: Sequence[str] = ()) -> str | None:
+        """
+        Looks up a validated answer for a query.
+
+        Args:
+            query (str): The user's question
+            context (Sequence[str]): The user's previous messages, oldest first
+
+        Returns:
+            Optional[str]: The cached answer, or None if missing or stale
+        """
+        key = self.key(query, context)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stale_versions = self._versions.snapshot(entry.versions) != entry.versions
+        if self._clock() >= entry.expires_at or stale_versions:
+            logger.debug(
+                f"[TurnAnswerCache.get] Dropping stale entry for plan {entry.plan} (market data changed: {stale_versions})"
+            )
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.info(f"[TurnAnswerCache.get] Answer cache hit ({self.hits} total)")
+        return entry.answer
+
+    def put(
+        self,
+        query: str,
+        tool_names: Iterable[str],
+        tickers: Iterable[str],
+        answer: str,
+        context: Sequence[str] = (),
+    ) -> bool:
+        """
+        Stores a validated answer with the tool plan that produced it.
+
+        Args:
+            query (str): The user's question
+            tool_names (Iterable[str]): Tools that ran for the answer, see ``executed_plan``
+            tickers (Iterable[str]): Tickers those tools were called with
+            answer (str): Final answer that passed every engine check
+            context (Sequence[str]): The user's previous messages, oldest first
+
+        Returns:
+            bool: False if the plan's TTL is 0 and nothing was stored
+        """
+        tool_names = list(tool_names)
+        tickers = list(tickers)
+        ttl = self.ttl_for(tool_names)
+        if ttl <= 0:
+            return False
+
+        key = self.key(query, context)
+        self._entries[key] = CachedAnswer(
+            answer=answer,
+            expires_at=self._clock() + ttl,
+            versions=self._versions.snapshot(tickers),
+            plan=self.plan_signature(tool_names, tickers),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self) -> None:
+        """Drops every cached answer."""
+        self._entries.clear()
@@ -0,0 +1,203 @@
+"""
+Per-turn deadline split into stage budgets.
+
+Nothing else bounds how long a turn takes: a hung yfinance call or engine
+request would block the user indefinitely. ``TurnDeadline`` gives each stage
+of a turn a share of the overall deadline. Work for a stage runs through
+``TurnDeadline.run``, which cancels it when the stage's budget (or what is
+left of the turn) runs out and raises ``StageOverrun`` so the orchestrator can
+fall back to a degraded answer. Every overrun is recorded in ``OverrunLog``
+with the stage that caused it.
+
+The deadline also owns a ``CancellationToken`` linked to the message's token;
+LLM and tool calls receive it so cancelling the turn reaches them too.
+"""
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+import time
+from typing import TypeVar
+
+from autogen_core import CancellationToken
+
+from src.llm.stages import PLANNING, RESOLUTION, VALIDATION
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Budgeted stages besides the LLM stages
+TOOLS = "tools"
+ENGINE = "engine"
+
+DEFAULT_TURN_DEADLINE = 90.0
+# Share of the turn deadline each stage may use. Engine checks gate the
+# answer, so they get a share of their own rather than what tools leave over.
+DEFAULT_STAGE_SHARES: dict[str, float] = {
+    PLANNING: 0.3,
+    TOOLS: 0.25,
+    ENGINE: 0.25,
+    VALIDATION: 0.1,
+    RESOLUTION: 0.1,
+}
+
+DEGRADED_ANSWER = (
+    "I could not finish answering in time. Please try again or ask a narrower question."
+)
+
+
+class StageOverrun(TimeoutError):
+    """
+    Raised when a stage uses up its budget.
+
+    Attributes:
+        stage (str): Stage that overran
+        budget (float): Seconds the stage had left when the work started
+    """
+
+    def __init__(self, stage: str, budget: float) -> None:
+        super().__init__(f"Stage {stage} exceeded its budget of {budget:.1f}s")
+        self.stage = stage
+        self.budget = budget
+
+
+@dataclass(frozen=True)
+class OverrunEvent:
+    """
+    A stage that ran out of budget.
+
+    Attributes:
+        conversation_id (str): Turn the overrun happened in
+        stage (str): Stage that overran
+        budget (float): Seconds the stage had left
+        elapsed (float): Seconds the work ran before it was cancelled
+        timestamp (float): Wall-clock time of the overrun
+    """
+
+    conversation_id: str
+    stage: str
+    budget: float
+    elapsed: float
+    timestamp: float
+
+
+class OverrunLog:
+    """
+    Keeps recent overrun events and a count per stage.
+
+    Attributes:
+        events (deque[OverrunEvent]): Most recent events
+        by_stage (Counter): Overruns per stage since start-up
+    """
+
+    def __init__(self, max_events: int = 500) -> None:
+        self.events: deque[OverrunEvent] = deque(maxlen=max_events)
+        self.by_stage: Counter = Counter()
+
+    def record(
+        self, conversation_id: str, stage: str, budget: float, elapsed: float
+    ) -> OverrunEvent:
+        event = OverrunEvent(conversation_id, stage, budget, elapsed, time.time())
+        self.events.append(event)
+        self.by_stage[stage] += 1
+        logger.warning(
+            f"[OverrunLog.record] Turn {conversation_id}: {stage} overran its {budget:.1f}s budget after {elapsed:.1f}s"
+        )
+        return event
+
+
+turn_overruns = OverrunLog()
+
+
+class TurnDeadline:
+    """
+    Deadline for one turn, split into stage budgets.
+
+    Attributes:
+        total (float): Seconds the whole turn may take
+        cancellation_token (CancellationToken): Token handed to LLM and tool calls
+        _budgets: Seconds each stage may use in total
+        _spent: Seconds each stage has used so far; overlapping calls of one
+            stage are charged once, by wall-clock time
+        _active: Calls of each stage currently running, and since when
+    """
+
+    def __init__(
+        self,
+        total: float = DEFAULT_TURN_DEADLINE,
+        stage_shares: Mapping[str, float] = DEFAULT_STAGE_SHARES,
+        conversation_id: str = "",
+        parent_token: CancellationToken | None = None,
+        overruns: OverrunLog | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total = total
+        self.conversation_id = conversation_id
+        self._budgets = {stage: share * total for stage, share in stage_shares.items()}
+        self._spent: dict[str, float] = {}
+        self._active: dict[str, tuple[int, float]] = {}
+        self._overruns = overruns if overruns is not None else turn_overruns
+        self._clock = clock
+        self._started = clock()
+        self.cancellation_token = CancellationToken()
+        if parent_token is not None:
+            parent_token.add_callback(self.cancellation_token.cancel)
+
+    def remaining(self) -> float:
+        """Returns the seconds left for the whole turn."""
+        return self.total - (self._clock() - self._started)
+
+    def stage_remaining(self, stage: str) -> float:
+        """Returns the seconds left for ``stage``, capped by the turn deadline."""
+        spent = self._spent.get(stage, 0.0)
+        if stage in self._active:
+            spent += self._clock() - self._active[stage][1]
+        return min(self._budgets.get(stage, self.total) - spent, self.remaining())
+
+    async def run(self, stage: str, work: Awaitable[T]) -> T:
+        """
+        Awaits ``work`` within the budget left for ``stage``.
+
+        Args:
+            stage (str): Stage the work belongs to
+            work (Awaitable[T]): LLM, tool or engine call to bound
+
+        Returns:
+            T: Result of the work
+
+        Raises:
+            StageOverrun: If the budget runs out; the work is cancelled
+        """
+        budget = self.stage_remaining(stage)
+        started = self._clock()
+        running, since = self._active.get(stage, (0, started))
+        self._active[stage] = (running + 1, since)
+        try:
+            if budget <= 0:
+                if asyncio.iscoroutine(work):
+                    work.close()
+                raise TimeoutError
+            return await asyncio.wait_for(work, budget)
+        except TimeoutError as e:
+            elapsed = self._clock() - started
+            if budget > 0 and elapsed < budget:
+                # A timeout raised by the work itself, not by this budget
+                raise
+            self._overruns.record(
+                self.conversation_id, stage, max(budget, 0.0), elapsed
+            )
+            raise StageOverrun(stage, max(budget, 0.0)) from e
+        finally:
+            running, since = self._active.pop(stage)
+            if running > 1:
+                self._active[stage] = (running - 1, since)
+            else:
+                self._spent[stage] = self._spent.get(stage, 0.0) + self._clock() - since
+
+    def cancel(self) -> None:
+        """Cancels every call still linked to this turn's token."""
+        self.cancellation_token.cancel()
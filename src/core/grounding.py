@@ -0,0 +1,189 @@
+"""
+Deterministic check of the numbers in an answer against structured tool results.
+
+Tools such as ``StockInfoTool`` and ``OptionsPricingTool`` return the values
+behind their formatted text (prices, volume, rates) alongside it. When every
+number in a candidate answer matches one of those values, or a number the
+user supplied, the answer is grounded: asking the LLM whether it is
+"factually correct" adds a full completion without adding information. The
+validator skips that call for grounded answers that also passed the Arthur
+Evaluation Engine checks.
+
+Numbers are matched at the precision they are written with, so ``$189.12``
+matches a close of ``189.1234``; percentages also match their fraction and
+``K``/``M``/``B``/``T`` suffixes are expanded.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+import math
+import re
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# A number with optional thousands separators, decimals, scale suffix or percent
+NUMBER_PATTERN = re.compile(
+    r"(?<![\w.])-?\d{1,3}(?:,\d{3})+(?:\.\d+)?(?:\s?[KMBT]\b|%)?"
+    r"|(?<![\w.])-?\d+(?:\.\d+)?(?:\s?[KMBT]\b|%)?"
+)
+SCALES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+# Relative difference still accepted for numbers written without decimals
+DEFAULT_REL_TOLERANCE = 0.005
+
+
+@dataclass(frozen=True)
+class NumericClaim:
+    """
+    A number stated in text.
+
+    Attributes:
+        text (str): The number as written, e.g. ``"52,345,678"`` or ``"4.5%"``
+        value (float): Parsed value before any percent or suffix scaling
+        decimals (int): Decimal places written, the precision to match at
+        scale (float): Multiplier of a ``K``/``M``/``B``/``T`` suffix, else 1
+        percent (bool): Whether the number was written as a percentage
+    """
+
+    text: str
+    value: float
+    decimals: int
+    scale: float = 1.0
+    percent: bool = False
+
+    def renderings(self, value: float) -> list[float]:
+        """Returns ``value`` in each form this claim may have written it in."""
+        forms = [value]
+        if self.scale != 1.0:
+            forms.append(value / self.scale)
+        if self.percent:
+            # Fractions written as percentages, e.g. 0.0432 -> 4.32%
+            forms.append(value * 100)
+        return forms
+
+
+@dataclass
+class GroundingReport:
+    """
+    Result of checking an answer's numbers.
+
+    Attributes:
+        grounded (list[NumericClaim]): Claims matched by a tool value or the query
+        ungrounded (list[NumericClaim]): Claims nothing supports
+    """
+
+    grounded: list[NumericClaim] = field(default_factory=list)
+    ungrounded: list[NumericClaim] = field(default_factory=list)
+
+    @property
+    def all_grounded(self) -> bool:
+        """True if the answer states numbers and every one of them is supported."""
+        return bool(self.grounded) and not self.ungrounded
+
+    def summary(self) -> str:
+        return f"{len(self.grounded)} grounded, {len(self.ungrounded)} ungrounded" + (
+            f" ({[c.text for c in self.ungrounded]})" if self.ungrounded else ""
+        )
+
+
+def extract_numbers(text: str) -> list[NumericClaim]:
+    """
+    Finds the numbers stated in text.
+
+    Args:
+        text (str): Answer, query or argument text
+
+    Returns:
+        list[NumericClaim]: Every number in order of appearance
+    """
+    claims = []
+    for match in NUMBER_PATTERN.finditer(text):
+        written = match.group(0)
+        number = written.rstrip("%KMBT ").replace(",", "")
+        suffix = written[-1]
+        decimals = len(number.split(".")[1]) if "." in number else 0
+        claims.append(
+            NumericClaim(
+                text=written,
+                value=float(number),
+                decimals=decimals,
+                scale=SCALES.get(suffix, 1.0),
+                percent=suffix == "%",
+            )
+        )
+    return claims
+
+
+def matches(claim: NumericClaim, value: float, rel_tolerance: float) -> bool:
+    """
+    Checks whether a stated number agrees with a known value.
+
+    Args:
+        claim (NumericClaim): Number from the answer
+        value (float): Value from a tool result or the query
+        rel_tolerance (float): Relative difference accepted for whole numbers
+
+    Returns:
+        bool: True if the claim is the value written at the claim's precision
+    """
+    if not math.isfinite(value):
+        return False
+    for form in claim.renderings(value):
+        if round(form, claim.decimals) == claim.value:
+            return True
+        if claim.decimals == 0 and math.isclose(
+            form, claim.value, rel_tol=rel_tolerance
+        ):
+            return True
+    return False
+
+
+class NumericVerifier:
+    """
+    Checks the numbers in a candidate answer against structured tool results.
+
+    Attributes:
+        rel_tolerance (float): Relative difference accepted for whole numbers
+    """
+
+    def __init__(self, rel_tolerance: float = DEFAULT_REL_TOLERANCE) -> None:
+        self.rel_tolerance = rel_tolerance
+
+    def verify(
+        self,
+        answer: str,
+        tool_values: Iterable[Mapping[str, float]],
+        known_texts: Iterable[str] = (),
+    ) -> GroundingReport:
+        """
+        Matches every number in the answer against the tool values.
+
+        Args:
+            answer (str): Candidate answer
+            tool_values (Iterable[Mapping[str, float]]): Structured results of
+                the tools the answer was built from
+            known_texts (Iterable[str]): Text whose numbers need no support,
+                e.g. the user query and the tool call arguments
+
+        Returns:
+            GroundingReport: Grounded and ungrounded claims
+        """
+        values = [
+            float(value)
+            for result in tool_values
+            for value in result.values()
+            if isinstance(value, int | float)
+        ]
+        for text in known_texts:
+            values.extend(claim.value for claim in extract_numbers(text))
+
+        report = GroundingReport()
+        for claim in extract_numbers(answer):
+            if any(matches(claim, value, self.rel_tolerance) for value in values):
+                report.grounded.append(claim)
+            else:
+                report.ungrounded.append(claim)
+        logger.debug(f"[NumericVerifier.verify] {report.summary()}")
+        return report
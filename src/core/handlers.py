@@ -76,6 +76,10 @@ class NeedsUserInputHandler(DefaultInterventionHandler):
             return None
         return self.question_for_user.content
 
+    @property
+    def user_input_streamed(self) -> bool:
+        return self.question_for_user is not None and self.question_for_user.streamed
+
 
 class TerminationHandler(DefaultInterventionHandler):
     """
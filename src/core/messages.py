@@ -11,6 +11,8 @@ Classes:
     TerminateMessage: Message class for conversation termination
     UserTextMessage: Specialized class for user messages
     AssistantTextMessage: Specialized class for assistant messages
+    AssistantTextChunk: Partial assistant answer published while it streams
+    ToolProgressMessage: Intermediate result published as each tool finishes
 """
 
 from dataclasses import dataclass
@@ -41,9 +43,11 @@ class GetSlowUserMessage:
 
     Attributes:
         content (str): The message or prompt to show to the user
+        streamed (bool): True when the content was already shown as it streamed
     """
 
     content: str
+    streamed: bool = False
 
 
 @dataclass
@@ -76,6 +80,44 @@ class AssistantTextMessage(TextMessage):
     Represents a message from the AI assistant in the conversation.
     Inherits from TextMessage and maintains the same structure.
     Used to differentiate assistant messages from other message types.
+
+    Attributes:
+        streamed (bool): True when the answer was already shown as it streamed
     """
 
-    pass
+    streamed: bool = False
+
+
+@dataclass
+class AssistantTextChunk(AssistantTextMessage):
+    """
+    A partial assistant answer, published while the final answer streams in.
+    Rendered as it arrives; it does not ask the user for input. The complete,
+    checked answer still follows as an AssistantTextMessage, marked
+    ``streamed`` so it is not shown twice.
+
+    Attributes:
+        conversation_id (str): Trace ID of the turn the chunk belongs to
+        redact (bool): True when the text streamed so far must be withdrawn;
+            ``content`` then says why
+    """
+
+    conversation_id: str = ""
+    redact: bool = False
+
+
+@dataclass
+class ToolProgressMessage(TextMessage):
+    """
+    Intermediate result published while a multi-tool plan runs.
+    Rendered as it arrives; it does not ask the user for input.
+
+    Attributes:
+        tool_name (str): Tool that just finished
+        step (int): 1-based position of the tool call in the plan
+        total_steps (int): Number of tool calls in the plan
+    """
+
+    tool_name: str = ""
+    step: int = 0
+    total_steps: int = 0
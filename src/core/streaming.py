@@ -0,0 +1,134 @@
+"""
+Gating for answers streamed to the user before they are fully checked.
+
+The final answer is only checked by the Arthur Evaluation Engine once the
+resolution completion has finished, but users judge speed by the time to the
+first token. ``StreamGate`` sits between ``create_stream`` and the user:
+
+- ``off``: nothing is streamed; the checked answer is published as before
+- ``hold``: chunks are buffered and never shown; only the checked answer is
+- ``stream``: chunks are published as they arrive; if the engine verdict then
+  fails, a redaction chunk withdraws them before the blocked answer is sent.
+  The same happens when the turn overruns and a degraded answer replaces the
+  one being streamed
+
+In ``stream`` mode the gate also holds back output as soon as an earlier
+verdict for the turn (e.g. the prompt check) has already failed.
+"""
+
+from collections.abc import Awaitable, Callable
+import time
+
+from src.core.messages import AssistantTextChunk
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+STREAM_OFF = "off"
+STREAM_HOLD = "hold"
+STREAM_ON = "stream"
+STREAM_POLICIES = (STREAM_OFF, STREAM_HOLD, STREAM_ON)
+
+
+class StreamGate:
+    """
+    Decides which streamed chunks of a turn's answer reach the user.
+
+    Attributes:
+        policy (str): One of ``STREAM_POLICIES``
+        conversation_id (str): Trace ID of the turn
+        held (bool): True once output is being held back
+        text (str): Everything received from the stream so far
+        time_to_first_chunk (Optional[float]): Seconds from the gate's creation
+            to the first published chunk
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[AssistantTextChunk], Awaitable[None]],
+        policy: str = STREAM_ON,
+        conversation_id: str = "",
+        source: str = "Orchestrator",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if policy not in STREAM_POLICIES:
+            raise ValueError(
+                f"Unknown stream policy {policy!r}, use one of {STREAM_POLICIES}"
+            )
+        self.policy = policy
+        self.conversation_id = conversation_id
+        self.held = policy != STREAM_ON
+        self.text = ""
+        self.time_to_first_chunk: float | None = None
+        self._publish = publish
+        self._source = source
+        self._clock = clock
+        self._started = clock()
+        self._published = False
+
+    @property
+    def shown(self) -> bool:
+        """True if streamed output reached the user and was not withdrawn."""
+        return self._published
+
+    @property
+    def streaming(self) -> bool:
+        """True if the answer should be requested with ``create_stream``."""
+        return self.policy != STREAM_OFF
+
+    def hold(self, reason: str) -> None:
+        """Stops publishing chunks for the rest of the turn."""
+        if not self.held:
+            logger.info(f"[StreamGate.hold] Holding streamed output: {reason}")
+        self.held = True
+
+    async def feed(self, chunk: str) -> None:
+        """
+        Receives one chunk from the stream and publishes it unless held.
+
+        Args:
+            chunk (str): Text delta from ``create_stream``
+        """
+        self.text += chunk
+        if self.held or not chunk:
+            return
+        if self.time_to_first_chunk is None:
+            self.time_to_first_chunk = self._clock() - self._started
+            logger.info(
+                f"[StreamGate.feed] Time to first chunk: {self.time_to_first_chunk:.2f}s"
+            )
+        self._published = True
+        await self._publish(self._chunk(chunk))
+
+    async def settle(self, passed: bool) -> None:
+        """
+        Applies the engine verdict on the complete answer.
+
+        Args:
+            passed (bool): Whether the answer passed the engine checks
+        """
+        if passed:
+            return
+        await self.abort("it did not pass the safety checks")
+
+    async def abort(self, reason: str) -> None:
+        """
+        Withdraws the streamed output, e.g. before a different answer replaces it.
+
+        Args:
+            reason (str): Why the output is withdrawn, shown to the user
+        """
+        self.hold(reason)
+        if self._published:
+            logger.info(f"[StreamGate.abort] Withdrawing streamed output: {reason}")
+            self._published = False
+            await self._publish(self._chunk(reason, redact=True))
+
+    def _chunk(self, content: str, redact: bool = False) -> AssistantTextChunk:
+        return AssistantTextChunk(
+            source=self._source,
+            content=content,
+            conversation_id=self.conversation_id,
+            redact=redact,
+        )
@@ -145,6 +145,12 @@ class InferenceResult:
             if rule.details is not None
         ]
 
+    def all_rules_passed(self) -> bool:
+        """
+        Returns True if every rule passed, or if no rules were evaluated.
+        """
+        return all(rule.result_boolean for rule in self.rule_results)
+
     def get_inference_id(self) -> str:
         """
         Returns the inference ID.
@@ -0,0 +1,53 @@
+"""
+LLM client construction, wrappers, prompt assembly and usage accounting.
+"""
+
+from src.llm.base import ChatCompletionClientWrapper
+from src.llm.caching import CachingChatCompletionClient, CompletionCacheStats
+from src.llm.config import build_model_client, load_model_config
+from src.llm.pool import Deployment, PooledChatCompletionClient
+from src.llm.prompt_layout import (
+    CompactingChatCompletionContext,
+    PromptAssembler,
+    PromptCacheStats,
+)
+from src.llm.rate_limit import (
+    LLMRateLimiter,
+    RateLimitedChatCompletionClient,
+    RateLimiterStats,
+    get_shared_rate_limiter,
+)
+from src.llm.routing import (
+    ModelPricing,
+    StageRoutedChatCompletionClient,
+    StageRoutingStats,
+)
+from src.llm.stages import PLANNING, RESOLUTION, VALIDATION, llm_session, llm_stage
+from src.llm.tokens import count_tokens
+
+
+__all__ = [
+    "PLANNING",
+    "RESOLUTION",
+    "VALIDATION",
+    "CachingChatCompletionClient",
+    "ChatCompletionClientWrapper",
+    "CompactingChatCompletionContext",
+    "CompletionCacheStats",
+    "Deployment",
+    "LLMRateLimiter",
+    "ModelPricing",
+    "PooledChatCompletionClient",
+    "PromptAssembler",
+    "PromptCacheStats",
+    "RateLimitedChatCompletionClient",
+    "RateLimiterStats",
+    "StageRoutedChatCompletionClient",
+    "StageRoutingStats",
+    "build_model_client",
+    "count_tokens",
+    "get_shared_rate_limiter",
+    "llm_session",
+    "llm_stage",
+    "load_model_config",
+]
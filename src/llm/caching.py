@@ -0,0 +1,226 @@
+"""
+Exact-match completion cache for ``ChatCompletionClient``.
+
+Development replays, evaluation runs and popular repeated questions send
+byte-identical requests to the model. ``CachingChatCompletionClient`` hashes
+the canonicalized messages, tool schemas and create arguments and answers
+repeats from an in-memory LRU, backed by an optional on-disk tier that
+survives restarts.
+
+Key Components:
+- canonical_request_key: Stable hash of everything that affects a completion
+- CompletionCacheStats: Hits, misses, bypasses and tokens saved
+- CachingChatCompletionClient: Wrapper serving repeats from the cache
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from autogen_core import CancellationToken
+from autogen_core.models import ChatCompletionClient, CreateResult, LLMMessage
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import ValidationError
+
+from src.llm.base import ChatCompletionClientWrapper
+from src.llm.stages import current_llm_stage
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Only completions that ended normally are worth replaying
+CACHEABLE_FINISH_REASONS = {"stop", "function_calls"}
+
+
+def _tool_schema(tool: Tool | ToolSchema) -> Mapping[str, Any]:
+    return tool if isinstance(tool, Mapping) else tool.schema
+
+
+def canonical_request_key(
+    messages: Sequence[LLMMessage],
+    tools: Sequence[Tool | ToolSchema] = (),
+    json_output: bool | None = None,
+    extra_create_args: Mapping[str, Any] | None = None,
+    namespace: str = "",
+) -> str:
+    """
+    Hashes a completion request into a cache key.
+
+    Messages are serialized through their Pydantic models and every mapping is
+    dumped with sorted keys, so two requests that would produce the same
+    provider payload always get the same key.
+
+    Args:
+        messages (Sequence[LLMMessage]): Messages sent to the model
+        tools (Sequence[Tool | ToolSchema]): Tools or tool schemas sent with the request
+        json_output (Optional[bool]): JSON mode override
+        extra_create_args (Optional[Mapping[str, Any]]): Provider create arguments
+        namespace (str): Separates caches of different models or deployments
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical request
+    """
+    payload = {
+        "namespace": namespace,
+        "messages": [message.model_dump(mode="json") for message in messages],
+        "tools": [_tool_schema(tool) for tool in tools],
+        "json_output": json_output,
+        "extra_create_args": dict(extra_create_args or {}),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CompletionCacheStats:
+    """
+    Counters for the completion cache.
+
+    Attributes:
+        hits (int): Requests answered from memory or disk
+        misses (int): Requests sent to the wrapped client
+        bypassed (int): Requests that skipped the cache because of their stage
+        saved_prompt_tokens (int): Prompt tokens not sent thanks to hits
+        saved_completion_tokens (int): Completion tokens not generated thanks to hits
+    """
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    saved_prompt_tokens: int = 0
+    saved_completion_tokens: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.saved_prompt_tokens + self.saved_completion_tokens
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses, {self.bypassed} bypassed, "
+            f"{self.saved_tokens} tokens saved ({self.hit_ratio:.1%} hit ratio)"
+        )
+
+
+class CachingChatCompletionClient(ChatCompletionClientWrapper):
+    """
+    Serves repeated completion requests from an LRU and optional disk cache.
+
+    Attributes:
+        _max_entries: Capacity of the in-memory LRU
+        _cache_dir: Directory for the on-disk tier, or None for memory only
+        _bypass_stages: Stages (see ``src.llm.stages``) that are never cached
+        _namespace: Key prefix separating models that share a cache directory
+        stats: Hit, miss and saved-token counters
+    """
+
+    def __init__(
+        self,
+        inner: ChatCompletionClient,
+        max_entries: int = 256,
+        cache_dir: str | Path | None = None,
+        bypass_stages: Iterable[str] = (),
+        namespace: str = "",
+    ) -> None:
+        super().__init__(inner)
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, CreateResult] = OrderedDict()
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._bypass_stages = set(bypass_stages)
+        self._namespace = namespace
+        self.stats = CompletionCacheStats()
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> CreateResult:
+        stage = current_llm_stage()
+        if stage in self._bypass_stages:
+            self.stats.bypassed += 1
+            logger.debug(f"[CachingChatCompletionClient.create] Bypassing for {stage}")
+            return await super().create(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            )
+
+        key = canonical_request_key(
+            messages, tools, json_output, extra_create_args, self._namespace
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            self.stats.hits += 1
+            self.stats.saved_prompt_tokens += cached.usage.prompt_tokens
+            self.stats.saved_completion_tokens += cached.usage.completion_tokens
+            logger.info(
+                f"[CachingChatCompletionClient.create] Cache hit for {stage}: {self.stats.summary()}"
+            )
+            return cached.model_copy(update={"cached": True})
+
+        result = await super().create(
+            messages,
+            tools=tools,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+        self.stats.misses += 1
+        if result.finish_reason in CACHEABLE_FINISH_REASONS:
+            self._store(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Empties the in-memory tier; the disk tier is left untouched."""
+        self._memory.clear()
+
+    def _lookup(self, key: str) -> CreateResult | None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self._cache_dir is None:
+            return None
+
+        path = self._cache_dir / f"{key}.json"
+        if not path.exists():
+            return None
+        try:
+            result = CreateResult.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError) as e:
+            logger.error(f"[CachingChatCompletionClient._lookup] Unreadable {path}: {e}")
+            return None
+        self._remember(key, result)
+        return result
+
+    def _store(self, key: str, result: CreateResult) -> None:
+        self._remember(key, result)
+        if self._cache_dir is None:
+            return
+        path = self._cache_dir / f"{key}.json"
+        try:
+            path.write_text(result.model_dump_json(), encoding="utf-8")
+        except OSError as e:
+            logger.error(f"[CachingChatCompletionClient._store] Could not write {path}: {e}")
+
+    def _remember(self, key: str, result: CreateResult) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
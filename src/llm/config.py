@@ -0,0 +1,202 @@
+"""
+Builds the model client used by the agents from the model configuration file.
+
+The file at ``MODEL_CONFIG_PATH`` holds either an AutoGen component config
+(``provider`` and ``config``) or a ``deployments`` list of them, each with
+optional ``name``, ``max_concurrency`` and ``weight`` keys. Several
+deployments are served through a ``PooledChatCompletionClient``. Optional
+top-level sections add wrappers around that client:
+
+- ``pool``: pool settings, e.g. ``{"request_timeout": 60, "cooldown": 10}``
+- ``rate_limit``: shared TPM/RPM limiter, e.g.
+  ``{"tokens_per_minute": 90000, "requests_per_minute": 540}``; add
+  ``state_file`` to share the quota between processes
+- ``cache``: exact-match completion cache, e.g.
+  ``{"max_entries": 256, "cache_dir": ".cache/llm", "bypass_stages": ["validation"]}``
+
+Wrappers are applied in that order, so cache hits never consume rate-limit quota.
+
+A ``stages`` section maps stage names (``planning``, ``resolution``,
+``validation``) to model configs of their own, each built the same way, so a
+cheaper model can serve the resolution and validation calls. An optional
+``pricing`` section, top-level or per stage, e.g.
+``{"prompt_per_million": 2.5, "completion_per_million": 10}``, is used to
+report cost per stage.
+"""
+
+import json
+from typing import Any
+
+from autogen_core.models import ChatCompletionClient
+
+from src.llm.caching import CachingChatCompletionClient
+from src.llm.pool import Deployment, PooledChatCompletionClient
+from src.llm.rate_limit import (
+    DEFAULT_COMPLETION_RESERVE,
+    RateLimitedChatCompletionClient,
+    get_shared_rate_limiter,
+)
+from src.llm.routing import (
+    DEFAULT_STAGE,
+    ModelPricing,
+    StageRoutedChatCompletionClient,
+)
+from src.llm.stages import STAGES
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+WRAPPER_SECTIONS = ("cache", "deployments", "pool", "pricing", "rate_limit", "stages")
+DEPLOYMENT_KEYS = ("name", "max_concurrency", "weight")
+
+
+def load_model_config(config_path: str) -> dict[str, Any]:
+    """
+    Reads the model configuration JSON file.
+
+    Args:
+        config_path (str): Path to the model configuration file
+
+    Returns:
+        dict[str, Any]: Parsed configuration
+    """
+    with open(config_path, encoding="utf-8") as f:
+        model_config = json.load(f)
+    logger.debug(f"[load_model_config] Loaded model config from {config_path}")
+    return model_config
+
+
+def build_model_client(model_config: dict[str, Any]) -> ChatCompletionClient:
+    """
+    Creates the model client and applies the configured wrappers.
+
+    Args:
+        model_config (dict[str, Any]): Component config plus optional wrapper sections
+
+    Returns:
+        ChatCompletionClient: Client to hand to the agents
+    """
+    if "stages" in model_config:
+        return build_stage_routed_client(model_config)
+
+    if "deployments" in model_config:
+        model_client = build_pooled_client(
+            model_config["deployments"], model_config.get("pool", {})
+        )
+        component_config = model_config["deployments"][0]
+    else:
+        component_config = {
+            key: value
+            for key, value in model_config.items()
+            if key not in WRAPPER_SECTIONS
+        }
+        model_client = ChatCompletionClient.load_component(component_config)
+        logger.debug("[build_model_client] Initialized model client")
+
+    rate_limit_config = model_config.get("rate_limit")
+    if rate_limit_config is not None:
+        limiter = get_shared_rate_limiter(
+            rate_limit_config["tokens_per_minute"],
+            rate_limit_config["requests_per_minute"],
+            state_file=rate_limit_config.get("state_file"),
+        )
+        model_client = RateLimitedChatCompletionClient(
+            model_client,
+            limiter,
+            completion_reserve=rate_limit_config.get(
+                "completion_reserve", DEFAULT_COMPLETION_RESERVE
+            ),
+        )
+        logger.info("[build_model_client] Rate limiting enabled")
+
+    cache_config = model_config.get("cache")
+    if cache_config is not None:
+        model_client = CachingChatCompletionClient(
+            model_client,
+            max_entries=cache_config.get("max_entries", 256),
+            cache_dir=cache_config.get("cache_dir"),
+            bypass_stages=cache_config.get("bypass_stages", ()),
+            namespace=component_config.get("config", {}).get("model", ""),
+        )
+        logger.info("[build_model_client] Completion cache enabled")
+    return model_client
+
+
+def build_stage_routed_client(
+    model_config: dict[str, Any],
+) -> StageRoutedChatCompletionClient:
+    """
+    Creates a client that serves each stage from its own model config.
+
+    Args:
+        model_config (dict[str, Any]): Default model config with a ``stages`` section
+
+    Returns:
+        StageRoutedChatCompletionClient: Client routing calls by ``llm_stage``
+
+    Raises:
+        ValueError: If ``stages`` names a stage the agents do not use
+    """
+    stage_configs = model_config["stages"]
+    unknown_stages = set(stage_configs) - set(STAGES)
+    if unknown_stages:
+        raise ValueError(f"Unknown model stages: {sorted(unknown_stages)}")
+
+    default_config = {
+        key: value for key, value in model_config.items() if key != "stages"
+    }
+    pricing = {DEFAULT_STAGE: ModelPricing.from_config(model_config.get("pricing"))}
+    stage_clients = {}
+    for stage, stage_config in stage_configs.items():
+        stage_clients[stage] = build_model_client(stage_config)
+        pricing[stage] = ModelPricing.from_config(stage_config.get("pricing"))
+    logger.info(
+        f"[build_stage_routed_client] Routing stages to their own models: {sorted(stage_clients)}"
+    )
+    return StageRoutedChatCompletionClient(
+        build_model_client(default_config), stage_clients, pricing
+    )
+
+
+def build_pooled_client(
+    deployment_configs: list[dict[str, Any]], pool_config: dict[str, Any]
+) -> PooledChatCompletionClient:
+    """
+    Creates a pooled client from a list of deployment configs.
+
+    Args:
+        deployment_configs (list[dict[str, Any]]): Component configs with optional
+            ``name``, ``max_concurrency`` and ``weight`` keys
+        pool_config (dict[str, Any]): ``request_timeout`` and ``cooldown`` settings
+
+    Returns:
+        PooledChatCompletionClient: Client balancing across every deployment
+    """
+    deployments = []
+    for index, deployment_config in enumerate(deployment_configs):
+        component_config = {
+            key: value
+            for key, value in deployment_config.items()
+            if key not in DEPLOYMENT_KEYS
+        }
+        default_name = component_config.get("config", {}).get(
+            "azure_deployment", f"deployment-{index}"
+        )
+        name = deployment_config.get("name", default_name)
+        deployments.append(
+            Deployment(
+                name=name,
+                client=ChatCompletionClient.load_component(component_config),
+                max_concurrency=deployment_config.get("max_concurrency", 8),
+                weight=deployment_config.get("weight", 1.0),
+            )
+        )
+    logger.info(
+        f"[build_pooled_client] Pooling {len(deployments)} deployments: {[d.name for d in deployments]}"
+    )
+    return PooledChatCompletionClient(
+        deployments,
+        request_timeout=pool_config.get("request_timeout"),
+        cooldown=pool_config.get("cooldown", 10.0),
+    )
@@ -0,0 +1,268 @@
+"""
+Pooled, load-balanced model client spanning several deployments.
+
+A single deployment caps throughput at its own quota. ``PooledChatCompletionClient``
+spreads requests across every configured deployment:
+
+- Health-weighted balancing: each deployment's score is its configured
+  weight times a health estimate, divided by its in-flight requests
+- Per-deployment concurrency limits through an ``asyncio.Semaphore``
+- Failover: a 429, timeout or connection error puts the deployment in a
+  cooldown, lowers its health and retries the request on the next one
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from dataclasses import dataclass, field
+import itertools
+import time
+from typing import Any
+
+from autogen_core import CancellationToken
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+import openai
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+FAILOVER_ERRORS = (
+    asyncio.TimeoutError,
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+DEFAULT_COOLDOWN_SECONDS = 10.0
+
+
+def is_failover_error(error: BaseException) -> bool:
+    """Returns True for errors that another deployment may not hit (429s, timeouts)."""
+    return (
+        isinstance(error, FAILOVER_ERRORS) or getattr(error, "status_code", None) == 429
+    )
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Reads the ``Retry-After`` header of a provider error, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class Deployment:
+    """
+    One model deployment in the pool.
+
+    Attributes:
+        name (str): Label used in logs
+        client (ChatCompletionClient): Client for this deployment
+        max_concurrency (int): Maximum in-flight requests
+        weight (float): Relative share of traffic when healthy
+        health (float): Success estimate between 0 and 1
+        cooldown_until (float): Monotonic time before which the deployment is skipped
+        in_flight (int): Requests currently running
+    """
+
+    name: str
+    client: ChatCompletionClient
+    max_concurrency: int = 8
+    weight: float = 1.0
+    health: float = 1.0
+    cooldown_until: float = 0.0
+    in_flight: int = 0
+    semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def score(self) -> float:
+        return self.weight * self.health / (self.in_flight + 1)
+
+    def record_success(self) -> None:
+        self.health = min(1.0, self.health * 0.8 + 0.2)
+
+    def record_failure(self, cooldown: float) -> None:
+        self.health = max(0.05, self.health * 0.5)
+        self.cooldown_until = time.monotonic() + cooldown
+
+
+class PooledChatCompletionClient(ChatCompletionClient):
+    """
+    Load-balances completion requests across several deployments.
+
+    Attributes:
+        _deployments: Deployments in configuration order
+        _request_timeout: Seconds before a request fails over, or None
+        _cooldown: Seconds a failed deployment is skipped without Retry-After
+    """
+
+    def __init__(
+        self,
+        deployments: Sequence[Deployment],
+        request_timeout: float | None = None,
+        cooldown: float = DEFAULT_COOLDOWN_SECONDS,
+    ) -> None:
+        if not deployments:
+            raise ValueError("PooledChatCompletionClient needs at least one deployment")
+        self._deployments = list(deployments)
+        self._request_timeout = request_timeout
+        self._cooldown = cooldown
+        self._tiebreak = itertools.count()
+
+    @property
+    def deployments(self) -> list[Deployment]:
+        return list(self._deployments)
+
+    def _candidates(self, exclude: set[str]) -> list[Deployment]:
+        """Orders untried deployments, best first, skipping those cooling down."""
+        now = time.monotonic()
+        untried = [d for d in self._deployments if d.name not in exclude]
+        ready = [d for d in untried if d.cooldown_until <= now] or untried
+        offset = next(self._tiebreak)
+        return sorted(
+            ready,
+            key=lambda d: (
+                d.in_flight >= d.max_concurrency,
+                -d.score(),
+                (self._deployments.index(d) - offset) % len(self._deployments),
+            ),
+        )
+
+    def _on_failure(self, deployment: Deployment, error: BaseException) -> None:
+        cooldown = retry_after_seconds(error) or self._cooldown
+        deployment.record_failure(cooldown)
+        logger.warning(
+            f"[PooledChatCompletionClient] {deployment.name} failed ({type(error).__name__}), "
+            f"cooling down {cooldown:.1f}s"
+        )
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> CreateResult:
+        tried: set[str] = set()
+        last_error: BaseException | None = None
+        while candidates := self._candidates(tried):
+            deployment = candidates[0]
+            tried.add(deployment.name)
+            async with deployment.semaphore:
+                deployment.in_flight += 1
+                try:
+                    result = await asyncio.wait_for(
+                        deployment.client.create(
+                            messages,
+                            tools=tools,
+                            json_output=json_output,
+                            extra_create_args=extra_create_args,
+                            cancellation_token=cancellation_token,
+                        ),
+                        timeout=self._request_timeout,
+                    )
+                except Exception as e:
+                    if not is_failover_error(e):
+                        raise
+                    self._on_failure(deployment, e)
+                    last_error = e
+                    continue
+                finally:
+                    deployment.in_flight -= 1
+            deployment.record_success()
+            logger.debug(f"[PooledChatCompletionClient.create] Served by {deployment.name}")
+            return result
+        raise last_error
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> AsyncGenerator[str | CreateResult, None]:
+        tried: set[str] = set()
+        last_error: BaseException | None = None
+        while candidates := self._candidates(tried):
+            deployment = candidates[0]
+            tried.add(deployment.name)
+            started = False
+            async with deployment.semaphore:
+                deployment.in_flight += 1
+                try:
+                    async for chunk in deployment.client.create_stream(
+                        messages,
+                        tools=tools,
+                        json_output=json_output,
+                        extra_create_args=extra_create_args,
+                        cancellation_token=cancellation_token,
+                    ):
+                        started = True
+                        yield chunk
+                except Exception as e:
+                    # Chunks already yielded cannot be replayed on another deployment
+                    if started or not is_failover_error(e):
+                        raise
+                    self._on_failure(deployment, e)
+                    last_error = e
+                    continue
+                finally:
+                    deployment.in_flight -= 1
+            deployment.record_success()
+            return
+        raise last_error
+
+    async def close(self) -> None:
+        await asyncio.gather(*(d.client.close() for d in self._deployments))
+
+    def _sum_usage(self, attribute: str) -> RequestUsage:
+        usages = [getattr(d.client, attribute)() for d in self._deployments]
+        return RequestUsage(
+            prompt_tokens=sum(u.prompt_tokens for u in usages),
+            completion_tokens=sum(u.completion_tokens for u in usages),
+        )
+
+    def actual_usage(self) -> RequestUsage:
+        return self._sum_usage("actual_usage")
+
+    def total_usage(self) -> RequestUsage:
+        return self._sum_usage("total_usage")
+
+    def count_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        return self._deployments[0].client.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        return min(
+            d.client.remaining_tokens(messages, tools=tools) for d in self._deployments
+        )
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self._deployments[0].client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self._deployments[0].client.model_info
@@ -0,0 +1,218 @@
+"""
+Prompt assembly helpers that keep LLM requests prefix-cache friendly.
+
+Providers such as OpenAI and Azure OpenAI reuse the longest previously seen
+prompt prefix, which lowers both latency and the billed input tokens. A prefix
+only matches if it is byte-identical, so every request is laid out stable-first:
+
+1. System prompt
+2. Tool schemas (sent through ``tools=`` in a fixed order; a routed subset
+   keeps that order, so queries routed alike share it)
+3. Conversation history (append-only)
+4. Volatile, per-call content
+
+Messages that only matter to the request being made (intent notes, tool
+results, validation requests) are passed as volatile content and never stored
+in the history, so the history only grows by whole turns.
+
+Key Components:
+- PromptAssembler: Builds message and tool lists in the order above
+- CompactingChatCompletionContext: Append-only history trimmed in blocks
+- PromptCacheStats: Accumulates the cached prompt tokens reported by the provider
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import hashlib
+import json
+from typing import Any
+
+from autogen_core.model_context import ChatCompletionContext
+from autogen_core.models import LLMMessage, RequestUsage, SystemMessage
+from autogen_core.tools import BaseTool
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PromptAssembler:
+    """
+    Builds LLM requests with a byte-stable prefix.
+
+    The system prompt and the tool list are fixed when the assembler is
+    created, so every request made through it starts with exactly the same
+    bytes. History is appended after that and volatile content goes last.
+
+    Attributes:
+        _system_message: The single system prompt sent first on every request
+        _tools: Tools sorted by name so their schemas serialize identically
+    """
+
+    def __init__(self, system_prompt: str, tools: Sequence[BaseTool]) -> None:
+        self._system_message = SystemMessage(content=system_prompt)
+        self._tools = sorted(tools, key=lambda tool: tool.name)
+
+    @property
+    def system_message(self) -> SystemMessage:
+        return self._system_message
+
+    @property
+    def tools(self) -> list[BaseTool]:
+        return list(self._tools)
+
+    def assemble(
+        self,
+        history: Sequence[LLMMessage],
+        volatile: Sequence[LLMMessage] = (),
+    ) -> list[LLMMessage]:
+        """
+        Lays out a request as system prompt, then history, then volatile content.
+
+        Args:
+            history (Sequence[LLMMessage]): Append-only conversation history
+            volatile (Sequence[LLMMessage]): Per-call content that changes every request
+
+        Returns:
+            list[LLMMessage]: Messages ready to pass to ``model_client.create``
+        """
+        return [self._system_message, *history, *volatile]
+
+    def prefix_fingerprint(self) -> str:
+        """
+        Returns a hash of the stable prefix (system prompt and tool schemas).
+
+        Two requests can only share a provider-side cache entry if their
+        fingerprints match, which makes this useful in logs when hit rates drop.
+        """
+        payload = json.dumps(
+            {
+                "system": self._system_message.content,
+                "tools": [tool.schema for tool in self._tools],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompactingChatCompletionContext(ChatCompletionContext):
+    """
+    Append-only chat history that drops its oldest messages in blocks.
+
+    ``BufferedChatCompletionContext`` slides its window by one message per
+    message added once it is full, so the history right after the system
+    prompt differs on every request. This context returns every message until
+    it holds more than ``max_messages``, then drops the oldest down to ``keep``
+    in one step; the prefix only changes once every ``max_messages - keep``
+    messages.
+
+    Args:
+        max_messages (int): Messages held before the history is compacted
+        keep (Optional[int]): Most recent messages kept by a compaction,
+            half of ``max_messages`` if None
+        initial_messages (Optional[List[LLMMessage]]): The initial messages
+    """
+
+    def __init__(
+        self,
+        max_messages: int,
+        keep: int | None = None,
+        initial_messages: list[LLMMessage] | None = None,
+    ) -> None:
+        super().__init__(initial_messages)
+        if max_messages <= 0:
+            raise ValueError("max_messages must be greater than 0.")
+        keep = max_messages // 2 if keep is None else keep
+        if not 0 <= keep < max_messages:
+            raise ValueError("keep must be between 0 and max_messages - 1.")
+        self._max_messages = max_messages
+        self._keep = keep
+
+    async def add_message(self, message: LLMMessage) -> None:
+        await super().add_message(message)
+        if len(self._messages) > self._max_messages:
+            dropped = len(self._messages) - self._keep
+            self._messages = self._messages[dropped:]
+            logger.debug(
+                f"[CompactingChatCompletionContext.add_message] Dropped the {dropped} oldest messages"
+            )
+
+    async def get_messages(self) -> list[LLMMessage]:
+        return list(self._messages)
+
+
+def cached_prompt_tokens(usage: RequestUsage | Any) -> int:
+    """
+    Extracts the number of prompt tokens served from the provider cache.
+
+    ``RequestUsage`` only carries a cached-token count when the model client
+    populates one, either as ``cached_tokens`` or as OpenAI-style
+    ``prompt_tokens_details.cached_tokens``. Missing values count as zero.
+
+    Args:
+        usage (RequestUsage): Usage reported on a ``CreateResult``
+
+    Returns:
+        int: Cached prompt tokens for the request
+    """
+    cached = getattr(usage, "cached_tokens", None)
+    if cached is None:
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) if details else None
+    return int(cached or 0)
+
+
+@dataclass
+class PromptCacheStats:
+    """
+    Running totals of prompt tokens and provider cache hits.
+
+    Attributes:
+        calls (int): Number of recorded completions
+        prompt_tokens (int): Total prompt tokens sent
+        cached_tokens (int): Prompt tokens the provider served from its cache
+        by_label (dict[str, list[int]]): [prompt_tokens, cached_tokens] per call label
+    """
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    by_label: dict[str, list[int]] = field(default_factory=dict)
+
+    def record(self, usage: RequestUsage, label: str = "default") -> int:
+        """
+        Adds one completion's usage to the totals.
+
+        Args:
+            usage (RequestUsage): Usage reported on the ``CreateResult``
+            label (str): Name of the call site, e.g. "planning"
+
+        Returns:
+            int: Cached prompt tokens for this completion
+        """
+        cached = cached_prompt_tokens(usage)
+        self.calls += 1
+        self.prompt_tokens += usage.prompt_tokens
+        self.cached_tokens += cached
+        totals = self.by_label.setdefault(label, [0, 0])
+        totals[0] += usage.prompt_tokens
+        totals[1] += cached
+        logger.debug(
+            f"[PromptCacheStats.record] {label}: {cached}/{usage.prompt_tokens} prompt tokens cached"
+        )
+        return cached
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the provider cache."""
+        if self.prompt_tokens == 0:
+            return 0.0
+        return self.cached_tokens / self.prompt_tokens
+
+    def summary(self) -> str:
+        return (
+            f"{self.calls} calls, {self.cached_tokens}/{self.prompt_tokens} "
+            f"prompt tokens cached ({self.hit_ratio:.1%})"
+        )
@@ -0,0 +1,429 @@
+"""
+Shared rate limiter for model requests.
+
+Provider quotas are expressed in tokens per minute (TPM) and requests per
+minute (RPM). When concurrent sessions exceed them, 429s cascade into retries
+and latency spikes. ``LLMRateLimiter`` enforces both quotas with token
+buckets before a request is sent:
+
+- Prompt tokens are estimated with ``tiktoken`` and a completion reserve is
+  added; the difference to the real usage is settled afterwards
+- Waiting callers are served round-robin by session so one busy session
+  cannot starve the others
+- Bucket state can live in a lock-protected file so several processes on a
+  host share one quota
+- Queue wait times are recorded in ``RateLimiterStats``
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from autogen_core import CancellationToken
+from autogen_core.models import ChatCompletionClient, CreateResult, LLMMessage
+from autogen_core.tools import Tool, ToolSchema
+
+from src.llm.base import ChatCompletionClientWrapper
+from src.llm.stages import current_llm_session
+from src.llm.tokens import count_tokens
+from src.utils.logger import get_logger
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+logger = get_logger(__name__)
+
+DEFAULT_SESSION = "default"
+DEFAULT_COMPLETION_RESERVE = 256
+# Per-message overhead of the chat format (role, separators)
+TOKENS_PER_MESSAGE = 4
+
+
+def estimate_request_tokens(
+    messages: Sequence[LLMMessage],
+    tools: Sequence[Tool | ToolSchema] = (),
+    completion_reserve: int = DEFAULT_COMPLETION_RESERVE,
+) -> int:
+    """
+    Estimates the quota a request will use: prompt tokens plus a completion reserve.
+
+    Args:
+        messages (Sequence[LLMMessage]): Messages to send
+        tools (Sequence[Tool | ToolSchema]): Tools sent with the request
+        completion_reserve (int): Tokens held back for the completion
+
+    Returns:
+        int: Estimated tokens counted against the TPM quota
+    """
+    prompt_tokens = sum(
+        count_tokens(str(message.content)) + TOKENS_PER_MESSAGE for message in messages
+    )
+    if tools:
+        schemas = [tool if isinstance(tool, Mapping) else tool.schema for tool in tools]
+        prompt_tokens += count_tokens(json.dumps(schemas))
+    return prompt_tokens + completion_reserve
+
+
+class QuotaBuckets:
+    """
+    Token buckets for the tokens-per-minute and requests-per-minute quotas.
+
+    Both buckets start full and refill continuously. A request is admitted only
+    when both can cover it, and then both are debited together.
+
+    Attributes:
+        tokens_per_minute (float): TPM quota
+        requests_per_minute (float): RPM quota
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: float,
+        requests_per_minute: float,
+        clock=time.time,
+    ) -> None:
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self._clock = clock
+        self._state = self._full_state()
+
+    def _full_state(self) -> dict[str, float]:
+        return {
+            "tokens": self.tokens_per_minute,
+            "requests": self.requests_per_minute,
+            "updated": self._clock(),
+        }
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict[str, float]]:
+        yield self._state
+
+    def _refill(self, state: dict[str, float]) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(
+            self.tokens_per_minute,
+            state["tokens"] + elapsed * self.tokens_per_minute / 60,
+        )
+        state["requests"] = min(
+            self.requests_per_minute,
+            state["requests"] + elapsed * self.requests_per_minute / 60,
+        )
+        state["updated"] = now
+
+    def try_acquire(self, tokens: int) -> float:
+        """
+        Debits one request and ``tokens`` tokens if both buckets allow it.
+
+        Args:
+            tokens (int): Estimated tokens for the request
+
+        Returns:
+            float: 0.0 if admitted, otherwise seconds until it could be
+        """
+        # A request larger than the whole quota would otherwise wait forever
+        tokens = min(tokens, self.tokens_per_minute)
+        with self._locked_state() as state:
+            self._refill(state)
+            if state["tokens"] >= tokens and state["requests"] >= 1:
+                state["tokens"] -= tokens
+                state["requests"] -= 1
+                return 0.0
+            token_wait = (tokens - state["tokens"]) * 60 / self.tokens_per_minute
+            request_wait = (1 - state["requests"]) * 60 / self.requests_per_minute
+            return max(token_wait, request_wait, 0.001)
+
+    def settle(self, token_delta: int) -> None:
+        """
+        Corrects the token bucket once the real usage is known.
+
+        Args:
+            token_delta (int): Actual minus estimated tokens; negative refunds
+        """
+        with self._locked_state() as state:
+            self._refill(state)
+            state["tokens"] = min(self.tokens_per_minute, state["tokens"] - token_delta)
+
+
+class FileQuotaBuckets(QuotaBuckets):
+    """
+    Quota buckets stored in a file so every process on the host shares them.
+
+    The file is locked with ``fcntl.flock`` for each read-modify-write, so this
+    is only available on POSIX systems.
+
+    Attributes:
+        _path: JSON file holding the bucket levels
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        tokens_per_minute: float,
+        requests_per_minute: float,
+        clock=time.time,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("Cross-process rate limiting requires fcntl (POSIX)")
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(tokens_per_minute, requests_per_minute, clock)
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict[str, float]]:
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(fd, "r+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                raw = f.read()
+                state = json.loads(raw) if raw else self._full_state()
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Queue wait metrics for the rate limiter.
+
+    Attributes:
+        requests (int): Requests admitted
+        total_wait (float): Seconds spent queued across all requests
+        max_wait (float): Longest single queue wait in seconds
+        recent_waits (deque[float]): Last 1000 waits, for percentiles
+        wait_by_session (dict[str, float]): Seconds queued per session
+    """
+
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    recent_waits: deque = field(default_factory=lambda: deque(maxlen=1000))
+    wait_by_session: dict[str, float] = field(default_factory=dict)
+
+    def record(self, session: str, wait: float) -> None:
+        self.requests += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.recent_waits.append(wait)
+        self.wait_by_session[session] = self.wait_by_session.get(session, 0.0) + wait
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def percentile_wait(self, percentile: float) -> float:
+        if not self.recent_waits:
+            return 0.0
+        waits = sorted(self.recent_waits)
+        index = min(len(waits) - 1, int(percentile / 100 * len(waits)))
+        return waits[index]
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, mean wait {self.mean_wait:.3f}s, "
+            f"p95 {self.percentile_wait(95):.3f}s, max {self.max_wait:.3f}s"
+        )
+
+
+class LLMRateLimiter:
+    """
+    Admits model requests under TPM and RPM quotas, round-robin by session.
+
+    Each session has a FIFO queue. The dispatcher serves the head of the
+    session at the front of the rotation and then moves that session to the
+    back, so sessions take turns regardless of how many requests each queued.
+
+    Attributes:
+        _buckets: Quota state, in-process or shared through a file
+        _queues: Waiting requests per session, in rotation order
+        stats: Queue wait metrics
+    """
+
+    def __init__(self, buckets: QuotaBuckets) -> None:
+        self._buckets = buckets
+        self._queues: OrderedDict[str, deque] = OrderedDict()
+        self._timer: asyncio.TimerHandle | None = None
+        self.stats = RateLimiterStats()
+
+    async def acquire(self, tokens: int, session: str = DEFAULT_SESSION) -> float:
+        """
+        Waits until the request fits in both quotas.
+
+        Args:
+            tokens (int): Estimated tokens for the request
+            session (str): Session to queue the request under
+
+        Returns:
+            float: Seconds spent waiting in the queue
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        admitted = loop.create_future()
+        self._queues.setdefault(session, deque()).append((tokens, admitted))
+        self._dispatch()
+        await admitted
+        wait = loop.time() - started
+        self.stats.record(session, wait)
+        if wait > 0.01:
+            logger.debug(
+                f"[LLMRateLimiter.acquire] {session} waited {wait:.3f}s: {self.stats.summary()}"
+            )
+        return wait
+
+    def settle(self, token_delta: int) -> None:
+        """Corrects the token quota with actual minus estimated usage."""
+        self._buckets.settle(token_delta)
+        if token_delta < 0:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queues:
+            session, queue = next(iter(self._queues.items()))
+            tokens, admitted = queue[0]
+            if admitted.done():
+                # The caller was cancelled while queued
+                queue.popleft()
+            else:
+                wait = self._buckets.try_acquire(tokens)
+                if wait > 0:
+                    loop = asyncio.get_running_loop()
+                    self._timer = loop.call_later(wait, self._dispatch)
+                    return
+                queue.popleft()
+                admitted.set_result(None)
+            if queue:
+                self._queues.move_to_end(session)
+            else:
+                del self._queues[session]
+
+
+class RateLimitedChatCompletionClient(ChatCompletionClientWrapper):
+    """
+    Waits for quota from a shared ``LLMRateLimiter`` before every request.
+
+    Attributes:
+        _limiter: Limiter shared by every client using the same quota
+        _completion_reserve: Tokens reserved for completions without ``max_tokens``
+    """
+
+    def __init__(
+        self,
+        inner: ChatCompletionClient,
+        limiter: LLMRateLimiter,
+        completion_reserve: int = DEFAULT_COMPLETION_RESERVE,
+    ) -> None:
+        super().__init__(inner)
+        self._limiter = limiter
+        self._completion_reserve = completion_reserve
+
+    @property
+    def limiter(self) -> LLMRateLimiter:
+        return self._limiter
+
+    def _reserve(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        extra_create_args: Mapping[str, Any],
+    ) -> int:
+        completion_reserve = extra_create_args.get(
+            "max_tokens", self._completion_reserve
+        )
+        return estimate_request_tokens(messages, tools, completion_reserve)
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> CreateResult:
+        reserved = self._reserve(messages, tools, extra_create_args)
+        await self._limiter.acquire(reserved, current_llm_session() or DEFAULT_SESSION)
+        result = await super().create(
+            messages,
+            tools=tools,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+        used = result.usage.prompt_tokens + result.usage.completion_tokens
+        if used:
+            self._limiter.settle(used - reserved)
+        return result
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> AsyncGenerator[str | CreateResult, None]:
+        reserved = self._reserve(messages, tools, extra_create_args)
+        await self._limiter.acquire(reserved, current_llm_session() or DEFAULT_SESSION)
+        async for chunk in self._inner.create_stream(
+            messages,
+            tools=tools,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        ):
+            if isinstance(chunk, CreateResult):
+                used = chunk.usage.prompt_tokens + chunk.usage.completion_tokens
+                if used:
+                    self._limiter.settle(used - reserved)
+            yield chunk
+
+
+_shared_limiters: dict[tuple, LLMRateLimiter] = {}
+
+
+def get_shared_rate_limiter(
+    tokens_per_minute: float,
+    requests_per_minute: float,
+    state_file: str | None = None,
+) -> LLMRateLimiter:
+    """
+    Returns the process-wide limiter for a quota, creating it on first use.
+
+    Args:
+        tokens_per_minute (float): TPM quota
+        requests_per_minute (float): RPM quota
+        state_file (Optional[str]): Shared bucket file for cross-process limiting
+
+    Returns:
+        LLMRateLimiter: Limiter shared by every caller with the same settings
+    """
+    key = (tokens_per_minute, requests_per_minute, state_file)
+    if key not in _shared_limiters:
+        if state_file:
+            buckets = FileQuotaBuckets(
+                state_file, tokens_per_minute, requests_per_minute
+            )
+        else:
+            buckets = QuotaBuckets(tokens_per_minute, requests_per_minute)
+        _shared_limiters[key] = LLMRateLimiter(buckets)
+    return _shared_limiters[key]
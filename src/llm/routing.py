@@ -0,0 +1,227 @@
+"""
+Per-stage model routing.
+
+Not every model call in a turn needs the strongest model. Tool planning does,
+but the resolution call only rewrites an answer that is already known, and the
+validator's Yes/No check is a short classification. ``StageRoutedChatCompletionClient``
+sends each call to the client configured for its ``llm_stage`` and falls back
+to the default client for unmapped stages. It also records latency, token usage
+and cost per stage so the effect of a routing change can be measured.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from autogen_core import CancellationToken
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+
+from src.llm.base import ChatCompletionClientWrapper
+from src.llm.stages import current_llm_stage
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_STAGE = "default"
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """
+    Price of a model in currency units per million tokens.
+
+    Attributes:
+        prompt_per_million (float): Price of one million prompt tokens
+        completion_per_million (float): Price of one million completion tokens
+    """
+
+    prompt_per_million: float = 0.0
+    completion_per_million: float = 0.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, float] | None) -> "ModelPricing":
+        config = config or {}
+        return cls(
+            prompt_per_million=config.get("prompt_per_million", 0.0),
+            completion_per_million=config.get("completion_per_million", 0.0),
+        )
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        return (
+            prompt_tokens * self.prompt_per_million
+            + completion_tokens * self.completion_per_million
+        ) / 1_000_000
+
+
+@dataclass
+class StageUsage:
+    """
+    Latency, usage and cost of the model calls made for one stage.
+
+    Attributes:
+        calls (int): Calls made
+        latency (float): Total seconds spent waiting on the model
+        prompt_tokens (int): Prompt tokens billed
+        completion_tokens (int): Completion tokens billed
+        cost (float): Cost computed from the stage model's pricing
+    """
+
+    calls: int = 0
+    latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency / self.calls if self.calls else 0.0
+
+    def record(
+        self, latency: float, usage: RequestUsage, pricing: ModelPricing
+    ) -> None:
+        self.calls += 1
+        self.latency += latency
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        self.cost += pricing.cost(usage.prompt_tokens, usage.completion_tokens)
+
+
+@dataclass
+class StageRoutingStats:
+    """
+    Per-stage usage recorded by ``StageRoutedChatCompletionClient``.
+
+    Attributes:
+        by_stage (dict[str, StageUsage]): Usage keyed by stage name
+    """
+
+    by_stage: dict[str, StageUsage] = field(default_factory=dict)
+
+    def record(
+        self, stage: str, latency: float, usage: RequestUsage, pricing: ModelPricing
+    ) -> None:
+        self.by_stage.setdefault(stage, StageUsage()).record(latency, usage, pricing)
+
+    def summary(self) -> str:
+        return "; ".join(
+            f"{stage}: {usage.calls} calls, mean {usage.mean_latency:.2f}s, "
+            f"{usage.prompt_tokens}+{usage.completion_tokens} tokens, cost {usage.cost:.4f}"
+            for stage, usage in sorted(self.by_stage.items())
+        )
+
+
+class StageRoutedChatCompletionClient(ChatCompletionClientWrapper):
+    """
+    Sends each model call to the client configured for its stage.
+
+    Attributes:
+        _inner: Default client, used for stages without their own client
+        _stage_clients: Client per stage name
+        _pricing: Pricing per stage name, plus ``DEFAULT_STAGE`` for the default client
+        stats: Latency, usage and cost per stage
+    """
+
+    def __init__(
+        self,
+        default_client: ChatCompletionClient,
+        stage_clients: Mapping[str, ChatCompletionClient],
+        pricing: Mapping[str, ModelPricing] | None = None,
+    ) -> None:
+        super().__init__(default_client)
+        self._stage_clients = dict(stage_clients)
+        self._pricing = dict(pricing or {})
+        self.stats = StageRoutingStats()
+
+    def client_for(self, stage: str | None) -> ChatCompletionClient:
+        """Returns the client that serves ``stage``."""
+        return self._stage_clients.get(stage, self._inner)
+
+    def _pricing_for(self, stage: str | None) -> ModelPricing:
+        if stage in self._stage_clients:
+            return self._pricing.get(stage, ModelPricing())
+        return self._pricing.get(DEFAULT_STAGE, ModelPricing())
+
+    def _clients(self) -> list[ChatCompletionClient]:
+        clients = [self._inner]
+        for client in self._stage_clients.values():
+            if all(client is not known for known in clients):
+                clients.append(client)
+        return clients
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> CreateResult:
+        stage = current_llm_stage()
+        started = time.perf_counter()
+        result = await self.client_for(stage).create(
+            messages,
+            tools=tools,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+        self.stats.record(
+            stage or DEFAULT_STAGE,
+            time.perf_counter() - started,
+            result.usage,
+            self._pricing_for(stage),
+        )
+        return result
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: bool | None = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: CancellationToken | None = None,
+    ) -> AsyncGenerator[str | CreateResult, None]:
+        stage = current_llm_stage()
+        started = time.perf_counter()
+        async for chunk in self.client_for(stage).create_stream(
+            messages,
+            tools=tools,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        ):
+            if isinstance(chunk, CreateResult):
+                self.stats.record(
+                    stage or DEFAULT_STAGE,
+                    time.perf_counter() - started,
+                    chunk.usage,
+                    self._pricing_for(stage),
+                )
+            yield chunk
+
+    async def close(self) -> None:
+        await asyncio.gather(*(client.close() for client in self._clients()))
+
+    def _sum_usage(self, attribute: str) -> RequestUsage:
+        usages = [getattr(client, attribute)() for client in self._clients()]
+        return RequestUsage(
+            prompt_tokens=sum(u.prompt_tokens for u in usages),
+            completion_tokens=sum(u.completion_tokens for u in usages),
+        )
+
+    def actual_usage(self) -> RequestUsage:
+        return self._sum_usage("actual_usage")
+
+    def total_usage(self) -> RequestUsage:
+        return self._sum_usage("total_usage")
@@ -0,0 +1,71 @@
+"""
+Labels for the stages of a turn that call the model.
+
+The orchestrators wrap each ``model_client.create`` call in ``llm_stage`` so
+model client wrappers can tell a planning call from a resolution or
+validation call without changing the ``ChatCompletionClient`` interface.
+``llm_session`` does the same for the conversation a call belongs to.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+PLANNING = "planning"
+RESOLUTION = "resolution"
+VALIDATION = "validation"
+STAGES = (PLANNING, RESOLUTION, VALIDATION)
+
+_current_stage: ContextVar[str | None] = ContextVar("llm_stage", default=None)
+
+
+@contextmanager
+def llm_stage(name: str) -> Iterator[str]:
+    """
+    Marks the model calls made inside the block as belonging to a stage.
+
+    Args:
+        name (str): One of PLANNING, RESOLUTION or VALIDATION
+
+    Yields:
+        str: The stage name
+    """
+    token = _current_stage.set(name)
+    try:
+        yield name
+    finally:
+        _current_stage.reset(token)
+
+
+def current_llm_stage() -> str | None:
+    """Returns the stage of the model call being made, if one was set."""
+    return _current_stage.get()
+
+
+_current_session: ContextVar[str | None] = ContextVar("llm_session", default=None)
+
+
+@contextmanager
+def llm_session(session_id: str) -> Iterator[str]:
+    """
+    Marks the model calls made inside the block as belonging to a session.
+
+    Shared wrappers such as the rate limiter use this to queue sessions fairly.
+
+    Args:
+        session_id (str): Conversation or trace identifier
+
+    Yields:
+        str: The session identifier
+    """
+    token = _current_session.set(session_id)
+    try:
+        yield session_id
+    finally:
+        _current_session.reset(token)
+
+
+def current_llm_session() -> str | None:
+    """Returns the session of the model call being made, if one was set."""
+    return _current_session.get()
@@ -0,0 +1,49 @@
+"""
+Token counting helpers built on ``tiktoken``.
+
+``tiktoken`` downloads its encoding files on first use. When that is not
+possible (offline CI, air-gapped hosts) counts fall back to a
+characters-per-token estimate so callers never fail on a token count.
+"""
+
+from functools import lru_cache
+import math
+
+import tiktoken
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+# Average characters per token for English text with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(name: str) -> tiktoken.Encoding | None:
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning(
+            f"[_get_encoding] Could not load tiktoken encoding {name}, estimating: {e}"
+        )
+        return None
+
+
+def count_tokens(text: str, encoding: str = DEFAULT_ENCODING) -> int:
+    """
+    Counts the tokens in a piece of text.
+
+    Args:
+        text (str): Text to count
+        encoding (str): tiktoken encoding name
+
+    Returns:
+        int: Exact token count, or an estimate if the encoding is unavailable
+    """
+    enc = _get_encoding(encoding)
+    if enc is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(enc.encode(text, disallowed_special=()))
@@ -2,6 +2,27 @@
 Financial analysis and utility tools for the AI assistant system.
 """
 
+from src.tools.american import AmericanValuation, price_american
+from src.tools.backtest import BacktestResult, ForecastModel, walk_forward
+from src.tools.fetch_scheduler import FetchScheduler, TokenBucket
+from src.tools.forecast import TrendForecaster, fit_trends, trend_forecaster
+from src.tools.market_data import (
+    MarketDataService,
+    ProviderExecutor,
+    market_data,
+    provider_executor,
+)
+from src.tools.options import (
+    OptionChain,
+    VolatilitySurface,
+    black_scholes,
+    implied_volatility,
+    price_chain,
+)
+from src.tools.rates_vol import RatesVolService, TreasuryCurve, rates_vol
+from src.tools.registry import ORCHESTRATOR_TOOL_CLASSES, build_orchestrator_tools
+from src.tools.router import RouteDecision, ToolRouter
+from src.tools.screener_universe import ScreenerUniverse, screener_universe
 from src.tools.tools import (
     FinancialLiteracyInput,
     FinancialLiteracyOutput,
@@ -22,19 +43,47 @@ from src.tools.tools import (
 
 
 __all__ = [
-    "StockInfoTool",
-    "StockForecastTool",
-    "SentimentAnalysisTool",
-    "FinancialLiteracyTool",
-    "PortfolioOptimizationTool",
-    "OptionsPricingTool",
-    "StockScreenerTool",
+    "ORCHESTRATOR_TOOL_CLASSES",
+    "AmericanValuation",
+    "BacktestResult",
+    "FetchScheduler",
     "FinancialLiteracyInput",
     "FinancialLiteracyOutput",
+    "FinancialLiteracyTool",
+    "ForecastModel",
+    "MarketDataService",
+    "OptionChain",
+    "OptionsPricingInput",
+    "OptionsPricingOutput",
+    "OptionsPricingTool",
+    "PortfolioOptimizationTool",
+    "ProviderExecutor",
+    "RatesVolService",
+    "RouteDecision",
+    "ScreenerUniverse",
     "SentimentAnalysisInput",
     "SentimentAnalysisOutput",
+    "SentimentAnalysisTool",
+    "StockForecastTool",
+    "StockInfoTool",
     "StockPredictorInput",
     "StockPredictorOutput",
-    "OptionsPricingInput",
-    "OptionsPricingOutput",
+    "StockScreenerTool",
+    "TokenBucket",
+    "ToolRouter",
+    "TreasuryCurve",
+    "TrendForecaster",
+    "VolatilitySurface",
+    "black_scholes",
+    "build_orchestrator_tools",
+    "fit_trends",
+    "implied_volatility",
+    "market_data",
+    "price_american",
+    "price_chain",
+    "provider_executor",
+    "rates_vol",
+    "screener_universe",
+    "trend_forecaster",
+    "walk_forward",
 ]
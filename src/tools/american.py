@@ -0,0 +1,269 @@
+"""
+American-exercise option pricing for arrays of contracts.
+
+Two methods price many contracts per call:
+
+- ``binomial_american``: a Cox-Ross-Rubinstein tree rolled back for a whole
+  batch of contracts at once, one NumPy operation per time step.
+- ``longstaff_schwartz``: Monte Carlo with least-squares regression of the
+  continuation value on ``(1, S/K, (S/K)**2)`` at every exercise date, solved
+  for every contract of a batch together. Antithetic paths halve the variance.
+
+Both split their contracts into chunks so that no intermediate array holds
+more than ``chunk_elements`` values. ``price_american`` runs either method
+and reports the early-exercise premium over the European Black-Scholes price.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.tools.options import black_scholes
+
+
+AMERICAN_METHODS = ("binomial", "monte_carlo")
+DEFAULT_TREE_STEPS = 200
+DEFAULT_MC_PATHS = 20_000
+DEFAULT_MC_STEPS = 50
+# Values per intermediate array, about 16 MB of float64
+DEFAULT_CHUNK_ELEMENTS = 2_000_000
+# Keeps the regression's normal equations solvable with few paths in the money
+_RIDGE = 1e-10
+# Entry (i, j) of the regression's normal matrix is the moment of order i + j
+_HANKEL = np.add.outer(np.arange(3), np.arange(3))
+
+
+@dataclass
+class AmericanValuation:
+    """
+    American prices of an array of contracts, all of the same shape.
+
+    Attributes:
+        price (np.ndarray): Fair value with early exercise
+        european_price (np.ndarray): Black-Scholes value without it
+        std_error (np.ndarray): Monte Carlo standard error, zero for the tree
+    """
+
+    price: np.ndarray
+    european_price: np.ndarray
+    std_error: np.ndarray
+
+    @property
+    def early_exercise_premium(self) -> np.ndarray:
+        return self.price - self.european_price
+
+    def contract(self, index: int | tuple[int, ...] = ()) -> dict[str, float]:
+        """Returns the prices of one contract as floats."""
+        return {
+            "price": float(self.price[index]),
+            "european_price": float(self.european_price[index]),
+            "early_exercise_premium": float(self.early_exercise_premium[index]),
+            "std_error": float(self.std_error[index]),
+        }
+
+
+def _flatten(
+    spot, strike, time_to_expiry, rate, volatility, is_call
+) -> tuple[tuple[int, ...], list[np.ndarray]]:
+    """Broadcasts the contract inputs together and flattens them to 1-D."""
+    arrays = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (spot, strike, time_to_expiry, rate, volatility)
+        ),
+        np.asarray(is_call, dtype=bool),
+    )
+    if np.any(arrays[1] <= 0) or np.any(arrays[2] <= 0):
+        raise ValueError("Strike prices and times to expiry must be positive.")
+    return arrays[0].shape, [array.ravel() for array in arrays]
+
+
+def _chunks(size: int, per_contract: int, chunk_elements: int) -> Iterator[slice]:
+    """Splits ``size`` contracts into batches of at most ``chunk_elements``."""
+    batch = max(1, chunk_elements // per_contract)
+    for start in range(0, size, batch):
+        yield slice(start, min(start + batch, size))
+
+
+def binomial_american(
+    spot: float | np.ndarray,
+    strike: float | np.ndarray,
+    time_to_expiry: float | np.ndarray,
+    rate: float | np.ndarray,
+    volatility: float | np.ndarray,
+    is_call: bool | np.ndarray = True,
+    steps: int = DEFAULT_TREE_STEPS,
+    chunk_elements: int = DEFAULT_CHUNK_ELEMENTS,
+) -> np.ndarray:
+    """
+    Prices American options on Cox-Ross-Rubinstein trees, a batch at a time.
+
+    Args:
+        spot (float | np.ndarray): Price of the underlying
+        strike (float | np.ndarray): Strike prices
+        time_to_expiry (float | np.ndarray): Times to expiry in years
+        rate (float | np.ndarray): Continuously compounded risk-free rates
+        volatility (float | np.ndarray): Annualized volatilities
+        is_call (bool | np.ndarray): True for calls, False for puts
+        steps (int): Time steps per tree
+        chunk_elements (int): Largest number of tree nodes held at once
+
+    Returns:
+        np.ndarray: Prices of the broadcast input shape
+    """
+    shape, (spot, strike, time_to_expiry, rate, volatility, is_call) = _flatten(
+        spot, strike, time_to_expiry, rate, volatility, is_call
+    )
+    prices = np.empty(spot.shape)
+    nodes = np.arange(steps + 1)
+    for batch in _chunks(spot.size, steps + 1, chunk_elements):
+        dt = time_to_expiry[batch] / steps
+        log_up = volatility[batch] * np.sqrt(dt)
+        up = np.exp(log_up)[:, np.newaxis]
+        growth = np.exp(rate[batch] * dt)
+        p_up = ((growth - 1 / up[:, 0]) / (up[:, 0] - 1 / up[:, 0]))[:, np.newaxis]
+        discount = (1 / growth)[:, np.newaxis]
+        sign = np.where(is_call[batch], 1.0, -1.0)[:, np.newaxis]
+        strikes = strike[batch][:, np.newaxis]
+
+        # Node j at step i is spot * up**(2j - i)
+        spots = spot[batch][:, np.newaxis] * np.exp(
+            log_up[:, np.newaxis] * (2 * nodes - steps)
+        )
+        values = np.maximum(sign * (spots - strikes), 0.0)
+        for step in range(steps - 1, -1, -1):
+            spots = spots[:, : step + 1] * up
+            held = discount * (
+                p_up * values[:, 1 : step + 2] + (1 - p_up) * values[:, : step + 1]
+            )
+            values = np.maximum(held, sign * (spots - strikes))
+        prices[batch] = values[:, 0]
+    return prices.reshape(shape)
+
+
+def longstaff_schwartz(
+    spot: float | np.ndarray,
+    strike: float | np.ndarray,
+    time_to_expiry: float | np.ndarray,
+    rate: float | np.ndarray,
+    volatility: float | np.ndarray,
+    is_call: bool | np.ndarray = True,
+    paths: int = DEFAULT_MC_PATHS,
+    steps: int = DEFAULT_MC_STEPS,
+    seed: int | None = None,
+    chunk_elements: int = DEFAULT_CHUNK_ELEMENTS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Prices American options by Longstaff-Schwartz Monte Carlo, a batch at a time.
+
+    Args:
+        spot (float | np.ndarray): Price of the underlying
+        strike (float | np.ndarray): Strike prices
+        time_to_expiry (float | np.ndarray): Times to expiry in years
+        rate (float | np.ndarray): Continuously compounded risk-free rates
+        volatility (float | np.ndarray): Annualized volatilities
+        is_call (bool | np.ndarray): True for calls, False for puts
+        paths (int): Simulated paths per contract, rounded up to an even number
+        steps (int): Exercise dates per path
+        seed (Optional[int]): Seed for reproducible prices
+        chunk_elements (int): Largest number of path values held at once
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Prices and their standard errors, of the
+            broadcast input shape
+    """
+    shape, (spot, strike, time_to_expiry, rate, volatility, is_call) = _flatten(
+        spot, strike, time_to_expiry, rate, volatility, is_call
+    )
+    rng = np.random.default_rng(seed)
+    half = (paths + 1) // 2
+    prices = np.empty(spot.size)
+    errors = np.empty(spot.size)
+    for batch in _chunks(spot.size, 2 * half * steps, chunk_elements):
+        dt = (time_to_expiry[batch] / steps)[:, np.newaxis, np.newaxis]
+        sigma = volatility[batch][:, np.newaxis, np.newaxis]
+        r = rate[batch][:, np.newaxis, np.newaxis]
+        shocks = rng.standard_normal((batch.stop - batch.start, half, steps))
+        shocks = np.concatenate([shocks, -shocks], axis=1)
+        # Prices at dt, 2 dt, ..., T along each path
+        path_prices = spot[batch][:, np.newaxis, np.newaxis] * np.exp(
+            np.cumsum((r - sigma**2 / 2) * dt + sigma * np.sqrt(dt) * shocks, axis=2)
+        )
+        del shocks
+
+        sign = np.where(is_call[batch], 1.0, -1.0)[:, np.newaxis]
+        strikes = strike[batch][:, np.newaxis]
+        discount = np.exp(-r * dt)[:, :, 0]
+        cash_flows = np.maximum(sign * (path_prices[:, :, -1] - strikes), 0.0)
+        for step in range(steps - 2, -1, -1):
+            cash_flows *= discount
+            prices_now = path_prices[:, :, step]
+            exercise = np.maximum(sign * (prices_now - strikes), 0.0)
+            in_the_money = exercise > 0
+            moneyness = prices_now / strikes
+            # Normal equations of the in-the-money regression from moment sums
+            weights = in_the_money.astype(float)
+            powers = [weights]
+            for _ in range(4):
+                powers.append(powers[-1] * moneyness)
+            moments = np.stack([power.sum(axis=1) for power in powers], axis=-1)
+            normal = moments[:, _HANKEL] + _RIDGE * np.eye(3)
+            target = np.stack(
+                [(power * cash_flows).sum(axis=1) for power in powers[:3]], axis=-1
+            )
+            c = np.linalg.solve(normal, target[..., np.newaxis])[..., 0]
+            continuation = (c[:, 2:3] * moneyness + c[:, 1:2]) * moneyness + c[:, 0:1]
+            cash_flows = np.where(
+                in_the_money & (exercise > continuation), exercise, cash_flows
+            )
+        cash_flows *= discount
+
+        intrinsic = np.maximum(sign[:, 0] * (spot[batch] - strikes[:, 0]), 0.0)
+        prices[batch] = np.maximum(cash_flows.mean(axis=1), intrinsic)
+        errors[batch] = cash_flows.std(axis=1, ddof=1) / np.sqrt(cash_flows.shape[1])
+    return prices.reshape(shape), errors.reshape(shape)
+
+
+def price_american(
+    spot: float | np.ndarray,
+    strike: float | np.ndarray,
+    time_to_expiry: float | np.ndarray,
+    rate: float | np.ndarray,
+    volatility: float | np.ndarray,
+    is_call: bool | np.ndarray = True,
+    method: str = "binomial",
+    **kwargs,
+) -> AmericanValuation:
+    """
+    Prices American options and their early-exercise premium.
+
+    Args:
+        spot (float | np.ndarray): Price of the underlying
+        strike (float | np.ndarray): Strike prices
+        time_to_expiry (float | np.ndarray): Times to expiry in years
+        rate (float | np.ndarray): Continuously compounded risk-free rates
+        volatility (float | np.ndarray): Annualized volatilities
+        is_call (bool | np.ndarray): True for calls, False for puts
+        method (str): ``"binomial"`` or ``"monte_carlo"``
+        **kwargs: Further arguments of ``binomial_american`` or
+            ``longstaff_schwartz``
+
+    Returns:
+        AmericanValuation: Prices of the broadcast input shape
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    inputs = (spot, strike, time_to_expiry, rate, volatility, is_call)
+    if method == "binomial":
+        price = binomial_american(*inputs, **kwargs)
+        std_error = np.zeros_like(price)
+    elif method == "monte_carlo":
+        price, std_error = longstaff_schwartz(*inputs, **kwargs)
+    else:
+        raise ValueError(
+            f"Invalid pricing method. Must be one of {', '.join(AMERICAN_METHODS)}."
+        )
+    european = black_scholes(*inputs).price
+    return AmericanValuation(price, european, std_error)
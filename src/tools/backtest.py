@@ -0,0 +1,327 @@
+"""
+Walk-forward backtesting of price forecast models.
+
+Every ticker's closes are cut into rolling windows of ``lookback`` bars, each
+paired with the close ``horizon`` bars after its end, so a model only ever
+sees the past of the price it forecasts. The windows stay strided views of
+the closes; each model fits and predicts them a chunk of rows at a time,
+each chunk in a few array operations, so memory is bounded by the chunk
+rather than by the size of the universe.
+
+Prices are read from a local CSV cache (``load_price_cache``), so backtests
+run offline; ``synthetic_prices`` generates a seeded universe for CI.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+import time
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import pandas as pd
+
+from src.tools.forecast import fit_trends
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Two years of daily bars, the history StockForecastTool fits on
+DEFAULT_LOOKBACK = 504
+DEFAULT_HORIZON = 1
+DEFAULT_STRIDE = 1
+# Values per window chunk, about 16 MB of float64
+DEFAULT_CHUNK_ELEMENTS = 2_000_000
+
+
+@dataclass(frozen=True)
+class ForecastModel:
+    """
+    A forecast model that works on a matrix of price windows.
+
+    Attributes:
+        name (str): Name used in reports
+        fit (Callable[[np.ndarray], Any]): Fits every row of a
+            ``(windows, lookback)`` matrix, returning the fitted state
+        predict (Callable[[Any, int], np.ndarray]): Forecasts the close
+            ``horizon`` bars after each window from the fitted state
+    """
+
+    name: str
+    fit: Callable[[np.ndarray], Any]
+    predict: Callable[[Any, int], np.ndarray]
+
+
+def _last_close(windows: np.ndarray) -> np.ndarray:
+    return windows[:, -1]
+
+
+def _repeat_last_close(last_close: np.ndarray, horizon: int) -> np.ndarray:
+    return last_close
+
+
+FORECAST_MODELS: dict[str, ForecastModel] = {
+    # StockForecastTool's model
+    "linear_trend": ForecastModel(
+        "linear_trend", fit_trends, lambda fit, horizon: fit.predict(horizon)
+    ),
+    # Random-walk baseline a useful model has to beat
+    "last_close": ForecastModel("last_close", _last_close, _repeat_last_close),
+}
+
+
+@dataclass
+class BacktestResult:
+    """
+    Accuracy and speed of one model over a walk-forward backtest.
+
+    Attributes:
+        model (str): Model name
+        windows (int): Forecasts evaluated
+        mae (float): Mean absolute error
+        rmse (float): Root mean squared error
+        mape (float): Mean absolute percentage error, as a fraction
+        direction_accuracy (float): Share of the forecasts moving away from
+            the window's last close that called the move's sign right, NaN if
+            none moved
+        fit_seconds (float): Time spent fitting
+        predict_seconds (float): Time spent predicting
+        ticker_mape (dict[str, float]): MAPE per ticker
+    """
+
+    model: str
+    windows: int
+    mae: float
+    rmse: float
+    mape: float
+    direction_accuracy: float
+    fit_seconds: float
+    predict_seconds: float
+    ticker_mape: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def fits_per_second(self) -> float:
+        return self.windows / self.fit_seconds if self.fit_seconds else float("inf")
+
+    @property
+    def predictions_per_second(self) -> float:
+        return (
+            self.windows / self.predict_seconds
+            if self.predict_seconds
+            else float("inf")
+        )
+
+
+def walk_forward_windows(
+    closes: np.ndarray,
+    lookback: int = DEFAULT_LOOKBACK,
+    horizon: int = DEFAULT_HORIZON,
+    stride: int = DEFAULT_STRIDE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cuts a price series into rolling windows and their forecast targets.
+
+    Args:
+        closes (np.ndarray): Closes, oldest first
+        lookback (int): Bars per window
+        horizon (int): Bars from a window's last close to its target
+        stride (int): Bars between the ends of consecutive windows
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A read-only ``(windows, lookback)``
+            view of ``closes`` and the target close of each window
+    """
+    closes = np.asarray(closes, dtype=float)
+    if len(closes) < lookback + horizon:
+        return np.empty((0, lookback)), np.empty(0)
+    windows = sliding_window_view(closes[:-horizon], lookback)[::stride]
+    targets = closes[lookback - 1 + horizon :][::stride]
+    return windows, targets
+
+
+def _window_chunks(
+    windows: Sequence[np.ndarray], rows: int
+) -> Iterator[tuple[slice, np.ndarray]]:
+    """
+    Yields consecutive chunks of at most ``rows`` windows across the tickers.
+
+    Only a chunk spanning two tickers is copied; the others are views.
+    """
+    start, pending, size = 0, [], 0
+    for view in windows:
+        offset = 0
+        while offset < len(view):
+            take = min(rows - size, len(view) - offset)
+            pending.append(view[offset : offset + take])
+            offset += take
+            size += take
+            if size == rows:
+                chunk = pending[0] if len(pending) == 1 else np.concatenate(pending)
+                yield slice(start, start + size), chunk
+                start, pending, size = start + size, [], 0
+    if pending:
+        chunk = pending[0] if len(pending) == 1 else np.concatenate(pending)
+        yield slice(start, start + size), chunk
+
+
+def walk_forward(
+    prices: Mapping[str, pd.Series],
+    models: Iterable[ForecastModel] = FORECAST_MODELS.values(),
+    lookback: int = DEFAULT_LOOKBACK,
+    horizon: int = DEFAULT_HORIZON,
+    stride: int = DEFAULT_STRIDE,
+    chunk_elements: int = DEFAULT_CHUNK_ELEMENTS,
+) -> list[BacktestResult]:
+    """
+    Backtests models over the rolling windows of every ticker.
+
+    Args:
+        prices (Mapping[str, pd.Series]): Closes per ticker, oldest first
+        models (Iterable[ForecastModel]): Models to evaluate
+        lookback (int): Bars each forecast is fitted on
+        horizon (int): Bars ahead each forecast looks
+        stride (int): Bars between consecutive forecasts of a ticker
+        chunk_elements (int): Largest number of window values fitted at once
+
+    Returns:
+        list[BacktestResult]: One result per model
+
+    Raises:
+        ValueError: If no ticker has ``lookback + horizon`` closes
+    """
+    tickers, windows, targets = [], [], []
+    for ticker, closes in prices.items():
+        ticker_windows, ticker_targets = walk_forward_windows(
+            closes.dropna().to_numpy(dtype=float), lookback, horizon, stride
+        )
+        if len(ticker_targets):
+            tickers.append(np.full(len(ticker_targets), ticker, dtype=object))
+            windows.append(ticker_windows)
+            targets.append(ticker_targets)
+    if not windows:
+        raise ValueError(f"No ticker has the {lookback + horizon} closes needed.")
+
+    # One value per window; the windows themselves stay views of the closes
+    targets = np.concatenate(targets)
+    tickers = np.concatenate(tickers)
+    last_close = np.concatenate([view[:, -1] for view in windows])
+    rows = max(1, chunk_elements // lookback)
+    logger.info(
+        f"[walk_forward] {len(targets)} windows of {lookback} bars over "
+        f"{len(windows)} tickers, chunks of {rows}"
+    )
+
+    results = []
+    for model in models:
+        forecasts = np.empty_like(targets)
+        fit_seconds = predict_seconds = 0.0
+        for batch, chunk in _window_chunks(windows, rows):
+            started = time.perf_counter()
+            fitted = model.fit(chunk)
+            fitted_at = time.perf_counter()
+            forecasts[batch] = model.predict(fitted, horizon)
+            fit_seconds += fitted_at - started
+            predict_seconds += time.perf_counter() - fitted_at
+
+        errors = forecasts - targets
+        percentage_errors = np.abs(errors) / np.abs(targets)
+        moved = forecasts != last_close
+        called = np.sign(forecasts - last_close) == np.sign(targets - last_close)
+        results.append(
+            BacktestResult(
+                model=model.name,
+                windows=len(targets),
+                mae=float(np.mean(np.abs(errors))),
+                rmse=float(np.sqrt(np.mean(errors**2))),
+                mape=float(np.mean(percentage_errors)),
+                direction_accuracy=float(
+                    np.mean(called[moved]) if moved.any() else np.nan
+                ),
+                fit_seconds=fit_seconds,
+                predict_seconds=predict_seconds,
+                ticker_mape={
+                    ticker: float(percentage_errors[tickers == ticker].mean())
+                    for ticker in dict.fromkeys(tickers)
+                },
+            )
+        )
+    return results
+
+
+def load_price_cache(
+    directory: str | Path, tickers: Sequence[str] | None = None
+) -> dict[str, pd.Series]:
+    """
+    Reads cached closes, one ``<TICKER>.csv`` with Date and Close columns each.
+
+    Args:
+        directory (str | Path): Cache directory
+        tickers (Optional[Sequence[str]]): Tickers to read, all cached if None
+
+    Returns:
+        dict[str, pd.Series]: Closes per ticker, indexed by date
+
+    Raises:
+        FileNotFoundError: If a requested ticker is not cached
+    """
+    directory = Path(directory)
+    if tickers is None:
+        paths = sorted(directory.glob("*.csv"))
+    else:
+        paths = [directory / f"{ticker.upper()}.csv" for ticker in tickers]
+    missing = [path.stem for path in paths if not path.exists()]
+    if missing:
+        raise FileNotFoundError(
+            f"No cached prices for {', '.join(missing)} in {directory}."
+        )
+    return {
+        path.stem: pd.read_csv(path, index_col="Date", parse_dates=True)["Close"]
+        for path in paths
+    }
+
+
+def save_price_cache(directory: str | Path, prices: Mapping[str, pd.Series]) -> None:
+    """Writes closes per ticker in the format ``load_price_cache`` reads."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for ticker, closes in prices.items():
+        closes.rename("Close").rename_axis("Date").to_csv(
+            directory / f"{ticker.upper()}.csv"
+        )
+
+
+def synthetic_prices(
+    tickers: Sequence[str],
+    bars: int = 3 * 252,
+    seed: int = 0,
+    end: str = "2024-12-31",
+) -> dict[str, pd.Series]:
+    """
+    Generates geometric Brownian motion closes with random drifts and volatilities.
+
+    Args:
+        tickers (Sequence[str]): Ticker names
+        bars (int): Business days per ticker
+        seed (int): Seed of the random generator
+        end (str): Date of the last bar
+
+    Returns:
+        dict[str, pd.Series]: Closes per ticker, indexed by date
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=end, periods=bars)
+    drift = rng.uniform(-0.1, 0.3, (len(tickers), 1)) / 252
+    volatility = rng.uniform(0.15, 0.5, (len(tickers), 1)) / np.sqrt(252)
+    start = rng.uniform(20, 500, (len(tickers), 1))
+    returns = (
+        drift
+        - volatility**2 / 2
+        + volatility * rng.standard_normal((len(tickers), bars))
+    )
+    closes = start * np.exp(np.cumsum(returns, axis=1))
+    return {
+        ticker: pd.Series(row, index=dates, name="Close")
+        for ticker, row in zip(tickers, closes, strict=True)
+    }
@@ -0,0 +1,413 @@
+"""
+Rate-limit-aware concurrent fetching for quota-limited providers.
+
+Refreshing the screener universe takes one Alpha Vantage overview call per
+ticker. ``FetchScheduler`` runs such calls concurrently and admits each one
+through a ``TokenBucket`` sized for the configured API tier. Throttled
+responses and transient network errors are retried with exponential backoff.
+Progress is checkpointed to a JSON file after every ticker, so a refresh that
+was interrupted, or cut short by the daily quota, resumes where it stopped
+instead of spending the quota again.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import random
+import time
+from typing import Any, Generic, TypeVar
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+SECONDS_PER_DAY = 86400
+DEFAULT_TIER = "free"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF = 15.0
+# Checkpoints older than this belong to a refresh not worth resuming
+DEFAULT_CHECKPOINT_AGE = SECONDS_PER_DAY
+# Phrases Alpha Vantage answers with, instead of data, when called too often
+THROTTLE_MARKERS = ("call frequency", "rate limit", "api call volume", "per minute")
+DAILY_LIMIT_MARKERS = ("per day", "daily")
+
+
+@dataclass(frozen=True)
+class ApiTier:
+    """
+    Request limits of a provider plan.
+
+    Attributes:
+        requests_per_minute (float): Sustained request rate
+        requests_per_day (int | None): Daily quota, None if unlimited
+    """
+
+    requests_per_minute: float
+    requests_per_day: int | None = None
+
+
+# Alpha Vantage plans, selected with ALPHA_VANTAGE_TIER
+API_TIERS: dict[str, ApiTier] = {
+    "free": ApiTier(5, 25),
+    "premium-75": ApiTier(75),
+    "premium-150": ApiTier(150),
+    "premium-300": ApiTier(300),
+    "premium-600": ApiTier(600),
+    "premium-1200": ApiTier(1200),
+}
+
+
+class Throttled(Exception):
+    """The provider answered with a rate-limit notice instead of data."""
+
+
+class DailyQuotaExhausted(Exception):
+    """No requests are left for today on the configured tier."""
+
+
+def resolve_tier(name: str | None = None) -> ApiTier:
+    """
+    Looks up an API tier by name.
+
+    Args:
+        name (Optional[str]): Key of ``API_TIERS``; defaults to
+            ``ALPHA_VANTAGE_TIER``, then ``"free"``
+
+    Returns:
+        ApiTier: The tier's limits
+
+    Raises:
+        ValueError: If the tier is unknown
+    """
+    name = name or os.getenv("ALPHA_VANTAGE_TIER", DEFAULT_TIER)
+    if name not in API_TIERS:
+        raise ValueError(
+            f"Unknown Alpha Vantage tier {name!r}, expected one of {sorted(API_TIERS)}"
+        )
+    return API_TIERS[name]
+
+
+def classify_error(error: Exception) -> Exception:
+    """
+    Recognizes the rate-limit notices Alpha Vantage raises as ``ValueError``.
+
+    Args:
+        error (Exception): Error raised by a provider call
+
+    Returns:
+        Exception: ``Throttled`` or ``DailyQuotaExhausted`` for rate-limit
+            notices, ``error`` unchanged otherwise
+    """
+    message = str(error).lower()
+    if any(marker in message for marker in DAILY_LIMIT_MARKERS):
+        return DailyQuotaExhausted(str(error))
+    if any(marker in message for marker in THROTTLE_MARKERS):
+        return Throttled(str(error))
+    return error
+
+
+class TokenBucket:
+    """
+    Admits requests at a steady per-minute rate, up to a daily quota.
+
+    Attributes:
+        tier (ApiTier): Limits being enforced
+        _rate: Tokens added per second
+        _capacity: Requests that may be sent back to back
+        _tokens: Requests currently available
+        _day: Day number ``_used_today`` counts for
+        _used_today: Requests admitted on ``_day``
+    """
+
+    def __init__(
+        self,
+        tier: ApiTier,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.tier = tier
+        self._rate = tier.requests_per_minute / 60
+        # A fifth of a minute's requests by default, so bursts stay well
+        # inside the per-minute window the provider measures
+        self._capacity = burst if burst is not None else max(1.0, self._rate * 12)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._day = int(self._updated // SECONDS_PER_DAY)
+        self._used_today = 0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        day = int(now // SECONDS_PER_DAY)
+        if day != self._day:
+            self._day, self._used_today = day, 0
+
+    def exhaust_day(self) -> None:
+        """Marks today's quota as used up, e.g. after the provider said so."""
+        if self.tier.requests_per_day is not None:
+            self._used_today = self.tier.requests_per_day
+
+    async def acquire(self) -> None:
+        """
+        Waits until a request may be sent.
+
+        Raises:
+            DailyQuotaExhausted: If today's quota is used up
+        """
+        async with self._lock:
+            self._refill()
+            daily = self.tier.requests_per_day
+            if daily is not None and self._used_today >= daily:
+                raise DailyQuotaExhausted(f"All {daily} requests for today are used")
+            while self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+            self._used_today += 1
+
+
+@dataclass
+class FetchReport(Generic[T]):
+    """
+    Outcome of a scheduled fetch.
+
+    Attributes:
+        results (dict[str, T | None]): Fetched keys, None where the provider
+            had no usable data
+        pending (list[str]): Keys left for a later run
+        retries (int): Throttled or failed requests that were retried
+    """
+
+    results: dict[str, T | None] = field(default_factory=dict)
+    pending: list[str] = field(default_factory=list)
+    retries: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending
+
+
+class FetchScheduler(Generic[T]):
+    """
+    Fetches keys concurrently within a tier's limits, checkpointing progress.
+
+    Attributes:
+        bucket (TokenBucket): Limiter every request passes through, sized for
+            ``ALPHA_VANTAGE_TIER`` on first use unless one is given
+        _fetch: Coroutine function fetching one key, None for no data
+        _decode: Rebuilds a result from its checkpointed dict
+        _checkpoint_path: JSON file holding finished keys, or None
+        _concurrency: Requests in flight at once
+        _max_retries: Retries of a request before its key is left pending
+        _backoff: Seconds before the first retry, doubled on each further one
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[T | None]],
+        decode: Callable[[dict[str, Any]], T],
+        bucket: TokenBucket | None = None,
+        checkpoint_path: str | Path | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_checkpoint_age: float = DEFAULT_CHECKPOINT_AGE,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._bucket = bucket
+        self._fetch = fetch
+        self._decode = decode
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self._concurrency = concurrency
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_checkpoint_age = max_checkpoint_age
+        self._clock = clock
+        self._sleep = sleep
+
+    @property
+    def bucket(self) -> TokenBucket:
+        if self._bucket is None:
+            # Resolved here rather than at construction, so a bad setting cannot
+            # break importing the module-level screener universe
+            try:
+                tier = resolve_tier()
+            except ValueError as e:
+                logger.error(
+                    f"[FetchScheduler.bucket] {e}, using the {DEFAULT_TIER} tier"
+                )
+                tier = API_TIERS[DEFAULT_TIER]
+            self._bucket = TokenBucket(tier, clock=self._clock, sleep=self._sleep)
+        return self._bucket
+
+    def load_checkpoint(self) -> tuple[float, dict[str, T | None]]:
+        """
+        Reads the progress of an earlier, interrupted run.
+
+        Returns:
+            tuple[float, dict[str, T | None]]: When that run started and its
+                results; the current time and nothing if there is no usable
+                checkpoint
+        """
+        now = self._clock()
+        if self._checkpoint_path is None or not self._checkpoint_path.is_file():
+            return now, {}
+        try:
+            with open(self._checkpoint_path, encoding="utf-8") as f:
+                state = json.load(f)
+            started_at = float(state["started_at"])
+            results = {
+                key: self._decode(value) if value is not None else None
+                for key, value in state["results"].items()
+            }
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                f"[FetchScheduler.load_checkpoint] Ignoring {self._checkpoint_path}: {e}"
+            )
+            return now, {}
+        if now - started_at > self._max_checkpoint_age:
+            logger.info(
+                f"[FetchScheduler.load_checkpoint] Discarding checkpoint from {now - started_at:.0f}s ago"
+            )
+            return now, {}
+        return started_at, results
+
+    def save_checkpoint(self, started_at: float, results: dict[str, T | None]) -> None:
+        """Persists the results so far atomically."""
+        if self._checkpoint_path is None:
+            return
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._checkpoint_path.with_suffix(".tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "started_at": started_at,
+                    "results": {
+                        key: asdict(value) if value is not None else None
+                        for key, value in results.items()
+                    },
+                },
+                f,
+            )
+        temporary.replace(self._checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        if self._checkpoint_path is not None:
+            self._checkpoint_path.unlink(missing_ok=True)
+
+    async def run(
+        self,
+        keys: Iterable[str],
+        on_progress: Callable[[dict[str, T | None]], None] | None = None,
+    ) -> FetchReport[T]:
+        """
+        Fetches every key not already finished according to the checkpoint.
+
+        Args:
+            keys (Iterable[str]): Keys to fetch, e.g. tickers
+            on_progress (Optional[Callable]): Called with the results so far once
+                the checkpoint is resumed and after every fetched key
+
+        Returns:
+            FetchReport[T]: Results, including resumed ones, and the keys still
+                pending; the checkpoint is removed once nothing is pending
+        """
+        keys = list(dict.fromkeys(keys))
+        started_at, resumed = self.load_checkpoint()
+        report: FetchReport[T] = FetchReport(
+            results={key: value for key, value in resumed.items() if key in keys}
+        )
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for key in keys:
+            if key not in report.results:
+                queue.put_nowait(key)
+        logger.info(
+            f"[FetchScheduler.run] Fetching {queue.qsize()} keys, {len(report.results)} resumed from checkpoint"
+        )
+        if on_progress is not None and report.results:
+            on_progress(report.results)
+        stop = asyncio.Event()
+
+        async def worker() -> None:
+            while not stop.is_set() and not queue.empty():
+                key = queue.get_nowait()
+                try:
+                    report.results[key] = await self._fetch_one(key, report)
+                except DailyQuotaExhausted as e:
+                    logger.warning(f"[FetchScheduler.run] Stopping at {key}: {e}")
+                    self.bucket.exhaust_day()
+                    report.pending.append(key)
+                    stop.set()
+                    continue
+                except (Throttled, OSError) as e:
+                    logger.warning(f"[FetchScheduler.run] Leaving {key} for later: {e}")
+                    report.pending.append(key)
+                    continue
+                except BaseException:
+                    stop.set()
+                    raise
+                self.save_checkpoint(started_at, report.results)
+                if on_progress is not None:
+                    on_progress(report.results)
+
+        await asyncio.gather(*(worker() for _ in range(self._concurrency)))
+        while not queue.empty():
+            report.pending.append(queue.get_nowait())
+        if report.complete:
+            self.clear_checkpoint()
+        logger.info(
+            f"[FetchScheduler.run] {len(report.results)} fetched, {len(report.pending)} pending, {report.retries} retries"
+        )
+        return report
+
+    async def _fetch_one(self, key: str, report: FetchReport[T]) -> T | None:
+        """
+        Fetches one key, retrying throttled and failed requests with backoff.
+
+        Raises:
+            Throttled: If the request is still throttled after every retry
+            OSError: If the request still fails after every retry
+            DailyQuotaExhausted: If today's quota is used up
+        """
+        for attempt in range(self._max_retries + 1):
+            await self.bucket.acquire()
+            try:
+                return await self._fetch(key)
+            except (KeyError, ValueError, TypeError) as e:
+                error = classify_error(e)
+                if error is e:
+                    # The provider had no usable data for this key
+                    logger.error(
+                        f"[FetchScheduler._fetch_one] Error processing {key}: {e}"
+                    )
+                    return None
+                if (
+                    isinstance(error, DailyQuotaExhausted)
+                    or attempt == self._max_retries
+                ):
+                    raise error from e
+            except OSError:
+                if attempt == self._max_retries:
+                    raise
+            report.retries += 1
+            delay = self._backoff * 2**attempt * (1 + random.random() / 4)
+            logger.info(
+                f"[FetchScheduler._fetch_one] Retrying {key} in {delay:.1f}s (attempt {attempt + 1})"
+            )
+            await self._sleep(delay)
+        return None
@@ -0,0 +1,172 @@
+"""
+Closed-form linear trend forecasts for many price series at once.
+
+``fit_trends`` fits an ordinary least-squares line through every row of a
+stacked price matrix in one pass of NumPy reductions. Rows are right-aligned
+on their latest bar and left-padded with NaN (see ``stack_series``), so
+tickers with different amounts of history share a matrix.
+
+``TrendForecaster`` keeps the fitted coefficients of each ticker keyed by its
+closes and refits, together, only the tickers whose data changed.
+"""
+
+import asyncio
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.tools.market_data import MarketDataService, market_data
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_FORECAST_PERIOD = "2y"
+
+
+@dataclass
+class TrendFit:
+    """
+    Least-squares lines through the rows of a stacked price matrix.
+
+    Attributes:
+        intercept (np.ndarray): Fitted price at the matrix's first column
+        slope (np.ndarray): Price change per bar
+        length (int): Columns of the matrix; its last column is the latest bar
+    """
+
+    intercept: np.ndarray
+    slope: np.ndarray
+    length: int
+
+    def predict(self, steps: int = 1) -> np.ndarray:
+        """Extrapolates each line ``steps`` bars past the latest one."""
+        return self.intercept + self.slope * (self.length - 1 + steps)
+
+
+def stack_series(series: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Stacks price series into rows aligned on their latest bar.
+
+    Args:
+        series (Sequence[np.ndarray]): One array of prices per ticker, oldest first
+
+    Returns:
+        np.ndarray: Matrix of shape ``(len(series), longest)``, NaN before
+            each series starts
+    """
+    length = max((len(values) for values in series), default=0)
+    stacked = np.full((len(series), length), np.nan)
+    for row, values in enumerate(series):
+        if len(values):
+            stacked[row, length - len(values) :] = values
+    return stacked
+
+
+def fit_trends(prices: np.ndarray) -> TrendFit:
+    """
+    Fits a line through each row of prices against the bar index.
+
+    NaN entries are left out of their row's fit. A row with a single price
+    gets a flat line and a row without any gets NaN.
+
+    Args:
+        prices (np.ndarray): Prices of shape ``(tickers, bars)``, or one series
+
+    Returns:
+        TrendFit: Coefficients per row, in the matrix's bar coordinates
+    """
+    prices = np.atleast_2d(np.asarray(prices, dtype=float))
+    bars = np.arange(prices.shape[1], dtype=float)
+    observed = ~np.isnan(prices)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        count = observed.sum(axis=1)
+        bar_mean = np.where(observed, bars, 0.0).sum(axis=1) / count
+        price_mean = np.where(observed, prices, 0.0).sum(axis=1) / count
+        # Centered sums keep the normal equations well conditioned
+        dx = np.where(observed, bars - bar_mean[:, np.newaxis], 0.0)
+        dy = np.where(observed, prices - price_mean[:, np.newaxis], 0.0)
+        sxx = np.einsum("ij,ij->i", dx, dx)
+        slope = np.where(sxx > 0, np.einsum("ij,ij->i", dx, dy) / sxx, 0.0)
+    slope = np.where(count > 0, slope, np.nan)
+    return TrendFit(price_mean - slope * bar_mean, slope, prices.shape[1])
+
+
+class TrendForecaster:
+    """
+    Forecasts tickers from linear trends, refitting only on new data.
+
+    Attributes:
+        _market: Cached price history source
+        _period: History each trend is fitted on
+        _fits: Per upper-cased ticker, the (latest bar, bars, hash of the
+            closes) its fit used and the fit's intercept and slope in the
+            ticker's own bar coordinates
+    """
+
+    def __init__(
+        self,
+        market: MarketDataService = market_data,
+        period: str = DEFAULT_FORECAST_PERIOD,
+    ) -> None:
+        self._market = market
+        self._period = period
+        self._fits: dict[str, tuple[tuple[str, int, int], float, float]] = {}
+
+    async def forecast(
+        self, tickers: Iterable[str], steps: int = 1
+    ) -> dict[str, float]:
+        """
+        Forecasts the close ``steps`` bars after each ticker's latest one.
+
+        Args:
+            tickers (Iterable[str]): Ticker symbols
+            steps (int): Bars ahead to forecast
+
+        Returns:
+            dict[str, float]: Forecast per upper-cased ticker
+
+        Raises:
+            ValueError: If a ticker has no price history
+        """
+        keys = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        histories = await asyncio.gather(
+            *(self._market.history(key, self._period) for key in keys)
+        )
+
+        stale: dict[str, tuple[tuple[str, int, int], np.ndarray]] = {}
+        for key, history in zip(keys, histories, strict=True):
+            if history.empty:
+                raise ValueError(f"No price history for {key}.")
+            closes = history["Close"].to_numpy(dtype=float)
+            # The latest bar's close changes while the market is open, and
+            # adjustments rewrite older ones, so the closes are part of the key
+            version = (str(history.index[-1]), len(closes), hash(closes.tobytes()))
+            cached = self._fits.get(key)
+            if cached is None or cached[0] != version:
+                stale[key] = (version, closes)
+
+        if stale:
+            series = [closes for _, closes in stale.values()]
+            fit = fit_trends(stack_series(series))
+            for row, (key, (version, closes)) in enumerate(stale.items()):
+                # Shift the intercept from the stacked to the ticker's own bars
+                offset = fit.length - len(closes)
+                intercept = fit.intercept[row] + fit.slope[row] * offset
+                self._fits[key] = (version, float(intercept), float(fit.slope[row]))
+            logger.info(
+                f"[TrendForecaster.forecast] Refitted {len(stale)} of {len(keys)} tickers"
+            )
+
+        forecasts = {}
+        for key in keys:
+            (_, length, _), intercept, slope = self._fits[key]
+            forecasts[key] = intercept + slope * (length - 1 + steps)
+        return forecasts
+
+    def clear(self) -> None:
+        self._fits.clear()
+
+
+trend_forecaster = TrendForecaster()
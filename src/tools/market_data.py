@@ -0,0 +1,456 @@
+"""
+Market data shared by the yfinance-backed tools.
+
+``MarketDataService`` fetches price history for every tool. It keeps recent
+histories in a TTL cache keyed by (ticker, period, interval). A shorter
+daily period is sliced from a longer cached history instead of being fetched
+again, e.g. the ``1d`` quote from the ``3mo`` history an options question
+already loaded. Concurrent requests for the same history share one fetch.
+
+Provider SDKs (yfinance, Alpha Vantage) are synchronous. ``ProviderExecutor``
+runs their calls in a dedicated, bounded thread pool with a concurrency limit
+per provider, so a slow fetch no longer freezes the event loop for every
+other agent and session.
+
+Every fetch records the most recent bar for its ticker. The resulting
+per-ticker version lets caches built on top of tool output (such as the
+turn-level answer cache) notice when the underlying market data has moved on.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import math
+import time
+from typing import Any, TypeVar
+import weakref
+
+import pandas as pd
+import yfinance as yf
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Calendar days each yfinance period covers; a cached period can serve any
+# shorter one. Trading-day periods ("1d", "5d") are sliced by row count.
+PERIOD_DAYS: dict[str, float] = {
+    "1d": 1,
+    "5d": 5,
+    "1mo": 31,
+    "3mo": 92,
+    "6mo": 183,
+    "1y": 366,
+    "2y": 731,
+    "5y": 1827,
+    "10y": 3653,
+    "max": math.inf,
+}
+# Only daily bars are sliced; other intervals are served by exact key
+SLICEABLE_INTERVALS = frozenset({"1d"})
+# Seconds a history stays fresh for requests of each period
+DEFAULT_PERIOD_TTLS: dict[str, float] = {"1d": 60, "5d": 300}
+DEFAULT_HISTORY_TTL = 900
+
+YFINANCE = "yfinance"
+ALPHA_VANTAGE = "alpha_vantage"
+# Calls each provider may have running at once; Alpha Vantage's request rate
+# is paced separately by the fetch scheduler's token bucket
+DEFAULT_PROVIDER_LIMITS: dict[str, int] = {YFINANCE: 4, ALPHA_VANTAGE: 4}
+DEFAULT_PROVIDER_WORKERS = 8
+# Nearest listed expiries fetched to build an implied volatility surface
+DEFAULT_OPTION_EXPIRIES = 6
+
+T = TypeVar("T")
+HistoryKey = tuple[str, str, str]
+HistoryFetcher = Callable[[str, str, str], Awaitable[pd.DataFrame]]
+
+
+class MarketDataVersions:
+    """
+    Tracks the latest bar and close observed for each ticker.
+
+    The daily bar label alone does not change during a session, so the close
+    is part of the version: an intraday fetch with a new last price bumps it.
+
+    Attributes:
+        _versions: Latest bar label and close per upper-cased ticker
+    """
+
+    def __init__(self) -> None:
+        self._versions: dict[str, str] = {}
+
+    def observe(
+        self, ticker: str, latest_bar: Any, latest_close: float | None = None
+    ) -> bool:
+        """
+        Records the latest bar fetched for a ticker.
+
+        Args:
+            ticker (str): Ticker symbol
+            latest_bar (Any): Index label of the newest row, usually a timestamp
+            latest_close (Optional[float]): Close of the newest row, if known
+
+        Returns:
+            bool: True if this changed the ticker's version
+        """
+        key = ticker.upper()
+        version = str(latest_bar)
+        if latest_close is not None:
+            version = f"{version}@{latest_close!r}"
+        changed = self._versions.get(key) != version
+        if changed:
+            logger.debug(f"[MarketDataVersions.observe] {key} is now at {version}")
+            self._versions[key] = version
+        return changed
+
+    def get(self, ticker: str) -> str | None:
+        return self._versions.get(ticker.upper())
+
+    def snapshot(self, tickers: Iterable[str]) -> dict[str, str | None]:
+        """Returns the current version of each ticker."""
+        return {ticker.upper(): self.get(ticker) for ticker in tickers}
+
+
+market_data_versions = MarketDataVersions()
+
+
+class ProviderExecutor:
+    """
+    Runs blocking provider calls in a bounded thread pool, off the event loop.
+
+    Each provider has its own limit on calls running at once. A slot is only
+    freed when the call's thread finishes, so a caller that gives up (e.g. on
+    a turn deadline) cannot push a provider past its limit.
+
+    Attributes:
+        _pool: Worker threads shared by every provider
+        _limits: Calls each provider may have running at once
+        _default_limit: Limit for providers missing from ``_limits``
+        _semaphores: Per-loop semaphores enforcing the limits
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_PROVIDER_WORKERS,
+        provider_limits: Mapping[str, int] | None = None,
+        default_limit: int = 1,
+    ) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="market-data"
+        )
+        self._limits = dict(
+            DEFAULT_PROVIDER_LIMITS if provider_limits is None else provider_limits
+        )
+        self._default_limit = default_limit
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if provider not in semaphores:
+            semaphores[provider] = asyncio.Semaphore(
+                self._limits.get(provider, self._default_limit)
+            )
+        return semaphores[provider]
+
+    async def run(
+        self, provider: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Calls ``func`` in the pool once ``provider`` has a free slot.
+
+        Args:
+            provider (str): Provider the call goes to, e.g. ``YFINANCE``
+            func (Callable[..., T]): Blocking function to run
+            *args (Any): Positional arguments for ``func``
+            **kwargs (Any): Keyword arguments for ``func``
+
+        Returns:
+            T: What ``func`` returned
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(provider)
+        await semaphore.acquire()
+
+        def release(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # The loop closed while the call was running
+                pass
+
+        try:
+            call = self._pool.submit(partial(func, *args, **kwargs))
+        except BaseException:
+            semaphore.release()
+            raise
+        call.add_done_callback(release)
+        return await asyncio.wrap_future(call)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+provider_executor = ProviderExecutor()
+
+
+async def fetch_yfinance_history(
+    ticker: str, period: str, interval: str
+) -> pd.DataFrame:
+    """Fetches price history from yfinance in the provider thread pool."""
+    return await provider_executor.run(
+        YFINANCE, lambda: yf.Ticker(ticker).history(period=period, interval=interval)
+    )
+
+
+def _yfinance_option_quotes(
+    ticker: str, max_expiries: int, today: pd.Timestamp
+) -> pd.DataFrame:
+    handle = yf.Ticker(ticker)
+    frames = []
+    for expiry in handle.options[:max_expiries]:
+        chain = handle.option_chain(expiry)
+        years = (pd.Timestamp(expiry) - today).days / 365
+        for option_type, quotes in (("call", chain.calls), ("put", chain.puts)):
+            bid, ask = quotes["bid"], quotes["ask"]
+            # Mid quote where the market is two-sided, last trade otherwise
+            price = ((bid + ask) / 2).where((bid > 0) & (ask > 0), quotes["lastPrice"])
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "option_type": option_type,
+                        "time_to_expiry": years,
+                        "strike": quotes["strike"],
+                        "price": price,
+                    }
+                )
+            )
+    if not frames:
+        return pd.DataFrame(
+            columns=["option_type", "time_to_expiry", "strike", "price"]
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+async def fetch_yfinance_option_quotes(
+    ticker: str, max_expiries: int = DEFAULT_OPTION_EXPIRIES
+) -> pd.DataFrame:
+    """
+    Fetches listed option prices from yfinance in the provider thread pool.
+
+    Args:
+        ticker (str): Underlying ticker symbol
+        max_expiries (int): Nearest expiries to fetch
+
+    Returns:
+        pd.DataFrame: One row per quote with ``option_type``,
+            ``time_to_expiry`` in years, ``strike`` and ``price``
+    """
+    today = pd.Timestamp.today().normalize()
+    return await provider_executor.run(
+        YFINANCE, _yfinance_option_quotes, ticker, max_expiries, today
+    )
+
+
+def slice_history(data: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Cuts a longer daily history down to the most recent ``period``.
+
+    Args:
+        data (pd.DataFrame): Daily bars indexed by date, oldest first
+        period (str): yfinance period, e.g. ``"1d"``, ``"3mo"`` or ``"1y"``
+
+    Returns:
+        pd.DataFrame: The trailing rows ``period`` covers, counted back from
+            the newest bar
+    """
+    if period == "max" or data.empty:
+        return data
+    if period.endswith("d"):
+        return data.iloc[-int(period[:-1]) :]
+    if not isinstance(data.index, pd.DatetimeIndex):
+        # Without dates, assume 252 trading days a year
+        return data.iloc[-math.ceil(PERIOD_DAYS[period] * 252 / 365) :]
+    if period.endswith("mo"):
+        offset = pd.DateOffset(months=int(period[:-2]))
+    else:
+        offset = pd.DateOffset(years=int(period[:-1]))
+    return data[data.index > data.index[-1] - offset]
+
+
+@dataclass
+class CachedHistory:
+    """
+    A fetched price history.
+
+    Attributes:
+        data (pd.DataFrame): Bars as returned by the fetcher
+        fetched_at (float): Clock time of the fetch
+    """
+
+    data: pd.DataFrame
+    fetched_at: float
+
+
+@dataclass
+class MarketDataStats:
+    """
+    Counters for the market data cache.
+
+    Attributes:
+        hits (int): Requests served from a cached history of the same period
+        sliced (int): Requests served by slicing a longer cached history
+        coalesced (int): Requests that joined a fetch already in flight
+        fetches (int): Histories fetched from the provider
+    """
+
+    hits: int = 0
+    sliced: int = 0
+    coalesced: int = 0
+    fetches: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} hits, {self.sliced} sliced, {self.coalesced} coalesced, "
+            f"{self.fetches} fetches"
+        )
+
+
+class MarketDataService:
+    """
+    TTL cache with single-flight fetching in front of the price history provider.
+
+    Attributes:
+        stats (MarketDataStats): Cache counters
+        _fetch: Coroutine function fetching (ticker, period, interval)
+        _period_ttls: Seconds a history stays fresh for each requested period
+        _default_ttl: TTL for periods missing from ``_period_ttls``
+        _max_entries: Capacity of the LRU
+        _versions: Latest bar and close per ticker, updated on every fetch
+        _entries: Cached histories keyed by (ticker, period, interval)
+        _inflight: Fetches in progress, keyed the same way
+    """
+
+    def __init__(
+        self,
+        fetch: HistoryFetcher = fetch_yfinance_history,
+        period_ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_HISTORY_TTL,
+        max_entries: int = 256,
+        versions: MarketDataVersions = market_data_versions,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self._period_ttls = dict(
+            DEFAULT_PERIOD_TTLS if period_ttls is None else period_ttls
+        )
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._versions = versions
+        self._clock = clock
+        self._entries: OrderedDict[HistoryKey, CachedHistory] = OrderedDict()
+        self._inflight: dict[HistoryKey, asyncio.Task] = {}
+        self.stats = MarketDataStats()
+
+    async def history(
+        self, ticker: str, period: str = "1d", interval: str = "1d"
+    ) -> pd.DataFrame:
+        """
+        Returns the price history of a ticker, from cache when fresh enough.
+
+        Args:
+            ticker (str): Ticker symbol, e.g. ``"AAPL"`` or ``"^IRX"``
+            period (str): yfinance period
+            interval (str): yfinance bar interval
+
+        Returns:
+            pd.DataFrame: A copy of the bars, safe for the caller to modify
+        """
+        key = (ticker.upper(), period, interval)
+        for source_key in self.covering_keys(key):
+            entry = self._entries.get(source_key)
+            if entry is not None and self._clock() - entry.fetched_at <= self.ttl_for(
+                period
+            ):
+                self._entries.move_to_end(source_key)
+                if source_key == key:
+                    self.stats.hits += 1
+                else:
+                    self.stats.sliced += 1
+                return self._serve(entry.data, source_key, key)
+
+        for source_key in self.covering_keys(key):
+            fetch = self._inflight.get(source_key)
+            if fetch is not None:
+                self.stats.coalesced += 1
+                logger.debug(
+                    f"[MarketDataService.history] Joining the fetch of {source_key} for {key}"
+                )
+                return self._serve(await asyncio.shield(fetch), source_key, key)
+
+        fetch = asyncio.ensure_future(self._fetch_and_store(key))
+        self._inflight[key] = fetch
+        fetch.add_done_callback(lambda done: self._forget(key, done))
+        # Callers cancelled while waiting leave the fetch running for the others
+        return self._serve(await asyncio.shield(fetch), key, key)
+
+    def covering_keys(self, key: HistoryKey) -> list[HistoryKey]:
+        """Returns the keys whose history can serve ``key``, exact key first."""
+        ticker, period, interval = key
+        keys = [key]
+        if interval in SLICEABLE_INTERVALS and period in PERIOD_DAYS:
+            keys.extend(
+                (ticker, longer, interval)
+                for longer, days in sorted(PERIOD_DAYS.items(), key=lambda p: p[1])
+                if days > PERIOD_DAYS[period]
+            )
+        return keys
+
+    def _forget(self, key: HistoryKey, fetch: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not fetch.cancelled() and fetch.exception() is not None:
+            logger.warning(
+                f"[MarketDataService._forget] Fetching {key} failed: {fetch.exception()}"
+            )
+
+    def ttl_for(self, period: str) -> float:
+        return self._period_ttls.get(period, self._default_ttl)
+
+    async def _fetch_and_store(self, key: HistoryKey) -> pd.DataFrame:
+        ticker, period, interval = key
+        logger.debug(f"[MarketDataService._fetch_and_store] Fetching {key}")
+        data = await self._fetch(ticker, period, interval)
+        self.stats.fetches += 1
+        if data.empty:
+            # Unknown tickers come back empty; let the next request retry
+            return data
+        self._versions.observe(
+            ticker,
+            data.index[-1],
+            float(data["Close"].iloc[-1]) if "Close" in data.columns else None,
+        )
+        self._entries[key] = CachedHistory(data, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _serve(
+        data: pd.DataFrame, source_key: HistoryKey, key: HistoryKey
+    ) -> pd.DataFrame:
+        if source_key != key:
+            data = slice_history(data, key[1])
+        return data.copy()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+market_data = MarketDataService()
@@ -0,0 +1,445 @@
+"""
+Vectorized Black-Scholes pricing of option chains with Greeks.
+
+``black_scholes`` prices arrays of contracts in one NumPy pass; its inputs
+broadcast against each other, so a single contract, a list of strikes or a
+full strikes x expiries x call/put grid all take the same path.
+``price_chain`` builds that grid from a spot price and returns an
+``OptionChain`` whose arrays are shaped ``(option type, expiry, strike)``.
+
+Greeks are in the model's own units: vega and rho per 1.00 change in
+volatility and rate, theta per year.
+
+``implied_volatility`` inverts the model for arrays of observed prices with
+safeguarded Newton iterations: each lane keeps a bracket around its root and
+falls back to bisection whenever a Newton step would leave it, so lanes where
+vega vanishes (deep in or out of the money) still converge. A
+``VolatilitySurface`` built from listed option prices interpolates those
+implied volatilities for any strike and expiry.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.special import ndtr
+
+
+OPTION_TYPES = ("call", "put")
+GREEKS = ("delta", "gamma", "vega", "theta", "rho")
+# Volatilities the implied volatility solver searches between
+IV_BOUNDS = (1e-4, 5.0)
+# Price difference at which an implied volatility counts as solved
+DEFAULT_IV_TOLERANCE = 1e-8
+DEFAULT_IV_ITERATIONS = 100
+_INV_SQRT_2PI = 1 / np.sqrt(2 * np.pi)
+
+
+def parse_option_types(option_type: str) -> tuple[str, ...]:
+    """
+    Resolves an option type argument.
+
+    Args:
+        option_type (str): ``"call"``, ``"put"`` or ``"both"``, any case
+
+    Returns:
+        tuple[str, ...]: Option types to price
+
+    Raises:
+        ValueError: If the option type is unknown
+    """
+    option_type = option_type.lower()
+    if option_type == "both":
+        return OPTION_TYPES
+    if option_type in OPTION_TYPES:
+        return (option_type,)
+    raise ValueError("Invalid option type. Must be 'call', 'put' or 'both'.")
+
+
+@dataclass
+class OptionValuation:
+    """
+    Prices and Greeks of an array of contracts, all of the same shape.
+
+    Attributes:
+        price (np.ndarray): Fair value
+        delta (np.ndarray): Sensitivity to the spot price
+        gamma (np.ndarray): Sensitivity of delta to the spot price
+        vega (np.ndarray): Sensitivity to volatility
+        theta (np.ndarray): Sensitivity to the passage of time, per year
+        rho (np.ndarray): Sensitivity to the risk-free rate
+    """
+
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+    rho: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.price.shape
+
+    def contract(self, index: int | tuple[int, ...] = ()) -> dict[str, float]:
+        """Returns the price and Greeks of one contract as floats."""
+        return {name: float(getattr(self, name)[index]) for name in ("price", *GREEKS)}
+
+
+def black_scholes(
+    spot: float | np.ndarray,
+    strike: float | np.ndarray,
+    time_to_expiry: float | np.ndarray,
+    rate: float | np.ndarray,
+    volatility: float | np.ndarray,
+    is_call: bool | np.ndarray = True,
+) -> OptionValuation:
+    """
+    Prices European options and their Greeks for broadcastable input arrays.
+
+    Args:
+        spot (float | np.ndarray): Price of the underlying
+        strike (float | np.ndarray): Strike prices
+        time_to_expiry (float | np.ndarray): Times to expiry in years
+        rate (float | np.ndarray): Continuously compounded risk-free rates
+        volatility (float | np.ndarray): Annualized volatilities
+        is_call (bool | np.ndarray): True for calls, False for puts
+
+    Returns:
+        OptionValuation: Arrays of the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If a strike or time to expiry is not positive
+    """
+    spot, strike, time_to_expiry, rate, volatility, is_call = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (spot, strike, time_to_expiry, rate, volatility)
+        ),
+        np.asarray(is_call, dtype=bool),
+    )
+    if np.any(strike <= 0) or np.any(time_to_expiry <= 0):
+        raise ValueError("Strike prices and times to expiry must be positive.")
+
+    sqrt_t = np.sqrt(time_to_expiry)
+    sigma_sqrt_t = volatility * sqrt_t
+    d1 = (
+        np.log(spot / strike) + (rate + volatility**2 / 2) * time_to_expiry
+    ) / sigma_sqrt_t
+    d2 = d1 - sigma_sqrt_t
+    # +1 for calls, -1 for puts turns each formula into its put counterpart
+    sign = np.where(is_call, 1.0, -1.0)
+    discounted_strike = strike * np.exp(-rate * time_to_expiry)
+    n_d1 = ndtr(sign * d1)
+    n_d2 = ndtr(sign * d2)
+    pdf_d1 = np.exp(-(d1**2) / 2) * _INV_SQRT_2PI
+
+    return OptionValuation(
+        price=sign * (spot * n_d1 - discounted_strike * n_d2),
+        delta=sign * n_d1,
+        gamma=pdf_d1 / (spot * sigma_sqrt_t),
+        vega=spot * pdf_d1 * sqrt_t,
+        theta=-spot * pdf_d1 * volatility / (2 * sqrt_t)
+        - sign * rate * discounted_strike * n_d2,
+        rho=sign * discounted_strike * time_to_expiry * n_d2,
+    )
+
+
+@dataclass
+class OptionChain:
+    """
+    A strikes x expiries x option types grid priced with ``black_scholes``.
+
+    Attributes:
+        spot (float): Price of the underlying
+        strikes (np.ndarray): Strike prices, the last axis
+        expiries (np.ndarray): Times to expiry in years, the middle axis
+        option_types (tuple[str, ...]): ``"call"``/``"put"``, the first axis
+        volatility (np.ndarray): Volatility used per ``(expiry, strike)``
+        valuation (OptionValuation): Arrays shaped
+            ``(len(option_types), len(expiries), len(strikes))``
+    """
+
+    spot: float
+    strikes: np.ndarray
+    expiries: np.ndarray
+    option_types: tuple[str, ...]
+    volatility: np.ndarray
+    valuation: OptionValuation
+
+    def __len__(self) -> int:
+        return self.valuation.price.size
+
+    def contracts(self) -> Iterator[tuple[str, float, float, dict[str, float]]]:
+        """Yields (option type, expiry, strike, price, Greeks and volatility)."""
+        for index in np.ndindex(self.valuation.shape):
+            kind, expiry, strike = index
+            contract = self.valuation.contract(index)
+            contract["volatility"] = float(self.volatility[expiry, strike])
+            yield (
+                self.option_types[kind],
+                float(self.expiries[expiry]),
+                float(self.strikes[strike]),
+                contract,
+            )
+
+
+def price_chain(
+    spot: float,
+    strikes: Iterable[float],
+    expiries: Iterable[float],
+    rate: float | np.ndarray,
+    volatility: float | np.ndarray,
+    option_types: Sequence[str] = OPTION_TYPES,
+) -> OptionChain:
+    """
+    Prices every combination of strike, expiry and option type in one pass.
+
+    Args:
+        spot (float): Price of the underlying
+        strikes (Iterable[float]): Strike prices
+        expiries (Iterable[float]): Times to expiry in years
+        rate (float | np.ndarray): Risk-free rate, or one per expiry shaped
+            ``(len(expiries), 1)``
+        volatility (float | np.ndarray): Volatility, or a surface broadcastable
+            to ``(len(expiries), len(strikes))``
+        option_types (Sequence[str]): ``"call"`` and/or ``"put"``
+
+    Returns:
+        OptionChain: The priced grid
+    """
+    strikes = np.asarray(list(strikes), dtype=float)
+    expiries = np.asarray(list(expiries), dtype=float)
+    option_types = tuple(option_types)
+    is_call = np.array([kind == "call" for kind in option_types])
+    valuation = black_scholes(
+        spot,
+        strikes[np.newaxis, np.newaxis, :],
+        expiries[np.newaxis, :, np.newaxis],
+        rate,
+        volatility,
+        is_call[:, np.newaxis, np.newaxis],
+    )
+    volatility = np.broadcast_to(
+        np.asarray(volatility, dtype=float), (len(expiries), len(strikes))
+    )
+    return OptionChain(spot, strikes, expiries, option_types, volatility, valuation)
+
+
+def _price_and_vega(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    time_to_expiry: np.ndarray,
+    rate: np.ndarray,
+    volatility: np.ndarray,
+    sign: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Black-Scholes price and vega only, for the solver's inner loop."""
+    sqrt_t = np.sqrt(time_to_expiry)
+    sigma_sqrt_t = volatility * sqrt_t
+    d1 = (
+        np.log(spot / strike) + (rate + volatility**2 / 2) * time_to_expiry
+    ) / sigma_sqrt_t
+    discounted_strike = strike * np.exp(-rate * time_to_expiry)
+    price = sign * (
+        spot * ndtr(sign * d1) - discounted_strike * ndtr(sign * (d1 - sigma_sqrt_t))
+    )
+    return price, spot * np.exp(-(d1**2) / 2) * _INV_SQRT_2PI * sqrt_t
+
+
+def implied_volatility(
+    price: float | np.ndarray,
+    spot: float | np.ndarray,
+    strike: float | np.ndarray,
+    time_to_expiry: float | np.ndarray,
+    rate: float | np.ndarray,
+    is_call: bool | np.ndarray = True,
+    tolerance: float = DEFAULT_IV_TOLERANCE,
+    max_iterations: int = DEFAULT_IV_ITERATIONS,
+) -> np.ndarray:
+    """
+    Finds the volatilities at which Black-Scholes reproduces observed prices.
+
+    Every lane starts from the Manaster-Koehler guess and keeps a bracket
+    ``[low, high]`` that the model price crosses. Newton steps that would leave
+    the bracket, e.g. where vega is nearly zero, are replaced by its midpoint.
+    Lanes are dropped from the iteration as they converge.
+
+    Args:
+        price (float | np.ndarray): Observed option prices
+        spot (float | np.ndarray): Price of the underlying
+        strike (float | np.ndarray): Strike prices
+        time_to_expiry (float | np.ndarray): Times to expiry in years
+        rate (float | np.ndarray): Continuously compounded risk-free rates
+        is_call (bool | np.ndarray): True for calls, False for puts
+        tolerance (float): Accepted difference between model and observed price
+        max_iterations (int): Iterations before unsolved lanes are given up
+
+    Returns:
+        np.ndarray: Implied volatilities of the broadcast input shape; NaN
+            where the price is outside the no-arbitrage bounds or the solver
+            did not converge
+    """
+    arrays = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (price, spot, strike, time_to_expiry, rate)
+        ),
+        np.asarray(is_call, dtype=bool),
+    )
+    shape = arrays[0].shape
+    price, spot, strike, time_to_expiry, rate, is_call = (
+        array.ravel() for array in arrays
+    )
+    sign = np.where(is_call, 1.0, -1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        discounted_strike = strike * np.exp(-rate * time_to_expiry)
+        lower = np.maximum(sign * (spot - discounted_strike), 0.0)
+        upper = np.where(is_call, spot, discounted_strike)
+        solvable = (
+            (price > lower) & (price < upper) & (strike > 0) & (time_to_expiry > 0)
+        )
+        guess = np.sqrt(
+            2 * np.abs(np.log(spot / strike) + rate * time_to_expiry) / time_to_expiry
+        )
+    low = np.full(price.shape, IV_BOUNDS[0])
+    high = np.full(price.shape, IV_BOUNDS[1])
+    sigma = np.clip(np.nan_to_num(guess, nan=0.2), 0.05, 1.0)
+    solved = np.zeros(price.shape, dtype=bool)
+
+    lanes = np.flatnonzero(solvable)
+    for _ in range(max_iterations):
+        if lanes.size == 0:
+            break
+        current = sigma[lanes]
+        model, vega = _price_and_vega(
+            spot[lanes],
+            strike[lanes],
+            time_to_expiry[lanes],
+            rate[lanes],
+            current,
+            sign[lanes],
+        )
+        error = model - price[lanes]
+        # Price rises with volatility, so the sign of the error moves a bound
+        high[lanes] = np.where(error > 0, current, high[lanes])
+        low[lanes] = np.where(error < 0, current, low[lanes])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = current - error / vega
+        inside = (step > low[lanes]) & (step < high[lanes])
+        sigma[lanes] = np.where(inside, step, (low[lanes] + high[lanes]) / 2)
+
+        converged = np.abs(error) < tolerance
+        sigma[lanes[converged]] = current[converged]
+        collapsed = high[lanes] - low[lanes] < tolerance
+        # A bracket collapsed onto a search bound means the root lies beyond it
+        within = (low[lanes] > IV_BOUNDS[0]) & (high[lanes] < IV_BOUNDS[1])
+        solved[lanes[converged | (collapsed & within)]] = True
+        lanes = lanes[~(converged | collapsed)]
+
+    return np.where(solved, sigma, np.nan).reshape(shape)
+
+
+@dataclass
+class VolatilitySurface:
+    """
+    Implied volatilities by expiry and strike, interpolated between quotes.
+
+    Volatility is interpolated linearly in strike within each listed expiry,
+    then linearly in total variance ``sigma**2 * T`` across expiries. Outside
+    the quoted range the nearest volatility is used.
+
+    Attributes:
+        expiries (np.ndarray): Listed times to expiry in years, ascending
+        strikes (list[np.ndarray]): Quoted strikes per expiry, ascending
+        vols (list[np.ndarray]): Implied volatilities aligned with ``strikes``
+    """
+
+    expiries: np.ndarray
+    strikes: list[np.ndarray]
+    vols: list[np.ndarray]
+
+    @classmethod
+    def from_prices(
+        cls,
+        prices: np.ndarray,
+        spot: float,
+        strikes: np.ndarray,
+        expiries: np.ndarray,
+        rate: float | np.ndarray,
+        is_call: np.ndarray,
+    ) -> "VolatilitySurface":
+        """
+        Solves implied volatilities for listed option prices.
+
+        Calls and puts quoted at the same strike and expiry are averaged;
+        quotes without a solution are dropped.
+
+        Args:
+            prices (np.ndarray): Observed option prices, one per quote
+            spot (float): Price of the underlying
+            strikes (np.ndarray): Strike per quote
+            expiries (np.ndarray): Time to expiry in years per quote
+            rate (float | np.ndarray): Risk-free rate, or one per quote
+            is_call (np.ndarray): True for calls, False for puts, per quote
+
+        Returns:
+            VolatilitySurface: Surface over the solvable quotes
+
+        Raises:
+            ValueError: If no quote has an implied volatility
+        """
+        strikes = np.asarray(strikes, dtype=float)
+        expiries = np.asarray(expiries, dtype=float)
+        vols = implied_volatility(prices, spot, strikes, expiries, rate, is_call)
+        solved = np.isfinite(vols)
+        if not solved.any():
+            raise ValueError("No option price has an implied volatility.")
+        strikes, expiries, vols = strikes[solved], expiries[solved], vols[solved]
+
+        listed = np.unique(expiries)
+        surface_strikes, surface_vols = [], []
+        for expiry in listed:
+            row = expiries == expiry
+            row_strikes, inverse = np.unique(strikes[row], return_inverse=True)
+            totals = np.bincount(inverse, weights=vols[row])
+            surface_strikes.append(row_strikes)
+            surface_vols.append(totals / np.bincount(inverse))
+        return cls(listed, surface_strikes, surface_vols)
+
+    def __call__(
+        self, strikes: Iterable[float], expiries: Iterable[float]
+    ) -> np.ndarray:
+        """
+        Interpolates volatilities for a grid of contracts.
+
+        Args:
+            strikes (Iterable[float]): Strike prices
+            expiries (Iterable[float]): Times to expiry in years
+
+        Returns:
+            np.ndarray: Volatilities shaped ``(len(expiries), len(strikes))``
+        """
+        strikes = np.asarray(list(strikes), dtype=float)
+        expiries = np.asarray(list(expiries), dtype=float)
+        by_expiry = np.array(
+            [
+                np.interp(strikes, listed_strikes, listed_vols)
+                for listed_strikes, listed_vols in zip(
+                    self.strikes, self.vols, strict=True
+                )
+            ]
+        )
+        if len(self.expiries) == 1:
+            return np.tile(by_expiry[0], (len(expiries), 1))
+
+        variance = by_expiry**2 * self.expiries[:, np.newaxis]
+        clipped = np.clip(expiries, self.expiries[0], self.expiries[-1])
+        upper = np.clip(
+            np.searchsorted(self.expiries, clipped), 1, len(self.expiries) - 1
+        )
+        start, end = self.expiries[upper - 1], self.expiries[upper]
+        weight = ((clipped - start) / (end - start))[:, np.newaxis]
+        interpolated = variance[upper - 1] * (1 - weight) + variance[upper] * weight
+        return np.sqrt(interpolated / clipped[:, np.newaxis])
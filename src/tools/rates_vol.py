@@ -0,0 +1,280 @@
+"""
+Cached risk-free rate term structure and rolling realized volatility.
+
+Options pricing used to download ``^IRX`` and three months of prices on every
+request to get one rate and one volatility. ``RatesVolService`` keeps both:
+
+- ``TreasuryCurve``: yields of the 13-week bill and the 5 and 10 year notes
+  (``^IRX``, ``^FVX``, ``^TNX``), cached for ``curve_ttl`` seconds and
+  interpolated linearly to each option's time to expiry.
+- ``RollingVolatility``: annualized volatility of the last ``window`` daily
+  log returns per ticker. After the first three months of history it is fed
+  only the bars of a short recent fetch, so each new bar is one update rather
+  than a recomputation.
+
+All data comes through ``MarketDataService``, which caches and coalesces the
+underlying fetches.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.tools.market_data import MarketDataService, market_data
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Treasury yield indices, in percent, by maturity in years
+TREASURY_TENORS: dict[str, float] = {"^IRX": 0.25, "^FVX": 5.0, "^TNX": 10.0}
+DEFAULT_CURVE_TTL = 900
+# Daily returns in the volatility window, about three months of trading days
+DEFAULT_VOL_WINDOW = 63
+TRADING_DAYS = 252
+# Period fetched to catch up an existing volatility estimate
+RECENT_PERIOD = "5d"
+FULL_PERIOD = "3mo"
+
+
+@dataclass(frozen=True)
+class TreasuryCurve:
+    """
+    Risk-free rates by maturity.
+
+    Attributes:
+        tenors (np.ndarray): Maturities in years, ascending
+        rates (np.ndarray): Rates as fractions, aligned with ``tenors``
+    """
+
+    tenors: np.ndarray
+    rates: np.ndarray
+
+    def rate(self, time_to_expiry: float | Iterable[float]) -> float | np.ndarray:
+        """
+        Interpolates the rate for a maturity, flat beyond the quoted tenors.
+
+        Args:
+            time_to_expiry (float | Iterable[float]): Maturities in years
+
+        Returns:
+            float | np.ndarray: A rate per maturity, a float for a float input
+        """
+        if np.isscalar(time_to_expiry):
+            return float(np.interp(time_to_expiry, self.tenors, self.rates))
+        return np.interp(
+            np.asarray(list(time_to_expiry), dtype=float), self.tenors, self.rates
+        )
+
+
+class RollingVolatility:
+    """
+    Annualized realized volatility over a rolling window of daily log returns.
+
+    The newest bar of a history may still be trading, so its return is kept
+    provisional and replaced on the next update; only bars with a newer bar
+    after them are committed to the window.
+
+    Attributes:
+        window (int): Daily returns the estimate covers
+        last_bar (pd.Timestamp | None): Newest committed bar, None when the
+            history had no timestamps to resume from
+        _returns: Committed log returns, oldest first
+        _sum: Sum of ``_returns``
+        _sum_sq: Sum of squares of ``_returns``
+        _last_close: Close of the newest committed bar
+        _provisional_close: Close of the newest, uncommitted bar
+    """
+
+    def __init__(self, window: int = DEFAULT_VOL_WINDOW) -> None:
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self._returns: deque[float] = deque()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._last_close: float | None = None
+        self._provisional_close: float | None = None
+        self.last_bar: pd.Timestamp | None = None
+
+    def _commit(self, close: float) -> None:
+        if self._last_close is not None:
+            value = math.log(close / self._last_close)
+            self._returns.append(value)
+            self._sum += value
+            self._sum_sq += value * value
+            # One slot stays free for the provisional return
+            if len(self._returns) > self.window - 1:
+                evicted = self._returns.popleft()
+                self._sum -= evicted
+                self._sum_sq -= evicted * evicted
+        self._last_close = close
+
+    def update(self, closes: pd.Series) -> bool:
+        """
+        Feeds the bars newer than the last committed one.
+
+        Args:
+            closes (pd.Series): Daily closes, oldest first; without a
+                ``DatetimeIndex`` the estimate is rebuilt from them
+
+        Returns:
+            bool: False if ``closes`` starts after the last committed bar, so
+                bars are missing; nothing is fed then
+        """
+        closes = closes.dropna()
+        if not isinstance(closes.index, pd.DatetimeIndex):
+            self.reset()
+        elif self.last_bar is not None:
+            if not closes.empty and closes.index[0] > self.last_bar:
+                return False
+            closes = closes[closes.index > self.last_bar]
+        if closes.empty:
+            return True
+
+        for bar, close in closes.iloc[:-1].items():
+            self._commit(float(close))
+            if isinstance(bar, pd.Timestamp):
+                self.last_bar = bar
+        self._provisional_close = float(closes.iloc[-1])
+        return True
+
+    @property
+    def value(self) -> float:
+        """Annualized volatility, NaN before two closes were seen."""
+        count, total, total_sq = len(self._returns), self._sum, self._sum_sq
+        if self._last_close is not None and self._provisional_close is not None:
+            provisional = math.log(self._provisional_close / self._last_close)
+            count, total, total_sq = (
+                count + 1,
+                total + provisional,
+                total_sq + provisional * provisional,
+            )
+        if count == 0:
+            return math.nan
+        variance = max(total_sq / count - (total / count) ** 2, 0.0)
+        return math.sqrt(TRADING_DAYS * variance)
+
+
+class RatesVolService:
+    """
+    Shared source of risk-free rates and realized volatilities.
+
+    Attributes:
+        _market: Cached price history source
+        _tenors: Maturity in years per yield index
+        _curve_ttl: Seconds a fetched curve is reused
+        _vol_window: Returns per volatility estimate
+        _curve: Latest curve and when it was fetched
+        _estimators: Rolling volatility per upper-cased ticker
+    """
+
+    def __init__(
+        self,
+        market: MarketDataService = market_data,
+        tenors: Mapping[str, float] | None = None,
+        curve_ttl: float = DEFAULT_CURVE_TTL,
+        vol_window: int = DEFAULT_VOL_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._market = market
+        self._tenors = dict(TREASURY_TENORS if tenors is None else tenors)
+        self._curve_ttl = curve_ttl
+        self._vol_window = vol_window
+        self._clock = clock
+        self._curve: tuple[TreasuryCurve, float] | None = None
+        self._curve_lock = asyncio.Lock()
+        self._estimators: dict[str, RollingVolatility] = {}
+
+    def _fresh_curve(self) -> TreasuryCurve | None:
+        if self._curve is None:
+            return None
+        curve, fetched_at = self._curve
+        return curve if self._clock() - fetched_at <= self._curve_ttl else None
+
+    async def curve(self) -> TreasuryCurve:
+        """
+        Returns the Treasury curve, fetching it when the cached one expired.
+
+        Raises:
+            ValueError: If no yield index returned data
+        """
+        curve = self._fresh_curve()
+        if curve is not None:
+            return curve
+        async with self._curve_lock:
+            # Another caller may have refreshed it while this one waited
+            curve = self._fresh_curve()
+            if curve is not None:
+                return curve
+            histories = await asyncio.gather(
+                *(
+                    self._market.history(symbol, RECENT_PERIOD)
+                    for symbol in self._tenors
+                )
+            )
+            points = sorted(
+                (tenor, float(history["Close"].dropna().iloc[-1]) / 100)
+                for tenor, history in zip(self._tenors.values(), histories, strict=True)
+                if not history["Close"].dropna().empty
+            )
+            if not points:
+                raise ValueError("No Treasury yields available.")
+            tenors, rates = zip(*points, strict=True)
+            curve = TreasuryCurve(np.array(tenors), np.array(rates))
+            logger.info(
+                f"[RatesVolService.curve] Treasury curve: "
+                f"{', '.join(f'{t:g}y {r:.2%}' for t, r in points)}"
+            )
+            self._curve = (curve, self._clock())
+            return curve
+
+    async def risk_free_rate(
+        self, time_to_expiry: float | Iterable[float]
+    ) -> float | np.ndarray:
+        """Interpolates the current curve at one or more maturities."""
+        return (await self.curve()).rate(time_to_expiry)
+
+    async def realized_volatility(self, ticker: str) -> float:
+        """
+        Returns a ticker's annualized realized volatility.
+
+        The first request reads three months of history; later ones fetch
+        only the last few days and feed the new bars to the estimate. If bars
+        are missing in between, the estimate is rebuilt.
+
+        Args:
+            ticker (str): Ticker symbol
+
+        Returns:
+            float: Volatility as a fraction, NaN without enough history
+        """
+        key = ticker.upper()
+        estimator = self._estimators.get(key)
+        if estimator is not None and estimator.last_bar is not None:
+            recent = await self._market.history(key, RECENT_PERIOD)
+            if estimator.update(recent["Close"]):
+                return estimator.value
+            logger.info(
+                f"[RatesVolService.realized_volatility] Bars missing since {estimator.last_bar}, rebuilding {key}"
+            )
+
+        estimator = RollingVolatility(self._vol_window)
+        history = await self._market.history(key, FULL_PERIOD)
+        estimator.update(history["Close"])
+        self._estimators[key] = estimator
+        return estimator.value
+
+    def clear(self) -> None:
+        self._curve = None
+        self._estimators.clear()
+
+
+rates_vol = RatesVolService()
@@ -0,0 +1,36 @@
+"""
+Registry of the tools exposed to the orchestrator agents.
+
+Both orchestrators and the generated system prompt read from this registry so
+the tool list, the schemas sent through ``tools=`` and the prompt text cannot
+drift apart.
+"""
+
+from autogen_core.tools import BaseTool
+
+from src.tools.tools import (
+    FinancialLiteracyTool,
+    OptionsPricingTool,
+    PortfolioOptimizationTool,
+    SentimentAnalysisTool,
+    StockInfoTool,
+)
+
+
+ORCHESTRATOR_TOOL_CLASSES: tuple[type[BaseTool], ...] = (
+    OptionsPricingTool,
+    StockInfoTool,
+    SentimentAnalysisTool,
+    FinancialLiteracyTool,
+    PortfolioOptimizationTool,
+)
+
+
+def build_orchestrator_tools() -> list[BaseTool]:
+    """
+    Instantiates every tool registered for the orchestrator agents.
+
+    Returns:
+        list[BaseTool]: One instance per registered tool, in registry order
+    """
+    return [tool_class() for tool_class in ORCHESTRATOR_TOOL_CLASSES]
@@ -0,0 +1,240 @@
+"""
+Local pre-router that narrows the tool set before the LLM planning call.
+
+Every tool schema sent through ``tools=`` adds prompt tokens and gives the
+planner more options to weigh. Many questions clearly target one or two tools
+("what is an ETF" only needs ``explain_finance``), so a cheap keyword and
+ticker matcher picks that subset up front. When nothing matches with enough
+confidence the router falls back to the full tool set, so routing can only
+shrink a request, never make a tool unreachable for an ambiguous one. A
+planned call to a tool outside the subset gets an error as its result, which
+the validation retry re-plans.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import re
+
+from autogen_core.tools import BaseTool
+
+from src.tools.literacy import knowledge_base
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+STRONG = 1.0
+WEAK = 0.5
+
+# Keyword weights per tool name. Strong keywords select a tool on their own,
+# weak ones only count towards the score.
+TOOL_KEYWORDS: dict[str, dict[str, float]] = {
+    "explain_finance": {
+        "what is": STRONG,
+        "what are": STRONG,
+        "what does": STRONG,
+        "explain": STRONG,
+        "define": STRONG,
+        "definition": STRONG,
+        "meaning": STRONG,
+        "how does": WEAK,
+        "how do": WEAK,
+    },
+    "fetch_stock_data": {
+        "price": STRONG,
+        "quote": STRONG,
+        "trading at": STRONG,
+        "closed at": STRONG,
+        "opened at": STRONG,
+        "volume": STRONG,
+        "stock": WEAK,
+        "today": WEAK,
+        "close": WEAK,
+        "open": WEAK,
+    },
+    "options_pricing_calculator": {
+        "option": STRONG,
+        "options": STRONG,
+        "strike": STRONG,
+        "black-scholes": STRONG,
+        "greeks": STRONG,
+        "call": WEAK,
+        "put": WEAK,
+        "expiry": WEAK,
+        "expiration": WEAK,
+        "chain": WEAK,
+        "american": WEAK,
+    },
+    "analyze_sentiment": {
+        "sentiment": STRONG,
+        "bullish": STRONG,
+        "bearish": STRONG,
+        "mood": WEAK,
+        "news": WEAK,
+        "feel": WEAK,
+    },
+    "optimize_portfolio": {
+        "optimize": STRONG,
+        "optimise": STRONG,
+        "allocation": STRONG,
+        "rebalance": STRONG,
+        "weights": WEAK,
+        "portfolio": WEAK,
+    },
+    "predict_stock_price": {
+        "forecast": STRONG,
+        "predict": STRONG,
+        "prediction": STRONG,
+        "tomorrow": WEAK,
+        "next day": WEAK,
+    },
+    "ai_powered_stock_screener": {
+        "screen": STRONG,
+        "screener": STRONG,
+        "market cap": WEAK,
+        "sector": WEAK,
+    },
+}
+
+# Tickers on their own point at market data, but only weakly
+TICKER_TOOL = "fetch_stock_data"
+TICKER_PATTERN = re.compile(r"\$?\b[A-Z]{1,5}\b")
+NON_TICKER_WORDS = {"A", "I", "AI", "CEO", "EPS", "ETF", "IPO", "PE", "US", "USD"}
+
+
+def extract_tickers(query: str) -> list[str]:
+    """
+    Finds ticker-like tokens (upper-case words of up to five letters) in a query.
+
+    Args:
+        query (str): The user's question, with its original casing
+
+    Returns:
+        list[str]: Unique tickers in order of appearance
+    """
+    tickers = (token.lstrip("$") for token in TICKER_PATTERN.findall(query))
+    return list(dict.fromkeys(t for t in tickers if t not in NON_TICKER_WORDS))
+
+
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    return re.compile(rf"\b{re.escape(keyword)}\b")
+
+
+@dataclass
+class RouteDecision:
+    """
+    Result of routing one query.
+
+    Attributes:
+        tools (list[BaseTool]): Tools to send with the planning call
+        confidence (float): Highest per-tool score, capped at 1.0
+        scores (dict[str, float]): Score per matched tool name
+        tickers (list[str]): Tickers mentioned in the query
+        fallback (bool): True when the full tool set was returned
+    """
+
+    tools: list[BaseTool]
+    confidence: float
+    scores: dict[str, float] = field(default_factory=dict)
+    tickers: list[str] = field(default_factory=list)
+    fallback: bool = False
+
+    @property
+    def tool_names(self) -> list[str]:
+        return [tool.name for tool in self.tools]
+
+
+class ToolRouter:
+    """
+    Keyword and ticker matcher that picks a tool subset for a query.
+
+    Attributes:
+        _tools: Every available tool, in the order they are sent to the model
+        _min_confidence: Confidence below which all tools are returned
+        _min_score: Score a tool needs to be part of the subset
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        min_confidence: float = STRONG,
+        min_score: float = WEAK,
+    ) -> None:
+        self._tools = list(tools)
+        self._min_confidence = min_confidence
+        self._min_score = min_score
+        self._patterns = {
+            name: [
+                (_keyword_pattern(keyword), weight)
+                for keyword, weight in keywords.items()
+            ]
+            for name, keywords in TOOL_KEYWORDS.items()
+        }
+        self._topic_patterns = [_keyword_pattern(topic) for topic in knowledge_base]
+
+    def score(self, query: str) -> dict[str, float]:
+        """
+        Scores each available tool against the query.
+
+        Args:
+            query (str): The user's question
+
+        Returns:
+            dict[str, float]: Score per tool name, only for tools that matched
+        """
+        text = query.lower()
+        available = {tool.name for tool in self._tools}
+        scores: dict[str, float] = {}
+        for name, patterns in self._patterns.items():
+            if name not in available:
+                continue
+            total = sum(weight for pattern, weight in patterns if pattern.search(text))
+            if total:
+                scores[name] = total
+
+        if "explain_finance" in available and any(
+            pattern.search(text) for pattern in self._topic_patterns
+        ):
+            scores["explain_finance"] = scores.get("explain_finance", 0.0) + WEAK
+
+        if extract_tickers(query) and TICKER_TOOL in available:
+            scores[TICKER_TOOL] = scores.get(TICKER_TOOL, 0.0) + WEAK
+        return scores
+
+    def route(self, query: str) -> RouteDecision:
+        """
+        Picks the tools to send with the planning call for a query.
+
+        Args:
+            query (str): The user's question
+
+        Returns:
+            RouteDecision: Selected tools, or every tool if confidence is low
+        """
+        scores = self.score(query)
+        tickers = extract_tickers(query)
+        confidence = min(max(scores.values(), default=0.0), 1.0)
+        selected = [
+            tool
+            for tool in self._tools
+            if scores.get(tool.name, 0.0) >= self._min_score
+        ]
+        if confidence < self._min_confidence or not selected:
+            logger.debug(
+                f"[ToolRouter.route] Low confidence {confidence:.2f}, using all tools"
+            )
+            return RouteDecision(
+                tools=list(self._tools),
+                confidence=confidence,
+                scores=scores,
+                tickers=tickers,
+                fallback=True,
+            )
+
+        decision = RouteDecision(
+            tools=selected, confidence=confidence, scores=scores, tickers=tickers
+        )
+        logger.debug(
+            f"[ToolRouter.route] Routed to {decision.tool_names} with scores {scores}"
+        )
+        return decision
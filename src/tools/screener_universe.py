@@ -0,0 +1,416 @@
+"""
+Prebuilt fundamentals universe behind the stock screener.
+
+Screening used to fetch a company overview from Alpha Vantage for every
+candidate ticker on every request. ``ScreenerUniverse`` fetches the overviews
+once, persists them to a local JSON file and indexes them by sector, with
+market caps kept in sorted arrays. A screen is then two ``bisect`` lookups.
+
+The universe is refreshed in the background once it is older than its
+refresh interval; screens never wait for a refresh to finish. While one runs,
+the index is rebuilt after every fetched overview, so on a slow tier the first
+screen already sees the companies fetched so far. Overviews are fetched
+concurrently by a ``FetchScheduler`` within the limits of
+``ALPHA_VANTAGE_TIER``; a refresh cut short by the daily quota keeps the
+previous data for the tickers it missed and resumes from its checkpoint an
+hour later. The tickers come from ``SCREENER_UNIVERSE``, either a comma
+separated list or a file with one ticker per line, and default to
+``DEFAULT_UNIVERSE``.
+
+Usage (prebuild the universe file):
+    python -m src.tools.screener_universe
+"""
+
+import asyncio
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import time
+
+from alpha_vantage.fundamentaldata import FundamentalData
+from dotenv import load_dotenv
+
+from src.tools.fetch_scheduler import FetchScheduler
+from src.tools.market_data import ALPHA_VANTAGE, provider_executor
+from src.utils.logger import get_logger
+
+
+load_dotenv()
+logger = get_logger(__name__)
+
+DEFAULT_UNIVERSE_PATH = ".cache/screener_universe.json"
+DEFAULT_REFRESH_INTERVAL = 24 * 3600
+# Wait between attempts to finish a refresh cut short by the daily quota
+DEFAULT_RESUME_INTERVAL = 3600
+# Ten large caps per sector, the screener's original hard-coded list
+DEFAULT_UNIVERSE: tuple[str, ...] = (
+    # Technology
+    *("AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "INTC", "AMD", "CSCO"),
+    # Healthcare
+    *("PFE", "JNJ", "UNH", "MRK", "ABT", "MRNA", "LLY", "AMGN", "GILD", "CVS"),
+    # Financials
+    *("JPM", "BAC", "WFC", "GS", "MS", "C", "AXP", "SCHW", "V", "MA"),
+    # Consumer Discretionary
+    *("HD", "NKE", "MCD", "SBUX", "TGT", "DIS", "LOW", "BKNG", "YUM", "EBAY"),
+    # Consumer Staples
+    *("PG", "KO", "PEP", "WMT", "COST", "CL", "MDLZ", "KMB", "MO", "PM"),
+    # Energy
+    *("XOM", "CVX", "COP", "SLB", "HAL", "BKR", "MPC", "VLO", "OXY", "PXD"),
+    # Industrials
+    *("BA", "CAT", "LMT", "GE", "HON", "RTX", "MMM", "UNP", "DE", "NOC"),
+    # Utilities
+    *("DUK", "NEE", "D", "SO", "EXC", "AEP", "SRE", "ED", "XEL", "PEG"),
+    # Real Estate
+    *("PLD", "AMT", "SPG", "O", "AVB", "DLR", "EQR", "WELL", "VTR", "BXP"),
+    # Materials
+    *("DOW", "LYB", "DD", "NEM", "FCX", "IP", "VMC", "CF", "BALL", "EMN"),
+)
+
+
+@dataclass(frozen=True)
+class CompanyFundamentals:
+    """
+    The overview fields the screener filters on.
+
+    Attributes:
+        ticker (str): Ticker symbol
+        sector (str): Sector as reported by Alpha Vantage, e.g. ``"TECHNOLOGY"``
+        market_cap (float): Market capitalization in billions
+    """
+
+    ticker: str
+    sector: str
+    market_cap: float
+
+
+OverviewFetcher = Callable[[str], Awaitable[CompanyFundamentals | None]]
+
+
+def load_universe_tickers(setting: str | None = None) -> list[str]:
+    """
+    Resolves the tickers to screen.
+
+    Args:
+        setting (Optional[str]): Comma separated tickers or a path to a file with
+            one ticker per line; defaults to ``SCREENER_UNIVERSE``
+
+    Returns:
+        list[str]: Upper-cased tickers, ``DEFAULT_UNIVERSE`` if nothing is set
+    """
+    setting = setting if setting is not None else os.getenv("SCREENER_UNIVERSE", "")
+    if not setting.strip():
+        return list(DEFAULT_UNIVERSE)
+    if os.path.isfile(setting):
+        with open(setting, encoding="utf-8") as f:
+            entries = f.read().split()
+    else:
+        entries = setting.split(",")
+    return [entry.strip().upper() for entry in entries if entry.strip()]
+
+
+def parse_company_overview(ticker: str, overview: object) -> CompanyFundamentals | None:
+    """
+    Extracts sector and market cap from an Alpha Vantage company overview.
+
+    Args:
+        ticker (str): Ticker the overview was requested for
+        overview (object): ``get_company_overview`` result, ``(data, meta)``
+
+    Returns:
+        Optional[CompanyFundamentals]: None if the overview is empty or malformed
+    """
+    if not overview or not isinstance(overview, list | tuple):
+        return None
+    company_data = overview[0]
+    try:
+        return CompanyFundamentals(
+            ticker=ticker,
+            sector=company_data.get("Sector", ""),
+            market_cap=float(company_data.get("MarketCapitalization", 0)) / 1e9,
+        )
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.error(f"[parse_company_overview] Error processing {ticker}: {e}")
+        return None
+
+
+class AlphaVantageOverviews:
+    """Fetches company overviews from Alpha Vantage in the provider thread pool."""
+
+    def __init__(self, api_key: str | None = None) -> None:
+        self._api_key = api_key
+        self._client: FundamentalData | None = None
+
+    async def __call__(self, ticker: str) -> CompanyFundamentals | None:
+        if self._client is None:
+            self._client = FundamentalData(
+                self._api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
+            )
+        overview = await provider_executor.run(
+            ALPHA_VANTAGE, self._client.get_company_overview, ticker
+        )
+        return parse_company_overview(ticker, overview)
+
+
+class SectorIndex:
+    """
+    Companies grouped by sector, each sector sorted by market cap.
+
+    Attributes:
+        _caps: Ascending market caps per lower-cased sector
+        _tickers: Tickers aligned with ``_caps``
+    """
+
+    def __init__(self, companies: Iterable[CompanyFundamentals]) -> None:
+        by_sector: dict[str, list[CompanyFundamentals]] = {}
+        for company in companies:
+            by_sector.setdefault(company.sector.lower(), []).append(company)
+        self._caps: dict[str, list[float]] = {}
+        self._tickers: dict[str, list[str]] = {}
+        for sector, members in by_sector.items():
+            members.sort(key=lambda company: company.market_cap)
+            self._caps[sector] = [company.market_cap for company in members]
+            self._tickers[sector] = [company.ticker for company in members]
+
+    def __len__(self) -> int:
+        return sum(len(caps) for caps in self._caps.values())
+
+    @property
+    def sectors(self) -> list[str]:
+        return sorted(self._caps)
+
+    def screen(
+        self, sector: str, market_cap_min: float, market_cap_max: float
+    ) -> list[tuple[str, float]]:
+        """
+        Finds the companies of a sector within a market cap range.
+
+        Args:
+            sector (str): Sector name, case-insensitive
+            market_cap_min (float): Lower bound in billions, inclusive
+            market_cap_max (float): Upper bound in billions, inclusive
+
+        Returns:
+            list[tuple[str, float]]: (ticker, market cap) pairs, largest first
+        """
+        caps = self._caps.get(sector.lower(), [])
+        start = bisect_left(caps, market_cap_min)
+        end = bisect_right(caps, market_cap_max)
+        tickers = self._tickers.get(sector.lower(), [])
+        return [(tickers[i], caps[i]) for i in range(end - 1, start - 1, -1)]
+
+
+class ScreenerUniverse:
+    """
+    Persisted, periodically refreshed fundamentals of the screening universe.
+
+    Attributes:
+        tickers (list[str]): Tickers in the universe
+        index (SectorIndex): Current sector index
+        fetched_at (float | None): Wall-clock time of the last complete refresh
+        updated_at (float | None): Wall-clock time of the last refresh that
+            finished, complete or cut short
+        _path: JSON file the universe is persisted to
+        _scheduler: Fetches the companies' fundamentals within the API limits
+        _companies: Companies in the current index
+        _refresh_interval: Seconds after which the universe is refreshed
+        _resume_interval: Seconds before a partial refresh is resumed
+        _refresh: Background refresh in progress, if any
+        _indexed: Set once the index holds any company
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str] | None = None,
+        path: str | Path | None = None,
+        fetch: OverviewFetcher | None = None,
+        refresh_interval: float | None = None,
+        clock: Callable[[], float] = time.time,
+        scheduler: FetchScheduler[CompanyFundamentals] | None = None,
+        resume_interval: float = DEFAULT_RESUME_INTERVAL,
+    ) -> None:
+        self.tickers = list(tickers) if tickers is not None else load_universe_tickers()
+        self._path = Path(
+            path or os.getenv("SCREENER_UNIVERSE_PATH", DEFAULT_UNIVERSE_PATH)
+        )
+        self._scheduler = scheduler or FetchScheduler(
+            fetch or AlphaVantageOverviews(),
+            decode=lambda company: CompanyFundamentals(**company),
+            checkpoint_path=self._path.with_suffix(".checkpoint.json"),
+            clock=clock,
+        )
+        self._refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else float(os.getenv("SCREENER_REFRESH_SECONDS", DEFAULT_REFRESH_INTERVAL))
+        )
+        self._resume_interval = resume_interval
+        self._clock = clock
+        self.index = SectorIndex([])
+        self._companies: list[CompanyFundamentals] = []
+        self.fetched_at: float | None = None
+        self.updated_at: float | None = None
+        self._refresh: asyncio.Task | None = None
+        self._indexed = asyncio.Event()
+        self._loaded = False
+
+    def load(self) -> bool:
+        """
+        Loads the persisted universe, if there is one.
+
+        Returns:
+            bool: True if a universe file was read
+        """
+        self._loaded = True
+        if not self._path.is_file():
+            return False
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                state = json.load(f)
+            companies = [
+                CompanyFundamentals(**company) for company in state["companies"]
+            ]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"[ScreenerUniverse.load] Ignoring {self._path}: {e}")
+            return False
+        self._update_index(companies)
+        self.fetched_at = state.get("fetched_at")
+        self.updated_at = state.get("updated_at", self.fetched_at)
+        logger.info(
+            f"[ScreenerUniverse.load] Loaded {len(companies)} companies from {self._path}"
+        )
+        return True
+
+    def save(self, companies: list[CompanyFundamentals]) -> None:
+        """Persists the universe atomically next to its final path."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_suffix(".tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fetched_at": self.fetched_at,
+                    "updated_at": self.updated_at,
+                    "companies": [asdict(company) for company in companies],
+                },
+                f,
+            )
+        temporary.replace(self._path)
+
+    @property
+    def partial(self) -> bool:
+        """Whether the index may miss companies, i.e. no refresh completed yet."""
+        return self.fetched_at is None
+
+    def is_stale(self) -> bool:
+        return (
+            self.fetched_at is None
+            or self._clock() - self.fetched_at >= self._refresh_interval
+        )
+
+    def needs_refresh(self) -> bool:
+        """
+        Whether a refresh should start now.
+
+        A stale universe is refreshed right away, unless the last refresh was
+        cut short less than ``_resume_interval`` ago; the quota it ran into
+        would stop the next one just as quickly.
+        """
+        if not self.is_stale():
+            return False
+        cut_short = self.updated_at is not None and self.updated_at != self.fetched_at
+        return not cut_short or self._clock() - self.updated_at >= self._resume_interval
+
+    def _update_index(self, companies: list[CompanyFundamentals]) -> None:
+        self._companies = companies
+        self.index = SectorIndex(companies)
+        if companies:
+            self._indexed.set()
+
+    async def refresh(self) -> int:
+        """
+        Fetches every ticker's fundamentals and swaps in a new index.
+
+        The index is rebuilt after every fetched ticker, so screens see the
+        new fundamentals as they arrive. Tickers the scheduler could not fetch
+        within today's quota keep their previous fundamentals; only
+        ``updated_at`` moves then, and ``fetched_at`` waits for a refresh that
+        completes.
+
+        Returns:
+            int: Number of companies in the new index
+        """
+        logger.info(
+            f"[ScreenerUniverse.refresh] Refreshing {len(self.tickers)} tickers"
+        )
+        previous = {company.ticker: company for company in self._companies}
+
+        def merge(
+            results: dict[str, CompanyFundamentals | None],
+        ) -> list[CompanyFundamentals]:
+            merged = (
+                results[ticker] if ticker in results else previous.get(ticker)
+                for ticker in self.tickers
+            )
+            return [company for company in merged if company]
+
+        report = await self._scheduler.run(
+            self.tickers, on_progress=lambda results: self._update_index(merge(results))
+        )
+        companies = merge(report.results)
+        self.updated_at = self._clock()
+        if report.complete:
+            self.fetched_at = self.updated_at
+        else:
+            logger.warning(
+                f"[ScreenerUniverse.refresh] {len(report.pending)} tickers pending, kept their previous data"
+            )
+        self._update_index(companies)
+        self.save(companies)
+        logger.info(f"[ScreenerUniverse.refresh] Indexed {len(companies)} companies")
+        return len(companies)
+
+    async def ensure_fresh(self) -> None:
+        """
+        Makes an index available, refreshing it in the background when due.
+
+        Screens never wait for a refresh to finish. With nothing indexed yet,
+        they wait only until the first company is fetched.
+        """
+        if not self._loaded:
+            self.load()
+        if self.needs_refresh() and (self._refresh is None or self._refresh.done()):
+            self._refresh = asyncio.ensure_future(self.refresh())
+            self._refresh.add_done_callback(self._log_refresh_failure)
+        if self._indexed.is_set() or self._refresh is None or self._refresh.done():
+            return
+        indexed = asyncio.ensure_future(self._indexed.wait())
+        try:
+            await asyncio.wait(
+                {self._refresh, indexed}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            indexed.cancel()
+
+    @staticmethod
+    def _log_refresh_failure(refresh: asyncio.Future) -> None:
+        if not refresh.cancelled() and refresh.exception() is not None:
+            logger.error(
+                f"[ScreenerUniverse.refresh] Refresh failed: {refresh.exception()}"
+            )
+
+    async def screen(
+        self, sector: str, market_cap_min: float, market_cap_max: float
+    ) -> list[tuple[str, float]]:
+        """Runs ``SectorIndex.screen`` on a fresh enough index."""
+        await self.ensure_fresh()
+        return self.index.screen(sector, market_cap_min, market_cap_max)
+
+
+screener_universe = ScreenerUniverse()
+
+
+if __name__ == "__main__":
+    count = asyncio.run(screener_universe.refresh())
+    print(f"Indexed {count} companies into {screener_universe._path}")
@@ -4,21 +4,23 @@ This module contains tools for stock data retrieval, price prediction, sentiment
 portfolio optimization, options pricing, and stock screening functionalities.
 """
 
+import asyncio
 from datetime import datetime
-import math
 import os
 
-from alpha_vantage.fundamentaldata import FundamentalData
 from autogen_core import CancellationToken
 from autogen_core.tools import BaseTool
 from dotenv import load_dotenv
 import numpy as np
 from pydantic import BaseModel, Field
-from scipy.stats import norm
-from sklearn.linear_model import LinearRegression
-import yfinance as yf
 
+from src.tools.american import price_american
+from src.tools.forecast import trend_forecaster
 from src.tools.literacy import knowledge_base
+from src.tools.market_data import fetch_yfinance_option_quotes, market_data
+from src.tools.options import VolatilitySurface, parse_option_types, price_chain
+from src.tools.rates_vol import rates_vol
+from src.tools.screener_universe import ScreenerUniverse, screener_universe
 from src.utils.logger import get_logger
 
 
@@ -42,6 +44,9 @@ class StockDataOutput(BaseModel):
     """Output model for stock data containing historical data as JSON string."""
 
     data: str = Field(description="Historical stock data as a JSON string.")
+    values: dict[str, float] = Field(
+        default_factory=dict, description="Numbers behind the formatted data."
+    )
 
 
 class StockInfoTool(BaseTool[StockDataInput, StockDataOutput]):
@@ -60,8 +65,7 @@ class StockInfoTool(BaseTool[StockDataInput, StockDataOutput]):
     ) -> StockDataOutput:
         logger.info("Fetching stock data for ticker: %s", args.ticker)
         try:
-            stock = yf.Ticker(args.ticker)
-            data = stock.history(period="1d")
+            data = await market_data.history(args.ticker, "1d")
             formatted_data = (
                 f"The stock opened at ${data['Open'].iloc[0]:.2f}, "
                 f"reached a high of ${data['High'].iloc[0]:.2f} and a low of "
@@ -70,7 +74,13 @@ class StockInfoTool(BaseTool[StockDataInput, StockDataOutput]):
                 f"with {int(data['Volume'].iloc[0]):,} shares traded"
             )
             logger.info("Successfully fetched stock data for %s", args.ticker)
-            return StockDataOutput(data=formatted_data)
+            return StockDataOutput(
+                data=formatted_data,
+                values={
+                    column.lower(): float(data[column].iloc[0])
+                    for column in ("Open", "High", "Low", "Close", "Volume")
+                },
+            )
         except Exception as e:
             logger.error("Error fetching stock data for %s: %s", args.ticker, e)
             raise RuntimeError(
@@ -89,6 +99,9 @@ class StockPredictorOutput(BaseModel):
     """Output model for stock price prediction."""
 
     data: str = Field(description="Predicted stock price for the next day as a string.")
+    values: dict[str, float] = Field(
+        default_factory=dict, description="Numbers behind the formatted prediction."
+    )
 
 
 class StockForecastTool(BaseTool[StockPredictorInput, StockPredictorOutput]):
@@ -105,21 +118,12 @@ class StockForecastTool(BaseTool[StockPredictorInput, StockPredictorOutput]):
     ) -> StockPredictorOutput:
         logger.info("Starting stock price prediction")
         try:
-            data = yf.Ticker(args.ticker).history(period="2y")
-            data = data.reset_index()
-            data["Timestamp"] = data.index
-
-            features = np.array(data["Timestamp"]).reshape(-1, 1)
-            y = data["Close"].values
-
-            model = LinearRegression()
-            model.fit(features, y)
-            logger.info("Model trained successfully")
-            prediction = model.predict([[len(data)]])
-            logger.info("Predicted stock price: %s", prediction)
-            logger.info("Successfully predicted stock price: %s", prediction[0])
+            forecasts = await trend_forecaster.forecast([args.ticker])
+            prediction = forecasts[args.ticker.upper()]
+            logger.info("Successfully predicted stock price: %s", prediction)
             return StockPredictorOutput(
-                data=f"the predicted stock price for {args.ticker} is ${prediction[0]:.2f}"
+                data=f"the predicted stock price for {args.ticker} is ${prediction:.2f}",
+                values={"prediction": prediction},
             )
         except Exception as e:
             logger.error("Error predicting stock price: %s", e)
@@ -228,22 +232,56 @@ class OptionsPricingInput(BaseModel):
     ticker: str = Field(description="Stock ticker symbol (e.g., AAPL for Apple).")
     strike_price: float = Field(description="Strike price of the option.")
     time_to_expiry: float = Field(description="Time to expiry in years.")
-    option_type: str = Field(description="Option type: 'call' or 'put'.")
+    option_type: str = Field(description="Option type: 'call', 'put' or 'both'.")
+    strike_prices: list[float] = Field(
+        default_factory=list,
+        description="Additional strike prices, to price a chain of contracts.",
+    )
+    expiries: list[float] = Field(
+        default_factory=list,
+        description="Additional times to expiry in years, to price a chain of contracts.",
+    )
+    volatility_source: str = Field(
+        default="historical",
+        description="'historical' for 3 month realized volatility, or 'implied' to "
+        "price off the implied volatility surface of listed options.",
+    )
+    exercise_style: str = Field(
+        default="european",
+        description="'european' for Black-Scholes with Greeks, 'american' to include "
+        "early exercise on a binomial tree, or 'american_mc' for Longstaff-Schwartz "
+        "Monte Carlo.",
+    )
 
 
 class OptionsPricingOutput(BaseModel):
     data: str = Field(description="Fair price of the option.")
+    values: dict[str, float] = Field(
+        default_factory=dict, description="Inputs and result of the pricing model."
+    )
+
+
+# Contracts a single chain request may price; larger grids belong in code
+MAX_CHAIN_CONTRACTS = 200
+VOLATILITY_SOURCES = ("historical", "implied")
+# Exercise styles and the American pricing method each one uses
+EXERCISE_STYLES = {
+    "european": None,
+    "american": "binomial",
+    "american_mc": "monte_carlo",
+}
 
 
 class OptionsPricingTool(BaseTool[OptionsPricingInput, OptionsPricingOutput]):
-    """Tool for calculating options prices using Black-Scholes model."""
+    """Tool for calculating options prices and Greeks using Black-Scholes model."""
 
     def __init__(self):
         super().__init__(
             OptionsPricingInput,
             OptionsPricingOutput,
             "options_pricing_calculator",
-            "Calculates the fair price of an options contract.",
+            "Calculates the fair price and Greeks of an options contract, or of a "
+            "chain of strikes and expiries.",
         )
 
     async def run(
@@ -255,56 +293,157 @@ class OptionsPricingTool(BaseTool[OptionsPricingInput, OptionsPricingOutput]):
             args.strike_price,
         )
         try:
-            stock = yf.Ticker(args.ticker)
-            data = stock.history(period="1d")
+            option_types = parse_option_types(args.option_type)
+            strikes = list(dict.fromkeys([args.strike_price, *args.strike_prices]))
+            expiries = list(dict.fromkeys([args.time_to_expiry, *args.expiries]))
+            size = len(option_types) * len(expiries) * len(strikes)
+            if size > MAX_CHAIN_CONTRACTS:
+                raise ValueError(
+                    f"Chain of {size} contracts exceeds the limit of {MAX_CHAIN_CONTRACTS}."
+                )
+
+            exercise_style = args.exercise_style.lower()
+            if exercise_style not in EXERCISE_STYLES:
+                raise ValueError(
+                    "Invalid exercise style. Must be 'european', 'american' or 'american_mc'."
+                )
+            american_method = EXERCISE_STYLES[exercise_style]
+            volatility_source = args.volatility_source.lower()
+            if volatility_source not in VOLATILITY_SOURCES:
+                raise ValueError(
+                    "Invalid volatility source. Must be 'historical' or 'implied'."
+                )
+            if volatility_source == "historical":
+                # Read first so the 1d quote below is sliced from its history
+                sigma = await rates_vol.realized_volatility(args.ticker)
+            data = await market_data.history(args.ticker, "1d")
             spot_price = data["Open"].iloc[0]
             logger.info("Current stock price (S): %s", spot_price)
 
-            strike_price = args.strike_price
-            time_to_expiry = args.time_to_expiry
-
-            irx = yf.Ticker("^IRX").history(period="1d")
-            r = (irx["Close"].iloc[0]) / 100
+            # One rate per expiry, interpolated on the Treasury curve
+            rates = await rates_vol.risk_free_rate(expiries)
+            r = float(rates[0])
             logger.info("Risk-free rate (r): %.4f", r)
 
-            # Calculate volatility
-            stock_3mo = stock.history(period="3mo")
-            stock_3mo["lag_adj_close"] = stock_3mo["Close"].shift(1)
-            stock_3mo["log_return"] = np.log(
-                stock_3mo["Close"] / stock_3mo["lag_adj_close"]
-            )
-            vol = np.std(stock_3mo["log_return"])
-            sigma = 252**0.5 * vol
-            logger.info("Annualized volatility (sigma): %.4f", sigma)
-
-            # Calculate d1 and d2
-            d1 = (
-                math.log(spot_price / strike_price)
-                + (r + (sigma**2) / 2) * time_to_expiry
-            ) / (sigma * math.sqrt(time_to_expiry))
-            d2 = d1 - sigma * math.sqrt(time_to_expiry)
-            logger.debug("d1: %.4f, d2: %.4f", d1, d2)
-
-            if args.option_type.lower() == "call":
-                price = spot_price * norm.cdf(d1) - strike_price * math.exp(
-                    -r * time_to_expiry
-                ) * norm.cdf(d2)
-                logger.info("Calculated call option price: $%.2f", price)
-            elif args.option_type.lower() == "put":
-                price = strike_price * math.exp(-r * time_to_expiry) * norm.cdf(
-                    -d2
-                ) - spot_price * norm.cdf(-d1)
-                logger.info("Calculated put option price: $%.2f", price)
+            values = {"spot_price": float(spot_price), "risk_free_rate": r}
+            if volatility_source == "historical":
+                logger.info("Annualized volatility (sigma): %.4f", sigma)
+                values["volatility"] = float(sigma)
+                volatility_text = f"volatility {sigma:.2%}"
             else:
-                logger.error(f"Invalid option type provided: {args.option_type}")
-                raise ValueError("Invalid option type. Must be 'call' or 'put'.")
+                quotes = await fetch_yfinance_option_quotes(args.ticker)
+                quote_expiries = quotes["time_to_expiry"].to_numpy()
+                surface = VolatilitySurface.from_prices(
+                    quotes["price"].to_numpy(),
+                    spot_price,
+                    quotes["strike"].to_numpy(),
+                    quote_expiries,
+                    await rates_vol.risk_free_rate(quote_expiries),
+                    (quotes["option_type"] == "call").to_numpy(),
+                )
+                sigma = surface(strikes, expiries)
+                logger.info(
+                    "Implied volatility surface over %d expiries: %s",
+                    len(surface.expiries),
+                    np.round(sigma, 4).tolist(),
+                )
+                volatility_text = "implied volatility surface"
 
-            return OptionsPricingOutput(
-                data=(
-                    f"The fair price for this {args.option_type} option is ${price:.2f}, "
-                    f"to buy this please contact ibrahim@arthur.ai"
+            chain = price_chain(
+                spot_price, strikes, expiries, rates[:, np.newaxis], sigma, option_types
+            )
+            contracts = list(chain.contracts())
+            if american_method is not None:
+                # CPU-bound for large chains, so kept off the event loop
+                american = await asyncio.to_thread(
+                    price_american,
+                    spot_price,
+                    chain.strikes,
+                    chain.expiries[:, np.newaxis],
+                    rates[:, np.newaxis],
+                    chain.volatility,
+                    np.array([kind == "call" for kind in option_types])[
+                        :, np.newaxis, np.newaxis
+                    ],
+                    method=american_method,
                 )
+                contracts = [
+                    (
+                        option_type,
+                        expiry,
+                        strike,
+                        {
+                            **american.contract(index),
+                            "volatility": european["volatility"],
+                        },
+                    )
+                    for index, (option_type, expiry, strike, european) in zip(
+                        np.ndindex(american.price.shape), contracts, strict=True
+                    )
+                ]
+            style = "American " if american_method is not None else ""
+
+            if len(chain) == 1:
+                option_type, _, _, contract = contracts[0]
+                logger.info(
+                    "Calculated %s%s option price: $%.2f",
+                    style,
+                    option_type,
+                    contract["price"],
+                )
+                values.update(
+                    strike_price=args.strike_price,
+                    time_to_expiry=args.time_to_expiry,
+                    **contract,
+                )
+                premium = (
+                    f" (early exercise premium ${contract['early_exercise_premium']:.2f})"
+                    if american_method is not None
+                    else ""
+                )
+                return OptionsPricingOutput(
+                    data=(
+                        f"The fair price for this {style}{option_type} option is ${contract['price']:.2f}{premium}, "
+                        f"to buy this please contact ibrahim@arthur.ai"
+                    ),
+                    values=values,
+                )
+
+            logger.info("Calculated prices of a %d contract chain", len(chain))
+            rate_text = ", ".join(
+                f"{rate:.2%} at {expiry:g}y"
+                for expiry, rate in zip(chain.expiries, rates, strict=True)
             )
+            model = "American" if american_method is not None else "Black-Scholes"
+            lines = [
+                (
+                    f"{model} prices for {args.ticker.upper()} (spot ${spot_price:.2f}, "
+                    f"{volatility_text}, rates {rate_text}):"
+                )
+            ]
+            for option_type, expiry, strike, contract in contracts:
+                label = f"{option_type} {strike:g} {expiry:g}y"
+                if american_method is not None:
+                    details = (
+                        f"European ${contract['european_price']:.2f}, early exercise "
+                        f"premium ${contract['early_exercise_premium']:.2f}"
+                    )
+                else:
+                    details = (
+                        f"delta {contract['delta']:.4f}, gamma {contract['gamma']:.4f}, "
+                        f"vega {contract['vega']:.4f}, theta {contract['theta']:.4f}, "
+                        f"rho {contract['rho']:.4f}"
+                    )
+                lines.append(
+                    f"{option_type.capitalize()} K=${strike:.2f} T={expiry:g}y: "
+                    f"${contract['price']:.2f} ({details}, "
+                    f"volatility {contract['volatility']:.2%})"
+                )
+                values.update(
+                    {f"{label} {name}": value for name, value in contract.items()}
+                )
+            lines.append("To buy any of these please contact ibrahim@arthur.ai")
+            return OptionsPricingOutput(data="\n".join(lines), values=values)
         except Exception as e:
             logger.error(
                 "Error calculating option price for %s: %s", args.ticker, str(e)
@@ -337,7 +476,7 @@ class StockScreenerOutput(BaseModel):
 class StockScreenerTool(BaseTool[StockScreenerInput, StockScreenerOutput]):
     """Tool for screening stocks based on sector and market capitalization criteria."""
 
-    def __init__(self):
+    def __init__(self, universe: ScreenerUniverse | None = None):
         super().__init__(
             StockScreenerInput,
             StockScreenerOutput,
@@ -345,139 +484,16 @@ class StockScreenerTool(BaseTool[StockScreenerInput, StockScreenerOutput]):
             "Screens stocks based on sector and market capitalization criteria using Alpha "
             "Vantage.",
         )
-        self.fundamental_data = FundamentalData(ALPHA_VANTAGE_API_KEY)
+        # Shared, persisted fundamentals indexed by sector and market cap
+        self.universe = universe or screener_universe
 
     async def run(
         self, args: StockScreenerInput, cancellation_token: CancellationToken, **_
     ) -> StockScreenerOutput:
         try:
-            # Example stock tickers for demonstration
-            stock_tickers = [
-                "AAPL",
-                "MSFT",
-                "GOOGL",
-                "AMZN",
-                "META",
-                "NVDA",
-                "TSLA",
-                "INTC",
-                "AMD",
-                "CSCO",  # Technology
-                "PFE",
-                "JNJ",
-                "UNH",
-                "MRK",
-                "ABT",
-                "MRNA",
-                "LLY",
-                "AMGN",
-                "GILD",
-                "CVS",  # Healthcare
-                "JPM",
-                "BAC",
-                "WFC",
-                "GS",
-                "MS",
-                "C",
-                "AXP",
-                "SCHW",
-                "V",
-                "MA",  # Financials
-                "HD",
-                "NKE",
-                "MCD",
-                "SBUX",
-                "TGT",
-                "DIS",
-                "LOW",
-                "BKNG",
-                "YUM",
-                "EBAY",  # Consumer Discretionary
-                "PG",
-                "KO",
-                "PEP",
-                "WMT",
-                "COST",
-                "CL",
-                "MDLZ",
-                "KMB",
-                "MO",
-                "PM",  # Consumer Staples
-                "XOM",
-                "CVX",
-                "COP",
-                "SLB",
-                "HAL",
-                "BKR",
-                "MPC",
-                "VLO",
-                "OXY",
-                "PXD",  # Energy
-                "BA",
-                "CAT",
-                "LMT",
-                "GE",
-                "HON",
-                "RTX",
-                "MMM",
-                "UNP",
-                "DE",
-                "NOC",  # Industrials
-                "DUK",
-                "NEE",
-                "D",
-                "SO",
-                "EXC",
-                "AEP",
-                "SRE",
-                "ED",
-                "XEL",
-                "PEG",  # Utilities
-                "PLD",
-                "AMT",
-                "SPG",
-                "O",
-                "AVB",
-                "DLR",
-                "EQR",
-                "WELL",
-                "VTR",
-                "BXP",  # Real Estate
-                "DOW",
-                "LYB",
-                "DD",
-                "NEM",
-                "FCX",
-                "IP",
-                "VMC",
-                "CF",
-                "BALL",
-                "EMN",  # Materials
-            ]
-
-            filtered_stocks = {}
-            for ticker in stock_tickers:
-                try:
-                    # Fetch company overview from Alpha Vantage
-                    overview_data = self.fundamental_data.get_company_overview(ticker)
-                    if not overview_data or not isinstance(overview_data, list):
-                        continue
-
-                    company_data = overview_data[0]
-                    sector = company_data.get("Sector", "")
-                    market_cap = (
-                        float(company_data.get("MarketCapitalization", 0)) / 1e9
-                    )
-
-                    # Filter by sector and market capitalization
-                    if (
-                        sector.lower() == args.sector.lower()
-                        and args.market_cap_min <= market_cap <= args.market_cap_max
-                    ):
-                        filtered_stocks[ticker] = market_cap
-                except (KeyError, ValueError, TypeError) as e:
-                    logger.error("Error processing %s: %s", ticker, e)
-                    continue
+            filtered_stocks = await self.universe.screen(
+                args.sector, args.market_cap_min, args.market_cap_max
+            )
 
             # Format the filtered stocks into a string
             if not filtered_stocks:
@@ -490,10 +506,15 @@ class StockScreenerTool(BaseTool[StockScreenerInput, StockScreenerOutput]):
                     f"Stocks in {args.sector} sector with market cap between "
                     f"${args.market_cap_min}B - ${args.market_cap_max}B:\n"
                 )
-                for ticker, market_cap in filtered_stocks.items():
+                for ticker, market_cap in filtered_stocks:
                     result += f"{ticker}: ${market_cap:.2f}B\n"
+            if self.universe.partial:
+                result += (
+                    f"\nOnly {len(self.universe.index)} of {len(self.universe.tickers)} "
+                    "companies are indexed so far, more may match."
+                )
 
-            return StockScreenerOutput(stocks=result)
+            return StockScreenerOutput(data=result)
 
         except Exception as e:
             raise RuntimeError(f"Error during stock screening: {e}") from e
@@ -3,7 +3,12 @@ Utility functions and helpers for the AI assistant system.
 """
 
 from src.utils.logger import get_logger, setup_logging
-from src.utils.user_io import ainput, get_user_input
+from src.utils.user_io import (
+    ainput,
+    get_user_input,
+    render_progress,
+    render_stream_chunk,
+)
 
 
 __all__ = [
@@ -11,4 +16,6 @@ __all__ = [
     "get_logger",
     "ainput",
     "get_user_input",
+    "render_progress",
+    "render_stream_chunk",
 ]
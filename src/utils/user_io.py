@@ -34,20 +34,50 @@ async def ainput(prompt: str = "") -> str:
         return await asyncio.get_event_loop().run_in_executor(executor, input, prompt)
 
 
-async def get_user_input(question_for_user: str) -> str:
+async def get_user_input(question_for_user: str, streamed: bool = False) -> str:
     """
     Prompts for and collects user input with a formatted display.
 
     Args:
         question_for_user (str): Question to display to the user
+        streamed (bool): The question was already printed as it streamed in,
+            so only the closing rule is printed
 
     Returns:
         str: User's input response
     """
     logger.debug(f"[get_user_input] Displaying question to user: {question_for_user}")
-    print("--------------------------QUESTION_FOR_USER--------------------------")
-    print(question_for_user)
+    if streamed:
+        # Ends the line the streamed chunks were printed on
+        print()
+    else:
+        print("--------------------------QUESTION_FOR_USER--------------------------")
+        print(question_for_user)
     print("---------------------------------------------------------------------")
     user_input = await ainput("Enter your input: ")
     logger.debug(f"[get_user_input] Received user input: {user_input}")
     return user_input
+
+
+def render_stream_chunk(text: str, redact: bool = False) -> None:
+    """
+    Prints part of an answer that is still streaming in.
+
+    Args:
+        text (str): Text to append to the current line, or why it is withdrawn
+        redact (bool): Withdraws what was streamed so far instead of printing text
+    """
+    if redact:
+        print(f"\n[Streamed answer withdrawn: {text}]")
+        return
+    print(text, end="", flush=True)
+
+
+def render_progress(text: str) -> None:
+    """
+    Prints an intermediate result while the assistant is still working.
+
+    Args:
+        text (str): Progress update to show
+    """
+    print(f"... {text}", flush=True)
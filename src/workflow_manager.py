@@ -11,8 +11,8 @@ Key responsibilities:
 - Arthur Evaluation Engine service integration
 """
 
-import json
 import logging
+import os
 from typing import Any
 
 from autogen_core import DefaultTopicId, SingleThreadedAgentRuntime
@@ -25,8 +25,12 @@ from .core import (
     MockPersistence,
     NeedsUserInputHandler,
     TerminationHandler,
+    TurnAnswerCache,
     UserTextMessage,
 )
+from .core.deadline import DEFAULT_TURN_DEADLINE
+from .core.streaming import STREAM_OFF
+from .llm import build_model_client, load_model_config
 
 
 logger = logging.getLogger(__name__)
@@ -35,6 +39,35 @@ logger = logging.getLogger(__name__)
 class WorkflowManager:
     def __init__(self):
         self.state_persister = MockPersistence()
+        self._model_client: ChatCompletionClient | None = None
+        self.answer_cache = TurnAnswerCache()
+        self.turn_deadline = float(
+            os.getenv("TURN_DEADLINE_SECONDS", DEFAULT_TURN_DEADLINE)
+        )
+        self.stream_policy = os.getenv("ANSWER_STREAM_POLICY", STREAM_OFF)
+        self.show_progress = os.getenv("SHOW_TOOL_PROGRESS", "true").lower() == "true"
+        self.answer_candidates = int(os.getenv("ANSWER_CANDIDATES", "1"))
+        # Whether the last question for the user was already shown as it streamed
+        self.question_streamed = False
+
+    def get_model_client(self, config_file: str) -> ChatCompletionClient:
+        """
+        Returns the model client, creating it on first use.
+
+        The client is kept across turns so its connection pool and the
+        in-memory completion cache are reused.
+
+        Args:
+            config_file (str): Path to the model configuration JSON file
+
+        Returns:
+            ChatCompletionClient: Client shared by every turn of this workflow
+        """
+        if self._model_client is None:
+            model_config = load_model_config(config_file)
+            logger.debug(f"[workflow] Model config: {model_config}")
+            self._model_client = build_model_client(model_config)
+        return self._model_client
 
     async def trigger_agentic_workflow(
         self, config_file: dict[str, Any], latest_user_input: str | None = None
@@ -75,11 +108,8 @@ class WorkflowManager:
             "config/arthur_engine_config.json"
         )
 
-        with open(config_file, encoding="utf-8") as f:
-            model_config = json.load(f)
-            logger.debug(f"[workflow] Model config: {model_config}")
-        model_client = ChatCompletionClient.load_component(model_config)
-        logger.debug("[workflow] Initialized model client")
+        model_client = self.get_model_client(config_file)
+        logger.debug("[workflow] Using model client")
 
         initial_schedule_assistant_message = AssistantTextMessage(
             content="Hi! How can I help you?", source="User"
@@ -96,6 +126,11 @@ class WorkflowManager:
             runtime, "User", lambda: SlowUserProxyAgent("User", "I am a user")
         )
 
+        orchestrator_options = {}
+        if self.answer_candidates > 1:
+            # Racing candidates needs the validating orchestrator, see src/agents
+            orchestrator_options["candidates"] = self.answer_candidates
+
         await OrchestratorAgent.register(
             runtime,
             "Orchestrator",
@@ -105,6 +140,11 @@ class WorkflowManager:
                 model_client=model_client,
                 initial_message=initial_schedule_assistant_message,
                 arthur_engine_config=arthur_engine_config,
+                answer_cache=self.answer_cache,
+                turn_deadline=self.turn_deadline,
+                stream_policy=self.stream_policy,
+                show_progress=self.show_progress,
+                **orchestrator_options,
             ),
         )
 
@@ -128,11 +168,14 @@ class WorkflowManager:
 
         runtime.start()
         await runtime.stop_when(
-            lambda: termination_handler.is_terminated
-            or needs_user_input_handler.needs_user_input
+            lambda: (
+                termination_handler.is_terminated
+                or needs_user_input_handler.needs_user_input
+            )
         )
 
         user_input_needed = None
+        self.question_streamed = needs_user_input_handler.user_input_streamed
         if needs_user_input_handler.user_input_content is not None:
             user_input_needed = needs_user_input_handler.user_input_content
         elif termination_handler.is_terminated:
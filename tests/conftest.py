@@ -1,6 +1,8 @@
 import os
 import sys
 
+import numpy as np
+import pandas as pd
 import pytest
 
 # Add the src directory to the Python path
@@ -11,3 +13,46 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 @pytest.fixture
 def sample_stock_data():
     return {"ticker": "AAPL", "price": 150.0, "volume": 1000000}
+
+
+# Listed option prices generated offline from a known volatility smile
+OPTION_SPOT = 100.0
+OPTION_RATE = 0.025
+OPTION_STRIKES = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+# Whole days, so expiry dates convert back to these years exactly
+OPTION_EXPIRIES = np.array([73, 146, 365]) / 365
+OPTION_VOLS = np.array(
+    [
+        [0.32, 0.27, 0.24, 0.23, 0.245],
+        [0.30, 0.26, 0.235, 0.225, 0.235],
+        [0.28, 0.25, 0.23, 0.22, 0.225],
+    ]
+)
+
+
+@pytest.fixture
+def option_quotes():
+    from src.tools.options import black_scholes
+
+    expiries, strikes = np.meshgrid(OPTION_EXPIRIES, OPTION_STRIKES, indexing="ij")
+    rows = []
+    for option_type in ("call", "put"):
+        prices = black_scholes(
+            OPTION_SPOT,
+            strikes,
+            expiries,
+            OPTION_RATE,
+            OPTION_VOLS,
+            option_type == "call",
+        ).price
+        rows.append(
+            pd.DataFrame(
+                {
+                    "option_type": option_type,
+                    "time_to_expiry": expiries.ravel(),
+                    "strike": strikes.ravel(),
+                    "price": prices.ravel(),
+                }
+            )
+        )
+    return pd.concat(rows, ignore_index=True)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.tools.american import (
+    binomial_american,
+    longstaff_schwartz,
+    price_american,
+)
+from src.tools.options import black_scholes
+
+
+# Longstaff and Schwartz (2001), table 1: S=36, K=40, r=6%, sigma=20%, T=1
+REFERENCE_PUT = 4.478
+
+
+def test_binomial_tree_matches_reference_american_put():
+    price = binomial_american(36, 40, 1.0, 0.06, 0.2, False, steps=500)
+
+    assert price == pytest.approx(REFERENCE_PUT, abs=0.01)
+
+
+def test_american_call_without_dividends_is_european():
+    strikes = np.array([80.0, 100.0, 120.0])
+    american = binomial_american(100, strikes, 0.5, 0.04, 0.3, True, steps=500)
+
+    np.testing.assert_allclose(
+        american, black_scholes(100, strikes, 0.5, 0.04, 0.3).price, atol=0.02
+    )
+
+
+def test_chunking_does_not_change_prices():
+    strikes = np.linspace(80, 120, 25)
+    expiries = np.array([[0.25], [1.0]])
+
+    whole = binomial_american(100, strikes, expiries, 0.03, 0.25, False, steps=100)
+    chunked = binomial_american(
+        100, strikes, expiries, 0.03, 0.25, False, steps=100, chunk_elements=303
+    )
+
+    assert whole.shape == (2, 25)
+    np.testing.assert_array_equal(whole, chunked)
+
+
+def test_monte_carlo_agrees_with_tree_in_chunks():
+    strikes = np.array([36.0, 40.0, 44.0])
+    tree = binomial_american(36, strikes, 1.0, 0.06, 0.2, False, steps=500)
+
+    prices, errors = longstaff_schwartz(
+        36,
+        strikes,
+        1.0,
+        0.06,
+        0.2,
+        False,
+        paths=20_000,
+        steps=50,
+        seed=7,
+        chunk_elements=1_000_000,
+    )
+
+    assert (errors > 0).all()
+    # Longstaff-Schwartz is biased low by its finite set of exercise dates
+    np.testing.assert_array_less(np.abs(prices - tree), 4 * errors + 0.02)
+
+
+def test_price_american_reports_early_exercise_premium():
+    valuation = price_american(36, [40.0, 30.0], 1.0, 0.06, 0.2, False)
+
+    assert (valuation.early_exercise_premium >= 0).all()
+    assert valuation.contract(0)["early_exercise_premium"] > 0.5
+    with pytest.raises(ValueError):
+        price_american(36, 40, 1.0, 0.06, 0.2, False, method="trinomial")
@@ -0,0 +1,113 @@
+from src.core.answer_cache import TurnAnswerCache, executed_plan, normalize_query
+from src.tools.market_data import MarketDataVersions
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(**kwargs):
+    clock = FakeClock()
+    versions = MarketDataVersions()
+    cache = TurnAnswerCache(versions=versions, clock=clock, **kwargs)
+    return cache, clock, versions
+
+
+def test_normalize_query():
+    assert normalize_query("  AAPL price   today? ") == "aapl price today"
+    assert normalize_query("Explain compound interest.") == "explain compound interest"
+
+
+def test_hit_for_equivalent_query():
+    cache, _, _ = make_cache()
+    cache.put("Explain compound interest", ["explain_finance"], [], "answer")
+
+    assert cache.get("explain compound interest?") == "answer"
+    assert cache.get("explain simple interest") is None
+    assert cache.hits == 1
+
+
+def test_entry_expires_after_tool_ttl():
+    cache, clock, _ = make_cache(tool_ttls={"fetch_stock_data": 60})
+    cache.put("AAPL price today", ["fetch_stock_data"], ["AAPL"], "answer")
+
+    clock.now = 59
+    assert cache.get("AAPL price today") == "answer"
+    clock.now = 60
+    assert cache.get("AAPL price today") is None
+
+
+def test_market_data_version_change_invalidates():
+    cache, _, versions = make_cache()
+    versions.observe("AAPL", "2025-01-02")
+    cache.put("AAPL price today", ["fetch_stock_data"], ["AAPL"], "answer")
+
+    versions.observe("MSFT", "2025-01-03")
+    assert cache.get("AAPL price today") == "answer"
+
+    versions.observe("AAPL", "2025-01-03")
+    assert cache.get("AAPL price today") is None
+
+
+def test_zero_ttl_tools_are_not_cached():
+    cache, _, _ = make_cache()
+    stored = cache.put(
+        "sentiment for Apple", ["analyze_sentiment", "explain_finance"], [], "a"
+    )
+    assert not stored
+    assert cache.get("sentiment for Apple") is None
+
+
+def test_follow_ups_only_hit_after_the_same_previous_messages():
+    cache, _, _ = make_cache()
+    plan = (["options_pricing_calculator"], ["AAPL"])
+    cache.put("and the put?", *plan, "AAPL put", ["hi", "price an AAPL call"])
+
+    assert cache.get("and the put?", ["hi", "price an AAPL call"]) == "AAPL put"
+    assert cache.get("and the put?", ["hi", "price an MSFT call"]) is None
+    assert cache.get("and the put?") is None
+    # Only the most recent previous messages are part of the key
+    assert (
+        cache.get("and the put?", ["hello", "hi", "price an AAPL call"]) == "AAPL put"
+    )
+
+
+def test_new_close_on_the_same_bar_invalidates():
+    cache, _, versions = make_cache()
+    versions.observe("AAPL", "2025-01-02", 189.12)
+    cache.put("AAPL price today", ["fetch_stock_data"], ["AAPL"], "answer")
+
+    versions.observe("AAPL", "2025-01-02", 189.12)
+    assert cache.get("AAPL price today") == "answer"
+
+    versions.observe("AAPL", "2025-01-02", 190.5)
+    assert cache.get("AAPL price today") is None
+
+
+def test_executed_plan_sets_ttl_and_invalidation():
+    cache, clock, versions = make_cache(
+        tool_ttls={"explain_finance": 24 * 3600, "fetch_stock_data": 60}
+    )
+    # A question that sounds like a definition but fetched a live price
+    tool_names, tickers = executed_plan(
+        [
+            {"name": "explain_finance", "arguments": '{"query": "market cap"}'},
+            {"name": "fetch_stock_data", "arguments": '{"ticker": "aapl"}'},
+            {"name": "fetch_stock_data", "arguments": "not json"},
+        ]
+    )
+    assert tool_names == ["explain_finance", "fetch_stock_data"]
+    assert tickers == ["AAPL"]
+
+    versions.observe("AAPL", "2025-01-02", 189.12)
+    cache.put("what is apple worth", tool_names, tickers, "answer")
+    versions.observe("AAPL", "2025-01-02", 190.5)
+    assert cache.get("what is apple worth") is None
+
+    cache.put("what is apple worth", tool_names, tickers, "answer")
+    clock.now = 60
+    assert cache.get("what is apple worth") is None
@@ -0,0 +1,84 @@
+"""
+Test suite for the walk-forward forecast backtester.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.tools.backtest import (
+    FORECAST_MODELS,
+    ForecastModel,
+    load_price_cache,
+    save_price_cache,
+    synthetic_prices,
+    walk_forward,
+    walk_forward_windows,
+)
+
+
+def test_windows_end_before_their_targets():
+    windows, targets = walk_forward_windows(np.arange(10.0), lookback=4, horizon=2)
+
+    assert windows.shape == (5, 4)
+    assert windows[0].tolist() == [0, 1, 2, 3]
+    assert targets.tolist() == [5, 6, 7, 8, 9]
+
+    windows, targets = walk_forward_windows(
+        np.arange(10.0), lookback=4, horizon=1, stride=3
+    )
+    assert windows[:, -1].tolist() == [3, 6]
+    assert targets.tolist() == [4, 7]
+
+
+def test_walk_forward_scores_models_per_ticker():
+    dates = pd.bdate_range("2024-01-01", periods=40)
+    prices = {
+        "LINE": pd.Series(10 + 0.5 * np.arange(40.0), index=dates),
+        "ZIGZAG": pd.Series(100 + np.arange(40) % 2, index=dates, dtype=float),
+        "SHORT": pd.Series(np.arange(5.0) + 1, index=dates[:5]),
+    }
+
+    trend, last = walk_forward(
+        prices, FORECAST_MODELS.values(), lookback=10, stride=1, chunk_elements=50
+    )
+
+    assert trend.windows == last.windows == 2 * 30
+    assert trend.ticker_mape["LINE"] == pytest.approx(0.0, abs=1e-12)
+    assert "SHORT" not in trend.ticker_mape
+    assert last.mae == pytest.approx((30 * 0.5 + 30 * 1.0) / 60)
+    assert math.isnan(last.direction_accuracy)
+    assert trend.fits_per_second > 0
+
+
+def test_price_cache_round_trip(tmp_path):
+    prices = synthetic_prices(["aapl", "MSFT"], bars=30, seed=1)
+    save_price_cache(tmp_path, prices)
+
+    cached = load_price_cache(tmp_path, ["AAPL", "MSFT"])
+    pd.testing.assert_series_equal(
+        cached["AAPL"], prices["aapl"], check_names=False, check_freq=False
+    )
+    assert sorted(load_price_cache(tmp_path)) == ["AAPL", "MSFT"]
+    with pytest.raises(FileNotFoundError, match="NVDA"):
+        load_price_cache(tmp_path, ["NVDA"])
+
+
+def test_walk_forward_fits_bounded_chunks_across_tickers():
+    prices = synthetic_prices(["A", "B", "C"], bars=60, seed=2)
+    shapes = []
+
+    def fit(windows):
+        shapes.append(windows.shape)
+        return FORECAST_MODELS["linear_trend"].fit(windows)
+
+    model = ForecastModel("recorded", fit, FORECAST_MODELS["linear_trend"].predict)
+    (chunked,) = walk_forward(prices, [model], lookback=20, chunk_elements=20 * 7)
+    (whole,) = walk_forward(prices, [FORECAST_MODELS["linear_trend"]], lookback=20)
+
+    assert max(rows for rows, _ in shapes) == 7
+    assert sum(rows for rows, _ in shapes) == chunked.windows == 3 * 40
+    assert chunked.mae == pytest.approx(whole.mae)
+    assert chunked.ticker_mape == pytest.approx(whole.ticker_mape)
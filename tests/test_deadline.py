@@ -0,0 +1,105 @@
+import asyncio
+
+from autogen_core import CancellationToken
+import pytest
+
+from src.core.deadline import (
+    ENGINE,
+    TOOLS,
+    OverrunLog,
+    StageOverrun,
+    TurnDeadline,
+)
+from src.llm.stages import PLANNING
+
+
+@pytest.mark.asyncio
+async def test_work_within_budget_returns_result():
+    deadline = TurnDeadline(10, {PLANNING: 0.5})
+
+    async def plan():
+        return "plan"
+
+    assert await deadline.run(PLANNING, plan()) == "plan"
+    assert deadline.stage_remaining(PLANNING) <= 5
+
+
+@pytest.mark.asyncio
+async def test_overrun_cancels_work_and_records_stage():
+    overruns = OverrunLog()
+    deadline = TurnDeadline(
+        1, {TOOLS: 0.05}, conversation_id="turn-1", overruns=overruns
+    )
+    cancelled = asyncio.Event()
+
+    async def hung_tool():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(StageOverrun) as excinfo:
+        await deadline.run(TOOLS, hung_tool())
+
+    assert excinfo.value.stage == TOOLS
+    assert cancelled.is_set()
+    assert overruns.by_stage[TOOLS] == 1
+    assert overruns.events[0].conversation_id == "turn-1"
+
+
+@pytest.mark.asyncio
+async def test_exhausted_stage_fails_without_running_work():
+    overruns = OverrunLog()
+    deadline = TurnDeadline(1, {ENGINE: 0.0}, overruns=overruns)
+    started = False
+
+    async def engine_check():
+        nonlocal started
+        started = True
+
+    with pytest.raises(StageOverrun):
+        await deadline.run(ENGINE, engine_check())
+    assert not started
+    assert overruns.by_stage[ENGINE] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_charge_stage_once():
+    now = 0.0
+    deadline = TurnDeadline(100, {ENGINE: 0.1}, clock=lambda: now)
+    release = asyncio.Event()
+
+    async def engine_check():
+        await release.wait()
+
+    checks = [
+        asyncio.create_task(deadline.run(ENGINE, engine_check())) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    now = 4.0
+    release.set()
+    await asyncio.gather(*checks)
+
+    assert deadline.stage_remaining(ENGINE) == pytest.approx(6.0)
+
+
+@pytest.mark.asyncio
+async def test_timeout_raised_by_work_is_not_an_overrun():
+    overruns = OverrunLog()
+    deadline = TurnDeadline(10, {ENGINE: 0.5}, overruns=overruns)
+
+    async def engine_check():
+        raise TimeoutError("engine read timeout")
+
+    with pytest.raises(TimeoutError) as excinfo:
+        await deadline.run(ENGINE, engine_check())
+    assert not isinstance(excinfo.value, StageOverrun)
+    assert not overruns.events
+
+
+def test_cancelling_message_token_cancels_turn():
+    parent = CancellationToken()
+    deadline = TurnDeadline(10, parent_token=parent)
+    parent.cancel()
+    assert deadline.cancellation_token.is_cancelled()
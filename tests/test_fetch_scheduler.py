@@ -0,0 +1,161 @@
+import pytest
+
+from src.tools.fetch_scheduler import (
+    API_TIERS,
+    ApiTier,
+    DailyQuotaExhausted,
+    FetchScheduler,
+    Throttled,
+    TokenBucket,
+    classify_error,
+    resolve_tier,
+)
+from src.tools.screener_universe import CompanyFundamentals
+
+
+class FakeTime:
+    """Clock whose sleeps advance time instantly."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def company(ticker):
+    return CompanyFundamentals(ticker, "TECHNOLOGY", 1.0)
+
+
+def decode(fields):
+    return CompanyFundamentals(**fields)
+
+
+def scheduler(fetch, clock, **kwargs):
+    return FetchScheduler(
+        fetch,
+        decode,
+        bucket=TokenBucket(ApiTier(60), burst=1, clock=clock, sleep=clock.sleep),
+        clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_alpha_vantage_notices_are_classified():
+    minute = ValueError(
+        "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."
+    )
+    daily = ValueError("Our standard API rate limit is 25 requests per day.")
+    missing = ValueError("Invalid API call.")
+
+    assert isinstance(classify_error(minute), Throttled)
+    assert isinstance(classify_error(daily), DailyQuotaExhausted)
+    assert classify_error(missing) is missing
+
+
+def test_invalid_tier_falls_back_to_free_on_first_use(monkeypatch):
+    monkeypatch.setenv("ALPHA_VANTAGE_TIER", "platinum")
+    fetcher = FetchScheduler(company, decode)
+
+    with pytest.raises(ValueError):
+        resolve_tier()
+    assert fetcher.bucket.tier == API_TIERS["free"]
+
+
+@pytest.mark.asyncio
+async def test_bucket_paces_requests_to_tier_rate():
+    clock = FakeTime()
+    bucket = TokenBucket(API_TIERS["free"], burst=1, clock=clock, sleep=clock.sleep)
+    start = clock.now
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert clock.now - start == pytest.approx(48.0)
+
+
+@pytest.mark.asyncio
+async def test_bucket_enforces_daily_quota_until_next_day():
+    clock = FakeTime(now=0.0)
+    bucket = TokenBucket(ApiTier(6000, 2), clock=clock, sleep=clock.sleep)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    with pytest.raises(DailyQuotaExhausted):
+        await bucket.acquire()
+    clock.now = 86400.0
+    await bucket.acquire()
+
+
+@pytest.mark.asyncio
+async def test_throttled_requests_are_retried_with_backoff():
+    clock = FakeTime()
+    attempts = {}
+
+    async def fetch(ticker):
+        attempts[ticker] = attempts.get(ticker, 0) + 1
+        if ticker == "AAPL" and attempts[ticker] < 3:
+            raise ValueError("API call frequency is 5 calls per minute")
+        return company(ticker)
+
+    report = await scheduler(fetch, clock, backoff=10.0).run(["AAPL", "MSFT"])
+
+    assert report.complete
+    assert report.results == {"AAPL": company("AAPL"), "MSFT": company("MSFT")}
+    assert report.retries == 2
+    backoffs = [seconds for seconds in clock.sleeps if seconds >= 10.0]
+    assert 10.0 <= backoffs[0] < 12.5 and 20.0 <= backoffs[1] < 25.0
+
+
+@pytest.mark.asyncio
+async def test_interrupted_run_resumes_from_checkpoint(tmp_path):
+    clock = FakeTime()
+    checkpoint = tmp_path / "fetch.checkpoint.json"
+    calls = []
+
+    async def quota_after_two(ticker):
+        if len(calls) == 2:
+            raise ValueError("Our standard API rate limit is 25 requests per day.")
+        calls.append(ticker)
+        return company(ticker) if ticker != "BAD" else None
+
+    tickers = ["AAPL", "BAD", "MSFT", "NVDA"]
+    first = await scheduler(
+        quota_after_two, clock, checkpoint_path=checkpoint, concurrency=1
+    ).run(tickers)
+
+    assert first.pending == ["MSFT", "NVDA"]
+    assert checkpoint.is_file()
+
+    calls.clear()
+    progress = []
+    second = await scheduler(
+        quota_after_two, clock, checkpoint_path=checkpoint, concurrency=1
+    ).run(tickers, on_progress=lambda results: progress.append(sorted(results)))
+
+    assert calls == ["MSFT", "NVDA"]
+    assert progress == [["AAPL", "BAD"], ["AAPL", "BAD", "MSFT"], sorted(tickers)]
+    assert second.complete
+    assert second.results["AAPL"] == company("AAPL")
+    assert second.results["BAD"] is None
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_outdated_checkpoint_is_discarded(tmp_path):
+    clock = FakeTime()
+    checkpoint = tmp_path / "fetch.checkpoint.json"
+    fetch_scheduler = scheduler(
+        None, clock, checkpoint_path=checkpoint, max_checkpoint_age=3600
+    )
+    fetch_scheduler.save_checkpoint(clock.now, {"AAPL": company("AAPL")})
+
+    assert fetch_scheduler.load_checkpoint()[1] == {"AAPL": company("AAPL")}
+    clock.now += 7200
+    assert fetch_scheduler.load_checkpoint() == (clock.now, {})
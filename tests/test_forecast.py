@@ -0,0 +1,78 @@
+"""
+Test suite for the closed-form trend forecasts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.tools.forecast import TrendForecaster, fit_trends, stack_series
+
+
+def reference_trend(closes, steps=1):
+    slope, intercept = np.polyfit(np.arange(len(closes)), closes, 1)
+    return intercept + slope * (len(closes) - 1 + steps)
+
+
+class FakeMarket:
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = 0
+
+    async def history(self, ticker, period="3mo", interval="1d"):
+        self.calls += 1
+        return self.frames[ticker].copy()
+
+
+def test_fit_trends_matches_least_squares_per_row():
+    rng = np.random.default_rng(0)
+    series = [100 + np.cumsum(rng.normal(0, 1, n)) for n in (50, 120, 80)]
+    fit = fit_trends(stack_series(series))
+
+    expected = [reference_trend(closes, steps=5) for closes in series]
+    assert fit.predict(steps=5) == pytest.approx(expected)
+
+
+def test_fit_trends_handles_short_and_missing_rows():
+    fit = fit_trends(stack_series([np.array([7.0]), np.array([]), np.arange(4.0)]))
+
+    prediction = fit.predict()
+    assert prediction[0] == pytest.approx(7.0)
+    assert np.isnan(prediction[1])
+    assert prediction[2] == pytest.approx(4.0)
+
+
+@pytest.mark.asyncio
+async def test_forecaster_refits_only_tickers_with_new_bars():
+    dates = pd.bdate_range("2024-01-01", periods=30)
+    frames = {
+        "AAPL": pd.DataFrame({"Close": np.arange(30.0)}, index=dates),
+        "MSFT": pd.DataFrame({"Close": 2 * np.arange(20.0)}, index=dates[-20:]),
+    }
+    forecaster = TrendForecaster(FakeMarket(frames))
+
+    assert await forecaster.forecast(["aapl", "MSFT"]) == pytest.approx(
+        {"AAPL": 30.0, "MSFT": 40.0}
+    )
+    cached = forecaster._fits["AAPL"]
+
+    frames["MSFT"] = pd.DataFrame(
+        {"Close": 3 * np.arange(21.0)}, index=pd.bdate_range("2024-01-22", periods=21)
+    )
+    assert await forecaster.forecast(["AAPL", "MSFT"]) == pytest.approx(
+        {"AAPL": 30.0, "MSFT": 63.0}
+    )
+    assert forecaster._fits["AAPL"] is cached
+
+
+@pytest.mark.asyncio
+async def test_forecaster_refits_when_the_latest_close_moves_intraday():
+    dates = pd.bdate_range("2024-01-01", periods=5)
+    frames = {"AAPL": pd.DataFrame({"Close": np.arange(5.0)}, index=dates)}
+    forecaster = TrendForecaster(FakeMarket(frames))
+    assert (await forecaster.forecast(["AAPL"]))["AAPL"] == pytest.approx(5.0)
+
+    # Same bar, new price
+    frames["AAPL"] = pd.DataFrame({"Close": [0.0, 1, 2, 3, 8]}, index=dates)
+    expected = reference_trend(frames["AAPL"]["Close"].to_numpy())
+    assert (await forecaster.forecast(["AAPL"]))["AAPL"] == pytest.approx(expected)
@@ -0,0 +1,43 @@
+from src.core.grounding import NumericVerifier, extract_numbers
+
+
+def test_extract_numbers_reads_separators_suffixes_and_percentages():
+    claims = extract_numbers("closed at $189.12 on 52,345,678 shares, 4.5% and 1.2B")
+
+    assert [claim.value for claim in claims] == [189.12, 52345678.0, 4.5, 1.2]
+    assert claims[0].decimals == 2
+    assert claims[2].percent
+    assert claims[3].scale == 1e9
+
+
+def test_numbers_match_tool_values_at_written_precision():
+    report = NumericVerifier().verify(
+        "The stock closed at $189.12 with 52,345,678 shares traded at a 4.32% rate",
+        [{"close": 189.1234, "volume": 52345678, "rate": 0.0432}],
+    )
+
+    assert report.all_grounded
+    assert len(report.grounded) == 3
+
+
+def test_number_missing_from_tool_values_is_ungrounded():
+    report = NumericVerifier().verify(
+        "The stock closed at $191.40", [{"close": 189.1234}]
+    )
+
+    assert not report.all_grounded
+    assert [claim.text for claim in report.ungrounded] == ["191.40"]
+
+
+def test_numbers_from_the_query_need_no_tool_value():
+    report = NumericVerifier().verify(
+        "The 150 call is worth $7.25",
+        [{"price": 7.2461}],
+        known_texts=["price a 150 strike call"],
+    )
+
+    assert report.all_grounded
+
+
+def test_answer_without_numbers_is_not_grounded():
+    assert not NumericVerifier().verify("Compound interest grows", []).all_grounded
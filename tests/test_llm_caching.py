@@ -0,0 +1,91 @@
+from autogen_core.models import CreateResult, RequestUsage, SystemMessage, UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+import pytest
+
+from src.llm.caching import CachingChatCompletionClient, canonical_request_key
+from src.llm.stages import VALIDATION, llm_stage
+from src.tools.tools import FinancialLiteracyTool
+
+
+def make_result(content: str) -> CreateResult:
+    return CreateResult(
+        finish_reason="stop",
+        content=content,
+        usage=RequestUsage(prompt_tokens=100, completion_tokens=20),
+        cached=False,
+    )
+
+
+@pytest.fixture
+def messages():
+    return [
+        SystemMessage(content="system"),
+        UserMessage(content="what is an ETF", source="User"),
+    ]
+
+
+def test_canonical_request_key_is_stable(messages):
+    tool = FinancialLiteracyTool()
+    first = canonical_request_key(messages, [tool], extra_create_args={"a": 1, "b": 2})
+    second = canonical_request_key(
+        list(messages), [tool.schema], extra_create_args={"b": 2, "a": 1}
+    )
+    assert first == second
+    assert first != canonical_request_key(messages, [])
+    assert first != canonical_request_key(messages, [tool], namespace="gpt-4o")
+
+
+@pytest.mark.asyncio
+async def test_repeated_request_is_served_from_memory(messages):
+    inner = ReplayChatCompletionClient([make_result("first"), make_result("second")])
+    client = CachingChatCompletionClient(inner)
+
+    first = await client.create(messages)
+    second = await client.create(messages)
+
+    assert first.content == second.content == "first"
+    assert second.cached
+    assert client.stats.hits == 1
+    assert client.stats.misses == 1
+    assert client.stats.saved_tokens == 120
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_oldest_entry(messages):
+    inner = ReplayChatCompletionClient([make_result(str(i)) for i in range(3)])
+    client = CachingChatCompletionClient(inner, max_entries=1)
+    other = [UserMessage(content="explain compound interest", source="User")]
+
+    await client.create(messages)
+    await client.create(other)
+    result = await client.create(messages)
+
+    assert result.content == "2"
+    assert client.stats.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_client(messages, tmp_path):
+    inner = ReplayChatCompletionClient([make_result("stored")])
+    await CachingChatCompletionClient(inner, cache_dir=tmp_path).create(messages)
+
+    fresh = CachingChatCompletionClient(
+        ReplayChatCompletionClient([make_result("live")]), cache_dir=tmp_path
+    )
+    result = await fresh.create(messages)
+
+    assert result.content == "stored"
+    assert fresh.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_bypassed_stage_always_calls_model(messages):
+    inner = ReplayChatCompletionClient([make_result("a"), make_result("b")])
+    client = CachingChatCompletionClient(inner, bypass_stages=[VALIDATION])
+
+    with llm_stage(VALIDATION):
+        await client.create(messages)
+        result = await client.create(messages)
+    assert result.content == "b"
+    assert client.stats.bypassed == 2
+    assert client.stats.hits == 0
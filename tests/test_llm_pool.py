@@ -0,0 +1,124 @@
+import asyncio
+
+from autogen_core.models import CreateResult, RequestUsage, UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+import httpx
+import openai
+import pytest
+
+from src.llm.pool import Deployment, PooledChatCompletionClient
+
+
+MESSAGES = [UserMessage(content="AAPL price today", source="User")]
+
+
+def make_result(content: str) -> CreateResult:
+    return CreateResult(
+        finish_reason="stop",
+        content=content,
+        usage=RequestUsage(prompt_tokens=10, completion_tokens=2),
+        cached=False,
+    )
+
+
+def rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://example.test/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": "30"}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+class FailingClient(ReplayChatCompletionClient):
+    def __init__(self, error: Exception):
+        super().__init__([])
+        self.error = error
+        self.calls = 0
+
+    async def create(self, *args, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+class SlowClient(ReplayChatCompletionClient):
+    def __init__(self, delay: float):
+        super().__init__([make_result("slow")] * 10)
+        self.delay = delay
+        self.peak = 0
+        self.active = 0
+
+    async def create(self, *args, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return await super().create(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_rate_limit():
+    failing = FailingClient(rate_limit_error())
+    healthy = ReplayChatCompletionClient([make_result("ok")])
+    pool = PooledChatCompletionClient(
+        [Deployment("east", failing, weight=2.0), Deployment("west", healthy)]
+    )
+
+    result = await pool.create(MESSAGES)
+
+    assert result.content == "ok"
+    east = pool.deployments[0]
+    assert east.health < 1.0
+    assert east.cooldown_until > 0
+
+
+@pytest.mark.asyncio
+async def test_cooling_down_deployment_is_skipped():
+    failing = FailingClient(rate_limit_error())
+    healthy = ReplayChatCompletionClient([make_result("a"), make_result("b")])
+    pool = PooledChatCompletionClient(
+        [Deployment("east", failing, weight=2.0), Deployment("west", healthy)]
+    )
+
+    await pool.create(MESSAGES)
+    await pool.create(MESSAGES)
+
+    assert failing.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_non_failover_errors_are_raised():
+    pool = PooledChatCompletionClient(
+        [
+            Deployment("east", FailingClient(ValueError("bad request"))),
+            Deployment("west", ReplayChatCompletionClient([make_result("ok")])),
+        ]
+    )
+    with pytest.raises(ValueError):
+        await pool.create(MESSAGES)
+
+
+@pytest.mark.asyncio
+async def test_raises_last_error_when_every_deployment_fails():
+    pool = PooledChatCompletionClient(
+        [
+            Deployment("east", FailingClient(rate_limit_error())),
+            Deployment("west", FailingClient(asyncio.TimeoutError())),
+        ]
+    )
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.create(MESSAGES)
+
+
+@pytest.mark.asyncio
+async def test_balances_and_respects_concurrency_limits():
+    east = SlowClient(0.01)
+    west = SlowClient(0.01)
+    pool = PooledChatCompletionClient(
+        [
+            Deployment("east", east, max_concurrency=2),
+            Deployment("west", west, max_concurrency=2),
+        ]
+    )
+
+    await asyncio.gather(*(pool.create(MESSAGES) for _ in range(8)))
+
+    assert east.peak <= 2 and west.peak <= 2
+    assert east.peak > 0 and west.peak > 0
@@ -0,0 +1,120 @@
+import asyncio
+
+from autogen_core.models import UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+import pytest
+
+from src.llm.rate_limit import (
+    FileQuotaBuckets,
+    LLMRateLimiter,
+    QuotaBuckets,
+    RateLimitedChatCompletionClient,
+    estimate_request_tokens,
+)
+from src.llm.stages import llm_session
+
+
+MESSAGES = [UserMessage(content="What is the price of AAPL today?", source="User")]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_estimate_includes_completion_reserve():
+    base = estimate_request_tokens(MESSAGES, completion_reserve=0)
+    assert base > 0
+    assert estimate_request_tokens(MESSAGES, completion_reserve=100) == base + 100
+
+
+def test_buckets_enforce_requests_per_minute():
+    clock = FakeClock()
+    buckets = QuotaBuckets(tokens_per_minute=10_000, requests_per_minute=2, clock=clock)
+    assert buckets.try_acquire(10) == 0.0
+    assert buckets.try_acquire(10) == 0.0
+    wait = buckets.try_acquire(10)
+    assert wait == pytest.approx(30.0)
+    clock.now += 30
+    assert buckets.try_acquire(10) == 0.0
+
+
+def test_buckets_enforce_tokens_per_minute_and_settle():
+    clock = FakeClock()
+    buckets = QuotaBuckets(tokens_per_minute=600, requests_per_minute=100, clock=clock)
+    assert buckets.try_acquire(500) == 0.0
+    assert buckets.try_acquire(200) == pytest.approx(10.0)
+    # The request used 300 fewer tokens than reserved
+    buckets.settle(-300)
+    assert buckets.try_acquire(200) == 0.0
+
+
+def test_file_buckets_share_quota(tmp_path):
+    clock = FakeClock()
+    state_file = tmp_path / "quota.json"
+    first = FileQuotaBuckets(state_file, 10_000, 1, clock=clock)
+    second = FileQuotaBuckets(state_file, 10_000, 1, clock=clock)
+    assert first.try_acquire(10) == 0.0
+    assert second.try_acquire(10) > 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_serves_sessions_round_robin():
+    limiter = LLMRateLimiter(
+        QuotaBuckets(tokens_per_minute=1_000_000, requests_per_minute=1200)
+    )
+    # Drain the request bucket so every caller has to queue
+    for _ in range(1200):
+        limiter._buckets.try_acquire(1)
+
+    order = []
+
+    async def call(session, label):
+        await limiter.acquire(1, session)
+        order.append(label)
+
+    tasks = [asyncio.create_task(call("busy", f"busy-{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call("quiet", "quiet-0")))
+    await asyncio.gather(*tasks)
+
+    assert order.index("quiet-0") <= 1
+    assert limiter.stats.requests == 4
+    assert limiter.stats.max_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped():
+    limiter = LLMRateLimiter(
+        QuotaBuckets(tokens_per_minute=1_000_000, requests_per_minute=600)
+    )
+    for _ in range(600):
+        limiter._buckets.try_acquire(1)
+
+    cancelled = asyncio.create_task(limiter.acquire(1, "a"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    waited = await asyncio.wait_for(limiter.acquire(1, "b"), timeout=1)
+    assert waited > 0
+    assert limiter.stats.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_client_acquires_under_current_session():
+    limiter = LLMRateLimiter(
+        QuotaBuckets(tokens_per_minute=100_000, requests_per_minute=60)
+    )
+    client = RateLimitedChatCompletionClient(
+        ReplayChatCompletionClient(["first", "second"]), limiter
+    )
+    with llm_session("conversation-1"):
+        result = await client.create(MESSAGES)
+    assert result.content == "first"
+    assert "conversation-1" in limiter.stats.wait_by_session
+
+    chunks = [chunk async for chunk in client.create_stream(MESSAGES)]
+    assert chunks[-1].content == "second"
+    assert limiter.stats.requests == 2
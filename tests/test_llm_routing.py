@@ -0,0 +1,66 @@
+from autogen_core.models import UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+import pytest
+
+from src.llm.config import build_model_client
+from src.llm.routing import (
+    DEFAULT_STAGE,
+    ModelPricing,
+    StageRoutedChatCompletionClient,
+)
+from src.llm.stages import PLANNING, RESOLUTION, VALIDATION, llm_stage
+
+
+MESSAGES = [UserMessage(content="Make this answer readable", source="User")]
+
+
+@pytest.mark.asyncio
+async def test_calls_are_routed_by_stage():
+    strong = ReplayChatCompletionClient(["plan"])
+    cheap = ReplayChatCompletionClient(["formatted", "Yes"])
+    client = StageRoutedChatCompletionClient(
+        strong, {RESOLUTION: cheap, VALIDATION: cheap}
+    )
+
+    with llm_stage(PLANNING):
+        assert (await client.create(MESSAGES)).content == "plan"
+    with llm_stage(RESOLUTION):
+        assert (await client.create(MESSAGES)).content == "formatted"
+    with llm_stage(VALIDATION):
+        assert (await client.create(MESSAGES)).content == "Yes"
+
+    assert set(client.stats.by_stage) == {PLANNING, RESOLUTION, VALIDATION}
+    assert client.total_usage().prompt_tokens == (
+        strong.total_usage().prompt_tokens + cheap.total_usage().prompt_tokens
+    )
+
+
+@pytest.mark.asyncio
+async def test_unlabelled_calls_use_default_client_and_pricing():
+    client = StageRoutedChatCompletionClient(
+        ReplayChatCompletionClient(["default"]),
+        {},
+        {DEFAULT_STAGE: ModelPricing(prompt_per_million=1_000_000)},
+    )
+    result = await client.create(MESSAGES)
+    usage = client.stats.by_stage[DEFAULT_STAGE]
+    assert result.content == "default"
+    assert usage.calls == 1
+    assert usage.cost == pytest.approx(result.usage.prompt_tokens)
+
+
+@pytest.mark.asyncio
+async def test_streaming_is_routed_by_stage():
+    client = StageRoutedChatCompletionClient(
+        ReplayChatCompletionClient(["strong"]),
+        {RESOLUTION: ReplayChatCompletionClient(["cheap answer"])},
+    )
+    with llm_stage(RESOLUTION):
+        chunks = [chunk async for chunk in client.create_stream(MESSAGES)]
+    assert chunks[-1].content == "cheap answer"
+    assert client.stats.by_stage[RESOLUTION].calls == 1
+
+
+def test_config_rejects_unknown_stage():
+    with pytest.raises(ValueError, match="Unknown model stages"):
+        build_model_client({"provider": "x", "config": {}, "stages": {"drafting": {}}})
@@ -1,9 +1,22 @@
 import logging
 import os
+from pathlib import Path
+import shutil
+
+import pytest
 
 from src.utils.logger import get_logger, setup_logging
 
 
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path, monkeypatch):
+    # setup_logging writes relative to the working directory, keep it out of the repo
+    config = Path(__file__).resolve().parents[1] / "config" / "logging_config.yaml"
+    (tmp_path / "config").mkdir()
+    shutil.copy(config, tmp_path / "config")
+    monkeypatch.chdir(tmp_path)
+
+
 def test_get_logger():
     logger = get_logger("test_module")
     assert isinstance(logger, logging.Logger)
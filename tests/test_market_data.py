@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.tools.market_data import (
+    MarketDataService,
+    MarketDataVersions,
+    ProviderExecutor,
+    slice_history,
+)
+
+
+def daily_bars(days: int) -> pd.DataFrame:
+    index = pd.bdate_range(end="2024-06-28", periods=days)
+    return pd.DataFrame({"Open": range(days), "Close": range(days)}, index=index)
+
+
+class FakeProvider:
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def __call__(self, ticker, period, interval):
+        self.calls.append((ticker, period, interval))
+        await asyncio.sleep(self.delay)
+        return daily_bars(65 if period == "3mo" else 1)
+
+
+def make_service(provider, clock=lambda: 0.0):
+    return MarketDataService(provider, versions=MarketDataVersions(), clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_fresh_history_is_served_from_cache():
+    provider = FakeProvider()
+    service = make_service(provider)
+
+    await service.history("AAPL", "1d")
+    await service.history("aapl", "1d")
+
+    assert len(provider.calls) == 1
+    assert service.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_history_is_fetched_again():
+    now = 0.0
+    provider = FakeProvider()
+    service = make_service(provider, clock=lambda: now)
+
+    await service.history("AAPL", "1d")
+    now = 61.0
+    await service.history("AAPL", "1d")
+
+    assert len(provider.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_shorter_period_is_sliced_from_longer_history():
+    provider = FakeProvider()
+    service = make_service(provider)
+
+    history = await service.history("AAPL", "3mo")
+    quote = await service.history("AAPL", "1d")
+
+    assert provider.calls == [("AAPL", "3mo", "1d")]
+    assert service.stats.sliced == 1
+    assert len(quote) == 1
+    assert quote["Open"].iloc[0] == history["Open"].iloc[-1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch():
+    provider = FakeProvider(delay=0.01)
+    service = make_service(provider)
+
+    results = await asyncio.gather(
+        service.history("AAPL", "3mo"),
+        service.history("AAPL", "3mo"),
+        service.history("AAPL", "1d"),
+    )
+
+    assert provider.calls == [("AAPL", "3mo", "1d")]
+    assert service.stats.coalesced == 2
+    assert [len(result) for result in results] == [65, 65, 1]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_fetch_running_for_others():
+    provider = FakeProvider(delay=0.01)
+    service = make_service(provider)
+
+    first = asyncio.ensure_future(service.history("AAPL", "1d"))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(service.history("AAPL", "1d"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert len(await second) == 1
+    assert len(provider.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_served_history_is_a_copy():
+    service = make_service(FakeProvider())
+
+    history = await service.history("AAPL", "3mo")
+    history["Open"] = -1
+
+    assert (await service.history("AAPL", "3mo"))["Open"].iloc[0] == 0
+
+
+def test_slice_history_by_calendar_months():
+    sliced = slice_history(daily_bars(130), "1mo")
+
+    assert 19 <= len(sliced) <= 23
+    assert sliced.index[-1] == pd.Timestamp("2024-06-28")
+
+
+class BlockingCall:
+    """Sleeps in the calling thread and tracks how many run at once."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.running -= 1
+        return "done"
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_leave_the_loop_responsive():
+    executor = ProviderExecutor(provider_limits={"slow": 1})
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    beat = asyncio.ensure_future(heartbeat())
+    assert await executor.run("slow", BlockingCall(0.1)) == "done"
+    beat.cancel()
+    executor.shutdown()
+
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_provider_limit_bounds_concurrent_calls():
+    executor = ProviderExecutor(provider_limits={"alpha_vantage": 2})
+    call = BlockingCall(0.02)
+
+    await asyncio.gather(*(executor.run("alpha_vantage", call) for _ in range(6)))
+    executor.shutdown()
+
+    assert call.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_holds_slot_until_thread_finishes():
+    executor = ProviderExecutor(provider_limits={"yfinance": 1})
+    call = BlockingCall(0.05)
+
+    first = asyncio.ensure_future(executor.run("yfinance", call))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await executor.run("yfinance", call)
+    executor.shutdown()
+
+    assert call.peak == 1
@@ -0,0 +1,160 @@
+import math
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.tools.options import (
+    VolatilitySurface,
+    black_scholes,
+    implied_volatility,
+    parse_option_types,
+    price_chain,
+)
+from tests.conftest import (
+    OPTION_EXPIRIES,
+    OPTION_RATE,
+    OPTION_SPOT,
+    OPTION_STRIKES,
+    OPTION_VOLS,
+)
+
+
+def scalar_black_scholes(spot, strike, time_to_expiry, rate, sigma, option_type):
+    """The tool's original single-contract formula."""
+    d1 = (math.log(spot / strike) + (rate + sigma**2 / 2) * time_to_expiry) / (
+        sigma * math.sqrt(time_to_expiry)
+    )
+    d2 = d1 - sigma * math.sqrt(time_to_expiry)
+    if option_type == "call":
+        return spot * norm.cdf(d1) - strike * math.exp(
+            -rate * time_to_expiry
+        ) * norm.cdf(d2)
+    return strike * math.exp(-rate * time_to_expiry) * norm.cdf(-d2) - spot * norm.cdf(
+        -d1
+    )
+
+
+def test_single_contract_matches_reference_values():
+    call = black_scholes(100, 100, 1.0, 0.05, 0.2, True).contract()
+    put = black_scholes(100, 100, 1.0, 0.05, 0.2, False).contract()
+
+    assert call["price"] == pytest.approx(10.4506, abs=1e-4)
+    assert put["price"] == pytest.approx(5.5735, abs=1e-4)
+    assert call["delta"] == pytest.approx(0.6368, abs=1e-4)
+    assert put["delta"] == pytest.approx(call["delta"] - 1)
+    assert call["gamma"] == pytest.approx(put["gamma"])
+    assert call["vega"] == pytest.approx(37.524, abs=1e-3)
+
+
+def test_chain_matches_scalar_formula_and_put_call_parity():
+    strikes = [80.0, 95.0, 100.0, 120.0]
+    expiries = [0.1, 0.5, 2.0]
+    chain = price_chain(101.5, strikes, expiries, 0.03, 0.25)
+
+    assert chain.valuation.shape == (2, 3, 4)
+    for option_type, expiry, strike, contract in chain.contracts():
+        assert contract["price"] == pytest.approx(
+            scalar_black_scholes(101.5, strike, expiry, 0.03, 0.25, option_type)
+        )
+    calls, puts = chain.valuation.price
+    discounted = np.outer(np.exp(-0.03 * np.array(expiries)), strikes)
+    np.testing.assert_allclose(calls - puts, 101.5 - discounted)
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_greeks_match_finite_differences(is_call):
+    inputs = {
+        "spot": 105.0,
+        "strike": 100.0,
+        "time_to_expiry": 0.75,
+        "rate": 0.04,
+        "volatility": 0.3,
+    }
+    base = black_scholes(**inputs, is_call=is_call).contract()
+
+    def bumped(name, step):
+        up = black_scholes(**{**inputs, name: inputs[name] + step}, is_call=is_call)
+        down = black_scholes(**{**inputs, name: inputs[name] - step}, is_call=is_call)
+        return up, down
+
+    up, down = bumped("spot", 0.01)
+    assert base["delta"] == pytest.approx((up.price - down.price) / 0.02, rel=1e-5)
+    assert base["gamma"] == pytest.approx((up.delta - down.delta) / 0.02, rel=1e-5)
+    up, down = bumped("volatility", 1e-5)
+    assert base["vega"] == pytest.approx((up.price - down.price) / 2e-5, rel=1e-5)
+    up, down = bumped("rate", 1e-5)
+    assert base["rho"] == pytest.approx((up.price - down.price) / 2e-5, rel=1e-5)
+    up, down = bumped("time_to_expiry", 1e-5)
+    assert base["theta"] == pytest.approx(-(up.price - down.price) / 2e-5, rel=1e-5)
+
+
+def test_volatility_surface_broadcasts_over_chain():
+    surface = np.array([[0.2, 0.3], [0.25, 0.35]])
+    chain = price_chain(100, [90, 110], [0.5, 1.0], 0.02, surface, ("call",))
+
+    expected = black_scholes(100, 110, 1.0, 0.02, 0.35).price
+    assert chain.valuation.price[0, 1, 1] == pytest.approx(float(expected))
+
+
+def test_invalid_inputs_are_rejected():
+    assert parse_option_types("Both") == ("call", "put")
+    with pytest.raises(ValueError):
+        parse_option_types("straddle")
+    with pytest.raises(ValueError):
+        black_scholes(100, [100, 110], [0.5, 0.0], 0.02, 0.2)
+
+
+def test_implied_volatility_recovers_smile(option_quotes):
+    vols = implied_volatility(
+        option_quotes["price"],
+        OPTION_SPOT,
+        option_quotes["strike"],
+        option_quotes["time_to_expiry"],
+        OPTION_RATE,
+        option_quotes["option_type"] == "call",
+    )
+
+    expected = np.tile(OPTION_VOLS.ravel(), 2)
+    np.testing.assert_allclose(vols, expected, atol=1e-6)
+
+
+def test_implied_volatility_falls_back_to_bisection_on_flat_vega():
+    # Deep out of the money and short dated: vega is nearly zero, so plain
+    # Newton from the initial guess overshoots
+    strikes = np.array([40.0, 60.0, 200.0, 300.0])
+    sigma = np.array([0.9, 0.6, 0.8, 1.2])
+    prices = black_scholes(100, strikes, 0.05, 0.01, sigma, strikes > 100).price
+
+    vols = implied_volatility(prices, 100, strikes, 0.05, 0.01, strikes > 100)
+
+    np.testing.assert_allclose(vols, sigma, atol=1e-5)
+
+
+def test_implied_volatility_is_nan_outside_arbitrage_bounds():
+    # Below intrinsic value, above the spot price, and a valid lane
+    vols = implied_volatility([5.0, 120.0, 10.4506], 100, [90, 100, 100], 1.0, 0.05)
+
+    assert np.isnan(vols[:2]).all()
+    assert vols[2] == pytest.approx(0.2, abs=1e-4)
+
+
+def test_volatility_surface_interpolates_between_quotes(option_quotes):
+    surface = VolatilitySurface.from_prices(
+        option_quotes["price"],
+        OPTION_SPOT,
+        option_quotes["strike"],
+        option_quotes["time_to_expiry"],
+        OPTION_RATE,
+        option_quotes["option_type"] == "call",
+    )
+
+    np.testing.assert_allclose(
+        surface(OPTION_STRIKES, OPTION_EXPIRIES), OPTION_VOLS, atol=1e-6
+    )
+    between = surface([95.0], [0.4])[0, 0]
+    assert between == pytest.approx((0.26 + 0.235) / 2, abs=1e-6)
+    variance = (0.24**2 * 0.2 + 0.235**2 * 0.4) / 2
+    assert surface([100.0], [0.3])[0, 0] == pytest.approx((variance / 0.3) ** 0.5)
+    # Flat beyond the quoted strikes and expiries
+    assert surface([500.0], [3.0])[0, 0] == pytest.approx(0.225, abs=1e-6)
@@ -0,0 +1,75 @@
+from autogen_core.models import RequestUsage, SystemMessage, UserMessage
+import pytest
+
+from src.llm.prompt_layout import (
+    CompactingChatCompletionContext,
+    PromptAssembler,
+    PromptCacheStats,
+    cached_prompt_tokens,
+)
+from src.tools.tools import FinancialLiteracyTool, StockInfoTool
+
+
+def test_assemble_orders_stable_content_first():
+    assembler = PromptAssembler("system prompt", [])
+    history = [UserMessage(content="hi", source="User")]
+    volatile = [SystemMessage(content="validation: PASS")]
+
+    messages = assembler.assemble(history, volatile)
+
+    assert messages[0] == SystemMessage(content="system prompt")
+    assert messages[1:] == history + volatile
+
+
+def test_tools_are_sorted_by_name():
+    assembler = PromptAssembler("system", [StockInfoTool(), FinancialLiteracyTool()])
+    assert [tool.name for tool in assembler.tools] == [
+        "explain_finance",
+        "fetch_stock_data",
+    ]
+
+
+def test_prefix_fingerprint_is_independent_of_tool_order():
+    first = PromptAssembler("system", [StockInfoTool(), FinancialLiteracyTool()])
+    second = PromptAssembler("system", [FinancialLiteracyTool(), StockInfoTool()])
+    changed = PromptAssembler("other", [FinancialLiteracyTool(), StockInfoTool()])
+
+    assert first.prefix_fingerprint() == second.prefix_fingerprint()
+    assert first.prefix_fingerprint() != changed.prefix_fingerprint()
+
+
+@pytest.mark.asyncio
+async def test_compacting_context_only_changes_its_prefix_when_it_compacts():
+    context = CompactingChatCompletionContext(max_messages=4)
+    messages = [UserMessage(content=str(index), source="User") for index in range(6)]
+    prefixes = []
+    for message in messages:
+        await context.add_message(message)
+        prefixes.append((await context.get_messages())[0].content)
+
+    # Append-only up to four messages, then the oldest three go at once
+    assert prefixes == ["0", "0", "0", "0", "3", "3"]
+    assert await context.get_messages() == messages[3:]
+
+    with pytest.raises(ValueError):
+        CompactingChatCompletionContext(max_messages=4, keep=4)
+
+
+def test_cached_prompt_tokens_defaults_to_zero():
+    usage = RequestUsage(prompt_tokens=100, completion_tokens=10)
+    assert cached_prompt_tokens(usage) == 0
+
+
+def test_cache_stats_record():
+    usage = RequestUsage(prompt_tokens=2000, completion_tokens=10)
+    usage.cached_tokens = 1500
+    stats = PromptCacheStats()
+
+    stats.record(usage, "planning")
+    stats.record(RequestUsage(prompt_tokens=1000, completion_tokens=5), "resolution")
+
+    assert stats.calls == 2
+    assert stats.prompt_tokens == 3000
+    assert stats.cached_tokens == 1500
+    assert stats.hit_ratio == 0.5
+    assert stats.by_label["planning"] == [2000, 1500]
@@ -0,0 +1,46 @@
+from src.agents.prompts import build_orchestrator_system_message, format_tool_progress
+from src.llm.tokens import count_tokens
+from src.tools.registry import build_orchestrator_tools
+
+
+# Regression budget for the generated orchestrator prompt. The hand-written
+# prompt it replaced was roughly 600 tokens.
+ORCHESTRATOR_PROMPT_TOKEN_BUDGET = 120
+
+
+def test_orchestrator_prompt_token_budget():
+    prompt = build_orchestrator_system_message(build_orchestrator_tools())
+    assert count_tokens(prompt) <= ORCHESTRATOR_PROMPT_TOKEN_BUDGET
+
+
+def test_orchestrator_prompt_uses_real_parameter_names():
+    tools = build_orchestrator_tools()
+    prompt = build_orchestrator_system_message(tools)
+
+    for tool in tools:
+        assert tool.name in prompt
+        for parameter in tool.schema["parameters"]["properties"]:
+            assert parameter in prompt
+    assert "symbol" not in prompt
+
+
+def test_orchestrator_prompt_is_minified_and_deduplicated():
+    tools = build_orchestrator_tools()
+    prompt = build_orchestrator_system_message(tools + build_orchestrator_tools())
+
+    assert prompt == build_orchestrator_system_message(tools)
+    assert prompt.count("fetch_stock_data") == 1
+    assert "  " not in prompt
+    assert "\n" not in prompt
+    # Descriptions already travel in the tool schemas
+    assert tools[0].description not in prompt
+
+
+def test_tool_progress_is_truncated_and_names_next_tool():
+    text = format_tool_progress(2, 3, "fetch_stock_data", "x " * 200, "analyze_sentiment")
+    assert text.startswith("[2/3] fetch_stock_data: ")
+    assert text.endswith("... Running analyze_sentiment...")
+    assert len(text) < 220
+    assert format_tool_progress(3, 3, "analyze_sentiment", "positive", None) == (
+        "[3/3] analyze_sentiment: positive"
+    )
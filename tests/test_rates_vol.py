@@ -0,0 +1,112 @@
+"""
+Test suite for the Treasury curve and rolling volatility service.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.tools.rates_vol import RatesVolService, RollingVolatility, TreasuryCurve
+
+
+def closes(values, start="2024-01-01"):
+    return pd.Series(
+        values, index=pd.bdate_range(start, periods=len(values)), dtype=float
+    )
+
+
+def batch_volatility(series, window):
+    returns = np.log(series / series.shift(1)).dropna().iloc[-window:]
+    return math.sqrt(252) * np.std(returns)
+
+
+class FakeMarket:
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    async def history(self, ticker, period="3mo", interval="1d"):
+        self.calls.append((ticker, period))
+        return self.frames[ticker, period].copy()
+
+
+def test_treasury_curve_interpolates_and_extrapolates_flat():
+    curve = TreasuryCurve(np.array([0.25, 5.0, 10.0]), np.array([0.05, 0.04, 0.045]))
+
+    assert curve.rate(0.1) == pytest.approx(0.05)
+    assert curve.rate(2.625) == pytest.approx(0.045)
+    assert curve.rate([7.5, 30.0]) == pytest.approx([0.0425, 0.045])
+
+
+def test_rolling_volatility_updates_match_batch_computation():
+    rng = np.random.default_rng(0)
+    prices = closes(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 120))))
+    estimator = RollingVolatility(window=20)
+
+    assert estimator.update(prices.iloc[:60])
+    assert estimator.value == pytest.approx(batch_volatility(prices.iloc[:60], 20))
+    for end in range(61, 121):
+        # Overlapping windows, as successive short fetches return
+        assert estimator.update(prices.iloc[end - 5 : end])
+        assert estimator.value == pytest.approx(batch_volatility(prices.iloc[:end], 20))
+
+
+def test_rolling_volatility_revises_the_newest_bar():
+    estimator = RollingVolatility(window=10)
+    estimator.update(closes([100, 101, 99, 102]))
+    estimator.update(closes([100, 101, 99, 110]))
+
+    assert estimator.value == pytest.approx(
+        batch_volatility(closes([100, 101, 99, 110]), 10)
+    )
+
+
+def test_rolling_volatility_reports_gaps():
+    estimator = RollingVolatility(window=10)
+    estimator.update(closes([100, 101, 99, 102]))
+
+    assert not estimator.update(closes([103, 104], start="2024-02-01"))
+    assert estimator.value == pytest.approx(
+        batch_volatility(closes([100, 101, 99, 102]), 10)
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_caches_curve_until_ttl():
+    now = [0.0]
+    market = FakeMarket(
+        {
+            ("^IRX", "5d"): pd.DataFrame({"Close": [5.0]}),
+            ("^FVX", "5d"): pd.DataFrame({"Close": [4.0]}),
+            ("^TNX", "5d"): pd.DataFrame({"Close": [float("nan")]}),
+        }
+    )
+    service = RatesVolService(market, curve_ttl=60, clock=lambda: now[0])
+
+    assert await service.risk_free_rate(0.25) == pytest.approx(0.05)
+    assert await service.risk_free_rate([5.0, 10.0]) == pytest.approx([0.04, 0.04])
+    assert len(market.calls) == 3
+
+    now[0] = 61.0
+    await service.curve()
+    assert len(market.calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_service_feeds_recent_bars_to_volatility():
+    prices = closes(100 + np.arange(70) % 3)
+    market = FakeMarket(
+        {
+            ("AAPL", "3mo"): pd.DataFrame({"Close": prices.iloc[:67]}),
+            ("AAPL", "5d"): pd.DataFrame({"Close": prices.iloc[-5:]}),
+        }
+    )
+    service = RatesVolService(market, vol_window=63)
+
+    await service.realized_volatility("aapl")
+    sigma = await service.realized_volatility("AAPL")
+
+    assert market.calls == [("AAPL", "3mo"), ("AAPL", "5d")]
+    assert sigma == pytest.approx(batch_volatility(prices, 63))
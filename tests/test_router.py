@@ -0,0 +1,45 @@
+import pytest
+
+from src.tools.registry import build_orchestrator_tools
+from src.tools.router import ToolRouter
+
+
+@pytest.fixture
+def router():
+    return ToolRouter(build_orchestrator_tools())
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("what is an ETF", ["explain_finance"]),
+        ("explain compound interest", ["explain_finance"]),
+        ("AAPL price today", ["fetch_stock_data"]),
+        ("what is the market sentiment around Tesla", ["analyze_sentiment"]),
+    ],
+)
+def test_route_narrows_obvious_queries(router, query, expected):
+    decision = router.route(query)
+    assert not decision.fallback
+    for name in expected:
+        assert name in decision.tool_names
+    assert len(decision.tool_names) < len(build_orchestrator_tools())
+
+
+def test_route_keeps_multi_tool_queries(router):
+    decision = router.route("price a call option on AAPL with a strike of 150")
+    assert "options_pricing_calculator" in decision.tool_names
+    assert "fetch_stock_data" in decision.tool_names
+
+
+@pytest.mark.parametrize("query", ["hello", "How is TSLA doing?"])
+def test_route_falls_back_when_confidence_is_low(router, query):
+    decision = router.route(query)
+    assert decision.fallback
+    assert len(decision.tools) == len(build_orchestrator_tools())
+
+
+def test_route_ignores_tools_that_are_not_available():
+    router = ToolRouter(build_orchestrator_tools())
+    decision = router.route("forecast AAPL for tomorrow")
+    assert "predict_stock_price" not in decision.tool_names
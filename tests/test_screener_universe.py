@@ -0,0 +1,231 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.tools.fetch_scheduler import ApiTier, FetchScheduler, TokenBucket
+from src.tools.screener_universe import (
+    DEFAULT_UNIVERSE,
+    CompanyFundamentals,
+    ScreenerUniverse,
+    SectorIndex,
+    load_universe_tickers,
+    parse_company_overview,
+)
+from src.tools.tools import StockScreenerInput, StockScreenerTool
+
+
+COMPANIES = {
+    "AAPL": CompanyFundamentals("AAPL", "TECHNOLOGY", 3400.0),
+    "AMD": CompanyFundamentals("AMD", "TECHNOLOGY", 250.0),
+    "INTC": CompanyFundamentals("INTC", "TECHNOLOGY", 90.0),
+    "JPM": CompanyFundamentals("JPM", "FINANCIAL SERVICES", 600.0),
+}
+
+
+class FakeOverviews:
+    def __init__(self, companies=COMPANIES):
+        self.companies = dict(companies)
+        self.calls = []
+
+    async def __call__(self, ticker):
+        self.calls.append(ticker)
+        return self.companies.get(ticker)
+
+
+def unthrottled(fetch, path):
+    return FetchScheduler(
+        fetch,
+        decode=lambda company: CompanyFundamentals(**company),
+        bucket=TokenBucket(ApiTier(6000)),
+        checkpoint_path=path.with_suffix(".checkpoint.json"),
+    )
+
+
+def test_sector_index_range_query_is_inclusive_and_largest_first():
+    index = SectorIndex(COMPANIES.values())
+
+    assert index.screen("technology", 90, 250) == [("AMD", 250.0), ("INTC", 90.0)]
+    assert index.screen("Technology", 1000, 5000) == [("AAPL", 3400.0)]
+    assert index.screen("energy", 0, 5000) == []
+
+
+def test_universe_tickers_from_list_file_or_default(tmp_path):
+    path = tmp_path / "universe.txt"
+    path.write_text("aapl\nmsft\n")
+
+    assert load_universe_tickers("aapl, jpm") == ["AAPL", "JPM"]
+    assert load_universe_tickers(str(path)) == ["AAPL", "MSFT"]
+    assert load_universe_tickers("") == list(DEFAULT_UNIVERSE)
+
+
+def test_parse_company_overview_reads_alpha_vantage_tuple():
+    company = parse_company_overview(
+        "AAPL", ({"Sector": "TECHNOLOGY", "MarketCapitalization": "3.4e12"}, None)
+    )
+
+    assert company == CompanyFundamentals("AAPL", "TECHNOLOGY", 3400.0)
+    assert parse_company_overview("AAPL", None) is None
+
+
+@pytest.mark.asyncio
+async def test_refreshed_universe_is_persisted_and_reloaded(tmp_path):
+    path = tmp_path / "universe.json"
+    fetch = FakeOverviews()
+    universe = ScreenerUniverse(
+        list(COMPANIES),
+        path,
+        refresh_interval=3600,
+        scheduler=unthrottled(fetch, path),
+    )
+    await universe.refresh()
+
+    reloaded_fetch = FakeOverviews()
+    reloaded = ScreenerUniverse(
+        list(COMPANIES),
+        path,
+        refresh_interval=3600,
+        scheduler=unthrottled(reloaded_fetch, path),
+    )
+
+    assert await reloaded.screen("technology", 100, 1000) == [("AMD", 250.0)]
+    assert reloaded_fetch.calls == []
+
+
+@pytest.mark.asyncio
+async def test_stale_universe_is_served_while_refreshing(tmp_path):
+    now = 0.0
+    fetch = FakeOverviews()
+    universe = ScreenerUniverse(
+        list(COMPANIES),
+        tmp_path / "u.json",
+        refresh_interval=60,
+        clock=lambda: now,
+        scheduler=unthrottled(fetch, tmp_path / "u.json"),
+    )
+    await universe.screen("technology", 0, 5000)
+    await universe._refresh
+    fetch.companies["AMD"] = CompanyFundamentals("AMD", "TECHNOLOGY", 300.0)
+    now = 120.0
+
+    stale = await universe.screen("technology", 200, 400)
+    await universe._refresh
+    fresh = await universe.screen("technology", 200, 400)
+
+    assert stale == [("AMD", 250.0)]
+    assert fresh == [("AMD", 300.0)]
+    assert len(fetch.calls) == 2 * len(COMPANIES)
+
+
+@pytest.mark.asyncio
+async def test_screener_tool_answers_from_universe(tmp_path):
+    universe = ScreenerUniverse(
+        list(COMPANIES),
+        tmp_path / "u.json",
+        scheduler=unthrottled(FakeOverviews(), tmp_path / "u.json"),
+    )
+    tool = StockScreenerTool(universe)
+
+    result = await tool.run(
+        StockScreenerInput(
+            sector="Technology", market_cap_min=100, market_cap_max=5000
+        ),
+        MagicMock(),
+    )
+
+    assert "AAPL: $3400.00B" in result.data
+    assert "AMD: $250.00B" in result.data
+    assert "INTC" not in result.data
+
+
+@pytest.mark.asyncio
+async def test_partial_refresh_keeps_previous_data_and_stays_stale(tmp_path):
+    path = tmp_path / "u.json"
+    universe = ScreenerUniverse(
+        list(COMPANIES), path, scheduler=unthrottled(FakeOverviews(), path)
+    )
+    await universe.refresh()
+    fetched_at = universe.fetched_at
+
+    async def quota_after_two(ticker):
+        if quota_after_two.calls == 2:
+            raise ValueError("Our standard API rate limit is 25 requests per day.")
+        quota_after_two.calls += 1
+        return CompanyFundamentals(ticker, "TECHNOLOGY", 1.0)
+
+    quota_after_two.calls = 0
+    universe._scheduler = FetchScheduler(
+        quota_after_two,
+        decode=lambda company: CompanyFundamentals(**company),
+        bucket=TokenBucket(ApiTier(6000)),
+        concurrency=1,
+    )
+    count = await universe.refresh()
+
+    assert count == len(COMPANIES)
+    assert universe.fetched_at == fetched_at
+    assert universe.index.screen("financial services", 0, 5000) == [("JPM", 600.0)]
+
+
+@pytest.mark.asyncio
+async def test_first_screen_serves_the_partial_index(tmp_path):
+    release = asyncio.Event()
+
+    async def slow_after_first(ticker):
+        if ticker != "AAPL":
+            await release.wait()
+        return COMPANIES[ticker]
+
+    path = tmp_path / "u.json"
+    universe = ScreenerUniverse(
+        list(COMPANIES),
+        path,
+        scheduler=FetchScheduler(
+            slow_after_first,
+            decode=lambda company: CompanyFundamentals(**company),
+            bucket=TokenBucket(ApiTier(6000)),
+            concurrency=1,
+        ),
+    )
+    tool = StockScreenerTool(universe)
+
+    partial = await tool.run(
+        StockScreenerInput(sector="Technology", market_cap_min=0, market_cap_max=5000),
+        MagicMock(),
+    )
+
+    assert "AAPL: $3400.00B" in partial.data
+    assert "Only 1 of 4 companies are indexed so far" in partial.data
+    assert not universe._refresh.done()
+
+    release.set()
+    await universe._refresh
+
+    assert not universe.partial
+    assert await universe.screen("technology", 0, 5000) == [
+        ("AAPL", 3400.0),
+        ("AMD", 250.0),
+        ("INTC", 90.0),
+    ]
+
+
+def test_cut_short_refresh_is_resumed_after_the_resume_interval(tmp_path):
+    now = 0.0
+    universe = ScreenerUniverse(
+        list(COMPANIES),
+        tmp_path / "u.json",
+        refresh_interval=60,
+        resume_interval=600,
+        clock=lambda: now,
+        scheduler=MagicMock(),
+    )
+    universe.fetched_at = universe.updated_at = 0.0
+    now = 120.0
+    assert universe.needs_refresh()
+
+    # A refresh at 120 was cut short by the daily quota
+    universe.updated_at = 120.0
+    now = 300.0
+    assert not universe.needs_refresh()
+    now = 720.0
+    assert universe.needs_refresh()
@@ -0,0 +1,169 @@
+from autogen_core import (
+    AgentId,
+    CancellationToken,
+    MessageContext,
+    SingleThreadedAgentRuntime,
+)
+from autogen_core.models import CreateResult, RequestUsage
+from autogen_core.tools import BaseTool
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from pydantic import BaseModel
+import pytest
+
+from src.agents import orchestrator
+from src.agents.orchestrator import SoloOrchestratorAssistantAgent
+from src.core.answer_cache import TurnAnswerCache
+from src.core.deadline import ENGINE, RESOLUTION, StageOverrun
+from src.core.messages import UserTextMessage
+from src.core.streaming import STREAM_ON, StreamGate
+
+
+ENGINE_CONFIG = {
+    "tools": {
+        name: {"eval_engine_model": "task"} for name in ("fetch_stock_data", "default")
+    },
+    "agents": {"OrchestratorAgent": {"eval_engine_model": "task"}},
+}
+ENGINE_RESULT = {
+    "inference_id": "inference",
+    "user_id": "1",
+    "rule_results": [
+        {
+            "id": "rule",
+            "name": "Hallucination",
+            "rule_type": "hallucination",
+            "scope": "response",
+            "result": "Pass",
+            "latency_ms": 1,
+        }
+    ],
+}
+
+
+class TickerArgs(BaseModel):
+    ticker: str
+
+
+class TextResult(BaseModel):
+    data: str
+
+
+class PriceTool(BaseTool[TickerArgs, TextResult]):
+    def __init__(self):
+        super().__init__(TickerArgs, TextResult, "fetch_stock_data", "Price")
+
+    async def run(self, args: TickerArgs, cancellation_token: CancellationToken):
+        return TextResult(data=f"{args.ticker} closed at $189.12. ")
+
+
+def result(content) -> CreateResult:
+    return CreateResult(
+        finish_reason="function_calls" if isinstance(content, list) else "stop",
+        content=content,
+        usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+        cached=False,
+    )
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    async def validate_prompt(message, task, conversation_id):
+        return ENGINE_RESULT
+
+    async def validate_response(response, task, inference_id, context):
+        return ENGINE_RESULT
+
+    monkeypatch.setattr(orchestrator, "send_prompt_to_arthur_engine", validate_prompt)
+    monkeypatch.setattr(
+        orchestrator, "send_response_to_arthur_engine", validate_response
+    )
+
+
+async def make_agent(monkeypatch, replies):
+    monkeypatch.setattr(orchestrator, "build_orchestrator_tools", lambda: [PriceTool()])
+    runtime = SingleThreadedAgentRuntime()
+    await SoloOrchestratorAssistantAgent.register(
+        runtime,
+        "Orchestrator",
+        lambda: SoloOrchestratorAssistantAgent(
+            "Orchestrator",
+            description="test",
+            model_client=ReplayChatCompletionClient(
+                [result(reply) for reply in replies]
+            ),
+            arthur_engine_config=ENGINE_CONFIG,
+            answer_cache=TurnAnswerCache(),
+        ),
+    )
+    agent = await runtime.try_get_underlying_agent_instance(
+        AgentId("Orchestrator", "default"), SoloOrchestratorAssistantAgent
+    )
+    published = []
+
+    async def publish_answer(answer, conversation_id):
+        published.append(answer)
+
+    monkeypatch.setattr(agent, "publish_answer", publish_answer)
+    return agent, published
+
+
+def message_context() -> MessageContext:
+    return MessageContext(
+        sender=None,
+        topic_id=None,
+        is_rpc=False,
+        cancellation_token=CancellationToken(),
+        message_id="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_degraded_answer_without_tools_withdraws_the_stream(monkeypatch, engine):
+    agent, published = await make_agent(
+        monkeypatch, ["Apple makes phones.", "Apple makes phones."]
+    )
+    chunks = []
+
+    async def publish_chunk(chunk):
+        chunks.append(chunk)
+
+    agent._stream_gate = StreamGate(publish_chunk, STREAM_ON)
+
+    async def resolve(resolution_message):
+        await agent._stream_gate.feed("Apple is a company that")
+        raise StageOverrun(RESOLUTION, 0.0)
+
+    monkeypatch.setattr(agent, "resolve", resolve)
+
+    await agent.process_turn(
+        UserTextMessage(content="what does Apple do", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert published == ["Apple makes phones."]
+    assert [chunk.redact for chunk in chunks] == [False, True]
+    assert agent._answer_cache._entries == {}
+
+
+@pytest.mark.asyncio
+async def test_unchecked_tool_responses_mark_the_turn_degraded(monkeypatch, engine):
+    agent, _ = await make_agent(monkeypatch, [])
+    run = agent._deadline.run
+
+    async def overrun_engine(stage, work):
+        if stage == ENGINE:
+            work.close()
+            raise StageOverrun(stage, 0.0)
+        return await run(stage, work)
+
+    monkeypatch.setattr(agent._deadline, "run", overrun_engine)
+    responses = [
+        {"name": "fetch_stock_data", "arguments": '{"ticker": "AAPL"}', "response": r}
+        for r in ("AAPL closed at $189.12. ", "MSFT closed at $410.50. ")
+    ]
+
+    summary = await agent.validate_tool_responses(responses, "prices", [], "turn")
+
+    assert agent._turn_degraded
+    assert summary.count("validation timed out, unchecked") == 2
@@ -0,0 +1,38 @@
+import json
+
+from autogen_ext.models.replay import ReplayChatCompletionClient
+import pytest
+
+from benchmarks import stage_routing
+from src.llm.routing import StageRoutedChatCompletionClient
+from src.llm.stages import RESOLUTION, VALIDATION
+
+
+@pytest.mark.asyncio
+async def test_benchmark_runs_against_replay_clients(tmp_path, monkeypatch, capsys):
+    config_path = tmp_path / "model_config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "provider": "replay",
+                "config": {},
+                "stages": {RESOLUTION: {}, VALIDATION: {}},
+            }
+        )
+    )
+
+    def build_model_client(model_config):
+        if "stages" not in model_config:
+            return ReplayChatCompletionClient(["plan", "answer", "Yes"])
+        cheap = ReplayChatCompletionClient(["answer", "Yes"])
+        return StageRoutedChatCompletionClient(
+            ReplayChatCompletionClient(["plan"]),
+            {RESOLUTION: cheap, VALIDATION: cheap},
+        )
+
+    monkeypatch.setattr(stage_routing, "build_model_client", build_model_client)
+    await stage_routing.main(str(config_path), runs=1)
+
+    rows = capsys.readouterr().out.splitlines()[1:]
+    assert len(rows) == 6
+    assert [row.split()[1] for row in rows] == ["single", "routed"] * 3
@@ -0,0 +1,162 @@
+from autogen_core import DefaultTopicId, SingleThreadedAgentRuntime
+import pytest
+
+from src.agents.prompts import format_tool_progress
+from src.agents.user_agent import SlowUserProxyAgent
+from src.core.handlers import NeedsUserInputHandler
+from src.core.messages import (
+    AssistantTextChunk,
+    AssistantTextMessage,
+    ToolProgressMessage,
+)
+from src.core.streaming import STREAM_HOLD, STREAM_OFF, STREAM_ON, StreamGate
+from src.utils import user_io
+
+
+class Recorder:
+    def __init__(self):
+        self.chunks = []
+
+    async def __call__(self, chunk):
+        self.chunks.append(chunk)
+
+
+@pytest.mark.asyncio
+async def test_stream_policy_publishes_chunks_as_they_arrive():
+    published = Recorder()
+    gate = StreamGate(published, STREAM_ON, conversation_id="turn-1")
+    await gate.feed("AAPL closed ")
+    await gate.feed("at 189.12")
+    await gate.settle(True)
+
+    assert [c.content for c in published.chunks] == ["AAPL closed ", "at 189.12"]
+    assert all(c.conversation_id == "turn-1" for c in published.chunks)
+    assert gate.text == "AAPL closed at 189.12"
+    assert gate.time_to_first_chunk is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_verdict_redacts_streamed_output():
+    published = Recorder()
+    gate = StreamGate(published, STREAM_ON)
+    await gate.feed("Account 1234")
+    await gate.settle(False)
+    await gate.feed(" more")
+
+    assert published.chunks[-1].redact
+    assert len(published.chunks) == 2
+
+
+@pytest.mark.asyncio
+async def test_abort_withdraws_streamed_output_once_with_its_reason():
+    published = Recorder()
+    gate = StreamGate(published, STREAM_ON)
+    await gate.feed("AAPL is")
+    assert gate.shown
+    await gate.abort("the answer ran out of time")
+    await gate.settle(False)
+
+    assert not gate.shown
+
+    assert [c.redact for c in published.chunks] == [False, True]
+    assert published.chunks[-1].content == "the answer ran out of time"
+
+
+@pytest.mark.asyncio
+async def test_hold_policy_and_held_gate_publish_nothing():
+    published = Recorder()
+    hold = StreamGate(published, STREAM_HOLD)
+    await hold.feed("text")
+    await hold.settle(False)
+
+    held = StreamGate(published, STREAM_ON)
+    held.hold("prompt failed the PII check")
+    await held.feed("text")
+
+    assert hold.streaming
+    assert published.chunks == []
+
+
+def test_off_policy_does_not_stream_and_unknown_policy_fails():
+    assert not StreamGate(Recorder(), STREAM_OFF).streaming
+    with pytest.raises(ValueError):
+        StreamGate(Recorder(), "fast")
+
+
+@pytest.mark.asyncio
+async def test_user_proxy_renders_chunks_without_asking_for_input(capsys):
+    needs_user_input = NeedsUserInputHandler()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[needs_user_input])
+    await SlowUserProxyAgent.register(
+        runtime, "User", lambda: SlowUserProxyAgent("User", "I am a user")
+    )
+    runtime.start()
+    await runtime.publish_message(
+        AssistantTextChunk(source="Orchestrator", content="AAPL closed"),
+        DefaultTopicId("assistant_conversation"),
+    )
+    await runtime.stop_when_idle()
+
+    assert "AAPL closed" in capsys.readouterr().out
+    assert not needs_user_input.needs_user_input
+
+
+@pytest.mark.asyncio
+async def test_user_proxy_renders_progress_without_asking_for_input(capsys):
+    needs_user_input = NeedsUserInputHandler()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[needs_user_input])
+    await SlowUserProxyAgent.register(
+        runtime, "User", lambda: SlowUserProxyAgent("User", "I am a user")
+    )
+    runtime.start()
+    await runtime.publish_message(
+        ToolProgressMessage(
+            source="Orchestrator",
+            content=format_tool_progress(
+                1,
+                2,
+                "fetch_stock_data",
+                "AAPL closed at $189.12",
+                "options_pricing_calculator",
+            ),
+            tool_name="fetch_stock_data",
+            step=1,
+            total_steps=2,
+        ),
+        DefaultTopicId("assistant_conversation"),
+    )
+    await runtime.stop_when_idle()
+
+    out = capsys.readouterr().out
+    assert "[1/2] fetch_stock_data: AAPL closed at $189.12" in out
+    assert "Running options_pricing_calculator" in out
+    assert not needs_user_input.needs_user_input
+
+
+@pytest.mark.asyncio
+async def test_streamed_answer_is_not_repeated_in_the_question(monkeypatch, capsys):
+    needs_user_input = NeedsUserInputHandler()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[needs_user_input])
+    await SlowUserProxyAgent.register(
+        runtime, "User", lambda: SlowUserProxyAgent("User", "I am a user")
+    )
+    runtime.start()
+    await runtime.publish_message(
+        AssistantTextMessage(
+            source="Orchestrator", content="AAPL closed at 189.12", streamed=True
+        ),
+        DefaultTopicId("assistant_conversation"),
+    )
+    await runtime.stop_when_idle()
+
+    async def ainput(prompt=""):
+        return "thanks"
+
+    monkeypatch.setattr(user_io, "ainput", ainput)
+    await user_io.get_user_input(
+        needs_user_input.user_input_content, needs_user_input.user_input_streamed
+    )
+    await user_io.get_user_input("AAPL closed at 189.12")
+
+    assert needs_user_input.user_input_streamed
+    assert capsys.readouterr().out.count("AAPL closed at 189.12") == 1
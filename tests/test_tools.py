@@ -6,11 +6,16 @@ The tests cover various functionalities including stock forecasting, sentiment a
 
 """
 
+import math
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
+from src.tools.forecast import trend_forecaster
+from src.tools.market_data import market_data
+from src.tools.rates_vol import rates_vol
 from src.tools.tools import (
     FinancialLiteracyInput,
     FinancialLiteracyTool,
@@ -21,6 +26,18 @@ from src.tools.tools import (
     StockForecastTool,
     StockPredictorInput,
 )
+from tests.conftest import OPTION_EXPIRIES, OPTION_RATE, OPTION_SPOT, OPTION_VOLS
+
+
+@pytest.fixture(autouse=True)
+def clear_market_data():
+    market_data.clear()
+    rates_vol.clear()
+    trend_forecaster.clear()
+    yield
+    market_data.clear()
+    rates_vol.clear()
+    trend_forecaster.clear()
 
 
 @pytest.fixture
@@ -98,7 +115,7 @@ async def test_options_pricing_tool():
             {"Open": [100], "Close": [101], "lag_adj_close": [99], "log_return": [0.01]}
         )
 
-        # Setup IRX data mock
+        # Setup Treasury yield mock, a flat curve
         irx_instance = MagicMock()
         irx_instance.history.return_value = pd.DataFrame(
             {"Close": [2.5]}  # 2.5% interest rate
@@ -106,7 +123,7 @@ async def test_options_pricing_tool():
 
         # Configure mock to return different instances for different tickers
         def get_ticker(ticker):
-            return irx_instance if ticker == "^IRX" else stock_instance
+            return irx_instance if ticker.startswith("^") else stock_instance
 
         mock_ticker.side_effect = get_ticker
 
@@ -139,7 +156,7 @@ async def test_options_pricing_tool_put_option():
         irx_instance.history.return_value = pd.DataFrame({"Close": [2.5]})
 
         def get_ticker(ticker):
-            return irx_instance if ticker == "^IRX" else stock_instance
+            return irx_instance if ticker.startswith("^") else stock_instance
 
         mock_ticker.side_effect = get_ticker
 
@@ -157,3 +174,122 @@ async def test_options_pricing_tool_put_option():
         assert isinstance(result.data, str)
         assert "put" in result.data.lower()
         assert "$" in result.data
+
+
+@pytest.mark.asyncio
+async def test_options_pricing_tool_prices_chain_with_greeks(mock_stock_data):
+    with patch("yfinance.Ticker") as mock_ticker:
+        stock_instance = MagicMock()
+        stock_instance.history.return_value = mock_stock_data.assign(
+            Close=[100, 102, 101, 103, 104, 102, 105, 106, 104, 107]
+        )
+        irx_instance = MagicMock()
+        irx_instance.history.return_value = pd.DataFrame({"Close": [2.5]})
+        mock_ticker.side_effect = lambda ticker: (
+            irx_instance if ticker.startswith("^") else stock_instance
+        )
+
+        tool = OptionsPricingTool()
+        result = await tool.run(
+            OptionsPricingInput(
+                ticker="AAPL",
+                strike_price=100.0,
+                time_to_expiry=0.25,
+                option_type="both",
+                strike_prices=[110.0],
+                expiries=[0.5],
+            ),
+            MagicMock(),
+        )
+
+    assert len(result.data.splitlines()) == 1 + 8 + 1
+    assert "Put K=$110.00 T=0.5y" in result.data
+    call = result.values["call 100 0.25y price"]
+    put = result.values["put 100 0.25y price"]
+    assert call - put == pytest.approx(100 - 100 * math.exp(-0.025 * 0.25))
+    assert 0 < result.values["call 110 0.5y delta"] < 1
+
+
+@pytest.mark.asyncio
+async def test_options_pricing_tool_prices_off_implied_volatility_surface(
+    option_quotes,
+):
+    today = pd.Timestamp.today().normalize()
+    expiries = {
+        (today + pd.Timedelta(days=round(years * 365))).strftime("%Y-%m-%d"): years
+        for years in OPTION_EXPIRIES
+    }
+
+    def option_chain(expiry):
+        listed = option_quotes[option_quotes["time_to_expiry"] == expiries[expiry]]
+        quotes = {
+            option_type: listed[listed["option_type"] == option_type].assign(
+                bid=lambda df: df["price"], ask=lambda df: df["price"], lastPrice=0.0
+            )
+            for option_type in ("call", "put")
+        }
+        return SimpleNamespace(calls=quotes["call"], puts=quotes["put"])
+
+    with patch("yfinance.Ticker") as mock_ticker:
+        stock_instance = MagicMock()
+        stock_instance.history.return_value = pd.DataFrame(
+            {"Open": [OPTION_SPOT], "Close": [OPTION_SPOT]}
+        )
+        stock_instance.options = tuple(expiries)
+        stock_instance.option_chain.side_effect = option_chain
+        irx_instance = MagicMock()
+        irx_instance.history.return_value = pd.DataFrame({"Close": [OPTION_RATE * 100]})
+        mock_ticker.side_effect = lambda ticker: (
+            irx_instance if ticker.startswith("^") else stock_instance
+        )
+
+        tool = OptionsPricingTool()
+        result = await tool.run(
+            OptionsPricingInput(
+                ticker="AAPL",
+                strike_price=110.0,
+                time_to_expiry=OPTION_EXPIRIES[1],
+                option_type="call",
+                volatility_source="implied",
+            ),
+            MagicMock(),
+        )
+
+    assert result.values["volatility"] == pytest.approx(OPTION_VOLS[1, 3], abs=1e-6)
+    listed = option_quotes[
+        (option_quotes["option_type"] == "call")
+        & (option_quotes["strike"] == 110.0)
+        & (option_quotes["time_to_expiry"] == OPTION_EXPIRIES[1])
+    ]
+    assert result.values["price"] == pytest.approx(listed["price"].iloc[0], abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_options_pricing_tool_prices_american_put():
+    with patch("yfinance.Ticker") as mock_ticker:
+        stock_instance = MagicMock()
+        stock_instance.history.return_value = pd.DataFrame(
+            {"Open": [36.0] * 3, "Close": [36.0, 37.8, 36.0]}
+        )
+        irx_instance = MagicMock()
+        irx_instance.history.return_value = pd.DataFrame({"Close": [6.0]})
+        mock_ticker.side_effect = lambda ticker: (
+            irx_instance if ticker.startswith("^") else stock_instance
+        )
+
+        tool = OptionsPricingTool()
+        result = await tool.run(
+            OptionsPricingInput(
+                ticker="AAPL",
+                strike_price=40.0,
+                time_to_expiry=1.0,
+                option_type="put",
+                exercise_style="american",
+            ),
+            MagicMock(),
+        )
+
+    assert "American put" in result.data
+    assert "early exercise premium" in result.data
+    assert result.values["price"] > result.values["european_price"]
+    assert result.values["price"] >= 4.0
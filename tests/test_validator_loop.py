@@ -0,0 +1,557 @@
+import asyncio
+
+from autogen_core import (
+    AgentId,
+    CancellationToken,
+    FunctionCall,
+    MessageContext,
+    SingleThreadedAgentRuntime,
+)
+from autogen_core.models import CreateResult, RequestUsage, UserMessage
+from autogen_core.tools import BaseTool
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from pydantic import BaseModel
+import pytest
+
+from src.agents import orchestrator_validator
+from src.agents.orchestrator_validator import OrchestratorAssistantAgent, tool_call_key
+from src.core.answer_cache import TurnAnswerCache
+from src.core.deadline import RESOLUTION, TOOLS, StageOverrun
+from src.core.messages import UserTextMessage
+
+
+ENGINE_CONFIG = {
+    "tools": {
+        name: {"eval_engine_model": "task"}
+        for name in ("fetch_stock_data", "analyze_sentiment", "default")
+    },
+    "agents": {
+        "OrchestratorAgent": {"eval_engine_model": "task"},
+        "ValidatorAgent": {"eval_engine_model": "task"},
+    },
+}
+
+
+class TickerArgs(BaseModel):
+    ticker: str
+
+
+class TextResult(BaseModel):
+    data: str
+
+
+class ValuesResult(BaseModel):
+    data: str
+    values: dict[str, float]
+
+
+class ScriptedTool(BaseTool[TickerArgs, TextResult]):
+    """Returns scripted outputs in order; outputs containing BAD fail the engine."""
+
+    def __init__(self, name: str, outputs: list[str]):
+        super().__init__(TickerArgs, TextResult, name, f"Scripted {name}")
+        self.outputs = outputs
+        self.calls = 0
+
+    async def run(self, args: TickerArgs, cancellation_token: CancellationToken):
+        output = self.outputs[min(self.calls, len(self.outputs) - 1)]
+        self.calls += 1
+        return TextResult(data=f"{args.ticker} {output}. ")
+
+
+def result(content) -> CreateResult:
+    return CreateResult(
+        finish_reason="function_calls" if isinstance(content, list) else "stop",
+        content=content,
+        usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+        cached=False,
+    )
+
+
+def call(name: str) -> FunctionCall:
+    return FunctionCall(id=name, name=name, arguments='{"ticker": "AAPL"}')
+
+
+def engine_result(passed: bool) -> dict:
+    return {
+        "inference_id": "inference",
+        "user_id": "1",
+        "rule_results": [
+            {
+                "id": "rule",
+                "name": "Hallucination",
+                "rule_type": "hallucination",
+                "scope": "response",
+                "result": "Pass" if passed else "Fail",
+                "latency_ms": 1,
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    calls = []
+
+    async def validate_prompt(message, task, conversation_id):
+        calls.append("prompt")
+        return engine_result(True)
+
+    async def validate_response(response, task, inference_id, context):
+        calls.append("response")
+        return engine_result("BAD" not in str(response))
+
+    monkeypatch.setattr(
+        orchestrator_validator, "send_prompt_to_arthur_engine", validate_prompt
+    )
+    monkeypatch.setattr(
+        orchestrator_validator, "send_response_to_arthur_engine", validate_response
+    )
+    return calls
+
+
+async def make_agent(monkeypatch, tools, replies):
+    monkeypatch.setattr(
+        orchestrator_validator, "build_orchestrator_tools", lambda: tools
+    )
+    model_client = ReplayChatCompletionClient([result(reply) for reply in replies])
+    runtime = SingleThreadedAgentRuntime()
+    await OrchestratorAssistantAgent.register(
+        runtime,
+        "Orchestrator",
+        lambda: OrchestratorAssistantAgent(
+            "Orchestrator",
+            description="test",
+            model_client=model_client,
+            shield_config=ENGINE_CONFIG,
+        ),
+    )
+    agent = await runtime.try_get_underlying_agent_instance(
+        AgentId("Orchestrator", "default"), OrchestratorAssistantAgent
+    )
+    return agent, model_client
+
+
+def message_context() -> MessageContext:
+    return MessageContext(
+        sender=None,
+        topic_id=None,
+        is_rpc=False,
+        cancellation_token=CancellationToken(),
+        message_id="test",
+    )
+
+
+def test_tool_call_key_ignores_argument_formatting():
+    assert tool_call_key(call("fetch_stock_data")) == tool_call_key(
+        {"name": "fetch_stock_data", "arguments": '{ "ticker":"AAPL" }'}
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_reruns_only_the_failed_tool(monkeypatch, engine):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    sentiment = ScriptedTool("analyze_sentiment", ["BAD", "sentiment is positive"])
+    agent, model_client = await make_agent(
+        monkeypatch,
+        [stock, sentiment],
+        [
+            "intent",
+            [call("fetch_stock_data"), call("analyze_sentiment")],
+            "No, the sentiment is wrong",
+            # The retry plans both calls again; the passing one is reused
+            [call("fetch_stock_data"), call("analyze_sentiment")],
+            "Yes",
+        ],
+    )
+
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL price and sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert stock.calls == 1
+    assert sentiment.calls == 2
+    assert "closed at $189.12" in answer and "positive" in answer
+    # intent + 2 planning + 2 validation calls; no second intent call
+    assert len(model_client.create_calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_retries_keep_the_history_prefix_stable(monkeypatch, engine):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    sentiment = ScriptedTool("analyze_sentiment", ["BAD", "sentiment is positive"])
+    plan = [call("fetch_stock_data"), call("analyze_sentiment")]
+    agent, model_client = await make_agent(
+        monkeypatch, [stock, sentiment], ["intent", plan, "No", plan, "Yes"]
+    )
+    await agent._validator_context.add_message(
+        UserMessage(content="AAPL price and sentiment", source="User")
+    )
+    history = await agent._validator_context.get_messages()
+
+    await agent.message_loop(
+        UserTextMessage(content="AAPL price and sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    # Corrections and validation requests travel after the history, never in it
+    assert await agent._validator_context.get_messages() == history
+    planning = [
+        request["messages"]
+        for request in model_client.create_calls
+        if request["messages"][0] == agent._prompt.system_message
+    ]
+    assert len(planning) == 3
+    for messages in planning:
+        assert messages[1 : len(history) + 1] == history
+    assert len(planning[-1]) > len(planning[0])
+
+
+@pytest.mark.asyncio
+async def test_unrouted_and_unknown_tool_calls_do_not_fail_the_turn(
+    monkeypatch, engine
+):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    sentiment = ScriptedTool("analyze_sentiment", ["sentiment is positive"])
+    agent, model_client = await make_agent(
+        monkeypatch,
+        [stock, sentiment],
+        [
+            "intent",
+            [call("analyze_sentiment"), call("no_such_tool")],
+            "Yes",
+            [call("fetch_stock_data")],
+            "Yes",
+        ],
+    )
+
+    # Routed to fetch_stock_data only
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL price", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    # Both calls fail their checks and the retry re-plans them
+    assert sentiment.calls == 0
+    assert stock.calls == 1
+    assert answer == "AAPL closed at $189.12. "
+    retry = model_client.create_calls[3]["messages"][-1].content
+    assert "failed validation: analyze_sentiment, no_such_tool" in retry
+    intent, planning = model_client.create_calls[:2]
+    for request in (intent, planning):
+        assert [tool.name for tool in request["tools"]] == ["fetch_stock_data"]
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_attempts_stop_improving(monkeypatch, engine):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    sentiment = ScriptedTool("analyze_sentiment", ["BAD"])
+    plan = [call("analyze_sentiment")]
+    agent, _ = await make_agent(
+        monkeypatch,
+        [stock, sentiment],
+        ["intent", [call("fetch_stock_data"), *plan], "No", plan, "No", plan, "No"],
+    )
+
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL price and sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert sentiment.calls == 2
+    assert stock.calls == 1
+    assert "closed at $189.12" in answer
+
+
+@pytest.mark.asyncio
+async def test_engine_checks_overlap_llm_validation(monkeypatch, engine):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    agent, model_client = await make_agent(
+        monkeypatch, [stock], ["intent", [call("fetch_stock_data")], "Yes"]
+    )
+
+    async def validate_prompt(message, task, conversation_id):
+        # Only completes once the validation call has been sent, so the
+        # checks would time out if they ran one after another
+        async with asyncio.timeout(1):
+            while len(model_client.create_calls) < 3:
+                await asyncio.sleep(0)
+        return engine_result(True)
+
+    monkeypatch.setattr(
+        orchestrator_validator, "send_prompt_to_arthur_engine", validate_prompt
+    )
+
+    answer, tool_validation = await agent.message_loop(
+        UserTextMessage(content="AAPL price", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert "closed at $189.12" in answer
+    assert "PASS" in tool_validation
+
+
+class QuoteTool(BaseTool[TickerArgs, ValuesResult]):
+    """Returns a formatted close price along with the structured value."""
+
+    def __init__(self, close: float):
+        super().__init__(TickerArgs, ValuesResult, "fetch_stock_data", "Quote")
+        self.close = close
+
+    async def run(self, args: TickerArgs, cancellation_token: CancellationToken):
+        return ValuesResult(
+            data=f"{args.ticker} closed at ${self.close:.2f}. ",
+            values={"close": self.close},
+        )
+
+
+@pytest.mark.asyncio
+async def test_grounded_answer_skips_llm_validation(monkeypatch, engine):
+    agent, model_client = await make_agent(
+        monkeypatch, [QuoteTool(189.1234)], ["intent", [call("fetch_stock_data")]]
+    )
+
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL close", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert "closed at $189.12" in answer
+    # Intent and planning only; the numeric check replaced the validation call
+    assert len(model_client.create_calls) == 2
+    assert engine == ["prompt", "response"]
+
+
+@pytest.mark.asyncio
+async def test_unstructured_tool_output_still_uses_llm_validation(monkeypatch, engine):
+    sentiment = ScriptedTool("analyze_sentiment", ["score of 0.42"])
+    agent, model_client = await make_agent(
+        monkeypatch, [sentiment], ["intent", [call("analyze_sentiment")], "Yes"]
+    )
+
+    await agent.message_loop(
+        UserTextMessage(content="AAPL sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert len(model_client.create_calls) == 3
+
+
+class HangingTool(BaseTool[TickerArgs, TextResult]):
+    """Never finishes; records whether it was cancelled."""
+
+    def __init__(self, name: str):
+        super().__init__(TickerArgs, TextResult, name, f"Hanging {name}")
+        self.cancelled = False
+
+    async def run(self, args: TickerArgs, cancellation_token: CancellationToken):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class TemperaturePlanner(ReplayChatCompletionClient):
+    """Plans a tool (or none) per sampling temperature and approves every answer."""
+
+    def __init__(self, plans: dict[float, str]):
+        super().__init__([])
+        self.plans = plans
+
+    async def create(self, messages, *, tools=(), extra_create_args=None, **kwargs):
+        self.create_calls.append(messages)
+        temperature = (extra_create_args or {}).get("temperature")
+        if temperature is None:
+            return result("Yes")
+        plan = self.plans[temperature]
+        return result([call(plan)] if plan else "AAPL looks fine to me")
+
+
+@pytest.mark.asyncio
+async def test_first_passing_candidate_wins_and_others_are_cancelled(
+    monkeypatch, engine
+):
+    hanging = HangingTool("fetch_stock_data")
+    sentiment = ScriptedTool("analyze_sentiment", ["sentiment is positive"])
+    monkeypatch.setattr(
+        orchestrator_validator, "build_orchestrator_tools", lambda: [hanging, sentiment]
+    )
+    model_client = TemperaturePlanner(
+        {0.0: "fetch_stock_data", 1.0: "analyze_sentiment"}
+    )
+    runtime = SingleThreadedAgentRuntime()
+    await OrchestratorAssistantAgent.register(
+        runtime,
+        "Orchestrator",
+        lambda: OrchestratorAssistantAgent(
+            "Orchestrator",
+            description="test",
+            model_client=model_client,
+            shield_config=ENGINE_CONFIG,
+            candidates=2,
+        ),
+    )
+    agent = await runtime.try_get_underlying_agent_instance(
+        AgentId("Orchestrator", "default"), OrchestratorAssistantAgent
+    )
+
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL price and sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert "positive" in answer
+    assert hanging.cancelled
+
+
+async def make_racing_agent(monkeypatch, tools, plans):
+    monkeypatch.setattr(
+        orchestrator_validator, "build_orchestrator_tools", lambda: tools
+    )
+    runtime = SingleThreadedAgentRuntime()
+    await OrchestratorAssistantAgent.register(
+        runtime,
+        "Orchestrator",
+        lambda: OrchestratorAssistantAgent(
+            "Orchestrator",
+            description="test",
+            model_client=TemperaturePlanner(plans),
+            shield_config=ENGINE_CONFIG,
+            candidates=len(plans),
+        ),
+    )
+    return await runtime.try_get_underlying_agent_instance(
+        AgentId("Orchestrator", "default"), OrchestratorAssistantAgent
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_the_winning_candidate_joins_the_turn(monkeypatch, engine):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    sentiment = ScriptedTool("analyze_sentiment", ["BAD"])
+    agent = await make_racing_agent(
+        monkeypatch,
+        [stock, sentiment],
+        {0.0: "analyze_sentiment", 1.0: "fetch_stock_data"},
+    )
+
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL price and sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert "189.12" in answer
+    assert sentiment.calls == 1
+    tool_messages = [
+        message.content
+        for message in agent._turn_messages
+        if message.content.startswith("Tool ")
+    ]
+    assert tool_messages == ["Tool fetch_stock_data response: AAPL closed at $189.12. "]
+    assert [executed["name"] for executed in agent._turn_calls] == ["fetch_stock_data"]
+
+
+@pytest.mark.asyncio
+async def test_candidate_without_tool_calls_cannot_win(monkeypatch, engine):
+    sentiment = ScriptedTool("analyze_sentiment", ["sentiment is positive"])
+    agent = await make_racing_agent(
+        monkeypatch, [sentiment], {0.0: None, 1.0: "analyze_sentiment"}
+    )
+
+    outcome = await agent.run_candidate(
+        "AAPL sentiment", [sentiment], message_context(), "conversation", 0.0
+    )
+    assert not outcome.passed
+    assert outcome.score == 0.0
+
+    answer, _ = await agent.message_loop(
+        UserTextMessage(content="AAPL sentiment", source="User"),
+        message_context(),
+        "conversation",
+    )
+    assert "positive" in answer
+
+
+@pytest.mark.asyncio
+async def test_tool_budget_overrun_is_never_a_validated_answer(monkeypatch, engine):
+    stock = ScriptedTool("fetch_stock_data", ["price is 100"])
+    agent = await make_racing_agent(monkeypatch, [stock], {0.0: "fetch_stock_data"})
+    run = agent._deadline.run
+
+    async def overrun_tools(stage, work):
+        if stage == TOOLS:
+            work.close()
+            raise StageOverrun(stage, 0.0)
+        return await run(stage, work)
+
+    monkeypatch.setattr(agent._deadline, "run", overrun_tools)
+
+    outcome = await agent.run_candidate(
+        "AAPL price", [stock], message_context(), "conversation", 0.0
+    )
+    assert not outcome.passed
+    assert outcome.score == 0.0
+    assert outcome.answer == ""
+    assert outcome.failed == ["fetch_stock_data"]
+
+    agent._candidates = 1
+    agent._model_client = ReplayChatCompletionClient(
+        [result("Looking up AAPL"), result([call("fetch_stock_data")])]
+    )
+    with pytest.raises(StageOverrun):
+        await agent.message_loop(
+            UserTextMessage(content="AAPL price", source="User"),
+            message_context(),
+            "conversation",
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("degraded", [False, True])
+async def test_answers_are_cached_under_the_executed_plan(
+    monkeypatch, engine, degraded
+):
+    stock = ScriptedTool("fetch_stock_data", ["closed at $189.12"])
+    agent, _ = await make_agent(
+        monkeypatch,
+        [stock],
+        ["intent", [call("fetch_stock_data")], "Yes", "AAPL closed at $189.12."],
+    )
+    agent._answer_cache = TurnAnswerCache()
+    published = []
+
+    async def publish_answer(answer, conversation_id):
+        published.append(answer)
+
+    monkeypatch.setattr(agent, "publish_answer", publish_answer)
+    if degraded:
+
+        async def resolve(resolution_message):
+            raise StageOverrun(RESOLUTION, 0.0)
+
+        monkeypatch.setattr(agent, "resolve", resolve)
+
+    # Sounds like a definition to the router, but the model fetched a price
+    await agent.process_turn(
+        UserTextMessage(content="what is Apple worth", source="User"),
+        message_context(),
+        "conversation",
+    )
+
+    assert len(published) == 1
+    entries = list(agent._answer_cache._entries.values())
+    if degraded:
+        assert entries == []
+    else:
+        assert [entry.plan for entry in entries] == ["fetch_stock_data|AAPL"]